@@ -0,0 +1,55 @@
+"""Add impact rollup fact tables and refresh watermarks.
+
+Revision ID: a11c1d2e3f43
+Revises: a11c1d2e3f42
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "a11c1d2e3f43"
+down_revision = "a11c1d2e3f42"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "impact_rollups",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("grain", sa.String(), nullable=False),
+        sa.Column("bucket_start", sa.Date(), nullable=False),
+        sa.Column("state_of_residence", sa.String(), nullable=False),
+        sa.Column("benefits_discovered", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("benefits_claimed", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("benefit_value_discovered", sa.Float(), server_default=sa.text("0"), nullable=False),
+        sa.Column("benefit_value_unlocked", sa.Float(), server_default=sa.text("0"), nullable=False),
+        sa.Column("foreclosure_prevention_claims", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id", name="pk_impact_rollups"),
+        sa.UniqueConstraint("grain", "bucket_start", "state_of_residence", name="uq_impact_rollups_grain_bucket_state"),
+    )
+    op.create_index("ix_impact_rollups_bucket_start", "impact_rollups", ["bucket_start"], unique=False)
+
+    op.create_table(
+        "rollup_watermarks",
+        sa.Column("rollup_name", sa.String(), nullable=False),
+        sa.Column("watermark_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("rows_processed", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("last_run_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("rollup_name", name="pk_rollup_watermarks"),
+    )
+
+    # Incremental refresh scans benefit_progress by last modification time.
+    op.create_index("ix_benefit_progress_updated_at", "benefit_progress", ["updated_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_benefit_progress_updated_at", table_name="benefit_progress")
+    op.drop_table("rollup_watermarks")
+    op.drop_index("ix_impact_rollups_bucket_start", table_name="impact_rollups")
+    op.drop_table("impact_rollups")
@@ -0,0 +1,152 @@
+"""Add maintained membership_activity summary for the admin membership lists.
+
+Revision ID: a11c1d2e3f44
+Revises: a11c1d2e3f43
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "a11c1d2e3f44"
+down_revision = "a11c1d2e3f43"
+branch_labels = None
+depends_on = None
+
+
+# Frozen copy of app.services.membership_activity_service UPSERT_SQL over
+# SUMMARY_SELECT_SQL, filling the summary for every existing membership.
+BACKFILL_SQL = """
+INSERT INTO membership_activity (
+    membership_id,
+    last_activity_at,
+    missed_installments_count,
+    due_installments_count,
+    latest_stability_score,
+    latest_stability_at,
+    refreshed_at
+)
+SELECT
+    m.id AS membership_id,
+    NULLIF(
+        GREATEST(
+            COALESCE((SELECT max(mi.paid_at) FROM membership_installments mi WHERE mi.membership_id = m.id), to_timestamp(0)),
+            COALESCE((SELECT max(cc.created_at) FROM contribution_credits cc WHERE cc.membership_id = m.id), to_timestamp(0)),
+            COALESCE((SELECT max(mc.created_at) FROM member_checkins mc WHERE mc.membership_id = m.id), to_timestamp(0)),
+            COALESCE(
+                (
+                    SELECT max(d.uploaded_at)
+                    FROM cases c
+                    JOIN documents d ON d.case_id = c.id
+                    WHERE c.created_by = m.user_id AND c.program_key = m.program_key
+                ),
+                to_timestamp(0)
+            ),
+            COALESCE((SELECT max(tqa.created_at) FROM training_quiz_attempts tqa WHERE tqa.user_id = m.user_id), to_timestamp(0))
+        ),
+        to_timestamp(0)
+    ) AS last_activity_at,
+    ic.missed_installments_count,
+    ic.due_installments_count,
+    ls.stability_score AS latest_stability_score,
+    ls.created_at AS latest_stability_at,
+    now() AS refreshed_at
+FROM memberships m
+CROSS JOIN LATERAL (
+    SELECT
+        COUNT(*) FILTER (WHERE mi.status = 'missed') AS missed_installments_count,
+        COUNT(*) FILTER (WHERE mi.status = 'due') AS due_installments_count
+    FROM membership_installments mi
+    WHERE mi.membership_id = m.id
+) ic
+LEFT JOIN LATERAL (
+    SELECT sa.stability_score, sa.created_at
+    FROM stability_assessments sa
+    WHERE sa.user_id = m.user_id AND sa.program_key = m.program_key
+    ORDER BY sa.created_at DESC, sa.id DESC
+    LIMIT 1
+) ls ON true
+ON CONFLICT (membership_id) DO UPDATE SET
+    last_activity_at = EXCLUDED.last_activity_at,
+    missed_installments_count = EXCLUDED.missed_installments_count,
+    due_installments_count = EXCLUDED.due_installments_count,
+    latest_stability_score = EXCLUDED.latest_stability_score,
+    latest_stability_at = EXCLUDED.latest_stability_at,
+    refreshed_at = EXCLUDED.refreshed_at
+"""
+
+
+def _index_exists(bind, index_name: str) -> bool:
+    return bool(
+        bind.execute(
+            sa.text("SELECT 1 FROM pg_indexes WHERE schemaname = 'public' AND indexname = :name"),
+            {"name": index_name},
+        ).scalar()
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    op.create_table(
+        "membership_activity",
+        sa.Column("membership_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("last_activity_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("missed_installments_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("due_installments_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("latest_stability_score", sa.Integer(), nullable=True),
+        sa.Column("latest_stability_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["membership_id"],
+            ["memberships.id"],
+            name="fk_membership_activity_membership_id_memberships",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("membership_id", name="pk_membership_activity"),
+    )
+    op.create_index(
+        "ix_membership_activity_missed_installments_count",
+        "membership_activity",
+        ["missed_installments_count"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_membership_activity_latest_stability_score",
+        "membership_activity",
+        ["latest_stability_score"],
+        unique=False,
+    )
+
+    # Supporting indexes for the per-membership refresh subqueries and list ordering.
+    if not _index_exists(bind, "ix_memberships_created_at"):
+        op.create_index("ix_memberships_created_at", "memberships", ["created_at"], unique=False)
+    if not _index_exists(bind, "ix_documents_case_id"):
+        op.create_index("ix_documents_case_id", "documents", ["case_id"], unique=False)
+    if not _index_exists(bind, "ix_cases_created_by_program_key"):
+        op.create_index("ix_cases_created_by_program_key", "cases", ["created_by", "program_key"], unique=False)
+    if not _index_exists(bind, "ix_training_quiz_attempts_user_id"):
+        op.create_index("ix_training_quiz_attempts_user_id", "training_quiz_attempts", ["user_id"], unique=False)
+    if not _index_exists(bind, "ix_stability_assessments_user_program_created"):
+        op.create_index(
+            "ix_stability_assessments_user_program_created",
+            "stability_assessments",
+            ["user_id", "program_key", "created_at"],
+            unique=False,
+        )
+
+    op.execute(sa.text(BACKFILL_SQL))
+
+
+def downgrade() -> None:
+    op.drop_index("ix_stability_assessments_user_program_created", table_name="stability_assessments")
+    op.drop_index("ix_training_quiz_attempts_user_id", table_name="training_quiz_attempts")
+    op.drop_index("ix_cases_created_by_program_key", table_name="cases")
+    op.drop_index("ix_documents_case_id", table_name="documents")
+    op.drop_index("ix_memberships_created_at", table_name="memberships")
+    op.drop_index("ix_membership_activity_latest_stability_score", table_name="membership_activity")
+    op.drop_index("ix_membership_activity_missed_installments_count", table_name="membership_activity")
+    op.drop_table("membership_activity")
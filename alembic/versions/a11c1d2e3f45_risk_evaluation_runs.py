@@ -0,0 +1,59 @@
+"""Add risk evaluation run checkpoints and escalation audit lookup index.
+
+Revision ID: a11c1d2e3f45
+Revises: a11c1d2e3f44
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "a11c1d2e3f45"
+down_revision = "a11c1d2e3f44"
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(bind, index_name: str) -> bool:
+    return bool(
+        bind.execute(
+            sa.text("SELECT 1 FROM pg_indexes WHERE schemaname = 'public' AND indexname = :name"),
+            {"name": index_name},
+        ).scalar()
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    op.create_table(
+        "risk_evaluation_runs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("run_key", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), server_default=sa.text("'running'"), nullable=False),
+        sa.Column("checkpoint_membership_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("chunk_size", sa.Integer(), nullable=False),
+        sa.Column("chunks_completed", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("processed_memberships", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("risk_triggered", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("audit_logs_created", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("workflow_escalations", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id", name="pk_risk_evaluation_runs"),
+        sa.UniqueConstraint("run_key", name="uq_risk_evaluation_runs_run_key"),
+    )
+
+    # Escalation idempotency checks look audits up by (action_type, reason_code).
+    if not _index_exists(bind, "ix_audit_logs_action_type_reason_code"):
+        op.create_index("ix_audit_logs_action_type_reason_code", "audit_logs", ["action_type", "reason_code"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_logs_action_type_reason_code", table_name="audit_logs")
+    op.drop_table("risk_evaluation_runs")
@@ -0,0 +1,98 @@
+"""Add running stability counters per membership.
+
+Revision ID: a11c1d2e3f46
+Revises: a11c1d2e3f45
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "a11c1d2e3f46"
+down_revision = "a11c1d2e3f45"
+branch_labels = None
+depends_on = None
+
+
+BACKFILL_SQL = """
+    INSERT INTO membership_stability_counters (
+        membership_id,
+        paid_on_time_count,
+        paid_late_count,
+        missed_count,
+        contribution_credit_count,
+        document_upload_count,
+        updated_at
+    )
+    SELECT
+        m.id AS membership_id,
+        ic.paid_on_time_count,
+        ic.paid_late_count,
+        ic.missed_count,
+        (SELECT count(*) FROM contribution_credits cc WHERE cc.membership_id = m.id) AS contribution_credit_count,
+        (SELECT count(*) FROM documents d WHERE d.uploaded_by = m.user_id) AS document_upload_count,
+        now() AS updated_at
+    FROM memberships m
+    CROSS JOIN LATERAL (
+        SELECT
+            COUNT(*) FILTER (
+                WHERE mi.status = 'paid_cash'
+                  AND mi.paid_at IS NOT NULL
+                  AND (mi.paid_at AT TIME ZONE 'UTC')::date <= mi.due_date
+            ) AS paid_on_time_count,
+            COUNT(*) FILTER (
+                WHERE mi.status = 'paid_cash'
+                  AND mi.paid_at IS NOT NULL
+                  AND (mi.paid_at AT TIME ZONE 'UTC')::date > mi.due_date
+            ) AS paid_late_count,
+            COUNT(*) FILTER (WHERE mi.status = 'missed') AS missed_count
+        FROM membership_installments mi
+        WHERE mi.membership_id = m.id
+    ) ic
+    ON CONFLICT (membership_id) DO NOTHING
+"""
+
+
+def _index_exists(bind, index_name: str) -> bool:
+    return bool(
+        bind.execute(
+            sa.text("SELECT 1 FROM pg_indexes WHERE schemaname = 'public' AND indexname = :name"),
+            {"name": index_name},
+        ).scalar()
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    op.create_table(
+        "membership_stability_counters",
+        sa.Column("membership_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("paid_on_time_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("paid_late_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("missed_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("contribution_credit_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("document_upload_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["membership_id"],
+            ["memberships.id"],
+            name="fk_membership_stability_counters_membership_id_memberships",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("membership_id", name="pk_membership_stability_counters"),
+    )
+
+    # Document uploads are counted per member.
+    if not _index_exists(bind, "ix_documents_uploaded_by"):
+        op.create_index("ix_documents_uploaded_by", "documents", ["uploaded_by"], unique=False)
+
+    op.execute(sa.text(BACKFILL_SQL))
+
+
+def downgrade() -> None:
+    op.drop_index("ix_documents_uploaded_by", table_name="documents")
+    op.drop_table("membership_stability_counters")
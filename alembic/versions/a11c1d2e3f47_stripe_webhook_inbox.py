@@ -0,0 +1,64 @@
+"""Add Stripe webhook inbox for asynchronous, deduplicated event processing.
+
+Revision ID: a11c1d2e3f47
+Revises: a11c1d2e3f46
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "a11c1d2e3f47"
+down_revision = "a11c1d2e3f46"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stripe_webhook_events",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("stripe_event_id", sa.String(), nullable=False),
+        sa.Column("event_type", sa.String(), nullable=False),
+        sa.Column("stripe_customer_id", sa.String(), nullable=False),
+        sa.Column("stripe_created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("status", sa.String(), server_default=sa.text("'pending'"), nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), server_default=sa.text("5"), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("received_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("available_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("locked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id", name="pk_stripe_webhook_events"),
+        sa.UniqueConstraint("stripe_event_id", name="uq_stripe_webhook_events_stripe_event_id"),
+    )
+    op.create_index(
+        "ix_stripe_webhook_events_status_available_at",
+        "stripe_webhook_events",
+        ["status", "available_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_stripe_webhook_events_customer_created",
+        "stripe_webhook_events",
+        ["stripe_customer_id", "stripe_created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_stripe_webhook_events_processed_at",
+        "stripe_webhook_events",
+        ["processed_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_stripe_webhook_events_processed_at", table_name="stripe_webhook_events")
+    op.drop_index("ix_stripe_webhook_events_customer_created", table_name="stripe_webhook_events")
+    op.drop_index("ix_stripe_webhook_events_status_available_at", table_name="stripe_webhook_events")
+    op.drop_table("stripe_webhook_events")
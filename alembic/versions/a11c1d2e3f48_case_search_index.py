@@ -0,0 +1,143 @@
+"""Add case_search_index for ranked workspace case search.
+
+Revision ID: a11c1d2e3f48
+Revises: a11c1d2e3f47
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "a11c1d2e3f48"
+down_revision = "a11c1d2e3f47"
+branch_labels = None
+depends_on = None
+
+
+BACKFILL_SQL = """
+    INSERT INTO case_search_index (
+        case_id,
+        case_id_text,
+        property_address,
+        city,
+        state,
+        zip_code,
+        owner_name,
+        has_foreclosure_profile,
+        has_veteran_profile,
+        is_routed,
+        case_created_at,
+        search_text,
+        search_vector,
+        updated_at
+    )
+    SELECT
+        c.id,
+        c.id::text,
+        fcd.property_address,
+        fcd.city,
+        d.state,
+        fcd.zip_code,
+        d.owner_name,
+        fcd.id IS NOT NULL,
+        vp.id IS NOT NULL,
+        EXISTS (SELECT 1 FROM partner_referrals pr WHERE pr.case_id = c.id),
+        c.created_at,
+        lower(concat_ws(' ', c.id::text, fcd.property_address, fcd.city, d.state, fcd.zip_code, d.owner_name)),
+        setweight(to_tsvector('simple', concat_ws(' ', fcd.property_address, d.owner_name)), 'A')
+            || setweight(to_tsvector('simple', concat_ws(' ', fcd.city, d.state, fcd.zip_code)), 'B'),
+        now()
+    FROM cases c
+    LEFT JOIN foreclosure_case_data fcd ON fcd.case_id = c.id
+    LEFT JOIN veteran_profiles vp ON vp.case_id = c.id
+    CROSS JOIN LATERAL (
+        SELECT
+            COALESCE(fcd.state, vp.state_of_residence) AS state,
+            COALESCE(
+                NULLIF(btrim(c.meta::jsonb ->> 'full_name'), ''),
+                NULLIF(btrim(c.meta::jsonb ->> 'owner_name'), '')
+            ) AS owner_name
+    ) d
+    ON CONFLICT (case_id) DO NOTHING
+"""
+
+
+def _extension_available(bind, name: str) -> bool:
+    return bool(
+        bind.execute(
+            sa.text("SELECT 1 FROM pg_available_extensions WHERE name = :name"),
+            {"name": name},
+        ).scalar()
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    op.create_table(
+        "case_search_index",
+        sa.Column("case_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("case_id_text", sa.String(), nullable=False),
+        sa.Column("property_address", sa.String(), nullable=True),
+        sa.Column("city", sa.String(), nullable=True),
+        sa.Column("state", sa.String(), nullable=True),
+        sa.Column("zip_code", sa.String(), nullable=True),
+        sa.Column("owner_name", sa.String(), nullable=True),
+        sa.Column("has_foreclosure_profile", sa.Boolean(), server_default=sa.text("false"), nullable=False),
+        sa.Column("has_veteran_profile", sa.Boolean(), server_default=sa.text("false"), nullable=False),
+        sa.Column("is_routed", sa.Boolean(), server_default=sa.text("false"), nullable=False),
+        sa.Column("case_created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("search_text", sa.Text(), server_default=sa.text("''"), nullable=False),
+        sa.Column("search_vector", postgresql.TSVECTOR(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["case_id"],
+            ["cases.id"],
+            name="fk_case_search_index_case_id_cases",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("case_id", name="pk_case_search_index"),
+    )
+    op.create_index(
+        "ix_case_search_index_search_vector",
+        "case_search_index",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_case_search_index_case_id_text",
+        "case_search_index",
+        ["case_id_text"],
+        unique=False,
+        postgresql_ops={"case_id_text": "text_pattern_ops"},
+    )
+    op.create_index(
+        "ix_case_search_index_case_created_at",
+        "case_search_index",
+        ["case_created_at", "case_id"],
+        unique=False,
+    )
+
+    # Fuzzy matching is optional: search falls back to prefix full-text without pg_trgm.
+    if _extension_available(bind, "pg_trgm"):
+        op.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        op.execute(
+            sa.text(
+                "CREATE INDEX ix_case_search_index_search_text_trgm "
+                "ON case_search_index USING gin (search_text gin_trgm_ops)"
+            )
+        )
+
+    op.execute(sa.text(BACKFILL_SQL))
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DROP INDEX IF EXISTS ix_case_search_index_search_text_trgm"))
+    op.drop_index("ix_case_search_index_case_created_at", table_name="case_search_index")
+    op.drop_index("ix_case_search_index_case_id_text", table_name="case_search_index")
+    op.drop_index("ix_case_search_index_search_vector", table_name="case_search_index")
+    op.drop_table("case_search_index")
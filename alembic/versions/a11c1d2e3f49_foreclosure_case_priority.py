@@ -0,0 +1,78 @@
+"""Materialize foreclosure case priority score and tier.
+
+Revision ID: a11c1d2e3f49
+Revises: a11c1d2e3f48
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a11c1d2e3f49"
+down_revision = "a11c1d2e3f48"
+branch_labels = None
+depends_on = None
+
+
+# Frozen copy of the priority formula at the time of this migration.
+BACKFILL_SQL = """
+    UPDATE foreclosure_case_data fcd
+    SET priority_score = p.score,
+        priority_tier = CASE
+            WHEN p.score >= 70 THEN 'critical'
+            WHEN p.score >= 40 THEN 'high'
+            ELSE 'standard'
+        END,
+        priority_scored_at = now()
+    FROM (
+        SELECT
+            id,
+            round(CAST(LEAST(100,
+                CASE lower(COALESCE(foreclosure_stage, ''))
+                    WHEN 'pre_foreclosure' THEN 15
+                    WHEN 'notice_of_default' THEN 30
+                    WHEN 'auction_scheduled' THEN 50
+                    WHEN 'post_sale' THEN 80
+                    ELSE 10
+                END
+                + CASE WHEN COALESCE(homeowner_income, 0) <= 0 THEN 0
+                       ELSE LEAST(40, COALESCE(arrears_amount, 0) / GREATEST(homeowner_income, 1) * 10)
+                  END
+            ) AS numeric), 2) AS score
+        FROM foreclosure_case_data
+    ) p
+    WHERE fcd.id = p.id
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        "foreclosure_case_data",
+        sa.Column("priority_score", sa.Float(), server_default=sa.text("10"), nullable=False),
+    )
+    op.add_column(
+        "foreclosure_case_data",
+        sa.Column("priority_tier", sa.String(), server_default=sa.text("'standard'"), nullable=False),
+    )
+    op.add_column(
+        "foreclosure_case_data",
+        sa.Column("priority_scored_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    op.execute(sa.text(BACKFILL_SQL))
+
+    op.create_index(
+        "ix_foreclosure_case_data_priority",
+        "foreclosure_case_data",
+        ["priority_score", "case_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_foreclosure_case_data_priority", table_name="foreclosure_case_data")
+    op.drop_column("foreclosure_case_data", "priority_scored_at")
+    op.drop_column("foreclosure_case_data", "priority_tier")
+    op.drop_column("foreclosure_case_data", "priority_score")
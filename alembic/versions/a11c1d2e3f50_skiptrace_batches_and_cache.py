@@ -0,0 +1,77 @@
+"""Add skiptrace batches and the address-keyed skiptrace result cache.
+
+Revision ID: a11c1d2e3f50
+Revises: a11c1d2e3f49
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "a11c1d2e3f50"
+down_revision = "a11c1d2e3f49"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "skiptrace_batches",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("provider", sa.String(), nullable=False),
+        sa.Column("case_ids", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("requested_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("status", sa.String(), server_default=sa.text("'queued'"), nullable=False),
+        sa.Column("total_cases", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("processed_cases", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("resolved_cases", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("cache_hits", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("provider_calls", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("failed_cases", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("errors", postgresql.JSONB(astext_type=sa.Text()), server_default=sa.text("'{}'::jsonb"), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["requested_by"],
+            ["users.id"],
+            name="fk_skiptrace_batches_requested_by_users",
+        ),
+        sa.PrimaryKeyConstraint("id", name="pk_skiptrace_batches"),
+    )
+    op.create_index(
+        "ix_skiptrace_batches_status_created_at",
+        "skiptrace_batches",
+        ["status", "created_at"],
+        unique=False,
+    )
+
+    op.create_table(
+        "skiptrace_cache",
+        sa.Column("id", postgresql.UUID(as_uuid=True), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("provider", sa.String(), nullable=False),
+        sa.Column("address_key", sa.String(), nullable=False),
+        sa.Column("result", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id", name="pk_skiptrace_cache"),
+        sa.UniqueConstraint("provider", "address_key", name="uq_skiptrace_cache_provider_address_key"),
+    )
+    op.create_index(
+        "ix_skiptrace_cache_expires_at",
+        "skiptrace_cache",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_skiptrace_cache_expires_at", table_name="skiptrace_cache")
+    op.drop_table("skiptrace_cache")
+    op.drop_index("ix_skiptrace_batches_status_created_at", table_name="skiptrace_batches")
+    op.drop_table("skiptrace_batches")
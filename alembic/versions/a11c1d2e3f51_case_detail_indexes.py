@@ -0,0 +1,45 @@
+"""Index case-scoped audit and referral lookups used by the case detail assembler.
+
+Revision ID: a11c1d2e3f51
+Revises: a11c1d2e3f50
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a11c1d2e3f51"
+down_revision = "a11c1d2e3f50"
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(bind, index_name: str) -> bool:
+    return bool(
+        bind.execute(
+            sa.text("SELECT 1 FROM pg_indexes WHERE schemaname = 'public' AND indexname = :name"),
+            {"name": index_name},
+        ).scalar()
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if not _index_exists(bind, "ix_audit_logs_case_id_created_at"):
+        op.create_index(
+            "ix_audit_logs_case_id_created_at",
+            "audit_logs",
+            ["case_id", "created_at"],
+            unique=False,
+        )
+    # Declared on the model but never created by earlier revisions.
+    if not _index_exists(bind, "ix_partner_referrals_case_id"):
+        op.create_index("ix_partner_referrals_case_id", "partner_referrals", ["case_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DROP INDEX IF EXISTS ix_partner_referrals_case_id"))
+    op.execute(sa.text("DROP INDEX IF EXISTS ix_audit_logs_case_id_created_at"))
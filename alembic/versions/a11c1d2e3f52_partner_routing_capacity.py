@@ -0,0 +1,76 @@
+"""Add partner capacity and routing weight, and index open referrals per partner.
+
+Referrals may now be left without a partner while every partner serving them
+is at capacity.
+
+Revision ID: a11c1d2e3f52
+Revises: a11c1d2e3f51
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "a11c1d2e3f52"
+down_revision = "a11c1d2e3f51"
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(bind, index_name: str) -> bool:
+    return bool(
+        bind.execute(
+            sa.text("SELECT 1 FROM pg_indexes WHERE schemaname = 'public' AND indexname = :name"),
+            {"name": index_name},
+        ).scalar()
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    op.add_column("partner_organizations", sa.Column("capacity", sa.Integer(), nullable=True))
+    op.add_column(
+        "partner_organizations",
+        sa.Column("routing_weight", sa.Float(), server_default=sa.text("1"), nullable=False),
+    )
+
+    op.alter_column(
+        "partner_referrals",
+        "partner_organization_id",
+        existing_type=postgresql.UUID(as_uuid=True),
+        nullable=True,
+    )
+
+    if not _index_exists(bind, "ix_partner_referrals_open_partner"):
+        op.create_index(
+            "ix_partner_referrals_open_partner",
+            "partner_referrals",
+            ["partner_organization_id"],
+            unique=False,
+            postgresql_where=sa.text("status IN ('queued', 'accepted', 'in_progress')"),
+        )
+
+
+def downgrade() -> None:
+    # Unassigned referrals are live cases waiting for a partner; they are not dropped
+    # to make the column required again.
+    unassigned = op.get_bind().execute(
+        sa.text("SELECT count(*) FROM partner_referrals WHERE partner_organization_id IS NULL")
+    ).scalar()
+    if unassigned:
+        raise RuntimeError(
+            f"{unassigned} partner referrals have no partner; assign them before downgrading a11c1d2e3f52"
+        )
+    op.execute(sa.text("DROP INDEX IF EXISTS ix_partner_referrals_open_partner"))
+    op.alter_column(
+        "partner_referrals",
+        "partner_organization_id",
+        existing_type=postgresql.UUID(as_uuid=True),
+        nullable=False,
+    )
+    op.drop_column("partner_organizations", "routing_weight")
+    op.drop_column("partner_organizations", "capacity")
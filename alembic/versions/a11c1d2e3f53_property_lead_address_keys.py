@@ -0,0 +1,90 @@
+"""Add normalized address keys to property leads for set-based dedupe.
+
+The key replaces the unique (source_id, property_address) constraint: the same
+street address in two cities is two leads.
+
+Revision ID: a11c1d2e3f53
+Revises: a11c1d2e3f52
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a11c1d2e3f53"
+down_revision = "a11c1d2e3f52"
+branch_labels = None
+depends_on = None
+
+
+# Frozen copy of app.services.address_normalization.normalize_address over
+# (property_address, city, state). Only the oldest lead per (source, key) keeps
+# the key, so the unique index can be built over existing duplicates.
+BACKFILL_SQL = """
+    WITH abbreviations(word, abbr) AS (
+        VALUES ('street', 'st'), ('avenue', 'ave'), ('road', 'rd'), ('drive', 'dr'),
+               ('boulevard', 'blvd'), ('lane', 'ln'), ('court', 'ct'), ('place', 'pl'),
+               ('parkway', 'pkwy'), ('highway', 'hwy'), ('circle', 'cir'), ('terrace', 'ter'),
+               ('north', 'n'), ('south', 's'), ('east', 'e'), ('west', 'w'),
+               ('apartment', 'apt'), ('suite', 'ste')
+    ),
+    keyed AS (
+        SELECT
+            pl.id,
+            pl.source_id,
+            pl.created_at,
+            COALESCE((
+                SELECT string_agg(COALESCE(a.abbr, w.match[1]), ' ' ORDER BY w.ord)
+                FROM regexp_matches(
+                    lower(concat_ws(' ', pl.property_address, pl.city, pl.state)), '[a-z0-9]+', 'g'
+                ) WITH ORDINALITY AS w(match, ord)
+                LEFT JOIN abbreviations a ON a.word = w.match[1]
+            ), '') AS address_key
+        FROM property_leads pl
+    ),
+    ranked AS (
+        SELECT id, address_key,
+               row_number() OVER (PARTITION BY source_id, address_key ORDER BY created_at, id) AS rank
+        FROM keyed
+    )
+    UPDATE property_leads pl
+    SET address_key = ranked.address_key
+    FROM ranked
+    WHERE pl.id = ranked.id AND ranked.rank = 1
+"""
+
+
+def upgrade() -> None:
+    op.add_column("property_leads", sa.Column("address_key", sa.String(), nullable=True))
+    op.execute(sa.text(BACKFILL_SQL))
+    op.create_index(
+        "uq_property_leads_source_address_key",
+        "property_leads",
+        ["source_id", "address_key"],
+        unique=True,
+    )
+    op.drop_constraint("uq_property_leads_source_address", "property_leads", type_="unique")
+
+
+def downgrade() -> None:
+    # Leads that differ only by city are separate leads now; the raw-address constraint
+    # cannot come back without discarding one of them, so refuse instead.
+    duplicates = op.get_bind().execute(
+        sa.text(
+            "SELECT count(*) FROM ("
+            " SELECT 1 FROM property_leads GROUP BY source_id, property_address HAVING count(*) > 1"
+            ") d"
+        )
+    ).scalar()
+    if duplicates:
+        raise RuntimeError(
+            f"{duplicates} property addresses have more than one lead per source; "
+            "merge them before downgrading a11c1d2e3f53"
+        )
+    op.create_unique_constraint(
+        "uq_property_leads_source_address", "property_leads", ["source_id", "property_address"]
+    )
+    op.drop_index("uq_property_leads_source_address_key", table_name="property_leads")
+    op.drop_column("property_leads", "address_key")
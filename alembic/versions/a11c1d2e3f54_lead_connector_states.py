@@ -0,0 +1,37 @@
+"""Track per-connector watermarks and run metrics for lead connectors.
+
+Revision ID: a11c1d2e3f54
+Revises: a11c1d2e3f53
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a11c1d2e3f54"
+down_revision = "a11c1d2e3f53"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "lead_connector_states",
+        sa.Column("connector_name", sa.String(), nullable=False),
+        sa.Column("watermark_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("runs", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("total_leads_ingested", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("last_status", sa.String(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("last_leads_received", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("last_leads_ingested", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("last_duration_ms", sa.Float(), nullable=True),
+        sa.Column("last_run_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("connector_name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("lead_connector_states")
@@ -0,0 +1,41 @@
+"""Record scheduled background job runs with duration and row counts.
+
+Revision ID: a11c1d2e3f55
+Revises: a11c1d2e3f54
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "a11c1d2e3f55"
+down_revision = "a11c1d2e3f54"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_runs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("job_name", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("task_id", sa.String(), nullable=True),
+        sa.Column("queue", sa.String(), nullable=True),
+        sa.Column("rows_processed", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("duration_ms", sa.Float(), nullable=True),
+        sa.Column("result", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_job_runs_job_name_started_at", "job_runs", ["job_name", "started_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_runs_job_name_started_at", table_name="job_runs")
+    op.drop_table("job_runs")
@@ -0,0 +1,32 @@
+"""Keep the region a referral was routed for, so unassigned referrals can be re-routed.
+
+Revision ID: a11c1d2e3f56
+Revises: a11c1d2e3f55
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a11c1d2e3f56"
+down_revision = "a11c1d2e3f55"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("partner_referrals", sa.Column("routing_region", sa.String(), nullable=True))
+    op.create_index(
+        "ix_partner_referrals_unassigned",
+        "partner_referrals",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'unassigned'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_partner_referrals_unassigned", table_name="partner_referrals")
+    op.drop_column("partner_referrals", "routing_region")
@@ -5,64 +5,15 @@ import logging
 from fastapi import FastAPI
 from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy.exc import SQLAlchemyError
-
-# Core services
-from app.services.auth_service import ensure_admin_user
-from app.services.module_loader_service import load_modules_on_startup
-from db.session import SessionLocal
-
-# -----------------------------------------------------
-# Core API Routers (these currently live in /api/routes)
-# -----------------------------------------------------
-from api.routes import (
-    ai,
-    auth,
-    bulk_upload,
-    botops,
-    cases,
-    consent,
-    deals,
-    documents,
-    referral,
-    training,
-    properties,
-    auction_imports,
-    leads,
-    workflow,
-    partner_api,
-    impact_api,
-    foreclosure,
-    partners_housing,
-    portfolio,
-    membership,
-    pipeline,
-    verify,
-    essential_worker,
-    veteran,
-    lead_intelligence,
-    mufasa_ai,
-    system_verify,
-    skiptrace,
-)
-
-# -----------------------------------------------------
-# Admin/Member Routers (these live in /app/api/routes)
-# -----------------------------------------------------
-from app.api.routes import (
-    admin_ai,
-    admin_dashboard,
-    member_dashboard,
-    member_payments,
-    public_apply,
-    system_admin,
-)
-
-# Webhooks (these live in /app/routers)
-from app.routers import webhooks
+
+from api.route_groups import enabled_route_groups, include_route_groups
+from app.services.sql_profiler import SQLProfilerMiddleware
+from app.services.startup_service import StartupBootstrap
+from db.session import async_engine
 
 
 app = FastAPI()
+app.add_middleware(SQLProfilerMiddleware)
 logger = logging.getLogger(__name__)
 
 
@@ -148,43 +99,8 @@ def read_config():
 # =====================================================
 # Register Routers
 # =====================================================
-app.include_router(ai.router)
-app.include_router(auth.router)
-app.include_router(bulk_upload.router)
-app.include_router(botops.router)
-app.include_router(cases.router)
-app.include_router(consent.router)
-app.include_router(deals.router)
-app.include_router(documents.router)
-app.include_router(referral.router)
-app.include_router(training.router)
-app.include_router(properties.router)
-app.include_router(auction_imports.router)
-app.include_router(leads.router)
-app.include_router(workflow.router)
-app.include_router(partner_api.router)
-app.include_router(impact_api.router)
-app.include_router(foreclosure.router)
-app.include_router(partners_housing.router)
-app.include_router(portfolio.router)
-app.include_router(membership.router)
-app.include_router(pipeline.router)
-app.include_router(verify.router)
-app.include_router(essential_worker.router)
-app.include_router(veteran.router)
-app.include_router(lead_intelligence.router)
-app.include_router(mufasa_ai.router)
-app.include_router(system_verify.router)
-app.include_router(skiptrace.router)
-
-app.include_router(public_apply.router)
-app.include_router(system_admin.router)
-app.include_router(admin_ai.router)
-app.include_router(admin_dashboard.router)
-app.include_router(member_dashboard.router)
-app.include_router(member_payments.router)
-
-app.include_router(webhooks.router)
+# Only the route groups this process serves are imported; see api/route_groups.py.
+app.state.route_load_profile = include_route_groups(app, enabled_route_groups())
 
 
 # =====================================================
@@ -196,17 +112,15 @@ def admin_system_page():
 
 
 @app.on_event("startup")
-def bootstrap_admin_user() -> None:
-    db = None
-    try:
-        db = SessionLocal()
-        ensure_admin_user(db)
-        load_modules_on_startup(app)
-    except SQLAlchemyError as exc:
-        logger.warning(
-            "Database unavailable during startup bootstrap/module load; app will continue and DB-backed routes will fail until connectivity is restored: %s",
-            exc,
-        )
-    finally:
-        if db is not None:
-            db.close()
+def start_bootstrap() -> None:
+    # Admin bootstrap, module loading and the knowledge snapshot need the database;
+    # they run off the startup path and /health/ready reports when they are done.
+    app.state.startup_bootstrap = StartupBootstrap(app)
+    app.state.startup_bootstrap.start()
+
+
+@app.on_event("shutdown")
+async def dispose_async_engine() -> None:
+    app.state.startup_bootstrap.stop()
+    # asyncpg connections belong to the event loop that opened them.
+    await async_engine.dispose()
@@ -0,0 +1,97 @@
+"""Router modules by route group, imported only for the groups a process serves.
+
+``API_ROUTE_GROUPS`` (comma separated, default ``all``) selects the groups, so
+a pod serving only partner traffic never imports the admin, AI or ingestion
+route modules and their service graphs. Routers are included in the order
+listed here, which is the order that resolves overlapping paths (``/leads``
+before ``/leads/intelligence``, ``/verify`` twice).
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import time
+
+from fastapi import FastAPI
+
+ALWAYS_ENABLED_GROUP = "ops"
+
+ROUTERS: tuple[tuple[str, str], ...] = (
+    ("api.routes.ai", "ai"),
+    ("api.routes.auth", "core"),
+    ("api.routes.bulk_upload", "ingestion"),
+    ("api.routes.botops", "ingestion"),
+    ("api.routes.cases", "core"),
+    ("api.routes.consent", "core"),
+    ("api.routes.deals", "core"),
+    ("api.routes.documents", "core"),
+    ("api.routes.referral", "core"),
+    ("api.routes.training", "core"),
+    ("api.routes.properties", "core"),
+    ("api.routes.auction_imports", "ingestion"),
+    ("api.routes.leads", "core"),
+    ("api.routes.workflow", "core"),
+    ("api.routes.partner_api", "partner"),
+    ("api.routes.impact_api", "partner"),
+    ("api.routes.foreclosure", "workspaces"),
+    ("api.routes.partners_housing", "workspaces"),
+    ("api.routes.portfolio", "workspaces"),
+    ("api.routes.membership", "member"),
+    ("api.routes.pipeline", "workspaces"),
+    ("api.routes.verify", "admin"),
+    ("api.routes.essential_worker", "workspaces"),
+    ("api.routes.veteran", "workspaces"),
+    ("api.routes.lead_intelligence", "ingestion"),
+    ("api.routes.metrics", ALWAYS_ENABLED_GROUP),
+    ("api.routes.health", ALWAYS_ENABLED_GROUP),
+    ("api.routes.mufasa_ai", "ai"),
+    ("api.routes.system_verify", "admin"),
+    ("api.routes.skiptrace", "workspaces"),
+    ("api.routes.modules", "ai"),
+    ("app.api.routes.public_apply", "member"),
+    ("app.api.routes.system_admin", "admin"),
+    ("app.api.routes.admin_ai", "ai"),
+    ("app.api.routes.admin_dashboard", "admin"),
+    ("app.api.routes.member_dashboard", "member"),
+    ("app.api.routes.member_payments", "member"),
+    ("app.routers.webhooks", "member"),
+)
+
+ROUTE_GROUPS = frozenset(group for _, group in ROUTERS)
+
+
+def enabled_route_groups() -> frozenset[str]:
+    raw = os.getenv("API_ROUTE_GROUPS", "all").strip().lower()
+    if raw in ("", "all"):
+        return ROUTE_GROUPS
+    groups = {group.strip() for group in raw.split(",") if group.strip()}
+    unknown = groups - ROUTE_GROUPS
+    if unknown:
+        raise ValueError(f"Unknown API_ROUTE_GROUPS: {', '.join(sorted(unknown))}")
+    return frozenset(groups | {ALWAYS_ENABLED_GROUP})
+
+
+def include_route_groups(app: FastAPI, groups: frozenset[str]) -> list[dict]:
+    """Import and include the routers of ``groups``, timing each one.
+
+    Returns one entry per included module with its import and include time. A
+    module's import time covers only what earlier modules had not loaded yet.
+    """
+    profile = []
+    for module_path, group in ROUTERS:
+        if group not in groups:
+            continue
+        started = time.perf_counter()
+        module = importlib.import_module(module_path)
+        imported = time.perf_counter()
+        app.include_router(module.router)
+        profile.append(
+            {
+                "module": module_path,
+                "group": group,
+                "import_ms": round((imported - started) * 1000, 1),
+                "include_ms": round((time.perf_counter() - imported) * 1000, 1),
+            }
+        )
+    return profile
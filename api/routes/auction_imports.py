@@ -14,9 +14,9 @@ from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
 from db.session import get_db
-from ingestion.dallas.dallas_pdf_ingestion import ingest_pdf
 from app.models.auction_import_model import AuctionImport
 from app.models.ingestion_metrics import IngestionMetric
+from app.services import metrics
 
 router = APIRouter(prefix="/auction-imports", tags=["Auction Imports"])
 logger = logging.getLogger(__name__)
@@ -88,6 +88,9 @@ async def upload_auction_file(file: UploadFile = File(...), db: Session = Depend
     db.refresh(auction_import)
 
     if file.filename.lower().endswith(".pdf"):
+        # pdfplumber is only needed for PDF uploads; keep it out of API startup.
+        from ingestion.dallas.dallas_pdf_ingestion import ingest_pdf
+
         tmp_path = f"/tmp/{file.filename}"
         with open(tmp_path, "wb") as f:
             f.write(contents)
@@ -141,16 +144,19 @@ async def upload_auction_file(file: UploadFile = File(...), db: Session = Depend
 
         auction_import.status = "processed"
         auction_import.records_created = created
+        duration_seconds = (datetime.now(timezone.utc) - t0).total_seconds()
         _metric(
             db,
             "upload_to_case_creation_seconds",
             source="csv",
             file_hash=file_hash,
             file_name=file.filename,
-            duration_seconds=(datetime.now(timezone.utc) - t0).total_seconds(),
+            duration_seconds=duration_seconds,
             count_value=created,
         )
         db.commit()
+        metrics.record_ingestion("auction_csv", created=created)
+        metrics.INGESTION_RUN_SECONDS.labels("auction_csv").observe(duration_seconds)
 
         return {
             "id": str(auction_import.id),
@@ -175,6 +181,7 @@ async def upload_auction_file(file: UploadFile = File(...), db: Session = Depend
             notes=str(e)[:200],
         )
         db.commit()
+        metrics.INGESTION_PARSE_ERRORS.labels("auction_csv").inc()
         raise HTTPException(status_code=500, detail=str(e))
 
 
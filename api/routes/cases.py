@@ -4,14 +4,18 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from audit.logger import log_audit
-from db.session import get_db
+from auth.dependencies import get_current_user_async
+from db.session import get_async_db, get_db
 from app.models.cases import Case
 from app.models.enums import CaseStatus
 from app.models.policy_versions import PolicyVersion
 from app.schemas.case import CaseCreateRequest
+from app.services.case_search_service import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, search_cases
 from app.services.workflow_engine import initialize_case_workflow, sync_case_workflow
 
 router = APIRouter()
@@ -125,26 +129,43 @@ def create_case(case_data: CaseCreateRequest, db: Session = Depends(get_db)):
     }
 
 
+@router.get("/cases/search")
+async def search_workspace_cases(
+    q: str | None = Query(default=None),
+    workspace: str | None = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(default=0, ge=0),
+    sort: str | None = Query(default=None),
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user_async),
+):
+    _ = user
+    return await db.run_sync(
+        lambda session: search_cases(session, query=q, workspace=workspace, limit=limit, offset=offset, sort=sort)
+    )
+
+
 @router.get("/cases")
-def list_cases(
+async def list_cases(
     status: CaseStatus | None = Query(default=None),
     program_key: str | None = Query(default=None),
     created_from: datetime | None = Query(default=None),
     created_to: datetime | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    query = db.query(Case)
+    # Only the listed columns: no identity map or change tracking for a read-only list.
+    statement = select(Case.id, Case.program_key, Case.created_at, Case.status, Case.meta)
 
     if status is not None:
-        query = query.filter(Case.status == status)
+        statement = statement.where(Case.status == status)
     if program_key is not None:
-        query = query.filter(Case.program_key == program_key)
+        statement = statement.where(Case.program_key == program_key)
     if created_from is not None:
-        query = query.filter(Case.created_at >= created_from)
+        statement = statement.where(Case.created_at >= created_from)
     if created_to is not None:
-        query = query.filter(Case.created_at <= created_to)
+        statement = statement.where(Case.created_at <= created_to)
 
-    cases = query.order_by(Case.created_at.desc()).all()
+    cases = (await db.execute(statement.order_by(Case.created_at.desc()))).all()
     return [
         {
             "id": str(case.id),
@@ -2,6 +2,8 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.audit_logs import AuditLog
@@ -12,8 +14,8 @@ from app.schemas.application import ApplicationCreate
 from app.services.action_payload_builder import ActionExecutionContext, build_action_payload
 from app.services.application_service import submit_application
 from auth.authorization import PolicyAuthorizer
-from auth.dependencies import get_current_user
-from db.session import get_db
+from auth.dependencies import get_current_user, get_current_user_async
+from db.session import get_async_db, get_db
 from app.models.essential_worker import EssentialWorkerBenefitMatch, EssentialWorkerProfile
 from app.services.essential_worker_housing_service import (
     discover_housing_programs,
@@ -147,18 +149,19 @@ def submit_public_essential_worker_intake(
 
 
 @router.get("/workspace/cases")
-def get_essential_worker_workspace_cases(
-    db: Session = Depends(get_db),
-    user=Depends(get_current_user),
+async def get_essential_worker_workspace_cases(
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user_async),
 ):
     _ = user
     rows = (
-        db.query(Case, EssentialWorkerProfile)
-        .join(EssentialWorkerProfile, EssentialWorkerProfile.case_id == Case.id)
-        .order_by(Case.created_at.desc())
-        .limit(200)
-        .all()
-    )
+        await db.execute(
+            select(Case, EssentialWorkerProfile)
+            .join(EssentialWorkerProfile, EssentialWorkerProfile.case_id == Case.id)
+            .order_by(Case.created_at.desc())
+            .limit(200)
+        )
+    ).all()
 
     return [
         {
@@ -1,20 +1,25 @@
+from types import SimpleNamespace
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.schemas.foreclosure_intelligence import ForeclosureAnalyzeRequest, ForeclosureCreateRequest
 from app.schemas.application import ApplicationCreate
 from auth.authorization import PolicyAuthorizer
-from auth.dependencies import get_current_user
-from db.session import get_db
-from app.models.audit_logs import AuditLog
+from auth.dependencies import get_current_user, get_current_user_async
+from db.session import get_async_db, get_db
 from app.models.cases import Case
 from app.models.housing_intelligence import ForeclosureCaseData
 from app.services.action_payload_builder import ActionExecutionContext, build_action_payload
+from app.services.case_detail_service import get_case_detail
+from app.services.case_search_service import MAX_PAGE_SIZE, search_case_ids
 from app.services.application_service import submit_application
 from app.services.foreclosure_intelligence_service import (
     calculate_case_priority,
+    case_priority,
     create_foreclosure_profile,
     update_foreclosure_status,
 )
@@ -145,18 +150,29 @@ def submit_public_foreclosure_intake(
 
 
 @router.get("/workspace/cases")
-def get_foreclosure_workspace_cases(
-    db: Session = Depends(get_db),
-    user=Depends(get_current_user),
+async def get_foreclosure_workspace_cases(
+    search: str | None = None,
+    sort: str | None = None,
+    limit: int = Query(default=MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user_async),
 ):
     _ = user
-    rows = (
-        db.query(Case, ForeclosureCaseData)
-        .join(ForeclosureCaseData, ForeclosureCaseData.case_id == Case.id)
-        .order_by(Case.created_at.desc())
-        .limit(200)
-        .all()
+    case_ids = await db.run_sync(
+        lambda session: search_case_ids(
+            session, query=search, workspace="foreclosure", limit=limit, offset=offset, sort=sort
+        )
     )
+    by_id = {
+        case.id: (case, profile)
+        for case, profile in await db.execute(
+            select(Case, ForeclosureCaseData)
+            .join(ForeclosureCaseData, ForeclosureCaseData.case_id == Case.id)
+            .where(Case.id.in_(case_ids))
+        )
+    }
+    rows = [by_id[case_id] for case_id in case_ids if case_id in by_id]
 
     return [
         {
@@ -168,6 +184,8 @@ def get_foreclosure_workspace_cases(
             "foreclosure_stage": profile.foreclosure_stage,
             "arrears_amount": profile.arrears_amount,
             "homeowner_income": profile.homeowner_income,
+            "priority_score": profile.priority_score,
+            "priority_tier": profile.priority_tier,
             "contact_email": (case.meta or {}).get("contact_email"),
             "lead_id": (case.meta or {}).get("lead_id"),
         }
@@ -182,48 +200,33 @@ def get_foreclosure_workspace_case_detail(
     user=Depends(get_current_user),
 ):
     _ = user
-    case = db.query(Case).filter(Case.id == case_id).first()
-    profile = db.query(ForeclosureCaseData).filter(ForeclosureCaseData.case_id == case_id).first()
-    if not case or not profile:
+    detail = get_case_detail(db, case_id)
+    if not detail or not detail["foreclosure_profile"]:
         raise HTTPException(status_code=404, detail="Foreclosure case not found")
-
-    audits = (
-        db.query(AuditLog)
-        .filter(AuditLog.case_id == case_id)
-        .order_by(AuditLog.created_at.desc())
-        .limit(10)
-        .all()
-    )
-    priority = calculate_case_priority(db, case_id=case_id)
+    case, profile = detail["case"], detail["foreclosure_profile"]
 
     return {
-        "case_id": str(case.id),
-        "status": case.status.value if case.status else None,
-        "created_at": case.created_at.isoformat() if case.created_at else None,
-        "meta": case.meta or {},
+        "case_id": case["id"],
+        "status": case["status"],
+        "created_at": case["created_at"],
+        "meta": case["meta"] or {},
         "profile": {
-            "property_address": profile.property_address,
-            "city": profile.city,
-            "state": profile.state,
-            "zip_code": profile.zip_code,
-            "loan_balance": profile.loan_balance,
-            "estimated_property_value": profile.estimated_property_value,
-            "arrears_amount": profile.arrears_amount,
-            "foreclosure_stage": profile.foreclosure_stage,
-            "lender_name": profile.lender_name,
-            "servicer_name": profile.servicer_name,
-            "homeowner_income": profile.homeowner_income,
-            "homeowner_hardship_reason": profile.homeowner_hardship_reason,
+            "property_address": profile["property_address"],
+            "city": profile["city"],
+            "state": profile["state"],
+            "zip_code": profile["zip_code"],
+            "loan_balance": profile["loan_balance"],
+            "estimated_property_value": profile["estimated_property_value"],
+            "arrears_amount": profile["arrears_amount"],
+            "foreclosure_stage": profile["foreclosure_stage"],
+            "lender_name": profile["lender_name"],
+            "servicer_name": profile["servicer_name"],
+            "homeowner_income": profile["homeowner_income"],
+            "homeowner_hardship_reason": profile["homeowner_hardship_reason"],
         },
-        "priority": priority,
-        "audit_log": [
-            {
-                "created_at": row.created_at.isoformat() if row.created_at else None,
-                "action_type": row.action_type,
-                "reason_code": row.reason_code,
-            }
-            for row in audits
-        ],
+        "priority": case_priority(SimpleNamespace(**profile), case_id=case_id),
+        "documents": detail["documents"],
+        "audit_log": detail["recent_audits"],
     }
 
 
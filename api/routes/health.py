@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from db.session import SessionLocal
+
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+@router.get("/live")
+def liveness():
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+def readiness(request: Request):
+    bootstrap = getattr(request.app.state, "startup_bootstrap", None)
+    checks = {"bootstrap": bootstrap.snapshot() if bootstrap else {"status": "pending"}}
+
+    database_ok = True
+    db = SessionLocal()
+    try:
+        db.execute(text("SELECT 1"))
+    except SQLAlchemyError as exc:
+        database_ok = False
+        checks["database"] = str(exc).splitlines()[0]
+    finally:
+        db.close()
+    checks.setdefault("database", "ok")
+
+    ready = database_ok and bootstrap is not None and bootstrap.ready
+    return JSONResponse(status_code=200 if ready else 503, content={"ready": ready, "checks": checks})
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from auth.dependencies import require_role
 from app.models.users import UserRole
-from db.session import get_db
+from db.session import get_db, get_read_db
 from app.services.impact_analytics_service import get_housing_summary, get_impact_summary, get_opportunity_map
+from app.services.impact_rollup_service import GRAIN_WEEK, get_impact_trends, refresh_impact_rollups
 from app.services.platform_capability_service import get_platform_capabilities
 
 
@@ -13,7 +16,7 @@ router = APIRouter(tags=["Impact API"])
 
 @router.get("/impact/summary")
 def impact_summary(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _user=Depends(require_role([UserRole.admin, UserRole.audit_steward, UserRole.partner_org])),
 ):
     return get_impact_summary(db)
@@ -21,7 +24,7 @@ def impact_summary(
 
 @router.get("/impact/opportunity-map")
 def impact_opportunity_map(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _user=Depends(require_role([UserRole.admin, UserRole.audit_steward, UserRole.partner_org])),
 ):
     return {"states": get_opportunity_map(db)}
@@ -36,7 +39,34 @@ def platform_capabilities(
 
 @router.get("/impact/housing-summary")
 def impact_housing_summary(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _user=Depends(require_role([UserRole.admin, UserRole.audit_steward, UserRole.partner_org])),
 ):
     return get_housing_summary(db)
+
+
+@router.get("/impact/trends")
+def impact_trends(
+    grain: str = Query(default=GRAIN_WEEK),
+    state: str | None = Query(default=None),
+    start: date | None = Query(default=None),
+    end: date | None = Query(default=None),
+    db: Session = Depends(get_read_db),
+    _user=Depends(require_role([UserRole.admin, UserRole.audit_steward, UserRole.partner_org])),
+):
+    return {
+        "grain": grain,
+        "state": state,
+        "series": get_impact_trends(db, grain=grain, state_of_residence=state, start=start, end=end),
+    }
+
+
+@router.post("/impact/rollups/refresh")
+def impact_rollups_refresh(
+    full: bool = Query(default=False),
+    db: Session = Depends(get_db),
+    _user=Depends(require_role([UserRole.admin])),
+):
+    result = refresh_impact_rollups(db, full=full)
+    db.commit()
+    return result
@@ -1,13 +1,23 @@
+import io
 from datetime import datetime, timezone
+from pathlib import PurePath
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from auth.dependencies import get_current_user
-from db.session import get_db
-from app.services.lead_intelligence_service import ingest_leads, score_property_lead
+from auth.dependencies import get_current_user, require_role
+from db.session import SessionLocal, get_db
+from app.models.users import UserRole
+from app.services.lead_connector_service import connector_states, run_lead_connectors
+from app.services.lead_intelligence_service import (
+    bulk_ingest_leads,
+    ingest_leads,
+    iter_lead_file,
+    score_property_lead,
+)
+from app.services.lead_scoring_service import SCORE_THRESHOLD, rescore_leads
 
 
 router = APIRouter(prefix="/leads/intelligence", tags=["Lead Intelligence"])
@@ -23,6 +33,16 @@ class LeadScoreRequest(BaseModel):
     lead_id: UUID
 
 
+class ConnectorRunRequest(BaseModel):
+    connectors: list[str] | None = None
+
+
+class LeadRescoreRequest(BaseModel):
+    lead_ids: list[UUID] | None = None
+    create_cases: bool = False
+    threshold: float = SCORE_THRESHOLD
+
+
 @router.post("/ingest")
 def ingest(
     request: LeadIngestRequest,
@@ -43,6 +63,42 @@ def score(
     return score_property_lead(db, lead_id=request.lead_id)
 
 
+@router.post("/rescore")
+def rescore(
+    request: LeadRescoreRequest,
+    db: Session = Depends(get_db),
+    user=Depends(require_role([UserRole.admin])),
+):
+    """Score every lead (or the given ones) in batches; optionally convert qualifying leads."""
+    result = rescore_leads(
+        db,
+        lead_ids=request.lead_ids,
+        actor_id=user.id if request.create_cases else None,
+        threshold=request.threshold,
+    )
+    db.commit()
+    return result
+
+
+@router.get("/connectors")
+def list_connectors(
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    _ = user
+    return {"connectors": connector_states(db)}
+
+
+@router.post("/connectors/run")
+def run_connectors(
+    request: ConnectorRunRequest,
+    user=Depends(require_role([UserRole.admin])),
+):
+    """Run the given connectors (default: all) concurrently; each commits in its own session."""
+    _ = user
+    return run_lead_connectors(SessionLocal, names=request.connectors)
+
+
 @router.post("/ingest-csv")
 def ingest_csv(
     source_name: str,
@@ -53,3 +109,32 @@ def ingest_csv(
     _ = user
     sample = [{"property_address": "400 Cedar St", "city": "Dallas", "state": "TX", "foreclosure_stage": "pre_foreclosure", "auction_date": datetime.now(timezone.utc)}]
     return ingest_leads(db, source_name=source_name, source_type=source_type, leads=sample)
+
+
+@router.post("/ingest-file")
+def ingest_file(
+    source_name: str,
+    source_type: str,
+    file_format: str | None = None,
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    """Bulk-load a CSV or NDJSON lead export, reading it as it is parsed."""
+    _ = user
+    file_format = file_format or PurePath(file.filename or "").suffix.lstrip(".")
+    if file_format.lower() not in ("csv", "ndjson", "jsonl"):
+        raise HTTPException(status_code=400, detail="CSV or NDJSON file required")
+
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        result = bulk_ingest_leads(
+            db,
+            source_name=source_name,
+            source_type=source_type,
+            leads=iter_lead_file(stream, file_format),
+        )
+    finally:
+        stream.detach()
+    db.commit()
+    return result
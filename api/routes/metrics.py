@@ -0,0 +1,23 @@
+import os
+import secrets
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from app.services.metrics import render_metrics
+from db.session import SessionLocal
+
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def prometheus_metrics(authorization: str | None = Header(default=None)):
+    # Scrapers authenticate with a static bearer token when METRICS_TOKEN is set.
+    # Without it the endpoint is public, like most exporters: set the token, or keep
+    # /metrics off the public ingress, wherever the API is reachable from outside.
+    token = os.getenv("METRICS_TOKEN")
+    if token and not secrets.compare_digest(authorization or "", f"Bearer {token}"):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return Response(content=render_metrics(SessionLocal), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,101 @@
+import time
+from typing import Any
+from uuid import UUID, uuid4
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
+
+from auth.authorization import PolicyAuthorizer
+from auth.dependencies import get_current_user
+from db.session import get_db
+from app.models.audit_logs import AuditLog
+from app.models.users import User
+from app.services.module_dispatch_service import module_dispatch_table, record_action_latency
+from app.services.module_loader_service import DomainServiceBroker
+
+
+router = APIRouter(prefix="/modules", tags=["dynamic-modules"])
+
+# One route serves every registered module; which modules and actions exist is
+# decided by the dispatch table, so activations need neither new routes nor a restart.
+domain_broker = DomainServiceBroker()
+
+
+class ModuleActionRequest(BaseModel):
+    case_id: str | None = None
+    payload: dict[str, Any] = Field(default_factory=dict)
+
+
+@router.post("/{module_name}/actions/{action_name}")
+def invoke_module_action(
+    module_name: str,
+    action_name: str,
+    request: ModuleActionRequest,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    started = time.perf_counter()
+    live_module = module_dispatch_table(db, domain_broker.compile_module).get(module_name)
+    if not live_module:
+        raise HTTPException(status_code=404, detail="Module is not active")
+
+    if not request.case_id:
+        raise HTTPException(status_code=400, detail="case_id is required for policy authorization")
+    try:
+        case_uuid = UUID(request.case_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="case_id must be a valid UUID") from exc
+
+    # Only actions the module declares get their own metric labels; arbitrary names
+    # from the URL would grow the label set.
+    declared = action_name in live_module.routes or action_name in live_module.rejections
+    action = f"modules.{live_module.module_name}.{action_name}"
+    failed = True
+    try:
+        PolicyAuthorizer(db).require_case_action(
+            user=user,
+            case_id=request.case_id,
+            action=action,
+            metric_action=action if declared else "modules.unknown",
+        )
+
+        result = domain_broker.execute_action(
+            db,
+            module=live_module,
+            action_name=action_name,
+            payload=request.payload,
+            case_id=case_uuid,
+            actor_id=user.id,
+        )
+
+        db.add(
+            AuditLog(
+                id=uuid4(),
+                case_id=case_uuid,
+                actor_id=user.id,
+                actor_is_ai=False,
+                action_type="module_action_invoked",
+                reason_code=f"module_action:{live_module.module_name}:{action_name}",
+                before_state={
+                    "module_name": live_module.module_name,
+                    "version": live_module.version,
+                    "action": action_name,
+                },
+                after_state={"result": result},
+                policy_version_id=None,
+            )
+        )
+        db.commit()
+        failed = False
+    finally:
+        if declared:
+            record_action_latency(live_module.module_name, action_name, started, error=failed)
+
+    return {
+        "status": "success",
+        "module_name": live_module.module_name,
+        "version": live_module.version,
+        "action": action_name,
+        "result": result,
+    }
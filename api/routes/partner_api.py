@@ -2,10 +2,12 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
 
-from auth.dependencies import require_role
+from auth.dependencies import require_role, require_role_async
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from db.session import get_db
+from db.session import get_async_db, get_db
 from app.models.cases import Case
 from app.models.documents import Document
 from app.models.users import UserRole
@@ -16,12 +18,12 @@ router = APIRouter(prefix="/partner/v1", tags=["Partner API"])
 
 
 @router.get("/cases/{case_id}/status")
-def partner_case_status(
+async def partner_case_status(
     case_id: UUID,
-    db: Session = Depends(get_db),
-    _user=Depends(require_role([UserRole.partner_org, UserRole.admin, UserRole.audit_steward])),
+    db: AsyncSession = Depends(get_async_db),
+    _user=Depends(require_role_async([UserRole.partner_org, UserRole.admin, UserRole.audit_steward])),
 ):
-    case = db.query(Case).filter(Case.id == case_id).first()
+    case = (await db.execute(select(Case).where(Case.id == case_id))).scalar_one_or_none()
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
     return {
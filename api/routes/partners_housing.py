@@ -1,16 +1,26 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, Field
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from auth.authorization import PolicyAuthorizer
-from auth.dependencies import get_current_user
-from db.session import get_db
+from auth.dependencies import get_current_user, get_current_user_async, require_role
+from db.session import get_async_db, get_db
 from app.models.audit_logs import AuditLog
 from app.models.cases import Case
 from app.models.housing_intelligence import ForeclosureCaseData, PartnerOrganization, PartnerReferral
-from app.services.partner_routing_service import route_case_to_partner
+from app.models.users import UserRole
+from app.services.case_detail_service import get_case_detail
+from app.services.case_search_service import MAX_PAGE_SIZE, search_case_ids
+from app.services.partner_routing_service import (
+    MAX_BULK_ROUTING_CASES,
+    partner_routing_index,
+    route_case_to_partner,
+    route_cases_to_partners,
+)
 
 
 router = APIRouter(prefix="/partners", tags=["Housing Partner Routing"])
@@ -22,6 +32,10 @@ class RouteCaseRequest(BaseModel):
     routing_category: str
 
 
+class BulkRouteCasesRequest(BaseModel):
+    cases: list[RouteCaseRequest] = Field(min_length=1, max_length=MAX_BULK_ROUTING_CASES)
+
+
 class WorkspaceRouteCaseRequest(BaseModel):
     partner_organization_id: UUID | None = None
     state: str
@@ -54,32 +68,55 @@ def route_case(
     }
 
 
-@router.get("/workspace/cases")
-def get_partner_routing_workspace_cases(
+@router.post("/route-cases/bulk")
+def route_cases_bulk(
+    request: BulkRouteCasesRequest,
     db: Session = Depends(get_db),
-    user=Depends(get_current_user),
+    user=Depends(require_role([UserRole.admin, UserRole.referral_coordinator])),
 ):
-    _ = user
-    rows = (
-        db.query(Case, ForeclosureCaseData)
-        .join(ForeclosureCaseData, ForeclosureCaseData.case_id == Case.id)
-        .order_by(Case.created_at.desc())
-        .limit(200)
-        .all()
+    # Bulk routing is limited to coordinator roles instead of a per-case policy check.
+    referrals = route_cases_to_partners(
+        db,
+        cases=[item.model_dump() for item in request.cases],
+        actor_id=user.id,
     )
+    db.commit()
+    return {"routed": len(referrals), "referrals": referrals}
 
-    case_ids = [case.id for case, _profile in rows]
-    routed_case_ids = {
-        row[0]
-        for row in db.query(PartnerReferral.case_id)
-        .filter(PartnerReferral.case_id.in_(case_ids))
-        .all()
+
+@router.get("/routing-index")
+def get_partner_routing_index(
+    db: Session = Depends(get_db),
+    _user=Depends(require_role([UserRole.admin, UserRole.referral_coordinator])),
+):
+    index = partner_routing_index(db)
+    return {"partners": index.snapshot()}
+
+
+@router.get("/workspace/cases")
+async def get_partner_routing_workspace_cases(
+    search: str | None = None,
+    limit: int = Query(default=MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user_async),
+):
+    _ = user
+    # The index already excludes cases that have been routed to a partner.
+    case_ids = await db.run_sync(
+        lambda session: search_case_ids(session, query=search, workspace="partner_routing", limit=limit, offset=offset)
+    )
+    by_id = {
+        case.id: (case, profile)
+        for case, profile in await db.execute(
+            select(Case, ForeclosureCaseData)
+            .join(ForeclosureCaseData, ForeclosureCaseData.case_id == Case.id)
+            .where(Case.id.in_(case_ids))
+        )
     }
 
     items = []
-    for case, profile in rows:
-        if case.id in routed_case_ids:
-            continue
+    for case, profile in (by_id[case_id] for case_id in case_ids if case_id in by_id):
         items.append(
             {
                 "case_id": str(case.id),
@@ -101,10 +138,10 @@ def get_partner_routing_workspace_case_detail(
     user=Depends(get_current_user),
 ):
     _ = user
-    case = db.query(Case).filter(Case.id == case_id).first()
-    profile = db.query(ForeclosureCaseData).filter(ForeclosureCaseData.case_id == case_id).first()
-    if not case or not profile:
+    detail = get_case_detail(db, case_id)
+    if not detail or not detail["foreclosure_profile"]:
         raise HTTPException(status_code=404, detail="Routing case not found")
+    case, profile = detail["case"], detail["foreclosure_profile"]
 
     partners = (
         db.query(PartnerOrganization)
@@ -112,26 +149,18 @@ def get_partner_routing_workspace_case_detail(
         .limit(250)
         .all()
     )
-    referrals = (
-        db.query(PartnerReferral, PartnerOrganization)
-        .join(PartnerOrganization, PartnerOrganization.id == PartnerReferral.partner_organization_id)
-        .filter(PartnerReferral.case_id == case_id)
-        .order_by(PartnerReferral.created_at.desc())
-        .limit(20)
-        .all()
-    )
 
     return {
         "case": {
-            "case_id": str(case.id),
-            "status": case.status.value if case.status else None,
-            "property_address": profile.property_address,
-            "city": profile.city,
-            "state": profile.state,
-            "foreclosure_stage": profile.foreclosure_stage,
-            "loan_balance": profile.loan_balance,
-            "estimated_property_value": profile.estimated_property_value,
-            "arrears_amount": profile.arrears_amount,
+            "case_id": case["id"],
+            "status": case["status"],
+            "property_address": profile["property_address"],
+            "city": profile["city"],
+            "state": profile["state"],
+            "foreclosure_stage": profile["foreclosure_stage"],
+            "loan_balance": profile["loan_balance"],
+            "estimated_property_value": profile["estimated_property_value"],
+            "arrears_amount": profile["arrears_amount"],
         },
         "partner_options": [
             {
@@ -142,17 +171,7 @@ def get_partner_routing_workspace_case_detail(
             }
             for partner in partners
         ],
-        "referral_history": [
-            {
-                "partner_referral_id": str(referral.id),
-                "partner_name": partner.name,
-                "routing_category": referral.routing_category,
-                "status": referral.status,
-                "notes": referral.notes,
-                "created_at": referral.created_at.isoformat() if referral.created_at else None,
-            }
-            for referral, partner in referrals
-        ],
+        "referral_history": detail["referrals"],
     }
 
 
@@ -1,6 +1,6 @@
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -9,7 +9,11 @@ from db.session import get_db
 from app.models.audit_logs import AuditLog
 from app.models.cases import Case
 from app.models.housing_intelligence import ForeclosureCaseData
-from app.services.skiptrace_service import skiptrace_case_owner
+from app.models.skiptrace import SkiptraceBatch
+from app.services.case_detail_service import get_case_detail
+from app.services.case_search_service import MAX_PAGE_SIZE, search_case_ids
+from app.services.skiptrace_batch_service import skiptrace_batch_summary, skiptrace_cases, submit_skiptrace_batch
+from app.services.skiptrace_service import provider_stats_snapshot, waterfall_order
 
 
 router = APIRouter(prefix="/skiptrace", tags=["Skiptrace Workspace"])
@@ -19,6 +23,11 @@ class SkiptraceActionRequest(BaseModel):
     provider: str = "batchdata"
 
 
+class SkiptraceBatchRequest(BaseModel):
+    case_ids: list[UUID]
+    provider: str = "batchdata"
+
+
 class ConfirmSkiptraceRequest(BaseModel):
     owner_name: str | None = None
     phone: str | None = None
@@ -28,33 +37,25 @@ class ConfirmSkiptraceRequest(BaseModel):
 @router.get("/workspace/cases")
 def get_skiptrace_workspace_cases(
     search: str | None = None,
+    limit: int = Query(default=MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
     _ = user
+    case_ids = search_case_ids(db, query=search, workspace="skiptrace", limit=limit, offset=offset)
     rows = (
         db.query(Case, ForeclosureCaseData)
         .join(ForeclosureCaseData, ForeclosureCaseData.case_id == Case.id)
-        .order_by(Case.created_at.desc())
-        .limit(200)
+        .filter(Case.id.in_(case_ids))
         .all()
     )
+    by_id = {case.id: (case, profile) for case, profile in rows}
 
-    normalized_search = (search or "").strip().lower()
     items = []
-    for case, profile in rows:
+    for case, profile in (by_id[case_id] for case_id in case_ids if case_id in by_id):
         address = (profile.property_address or "").strip()
         owner_hint = ((case.meta or {}).get("full_name") or (case.meta or {}).get("owner_name") or "").strip()
-        if normalized_search:
-            haystack = " ".join([
-                str(case.id),
-                address,
-                profile.city or "",
-                profile.state or "",
-                owner_hint,
-            ]).lower()
-            if normalized_search not in haystack:
-                continue
         items.append(
             {
                 "case_id": str(case.id),
@@ -77,42 +78,34 @@ def get_skiptrace_workspace_case_detail(
     user=Depends(get_current_user),
 ):
     _ = user
-    case = db.query(Case).filter(Case.id == case_id).first()
-    profile = db.query(ForeclosureCaseData).filter(ForeclosureCaseData.case_id == case_id).first()
-    if not case or not profile:
+    detail = get_case_detail(db, case_id)
+    if not detail or not detail["foreclosure_profile"]:
         raise HTTPException(status_code=404, detail="Skiptrace case not found")
+    case, profile, logs = detail["case"], detail["foreclosure_profile"], detail["skiptrace_history"]
 
-    logs = (
-        db.query(AuditLog)
-        .filter(AuditLog.case_id == case_id)
-        .filter(AuditLog.action_type.in_(["skiptrace_run", "skiptrace_retry", "skiptrace_confirmed"]))
-        .order_by(AuditLog.created_at.desc())
-        .limit(20)
-        .all()
-    )
-
-    latest_result = next((row for row in logs if row.action_type in {"skiptrace_run", "skiptrace_retry"}), None)
-    current_result = (latest_result.after_state or {}).get("result") if latest_result else None
+    latest_result = next((row for row in logs if row["action_type"] in {"skiptrace_run", "skiptrace_retry"}), None)
+    current_result = (latest_result["after_state"] or {}).get("result") if latest_result else None
+    meta = case["meta"] or {}
 
     return {
-        "case_id": str(case.id),
+        "case_id": case["id"],
         "property": {
-            "address": profile.property_address,
-            "city": profile.city,
-            "state": profile.state,
-            "zip_code": profile.zip_code,
-            "foreclosure_stage": profile.foreclosure_stage,
+            "address": profile["property_address"],
+            "city": profile["city"],
+            "state": profile["state"],
+            "zip_code": profile["zip_code"],
+            "foreclosure_stage": profile["foreclosure_stage"],
         },
-        "owner_hint": ((case.meta or {}).get("full_name") or (case.meta or {}).get("owner_name")),
+        "owner_hint": meta.get("full_name") or meta.get("owner_name"),
         "current_result": current_result,
         "history": [
             {
-                "created_at": row.created_at.isoformat() if row.created_at else None,
-                "action_type": row.action_type,
-                "reason_code": row.reason_code,
-                "provider": (row.after_state or {}).get("provider"),
-                "result": (row.after_state or {}).get("result") if row.action_type in {"skiptrace_run", "skiptrace_retry"} else None,
-                "confirmed_contact": (row.after_state or {}).get("confirmed_contact") if row.action_type == "skiptrace_confirmed" else None,
+                "created_at": row["created_at"],
+                "action_type": row["action_type"],
+                "reason_code": row["reason_code"],
+                "provider": (row["after_state"] or {}).get("provider"),
+                "result": (row["after_state"] or {}).get("result") if row["action_type"] in {"skiptrace_run", "skiptrace_retry"} else None,
+                "confirmed_contact": (row["after_state"] or {}).get("confirmed_contact") if row["action_type"] == "skiptrace_confirmed" else None,
             }
             for row in logs
         ],
@@ -130,20 +123,17 @@ def run_skiptrace(
     if not profile:
         raise HTTPException(status_code=404, detail="Skiptrace case not found")
 
-    result = skiptrace_case_owner(case_id=case_id, address=profile.property_address, provider=request.provider)
-    db.add(
-        AuditLog(
-            id=uuid4(),
-            case_id=case_id,
-            actor_id=user.id,
-            actor_is_ai=False,
-            action_type="skiptrace_run",
-            reason_code="skiptrace_lookup_started",
-            before_state={},
-            after_state={"provider": request.provider, "result": result},
-            policy_version_id=None,
-        )
+    outcome = skiptrace_cases(
+        db,
+        case_ids=[case_id],
+        provider=request.provider,
+        actor_id=user.id,
+        action_type="skiptrace_run",
+        reason_code="skiptrace_lookup_started",
     )
+    result = outcome["results"].get(str(case_id))
+    if result is None:
+        raise HTTPException(status_code=502, detail=outcome["errors"].get(str(case_id), "Skiptrace lookup failed"))
     db.commit()
 
     return {"case_id": str(case_id), "provider": request.provider, "result": result}
@@ -160,25 +150,52 @@ def retry_skiptrace(
     if not profile:
         raise HTTPException(status_code=404, detail="Skiptrace case not found")
 
-    result = skiptrace_case_owner(case_id=case_id, address=profile.property_address, provider=request.provider)
-    db.add(
-        AuditLog(
-            id=uuid4(),
-            case_id=case_id,
-            actor_id=user.id,
-            actor_is_ai=False,
-            action_type="skiptrace_retry",
-            reason_code="skiptrace_lookup_retried",
-            before_state={},
-            after_state={"provider": request.provider, "result": result},
-            policy_version_id=None,
-        )
+    outcome = skiptrace_cases(
+        db,
+        case_ids=[case_id],
+        provider=request.provider,
+        actor_id=user.id,
+        action_type="skiptrace_retry",
+        reason_code="skiptrace_lookup_retried",
     )
+    result = outcome["results"].get(str(case_id))
+    if result is None:
+        raise HTTPException(status_code=502, detail=outcome["errors"].get(str(case_id), "Skiptrace lookup failed"))
     db.commit()
 
     return {"case_id": str(case_id), "provider": request.provider, "result": result}
 
 
+@router.post("/batches")
+def create_skiptrace_batch(
+    request: SkiptraceBatchRequest,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    batch = submit_skiptrace_batch(db, case_ids=request.case_ids, provider=request.provider, actor_id=user.id)
+    db.commit()
+    return skiptrace_batch_summary(batch)
+
+
+@router.get("/batches/{batch_id}")
+def get_skiptrace_batch(
+    batch_id: UUID,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    _ = user
+    batch = db.get(SkiptraceBatch, batch_id)
+    if not batch:
+        raise HTTPException(status_code=404, detail="Skiptrace batch not found")
+    return skiptrace_batch_summary(batch)
+
+
+@router.get("/providers/stats")
+def get_skiptrace_provider_stats(user=Depends(get_current_user)):
+    _ = user
+    return {"waterfall_order": waterfall_order(), "providers": provider_stats_snapshot()}
+
+
 @router.post("/workspace/cases/{case_id}/actions/confirm")
 def confirm_skiptrace_result(
     case_id: UUID,
@@ -7,7 +7,8 @@ from db.session import get_db
 from app.services.foreclosure_intelligence_service import calculate_case_priority, create_foreclosure_profile
 from app.services.partner_routing_service import route_case_to_partner
 from app.services.essential_worker_housing_service import discover_housing_programs, upsert_worker_profile
-from app.services.lead_intelligence_service import ingest_leads, weekly_foreclosure_scan
+from app.services.lead_connector_service import weekly_foreclosure_scan
+from app.services.lead_intelligence_service import ingest_leads
 from app.services.skiptrace_service import skiptrace_property_owner
 from app.services.property_analysis_service import (
     calculate_acquisition_score,
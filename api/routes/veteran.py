@@ -1,17 +1,18 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from app.models.audit_logs import AuditLog
 from app.models.cases import Case
 from app.models.enums import CaseStatus
 from app.models.policy_versions import PolicyVersion
-from app.models.veteran_intelligence import BenefitProgress, VeteranProfile
+from app.models.veteran_intelligence import VeteranProfile
 from app.schemas.application import ApplicationCreate
 from app.services.action_payload_builder import ActionExecutionContext, build_action_payload
 from app.services.application_service import submit_application
+from app.services.case_detail_service import get_case_detail
+from app.services.case_search_service import MAX_PAGE_SIZE, search_case_ids
 from app.services.veteran_intelligence_service import (
     calculate_benefit_value,
     generate_action_plan,
@@ -138,17 +139,22 @@ def submit_public_veteran_intake(
 
 @router.get("/workspace/cases")
 def get_veteran_workspace_cases(
+    search: str | None = None,
+    limit: int = Query(default=MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
     _ = user
-    rows = (
-        db.query(Case, VeteranProfile)
+    case_ids = search_case_ids(db, query=search, workspace="veteran", limit=limit, offset=offset)
+    by_id = {
+        case.id: (case, profile)
+        for case, profile in db.query(Case, VeteranProfile)
         .join(VeteranProfile, VeteranProfile.case_id == Case.id)
-        .order_by(Case.created_at.desc())
-        .limit(200)
+        .filter(Case.id.in_(case_ids))
         .all()
-    )
+    }
+    rows = [by_id[case_id] for case_id in case_ids if case_id in by_id]
 
     return [
         {
@@ -171,61 +177,33 @@ def get_veteran_workspace_case_detail(
     user=Depends(get_current_user),
 ):
     _ = user
-    case = db.query(Case).filter(Case.id == case_id).first()
-    profile = db.query(VeteranProfile).filter(VeteranProfile.case_id == case_id).first()
-    if not case or not profile:
+    detail = get_case_detail(db, case_id)
+    if not detail or not detail["veteran_profile"]:
         raise HTTPException(status_code=404, detail="Veteran case not found")
-
-    audits = (
-        db.query(AuditLog)
-        .filter(AuditLog.case_id == case_id)
-        .order_by(AuditLog.created_at.desc())
-        .limit(10)
-        .all()
-    )
-    progress = (
-        db.query(BenefitProgress)
-        .filter(BenefitProgress.case_id == case_id)
-        .order_by(BenefitProgress.updated_at.desc())
-        .all()
-    )
+    case, profile = detail["case"], detail["veteran_profile"]
 
     return {
-        "case_id": str(case.id),
-        "status": case.status.value if case.status else None,
-        "created_at": case.created_at.isoformat() if case.created_at else None,
-        "meta": case.meta or {},
+        "case_id": case["id"],
+        "status": case["status"],
+        "created_at": case["created_at"],
+        "meta": case["meta"] or {},
         "profile": {
-            "branch_of_service": profile.branch_of_service,
-            "years_of_service": profile.years_of_service,
-            "discharge_status": profile.discharge_status,
-            "disability_rating": profile.disability_rating,
-            "permanent_and_total_status": profile.permanent_and_total_status,
-            "combat_service": profile.combat_service,
-            "dependent_status": profile.dependent_status,
-            "state_of_residence": profile.state_of_residence,
-            "homeowner_status": profile.homeowner_status,
-            "mortgage_status": profile.mortgage_status,
-            "foreclosure_risk": profile.foreclosure_risk,
-            "income_level": profile.income_level,
+            "branch_of_service": profile["branch_of_service"],
+            "years_of_service": profile["years_of_service"],
+            "discharge_status": profile["discharge_status"],
+            "disability_rating": profile["disability_rating"],
+            "permanent_and_total_status": profile["permanent_and_total_status"],
+            "combat_service": profile["combat_service"],
+            "dependent_status": profile["dependent_status"],
+            "state_of_residence": profile["state_of_residence"],
+            "homeowner_status": profile["homeowner_status"],
+            "mortgage_status": profile["mortgage_status"],
+            "foreclosure_risk": profile["foreclosure_risk"],
+            "income_level": profile["income_level"],
         },
-        "benefit_progress": [
-            {
-                "benefit_name": row.benefit_name,
-                "status": row.status,
-                "status_notes": row.status_notes,
-                "updated_at": row.updated_at.isoformat() if row.updated_at else None,
-            }
-            for row in progress
-        ],
-        "audit_log": [
-            {
-                "created_at": row.created_at.isoformat() if row.created_at else None,
-                "action_type": row.action_type,
-                "reason_code": row.reason_code,
-            }
-            for row in audits
-        ],
+        "benefit_progress": detail["benefit_progress"],
+        "documents": detail["documents"],
+        "audit_log": detail["recent_audits"],
     }
 
 
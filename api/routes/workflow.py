@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from auth.dependencies import require_role
-from db.session import get_db
+from db.session import get_db, get_read_db
 from app.models.cases import Case
 from app.models.users import UserRole
 from app.models.workflow import WorkflowOverrideCategory
@@ -30,9 +30,9 @@ def foreclosure_kanban(db: Session = Depends(get_db)):
 @router.get("/workflow/analytics/foreclosure")
 def foreclosure_workflow_analytics(
     sla_days: int = 30,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
-    payload = get_workflow_analytics(db=db, sla_days=sla_days)
+    payload = get_workflow_analytics(db=db, default_sla_days=sla_days)
     db.commit()
     return payload
 
@@ -51,7 +51,7 @@ def report_stage_distribution(db: Session = Depends(get_db)):
 
 
 @router.get("/workflow/reports/time-per-stage")
-def report_time_per_stage(db: Session = Depends(get_db)):
+def report_time_per_stage(db: Session = Depends(get_read_db)):
     analytics = get_workflow_analytics(db)
     payload = {
         "avg_days_per_stage": analytics["portfolio"]["avg_days_per_stage"]
@@ -61,7 +61,7 @@ def report_time_per_stage(db: Session = Depends(get_db)):
 
 
 @router.get("/workflow/reports/block-reasons")
-def report_block_reasons(db: Session = Depends(get_db)):
+def report_block_reasons(db: Session = Depends(get_read_db)):
     analytics = get_workflow_analytics(db)
     payload = {
         "block_reason_frequency": analytics["portfolio"]["block_reason_frequency"]
@@ -71,7 +71,7 @@ def report_block_reasons(db: Session = Depends(get_db)):
 
 
 @router.get("/workflow/reports/sla-breaches")
-def report_sla_breaches(db: Session = Depends(get_db)):
+def report_sla_breaches(db: Session = Depends(get_read_db)):
     analytics = get_workflow_analytics(db)
     payload = {
         "sla_breach_count": analytics["portfolio"]["sla_breach_count"],
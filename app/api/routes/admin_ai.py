@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 
 from app.schemas.ai_orchestration import AIExecuteRequest, AIMessageRequest, AIVoiceResponse
 from app.services.ai_orchestration_service import advisory_message, handle_mufasa_prompt, process_voice
+from app.services.llm_gateway import llm_gateway
 from app.models.users import User, UserRole
 from auth.dependencies import require_role
 from db.session import get_db
@@ -79,4 +80,13 @@ async def ai_voice(
         audio_bytes=payload,
         confirm_phrase=confirm_phrase,
         user=current_user,
-    )
\ No newline at end of file
+    )
+
+
+@router.get(
+    "/llm-gateway",
+    dependencies=[Depends(require_role([UserRole.admin]))],
+)
+def llm_gateway_stats():
+    gateway = llm_gateway()
+    return gateway.stats() if gateway is not None else {"backend": None}
@@ -10,8 +10,12 @@ from app.services.admin_dashboard_service import (
     memberships_below_stability,
     memberships_with_missed_installments,
 )
+from app.services.case_detail_service import case_detail_cache_stats
+from app.services.module_dispatch_service import module_action_stats, module_dispatch_table
+from app.services.module_loader_service import DomainServiceBroker
+from app.services.stability_service import bulk_recalculate_stability
 from auth.dependencies import require_role
-from db.session import get_db
+from db.session import get_db, get_read_db
 from app.models.users import User, UserRole
 
 
@@ -28,7 +32,7 @@ def get_memberships(
     status: str | None = None,
     limit: int = 100,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     return list_memberships(db, program_key=program_key, status=status, limit=limit, offset=offset)
 
@@ -44,7 +48,7 @@ def get_below_stability(
     status: str = "active",
     limit: int = 100,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     return memberships_below_stability(
         db,
@@ -66,7 +70,7 @@ def get_missed_installments(
     status: str = "active",
     limit: int = 100,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     return memberships_with_missed_installments(
         db,
@@ -84,6 +88,37 @@ def get_missed_installments(
 )
 def get_membership(
     membership_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     return get_membership_detail(db, membership_id)
+
+
+@router.post(
+    "/memberships/stability/recalculate",
+    dependencies=[Depends(require_role([UserRole.admin]))],
+)
+def recalculate_membership_stability(
+    program_key: str | None = None,
+    recount: bool = True,
+    db: Session = Depends(get_db),
+):
+    rescored = bulk_recalculate_stability(db, program_key=program_key, recount=recount)
+    db.commit()
+    return {"memberships_rescored": rescored}
+
+
+@router.get(
+    "/cache/case-details",
+    dependencies=[Depends(require_role([UserRole.admin]))],
+)
+def get_case_detail_cache_stats():
+    return case_detail_cache_stats()
+
+
+@router.get(
+    "/modules/dispatch",
+    dependencies=[Depends(require_role([UserRole.admin]))],
+)
+def get_module_dispatch_table(db: Session = Depends(get_db)):
+    table = module_dispatch_table(db, DomainServiceBroker().compile_module)
+    return {"modules": table.snapshot(), "actions": module_action_stats()}
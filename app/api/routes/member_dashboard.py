@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.member_dashboard import MemberDashboardResponse
 from app.services.member_dashboard_service import get_member_dashboard
-from auth.dependencies import get_current_user
-from db.session import get_db
+from auth.dependencies import get_current_user_async
+from db.session import get_async_db
 from app.models.users import User
 
 
@@ -12,8 +12,8 @@ router = APIRouter(tags=["member"])
 
 
 @router.get("/member/dashboard", response_model=MemberDashboardResponse)
-def read_member_dashboard(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+async def read_member_dashboard(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
 ):
-    return get_member_dashboard(db, current_user.id)
+    return await db.run_sync(get_member_dashboard, current_user.id)
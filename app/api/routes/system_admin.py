@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from db.session import get_db
+from auth.dependencies import require_role
+from db.session import db_pool_status, get_db
 from verification.engine import VerificationEngine
-from app.services.escalation_service import run_daily_risk_evaluation
+from app.models.users import UserRole
+from app.services.scheduled_jobs_service import enqueue_job, job_run_history, latest_job_runs
+from app.services.sql_profiler import reset_route_query_stats, route_query_stats
 
 
 router = APIRouter(prefix="/admin/system", tags=["system-verification"])
@@ -25,7 +28,37 @@ def list_phase_statuses(db: Session = Depends(get_db)):
 
 
 @router.post("/run-daily-risk-evaluation")
-def run_daily_risk_scan(db: Session = Depends(get_db)):
-    summary = run_daily_risk_evaluation(db)
-    db.commit()
-    return {"status": "ok", "summary": summary}
+def run_daily_risk_scan():
+    # Queued for the batch workers; follow it through /admin/system/jobs/risk_evaluation/runs.
+    return {"status": "ok", **enqueue_job("risk_evaluation")}
+
+
+@router.get("/jobs", dependencies=[Depends(require_role([UserRole.admin]))])
+def list_scheduled_jobs(db: Session = Depends(get_db)):
+    return {"jobs": latest_job_runs(db)}
+
+
+@router.get("/jobs/{job_name}/runs", dependencies=[Depends(require_role([UserRole.admin]))])
+def list_job_runs(job_name: str, limit: int = 50, db: Session = Depends(get_db)):
+    return {"job": job_name, "runs": job_run_history(db, job_name, limit=limit)}
+
+
+@router.post("/jobs/{job_name}/enqueue", dependencies=[Depends(require_role([UserRole.admin]))])
+def enqueue_scheduled_job(job_name: str):
+    return enqueue_job(job_name)
+
+
+@router.get("/db-pools", dependencies=[Depends(require_role([UserRole.admin]))])
+def get_db_pool_status():
+    return db_pool_status()
+
+
+@router.get("/sql-profile", dependencies=[Depends(require_role([UserRole.admin]))])
+def get_sql_profile():
+    return route_query_stats()
+
+
+@router.delete("/sql-profile", dependencies=[Depends(require_role([UserRole.admin]))])
+def reset_sql_profile():
+    reset_route_query_stats()
+    return {"status": "reset"}
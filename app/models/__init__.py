@@ -49,6 +49,8 @@ from .member_layer import (
     ContributionCredit,
     MemberCheckin,
     StabilityAssessment,
+    MembershipActivity,
+    MembershipStabilityCounters,
     CreditType,
     CheckinType,
 )
@@ -63,6 +65,14 @@ from .housing_intelligence import ForeclosureCaseData, PartnerOrganization, Part
 
 from .essential_worker import EssentialWorkerProfile, EssentialWorkerBenefitMatch
 
-from .lead_intelligence import LeadSource, PropertyLead, LeadScore
+from .lead_intelligence import LeadSource, PropertyLead, LeadScore, LeadConnectorState
 
 from .ai_command_logs import AICommandLog
+
+from .impact_rollups import ImpactRollup, RollupWatermark
+
+from .risk_evaluation_runs import RiskEvaluationRun
+from .job_runs import JobRun
+from .stripe_webhook_events import StripeWebhookEvent
+from .case_search_index import CaseSearchIndex
+from .skiptrace import SkiptraceBatch, SkiptraceCacheEntry
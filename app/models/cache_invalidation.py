@@ -0,0 +1,27 @@
+import importlib
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+def invalidate_after_transaction(model: type, invalidate: str) -> None:
+    """Call ``invalidate`` ("module:function") once a session that wrote ``model`` ends.
+
+    It also runs after a rollback, since the cached state may have been built
+    from the discarded rows. The function is imported when it runs because the
+    services holding these caches import the models.
+    """
+    flag = f"{invalidate}.stale"
+
+    def collect_writes(session, flush_context):
+        if any(isinstance(obj, model) for obj in (*session.new, *session.dirty, *session.deleted)):
+            session.info[flag] = True
+
+    def run_invalidation(session):
+        if session.info.pop(flag, False):
+            module_name, function_name = invalidate.split(":")
+            getattr(importlib.import_module(module_name), function_name)()
+
+    event.listen(Session, "after_flush", collect_writes)
+    event.listen(Session, "after_commit", run_invalidation)
+    event.listen(Session, "after_rollback", run_invalidation)
@@ -0,0 +1,51 @@
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from app.models.audit_logs import AuditLog
+from app.models.cases import Case
+from app.models.documents import Document
+from app.models.housing_intelligence import ForeclosureCaseData, PartnerOrganization, PartnerReferral
+from app.models.veteran_intelligence import BenefitProgress, VeteranProfile
+
+
+CASE_SCOPED_MODELS = (AuditLog, Document, ForeclosureCaseData, VeteranProfile, BenefitProgress, PartnerReferral)
+
+
+# Cached case details are dropped once the writes that touched them commit; until
+# then the case is marked stale so reads in the writing transaction skip the cache.
+@event.listens_for(Session, "after_flush")
+def _collect_case_detail_writes(session, flush_context):
+    case_ids = set()
+    renamed_partner_ids = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Case):
+            case_ids.add(obj.id)
+        elif isinstance(obj, CASE_SCOPED_MODELS):
+            case_ids.add(obj.case_id)
+    # Details show the partner's name on each referral; new partners have none yet.
+    for obj in session.dirty:
+        if isinstance(obj, PartnerOrganization) and inspect(obj).attrs.name.history.has_changes():
+            renamed_partner_ids.add(obj.id)
+    if renamed_partner_ids:
+        case_ids.update(
+            session.connection().scalars(
+                select(PartnerReferral.case_id).where(PartnerReferral.partner_organization_id.in_(renamed_partner_ids))
+            )
+        )
+    from app.services.case_detail_service import mark_case_details_stale
+
+    mark_case_details_stale(session, case_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_case_details_after_commit(session):
+    case_ids = session.info.pop("case_detail_stale_ids", None)
+    if case_ids:
+        from app.services.case_detail_service import invalidate_case_details
+
+        invalidate_case_details(case_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_case_detail_writes(session):
+    session.info.pop("case_detail_stale_ids", None)
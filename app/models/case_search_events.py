@@ -0,0 +1,41 @@
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.models.cases import Case
+from app.models.housing_intelligence import ForeclosureCaseData, PartnerReferral
+from app.models.veteran_intelligence import VeteranProfile
+
+
+SEARCHABLE_CASE_KEYS = ("meta", "created_at")
+
+
+# Keep case_search_index in step with case, profile and routing writes. The refresh
+# runs on the flushing connection so it commits or rolls back with the write.
+@event.listens_for(Session, "after_flush")
+def _refresh_case_search_index_after_flush(session, flush_context):
+    case_ids: set = set()
+
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Case):
+            if obj in session.deleted:
+                continue
+            if obj in session.new or _changed(obj, SEARCHABLE_CASE_KEYS):
+                case_ids.add(obj.id)
+        elif isinstance(obj, (ForeclosureCaseData, VeteranProfile, PartnerReferral)):
+            case_ids.add(obj.case_id)
+
+    if not case_ids:
+        return
+
+    connection = session.connection()
+    if connection.dialect.name != "postgresql":
+        return
+
+    from app.services.case_search_service import refresh_case_search_index
+
+    refresh_case_search_index(connection, case_ids=case_ids)
+
+
+def _changed(obj, keys) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[key].history.has_changes() for key in keys)
@@ -0,0 +1,35 @@
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class CaseSearchIndex(Base):
+    """Denormalized, searchable row per case maintained by ``case_search_events``."""
+
+    __tablename__ = "case_search_index"
+    __table_args__ = (
+        Index("ix_case_search_index_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_case_search_index_case_id_text", "case_id_text", postgresql_ops={"case_id_text": "text_pattern_ops"}),
+        Index("ix_case_search_index_case_created_at", "case_created_at", "case_id"),
+    )
+
+    case_id = Column(UUID(as_uuid=True), ForeignKey("cases.id", ondelete="CASCADE"), primary_key=True)
+    case_id_text = Column(String, nullable=False)
+
+    property_address = Column(String, nullable=True)
+    city = Column(String, nullable=True)
+    state = Column(String, nullable=True)
+    zip_code = Column(String, nullable=True)
+    owner_name = Column(String, nullable=True)
+
+    # Workspace membership: foreclosure/skiptrace, veteran, partner routing (not yet routed).
+    has_foreclosure_profile = Column(Boolean, nullable=False, default=False)
+    has_veteran_profile = Column(Boolean, nullable=False, default=False)
+    is_routed = Column(Boolean, nullable=False, default=False)
+
+    case_created_at = Column(DateTime(timezone=True), nullable=True)
+    search_text = Column(Text, nullable=False, default="")
+    search_vector = Column(TSVECTOR, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -9,8 +9,8 @@ class Document(Base):
     __tablename__ = "documents"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    case_id = Column(UUID(as_uuid=True), ForeignKey("cases.id"), nullable=False)
-    uploaded_by = Column(UUID(as_uuid=True), nullable=False)
+    case_id = Column(UUID(as_uuid=True), ForeignKey("cases.id"), nullable=False, index=True)
+    uploaded_by = Column(UUID(as_uuid=True), nullable=False, index=True)
     doc_type = Column(
         ENUM(
             DocumentType,
@@ -0,0 +1,33 @@
+from datetime import datetime
+
+from sqlalchemy import event, inspect
+
+from app.models.housing_intelligence import ForeclosureCaseData
+
+
+PRIORITY_INPUT_KEYS = ("foreclosure_stage", "arrears_amount", "homeowner_income")
+
+
+# Keep the stored priority in step with its inputs. Mapper events only touch the
+# row being written, so the score lands in the same INSERT/UPDATE statement.
+@event.listens_for(ForeclosureCaseData, "before_insert")
+def _score_priority_before_insert(mapper, connection, target):
+    _apply_priority(target)
+
+
+@event.listens_for(ForeclosureCaseData, "before_update")
+def _score_priority_before_update(mapper, connection, target):
+    state = inspect(target)
+    if any(state.attrs[key].history.has_changes() for key in PRIORITY_INPUT_KEYS):
+        _apply_priority(target)
+
+
+def _apply_priority(target: ForeclosureCaseData) -> None:
+    from app.services.foreclosure_intelligence_service import score_case_priority
+
+    target.priority_score, target.priority_tier = score_case_priority(
+        foreclosure_stage=target.foreclosure_stage,
+        arrears_amount=target.arrears_amount,
+        homeowner_income=target.homeowner_income,
+    )
+    target.priority_scored_at = datetime.utcnow()
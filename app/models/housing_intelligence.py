@@ -1,7 +1,7 @@
 from datetime import datetime
 import uuid
 
-from sqlalchemy import Column, Date, DateTime, Float, ForeignKey, String
+from sqlalchemy import Column, Date, DateTime, Float, ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from .base import Base
@@ -9,6 +9,9 @@ from .base import Base
 
 class ForeclosureCaseData(Base):
     __tablename__ = "foreclosure_case_data"
+    __table_args__ = (
+        Index("ix_foreclosure_case_data_priority", "priority_score", "case_id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     case_id = Column(UUID(as_uuid=True), ForeignKey("cases.id"), nullable=False, unique=True, index=True)
@@ -29,6 +32,12 @@ class ForeclosureCaseData(Base):
     homeowner_income = Column(Float, nullable=True)
     homeowner_hardship_reason = Column(String, nullable=True)
 
+    # Materialized by app.models.foreclosure_priority_events when stage, arrears or
+    # income change; the defaults are the score of a profile with none of them set.
+    priority_score = Column(Float, nullable=False, default=10, server_default=text("10"))
+    priority_tier = Column(String, nullable=False, default="standard", server_default=text("'standard'"))
+    priority_scored_at = Column(DateTime(timezone=True), nullable=True)
+
     created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -42,17 +51,31 @@ class PartnerOrganization(Base):
     service_region = Column(String, nullable=True)
     contact_info = Column(JSONB, nullable=True)
     api_endpoint = Column(String, nullable=True)
+    # Open referrals the partner accepts at once (None is unlimited) and its share of
+    # new referrals relative to the other partners serving the same type and region.
+    capacity = Column(Integer, nullable=True)
+    routing_weight = Column(Float, nullable=False, default=1.0, server_default=text("1"))
 
     created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
 
 
 class PartnerReferral(Base):
     __tablename__ = "partner_referrals"
+    __table_args__ = (
+        Index(
+            "ix_partner_referrals_open_partner",
+            "partner_organization_id",
+            postgresql_where=text("status IN ('queued', 'accepted', 'in_progress')"),
+        ),
+        Index("ix_partner_referrals_unassigned", "created_at", postgresql_where=text("status = 'unassigned'")),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     case_id = Column(UUID(as_uuid=True), ForeignKey("cases.id"), nullable=False, index=True)
-    partner_organization_id = Column(UUID(as_uuid=True), ForeignKey("partner_organizations.id"), nullable=False)
+    partner_organization_id = Column(UUID(as_uuid=True), ForeignKey("partner_organizations.id"), nullable=True)
     routing_category = Column(String, nullable=False)
+    # The region the case was routed for; unassigned referrals are re-routed with it.
+    routing_region = Column(String, nullable=True)
     status = Column(String, nullable=False, default="queued")
     notes = Column(String, nullable=True)
 
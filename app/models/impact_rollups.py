@@ -0,0 +1,36 @@
+from datetime import datetime
+import uuid
+
+from sqlalchemy import Column, Date, DateTime, Float, Integer, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+
+from .base import Base
+
+
+class ImpactRollup(Base):
+    __tablename__ = "impact_rollups"
+    __table_args__ = (
+        UniqueConstraint("grain", "bucket_start", "state_of_residence", name="uq_impact_rollups_grain_bucket_state"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    grain = Column(String, nullable=False)
+    bucket_start = Column(Date, nullable=False, index=True)
+    state_of_residence = Column(String, nullable=False)
+
+    benefits_discovered = Column(Integer, nullable=False, default=0)
+    benefits_claimed = Column(Integer, nullable=False, default=0)
+    benefit_value_discovered = Column(Float, nullable=False, default=0.0)
+    benefit_value_unlocked = Column(Float, nullable=False, default=0.0)
+    foreclosure_prevention_claims = Column(Integer, nullable=False, default=0)
+
+    refreshed_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+
+
+class RollupWatermark(Base):
+    __tablename__ = "rollup_watermarks"
+
+    rollup_name = Column(String, primary_key=True)
+    watermark_at = Column(DateTime(timezone=True), nullable=True)
+    rows_processed = Column(Integer, nullable=False, default=0)
+    last_run_at = Column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,28 @@
+import uuid
+
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class JobRun(Base):
+    """One execution of a scheduled background job, including runs skipped on the singleton lock."""
+
+    __tablename__ = "job_runs"
+    __table_args__ = (Index("ix_job_runs_job_name_started_at", "job_name", "started_at"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    job_name = Column(String, nullable=False)
+    status = Column(String, nullable=False, default="running")
+    task_id = Column(String, nullable=True)
+    queue = Column(String, nullable=True)
+
+    rows_processed = Column(Integer, nullable=False, default=0)
+    duration_ms = Column(Float, nullable=True)
+    result = Column(JSONB, nullable=True)
+    error = Column(Text, nullable=True)
+
+    started_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
@@ -1,7 +1,7 @@
 from datetime import datetime
 import uuid
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, String, UniqueConstraint
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from .base import Base
@@ -19,12 +19,15 @@ class LeadSource(Base):
 class PropertyLead(Base):
     __tablename__ = "property_leads"
     __table_args__ = (
-        UniqueConstraint("source_id", "property_address", name="uq_property_leads_source_address"),
+        Index("uq_property_leads_source_address_key", "source_id", "address_key", unique=True),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     source_id = Column(UUID(as_uuid=True), ForeignKey("lead_sources.id"), nullable=True, index=True)
     property_address = Column(String, nullable=False)
+    # normalize_address(property_address, city, state); NULL only on rows that
+    # duplicated an older lead's key when the column was backfilled.
+    address_key = Column(String, nullable=True)
     city = Column(String, nullable=True)
     state = Column(String, nullable=True)
     zip_code = Column(String, nullable=True)
@@ -49,3 +52,22 @@ class LeadScore(Base):
     created_case_id = Column(UUID(as_uuid=True), ForeignKey("cases.id"), nullable=True)
 
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+
+
+class LeadConnectorState(Base):
+    """Watermark and last-run metrics of one registered lead connector."""
+
+    __tablename__ = "lead_connector_states"
+
+    connector_name = Column(String, primary_key=True)
+    # Latest filing time ingested; the next run only asks the source for newer filings.
+    watermark_at = Column(DateTime(timezone=True), nullable=True)
+
+    runs = Column(Integer, nullable=False, default=0)
+    total_leads_ingested = Column(Integer, nullable=False, default=0)
+    last_status = Column(String, nullable=True)
+    last_error = Column(Text, nullable=True)
+    last_leads_received = Column(Integer, nullable=False, default=0)
+    last_leads_ingested = Column(Integer, nullable=False, default=0)
+    last_duration_ms = Column(Float, nullable=True)
+    last_run_at = Column(DateTime(timezone=True), nullable=True)
@@ -273,3 +273,63 @@ class StabilityAssessment(Base):
         server_default=func.now(),
         index=True,
     )
+
+
+# =====================================================
+# MEMBERSHIP ACTIVITY SUMMARY
+# =====================================================
+
+class MembershipActivity(Base):
+    """Per-membership activity summary maintained by ``membership_activity_events``."""
+
+    __tablename__ = "membership_activity"
+
+    membership_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("memberships.id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+
+    last_activity_at = Column(DateTime(timezone=True), nullable=True)
+
+    missed_installments_count = Column(Integer, nullable=False, server_default="0", index=True)
+    due_installments_count = Column(Integer, nullable=False, server_default="0")
+
+    latest_stability_score = Column(Integer, nullable=True, index=True)
+    latest_stability_at = Column(DateTime(timezone=True), nullable=True)
+
+    refreshed_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+
+# =====================================================
+# MEMBERSHIP STABILITY COUNTERS
+# =====================================================
+
+class MembershipStabilityCounters(Base):
+    """Running stability score inputs maintained by ``stability_counter_events``."""
+
+    __tablename__ = "membership_stability_counters"
+
+    membership_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("memberships.id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+
+    paid_on_time_count = Column(Integer, nullable=False, server_default="0")
+    paid_late_count = Column(Integer, nullable=False, server_default="0")
+    missed_count = Column(Integer, nullable=False, server_default="0")
+    contribution_credit_count = Column(Integer, nullable=False, server_default="0")
+    document_upload_count = Column(Integer, nullable=False, server_default="0")
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -0,0 +1,76 @@
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.models.cases import Case
+from app.models.documents import Document
+from app.models.member_layer import (
+    ContributionCredit,
+    MemberCheckin,
+    Membership,
+    MembershipInstallment,
+    StabilityAssessment,
+)
+from app.models.training_quiz_attempts import TrainingQuizAttempt
+
+
+# Keep membership_activity in step with every flush that touches a source table.
+# The refresh runs on the flushing connection so it commits or rolls back with the write.
+@event.listens_for(Session, "after_flush")
+def _refresh_membership_activity_after_flush(session, flush_context):
+    membership_ids: set = set()
+    user_ids: set = set()
+    case_ids: set = set()
+
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Membership):
+            # Standing/status flips do not change the summary; only new rows or
+            # a re-keyed member/program do.
+            if obj in session.new or _membership_rekeyed(obj):
+                membership_ids.add(obj.id)
+        elif isinstance(obj, (MembershipInstallment, ContributionCredit, MemberCheckin)):
+            membership_ids.add(obj.membership_id)
+        elif isinstance(obj, (StabilityAssessment, TrainingQuizAttempt)):
+            user_ids.add(obj.user_id)
+        elif isinstance(obj, Document):
+            case_ids.add(obj.case_id)
+        elif isinstance(obj, Case) and obj not in session.new:
+            # Case documents count towards the membership of (created_by, program_key);
+            # re-keying or deleting a case moves them, so refresh both members.
+            user_ids.update(_case_members(obj, deleted=obj in session.deleted))
+
+    if not (membership_ids or user_ids or case_ids):
+        return
+
+    connection = session.connection()
+    if connection.dialect.name != "postgresql":
+        return
+
+    from app.services.membership_activity_service import refresh_membership_activity
+
+    refresh_membership_activity(
+        connection,
+        membership_ids=membership_ids,
+        user_ids=user_ids,
+        case_ids=case_ids,
+    )
+
+
+def _membership_rekeyed(membership: Membership) -> bool:
+    state = inspect(membership)
+    return any(state.attrs[key].history.has_changes() for key in ("user_id", "program_key"))
+
+
+# Load the previous owner on assignment (even when the attribute was expired), so
+# the flush can still refresh the membership the case moved away from.
+@event.listens_for(Case.created_by, "set", active_history=True)
+@event.listens_for(Case.program_key, "set", active_history=True)
+def _track_previous_case_member(target, value, oldvalue, initiator):
+    pass
+
+
+def _case_members(case: Case, *, deleted: bool) -> set:
+    state = inspect(case)
+    history = {key: state.attrs[key].history for key in ("created_by", "program_key")}
+    if not deleted and not any(h.has_changes() for h in history.values()):
+        return set()
+    return {case.created_by, *history["created_by"].deleted}
@@ -0,0 +1,10 @@
+from app.models.cache_invalidation import invalidate_after_transaction
+from app.models.module_registry import ModuleRegistry
+
+
+# Activations, deprecations and loader rejections drop the compiled dispatch table,
+# so the next module action rebuilds it from the registry.
+invalidate_after_transaction(
+    ModuleRegistry,
+    "app.services.module_dispatch_service:invalidate_module_dispatch_table",
+)
@@ -0,0 +1,30 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.cache_invalidation import invalidate_after_transaction
+from app.models.housing_intelligence import PartnerOrganization
+
+
+# Partner writes drop the in-memory routing index, so the next routing call
+# reloads it instead of waiting for the refresh interval.
+invalidate_after_transaction(
+    PartnerOrganization,
+    "app.services.partner_routing_service:invalidate_partner_routing_index",
+)
+
+
+# Routing picks reach the index's queue depths only once their referrals commit.
+@event.listens_for(Session, "after_commit")
+def _record_partner_assignments(session):
+    if "partner_routing_pending_assignments" in session.info:
+        from app.services.partner_routing_service import apply_pending_partner_assignments
+
+        apply_pending_partner_assignments(session, committed=True)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_partner_assignments(session):
+    if "partner_routing_pending_assignments" in session.info:
+        from app.services.partner_routing_service import apply_pending_partner_assignments
+
+        apply_pending_partner_assignments(session, committed=False)
@@ -0,0 +1,32 @@
+import uuid
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class RiskEvaluationRun(Base):
+    """Progress and checkpoint of one batch risk evaluation run."""
+
+    __tablename__ = "risk_evaluation_runs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    run_key = Column(String, nullable=False, unique=True)
+    status = Column(String, nullable=False, default="running")
+
+    # Every active membership with id <= checkpoint has been evaluated and committed.
+    checkpoint_membership_id = Column(UUID(as_uuid=True), nullable=True)
+    chunk_size = Column(Integer, nullable=False)
+    chunks_completed = Column(Integer, nullable=False, default=0)
+
+    processed_memberships = Column(Integer, nullable=False, default=0)
+    risk_triggered = Column(Integer, nullable=False, default=0)
+    audit_logs_created = Column(Integer, nullable=False, default=0)
+    workflow_escalations = Column(Integer, nullable=False, default=0)
+
+    error = Column(Text, nullable=True)
+    started_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
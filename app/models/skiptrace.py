@@ -0,0 +1,54 @@
+import uuid
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class SkiptraceBatch(Base):
+    """A submitted list of cases to skiptrace, drained by the skiptrace worker."""
+
+    __tablename__ = "skiptrace_batches"
+    __table_args__ = (
+        Index("ix_skiptrace_batches_status_created_at", "status", "created_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    provider = Column(String, nullable=False)
+    case_ids = Column(JSONB, nullable=False)
+    requested_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+
+    # queued -> running -> completed | failed. Cases before processed_cases are
+    # committed, so a restarted batch resumes where it stopped.
+    status = Column(String, nullable=False, default="queued")
+    total_cases = Column(Integer, nullable=False, default=0)
+    processed_cases = Column(Integer, nullable=False, default=0)
+    resolved_cases = Column(Integer, nullable=False, default=0)
+    cache_hits = Column(Integer, nullable=False, default=0)
+    provider_calls = Column(Integer, nullable=False, default=0)
+    failed_cases = Column(Integer, nullable=False, default=0)
+    errors = Column(JSONB, nullable=False, default=dict)
+
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class SkiptraceCacheEntry(Base):
+    """Provider result for a normalized address, reused until it expires."""
+
+    __tablename__ = "skiptrace_cache"
+    __table_args__ = (
+        UniqueConstraint("provider", "address_key", name="uq_skiptrace_cache_provider_address_key"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    provider = Column(String, nullable=False)
+    address_key = Column(String, nullable=False)
+    result = Column(JSONB, nullable=False)
+    fetched_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -0,0 +1,115 @@
+from collections import defaultdict
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.models.documents import Document
+from app.models.member_layer import ContributionCredit, Membership, MembershipInstallment
+
+
+INSTALLMENT_KEYS = ("membership_id", "status", "paid_at", "due_date")
+
+
+# Keep membership_stability_counters in step with installment transitions, credits
+# and document uploads. Each flush applies +/- deltas; rows whose previous state is
+# unknown (e.g. written after expiry) are recounted for their membership instead.
+@event.listens_for(Session, "after_flush")
+def _update_stability_counters_after_flush(session, flush_context):
+    from app.services.stability_counter_service import (
+        apply_stability_counter_deltas,
+        installment_bucket,
+        refresh_stability_counters,
+    )
+
+    membership_deltas: dict = defaultdict(lambda: defaultdict(int))
+    document_deltas: dict = defaultdict(int)
+    recount_membership_ids: set = set()
+    recount_user_ids: set = set()
+
+    for obj in session.new:
+        if isinstance(obj, Membership):
+            recount_membership_ids.add(obj.id)
+        elif isinstance(obj, MembershipInstallment):
+            bucket = installment_bucket(obj.status, obj.paid_at, obj.due_date)
+            if bucket:
+                membership_deltas[obj.membership_id][bucket] += 1
+        elif isinstance(obj, ContributionCredit):
+            membership_deltas[obj.membership_id]["contribution_credit_count"] += 1
+        elif isinstance(obj, Document):
+            document_deltas[obj.uploaded_by] += 1
+
+    for obj in session.dirty:
+        if isinstance(obj, Membership):
+            if _changed(obj, ("user_id",)):
+                recount_membership_ids.add(obj.id)
+        elif isinstance(obj, MembershipInstallment):
+            if not _changed(obj, INSTALLMENT_KEYS):
+                continue
+            previous = _previous_values(obj, INSTALLMENT_KEYS)
+            if previous is None:
+                recount_membership_ids.add(obj.membership_id)
+                continue
+            old_bucket = installment_bucket(previous["status"], previous["paid_at"], previous["due_date"])
+            new_bucket = installment_bucket(obj.status, obj.paid_at, obj.due_date)
+            if old_bucket:
+                membership_deltas[previous["membership_id"]][old_bucket] -= 1
+            if new_bucket:
+                membership_deltas[obj.membership_id][new_bucket] += 1
+        elif isinstance(obj, ContributionCredit):
+            if _changed(obj, ("membership_id",)):
+                previous = _previous_values(obj, ("membership_id",))
+                if previous is not None:
+                    recount_membership_ids.add(previous["membership_id"])
+                recount_membership_ids.add(obj.membership_id)
+        elif isinstance(obj, Document):
+            if _changed(obj, ("uploaded_by",)):
+                previous = _previous_values(obj, ("uploaded_by",))
+                if previous is not None:
+                    recount_user_ids.add(previous["uploaded_by"])
+                recount_user_ids.add(obj.uploaded_by)
+
+    for obj in session.deleted:
+        if isinstance(obj, MembershipInstallment):
+            bucket = installment_bucket(obj.status, obj.paid_at, obj.due_date)
+            if bucket:
+                membership_deltas[obj.membership_id][bucket] -= 1
+        elif isinstance(obj, ContributionCredit):
+            membership_deltas[obj.membership_id]["contribution_credit_count"] -= 1
+        elif isinstance(obj, Document):
+            document_deltas[obj.uploaded_by] -= 1
+
+    if not (membership_deltas or document_deltas or recount_membership_ids or recount_user_ids):
+        return
+
+    connection = session.connection()
+    if connection.dialect.name != "postgresql":
+        return
+
+    apply_stability_counter_deltas(
+        connection,
+        membership_deltas=membership_deltas,
+        document_deltas=document_deltas,
+        skip_membership_ids=recount_membership_ids,
+    )
+    # Recounts run last so they overwrite any delta applied to the same membership.
+    refresh_stability_counters(connection, membership_ids=recount_membership_ids, user_ids=recount_user_ids)
+
+
+def _changed(obj, keys) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[key].history.has_changes() for key in keys)
+
+
+def _previous_values(obj, keys) -> dict | None:
+    state = inspect(obj)
+    values = {}
+    for key in keys:
+        history = state.attrs[key].history
+        if history.deleted:
+            values[key] = history.deleted[0]
+        elif history.added:
+            # Set without the prior value loaded, so there is nothing to subtract.
+            return None
+        else:
+            values[key] = getattr(obj, key)
+    return values
@@ -0,0 +1,35 @@
+import uuid
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class StripeWebhookEvent(Base):
+    """Inbox row for a verified Stripe webhook, drained by the webhook worker."""
+
+    __tablename__ = "stripe_webhook_events"
+    __table_args__ = (
+        Index("ix_stripe_webhook_events_status_available_at", "status", "available_at"),
+        Index("ix_stripe_webhook_events_customer_created", "stripe_customer_id", "stripe_created_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    stripe_event_id = Column(String, nullable=False, unique=True)
+    event_type = Column(String, nullable=False)
+    stripe_customer_id = Column(String, nullable=False)
+    stripe_created_at = Column(DateTime(timezone=True), nullable=True)
+    payload = Column(JSONB, nullable=False)
+
+    # pending -> processing -> processed | failed; failures are retried until max_attempts.
+    status = Column(String, nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    last_error = Column(Text, nullable=True)
+
+    received_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    available_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    processed_at = Column(DateTime(timezone=True), nullable=True, index=True)
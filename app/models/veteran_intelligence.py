@@ -59,7 +59,7 @@ class BenefitProgress(Base):
     updated_by = Column(UUID(as_uuid=True), nullable=True)
 
     created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
 
 class BenefitDiscoveryAggregate(Base):
@@ -3,12 +3,13 @@ from sqlalchemy.orm import Session
 
 from app.models.audit_logs import AuditLog
 from app.models.documents import Document
-from app.services.workflow_engine import sync_case_workflow
 
 
 def _sync_case_on_event(connection, case_id):
     if not case_id:
         return
+    from app.services.workflow_engine import sync_case_workflow
+
     session = Session(bind=connection)
     try:
         sync_case_workflow(session, case_id)
@@ -6,10 +6,12 @@ import json
 import os
 from typing import Any
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 
-from app.services.payment_service import PaymentProcessingError, handle_successful_payment
+from app.models.users import UserRole
+from app.services.stripe_webhook_inbox_service import INBOX_EVENT_TYPES, enqueue_stripe_event, stripe_inbox_metrics
+from auth.dependencies import require_role
 from db.session import get_db
 
 
@@ -51,7 +53,7 @@ async def stripe_webhook(
         raise HTTPException(status_code=400, detail="Invalid Stripe signature")
 
     event: dict[str, Any] = json.loads(payload.decode("utf-8"))
-    if event.get("type") != "invoice.payment_succeeded":
+    if event.get("type") not in INBOX_EVENT_TYPES:
         return {"status": "ignored"}
 
     obj = event.get("data", {}).get("object", {})
@@ -62,14 +64,16 @@ async def stripe_webhook(
     if not stripe_invoice_id or not stripe_customer_id or amount_paid_cents is None:
         raise HTTPException(status_code=400, detail="Missing required Stripe invoice payload fields")
 
-    try:
-        handle_successful_payment(
-            db=db,
-            stripe_invoice_id=str(stripe_invoice_id),
-            stripe_customer_id=str(stripe_customer_id),
-            amount_paid_cents=int(amount_paid_cents),
-        )
-    except PaymentProcessingError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-
-    return {"status": "ok"}
+    # Settlement runs in the inbox worker; acknowledge as soon as the event is durable.
+    queued = enqueue_stripe_event(db, event)
+    db.commit()
+    return {"status": "ok", "queued": queued}
+
+
+@router.get("/stripe/inbox/metrics")
+def stripe_inbox_metrics_endpoint(
+    window_minutes: int = Query(default=5, ge=1, le=1440),
+    db: Session = Depends(get_db),
+    _user=Depends(require_role([UserRole.admin])),
+):
+    return stripe_inbox_metrics(db, window_minutes=window_minutes)
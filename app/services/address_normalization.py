@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import re
+
+
+ADDRESS_ABBREVIATIONS = {
+    "street": "st",
+    "avenue": "ave",
+    "road": "rd",
+    "drive": "dr",
+    "boulevard": "blvd",
+    "lane": "ln",
+    "court": "ct",
+    "place": "pl",
+    "parkway": "pkwy",
+    "highway": "hwy",
+    "circle": "cir",
+    "terrace": "ter",
+    "north": "n",
+    "south": "s",
+    "east": "e",
+    "west": "w",
+    "apartment": "apt",
+    "suite": "ste",
+}
+
+
+def normalize_address(*parts: str | None) -> str:
+    """Canonical key for an address: lowercase words, punctuation dropped, suffixes abbreviated."""
+    words = re.findall(r"[a-z0-9]+", " ".join(p for p in parts if p).lower())
+    return " ".join(ADDRESS_ABBREVIATIONS.get(word, word) for word in words)
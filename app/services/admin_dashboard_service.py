@@ -4,6 +4,7 @@ from fastapi import HTTPException
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.models.member_layer import MembershipStatus
 from app.schemas.admin_dashboard import (
     AdminMembershipDetailResponse,
     AdminMembershipListResponse,
@@ -11,41 +12,10 @@ from app.schemas.admin_dashboard import (
 )
 
 
+# Activity, installment counts and latest stability come from the maintained
+# membership_activity summary (see app/models/membership_activity_events.py), so
+# each listed row is a primary-key lookup instead of a fan-out aggregate.
 BASE_LIST_SQL = """
-WITH latest_stability AS (
-    SELECT DISTINCT ON (sa.user_id, sa.program_key)
-        sa.user_id,
-        sa.program_key,
-        sa.stability_score,
-        sa.created_at
-    FROM stability_assessments sa
-    ORDER BY sa.user_id, sa.program_key, sa.created_at DESC
-), installment_counts AS (
-    SELECT
-        mi.membership_id,
-        COUNT(*) FILTER (WHERE mi.status = 'missed') AS missed_installments_count,
-        COUNT(*) FILTER (WHERE mi.status = 'due') AS due_installments_count
-    FROM membership_installments mi
-    GROUP BY mi.membership_id
-), activity AS (
-    SELECT
-        m.id AS membership_id,
-        GREATEST(
-            COALESCE(max(mi.paid_at), to_timestamp(0)),
-            COALESCE(max(cc.created_at), to_timestamp(0)),
-            COALESCE(max(mc.created_at), to_timestamp(0)),
-            COALESCE(max(d.uploaded_at), to_timestamp(0)),
-            COALESCE(max(tqa.created_at), to_timestamp(0))
-        ) AS last_activity_at
-    FROM memberships m
-    LEFT JOIN membership_installments mi ON mi.membership_id = m.id
-    LEFT JOIN contribution_credits cc ON cc.membership_id = m.id
-    LEFT JOIN member_checkins mc ON mc.membership_id = m.id
-    LEFT JOIN cases c ON c.created_by = m.user_id AND c.program_key = m.program_key
-    LEFT JOIN documents d ON d.case_id = c.id
-    LEFT JOIN training_quiz_attempts tqa ON tqa.user_id = m.user_id
-    GROUP BY m.id
-)
 SELECT
     m.id AS membership_id,
     m.user_id,
@@ -57,20 +27,27 @@ SELECT
     m.term_start,
     m.term_end,
     m.created_at,
-    ls.stability_score AS latest_stability_score,
-    ls.created_at AS latest_stability_at,
-    COALESCE(ic.missed_installments_count, 0) AS missed_installments_count,
-    COALESCE(ic.due_installments_count, 0) AS due_installments_count,
-    a.last_activity_at
+    ma.latest_stability_score,
+    ma.latest_stability_at,
+    COALESCE(ma.missed_installments_count, 0) AS missed_installments_count,
+    COALESCE(ma.due_installments_count, 0) AS due_installments_count,
+    ma.last_activity_at
 FROM memberships m
 LEFT JOIN users u ON u.id = m.user_id
-LEFT JOIN latest_stability ls ON ls.user_id = m.user_id AND ls.program_key = m.program_key
-LEFT JOIN installment_counts ic ON ic.membership_id = m.id
-LEFT JOIN activity a ON a.membership_id = m.id
+LEFT JOIN membership_activity ma ON ma.membership_id = m.id
 WHERE 1=1
 """
 
 
+def _status_clause(status: str, params: dict) -> str:
+    # Compare against the enum rather than status::text so the planner keeps its
+    # row estimates and can walk ix_memberships_created_at for the page.
+    if status not in {s.value for s in MembershipStatus}:
+        raise HTTPException(status_code=400, detail=f"Unknown membership status: {status}")
+    params["status"] = status
+    return " AND m.status = CAST(:status AS membershipstatus)"
+
+
 def _fetch_memberships(
     db: Session,
     where_clause: str,
@@ -97,8 +74,7 @@ def list_memberships(
         where += " AND m.program_key = :program_key"
         params["program_key"] = program_key
     if status:
-        where += " AND m.status::text = :status"
-        params["status"] = status
+        where += _status_clause(status, params)
     return _fetch_memberships(db, where, params, limit, offset)
 
 
@@ -110,14 +86,13 @@ def memberships_below_stability(
     limit: int = 100,
     offset: int = 0,
 ) -> AdminMembershipListResponse:
-    where = " AND COALESCE(ls.stability_score, 70) < :threshold"
+    where = " AND COALESCE(ma.latest_stability_score, 70) < :threshold"
     params: dict = {"threshold": threshold}
     if program_key:
         where += " AND m.program_key = :program_key"
         params["program_key"] = program_key
     if status:
-        where += " AND m.status::text = :status"
-        params["status"] = status
+        where += _status_clause(status, params)
     return _fetch_memberships(db, where, params, limit, offset)
 
 
@@ -128,14 +103,13 @@ def memberships_with_missed_installments(
     limit: int = 100,
     offset: int = 0,
 ) -> AdminMembershipListResponse:
-    where = " AND COALESCE(ic.missed_installments_count, 0) > 0"
+    where = " AND ma.missed_installments_count > 0"
     params: dict = {}
     if program_key:
         where += " AND m.program_key = :program_key"
         params["program_key"] = program_key
     if status:
-        where += " AND m.status::text = :status"
-        params["status"] = status
+        where += _status_clause(status, params)
     return _fetch_memberships(db, where, params, limit, offset)
 
 
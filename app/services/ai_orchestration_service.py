@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import json
-import os
+import logging
 import re
 from uuid import UUID
 
@@ -19,7 +18,8 @@ from app.models.housing_intelligence import ForeclosureCaseData
 from app.models.essential_worker import EssentialWorkerProfile
 from app.models.veteran_intelligence import VeteranProfile
 
-from app.services.platform_knowledge_service import PlatformKnowledgeService
+from app.services.llm_gateway import llm_gateway
+from app.services.platform_knowledge_service import knowledge_snapshot
 from app.services.action_payload_builder import ActionExecutionContext, build_action_payload
 
 from app.services.veteran_intelligence_service import (
@@ -45,8 +45,8 @@ from app.services.lead_intelligence_service import (
     create_case_from_lead,
     ingest_leads,
     score_property_lead,
-    weekly_foreclosure_scan,
 )
+from app.services.scheduled_jobs_service import enqueue_job
 
 from app.services.property_portfolio_service import (
     add_property_to_portfolio,
@@ -58,6 +58,8 @@ from app.services.skiptrace_service import (
     skiptrace_property_owner,
 )
 
+logger = logging.getLogger(__name__)
+
 
 def advisory_message(db: Session, message: str) -> dict:
     parsed = parse_command(message)
@@ -145,13 +147,7 @@ def _is_system_action_prompt(prompt: str) -> bool:
 
 
 def handle_mufasa_question(prompt: str, db: Session, *, investor_mode: bool = False) -> str:
-    from app.services.platform_knowledge_service import PlatformKnowledgeService
-
-    knowledge = PlatformKnowledgeService(db)
-    overview = knowledge.get_platform_overview()
-    capabilities = knowledge.get_capability_summary()
-    architecture = knowledge.get_architecture_summary()
-    modules = knowledge.get_module_descriptions()[:8]
+    snapshot = knowledge_snapshot(db)
 
     system_prompt = (
         "You are Mufasa, an expert platform guide for housing intervention operations. "
@@ -161,62 +157,20 @@ def handle_mufasa_question(prompt: str, db: Session, *, investor_mode: bool = Fa
     if investor_mode:
         system_prompt += " Prioritize business value, operational differentiation, and impact metrics framing for investors."
 
-    context = {
-        "overview": overview,
-        "capabilities": capabilities,
-        "architecture": architecture,
-        "modules": modules,
-        "investor_mode": investor_mode,
-    }
-
-    openai_api_key = os.getenv("OPENAI_API_KEY", "").strip()
-    if openai_api_key:
+    gateway = llm_gateway()
+    if gateway is not None:
         try:
-            # OpenAI python SDK v1 style
-            try:
-                from openai import OpenAI  # type: ignore
-
-                client = OpenAI(api_key=openai_api_key)
-                completion = client.chat.completions.create(
-                    model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-                    temperature=0.2,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {
-                            "role": "user",
-                            "content": (
-                                f"User question: {prompt}\n\n"
-                                f"Platform context: {json.dumps(context, default=str)[:12000]}"
-                            ),
-                        },
-                    ],
-                )
-                answer = completion.choices[0].message.content or ""
-                if answer.strip():
-                    return answer.strip()
-            except Exception:
-                import openai  # type: ignore
-
-                openai.api_key = openai_api_key
-                completion = openai.ChatCompletion.create(
-                    model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-                    temperature=0.2,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {
-                            "role": "user",
-                            "content": (
-                                f"User question: {prompt}\n\n"
-                                f"Platform context: {json.dumps(context, default=str)[:12000]}"
-                            ),
-                        },
-                    ],
-                )
-                answer = completion["choices"][0]["message"]["content"]
-                if answer and str(answer).strip():
-                    return str(answer).strip()
+            answer = gateway.complete(
+                system_prompt=system_prompt,
+                prompt=prompt,
+                # Serialized once per snapshot rather than per question.
+                context=snapshot.prompt_context(investor_mode=investor_mode),
+                context_version=snapshot.version,
+            )
+            if answer.strip():
+                return answer.strip()
         except Exception:
-            pass
+            logger.warning("mufasa.llm_unavailable", exc_info=True)
 
     # deterministic fallback when OpenAI is unavailable
     domain_hint = "system"
@@ -229,15 +183,15 @@ def handle_mufasa_question(prompt: str, db: Session, *, investor_mode: bool = Fa
         domain_hint = "lead_intelligence"
     elif "module" in lower:
         domain_hint = "system"
-    domain_summary = knowledge.get_domain_capabilities(domain_hint)
+    domain_services = snapshot.domain_services(domain_hint)
 
     return (
         "This platform is an AI-enabled housing intervention operating system that combines lead intelligence, "
         "foreclosure analysis, skiptrace, assistance discovery, partner routing, portfolio analytics, and training "
         "inside one governed admin command center. "
-        f"For your question, the most relevant domain is '{domain_hint}' with services: {', '.join(domain_summary.get('services', [])) or 'n/a'}. "
-        f"Current capability domains include: {', '.join(capabilities.get('domains', []))}. "
-        f"Module registry snapshot includes {len(modules)} loaded/registered module records available for governed runtime actions."
+        f"For your question, the most relevant domain is '{domain_hint}' with services: {', '.join(domain_services) or 'n/a'}. "
+        f"Current capability domains include: {', '.join(snapshot.capabilities.get('domains', []))}. "
+        f"Module registry snapshot includes {len(snapshot.modules)} loaded/registered module records available for governed runtime actions."
     )
 
 
@@ -283,8 +237,8 @@ def _execute_mufasa_actions(prompt: str, user_id: UUID, db: Session) -> tuple[li
             return None
 
     if any(word in normalized for word in ["scan foreclosure", "foreclosure leads", "foreclosure filings"]):
-        run_action("scan_foreclosure_filings", lambda: weekly_foreclosure_scan(db))
-        response_fragments.append("Scanning foreclosure filings and refreshing lead pipeline.")
+        run_action("scan_foreclosure_filings", lambda: enqueue_job("foreclosure_scan"))
+        response_fragments.append("Queued a foreclosure filings scan to refresh the lead pipeline.")
 
     if any(word in normalized for word in ["ingest lead", "ingest leads"]):
         sample_leads = [{"property_address": "101 Elm St", "city": "Dallas", "state": "TX", "foreclosure_stage": "auction_scheduled", "tax_delinquent": True, "equity_estimate": 95000}]
@@ -466,7 +420,7 @@ def _execute_mufasa_actions(prompt: str, user_id: UUID, db: Session) -> tuple[li
 
     if "run investor demo" in normalized:
         response_fragments.append("Running investor demo sequence across lead, foreclosure, skiptrace, assistance, and portfolio workflows.")
-        run_action("scan_foreclosure_filings", lambda: weekly_foreclosure_scan(db))
+        run_action("scan_foreclosure_filings", lambda: enqueue_job("foreclosure_scan"))
         top_lead = db.query(PropertyLead).order_by(PropertyLead.created_at.desc()).first()
         if top_lead:
             run_action("score_lead", lambda: score_property_lead(db, lead_id=top_lead.id))
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_TTL_SECONDS = 120
+DEFAULT_CACHE_MAX_ENTRIES = 5000
+RECENT_AUDIT_LIMIT = 10
+SKIPTRACE_HISTORY_LIMIT = 20
+REFERRAL_LIMIT = 20
+DOCUMENT_LIMIT = 20
+SKIPTRACE_ACTION_TYPES = ("skiptrace_run", "skiptrace_retry", "skiptrace_confirmed")
+
+# Everything any workspace detail tab shows for one case, as a single JSON document.
+CASE_DETAIL_SQL = """
+SELECT jsonb_build_object(
+    'case', to_jsonb(c),
+    'foreclosure_profile', (SELECT to_jsonb(f) FROM foreclosure_case_data f WHERE f.case_id = c.id),
+    'veteran_profile', (SELECT to_jsonb(v) FROM veteran_profiles v WHERE v.case_id = c.id),
+    'recent_audits', COALESCE((
+        SELECT jsonb_agg(a ORDER BY a.created_at DESC)
+        FROM (
+            SELECT created_at, action_type, reason_code
+            FROM audit_logs
+            WHERE case_id = c.id
+            ORDER BY created_at DESC
+            LIMIT :audit_limit
+        ) a
+    ), '[]'::jsonb),
+    'skiptrace_history', COALESCE((
+        SELECT jsonb_agg(a ORDER BY a.created_at DESC)
+        FROM (
+            SELECT created_at, action_type, reason_code, after_state
+            FROM audit_logs
+            WHERE case_id = c.id AND action_type = ANY(CAST(:skiptrace_action_types AS text[]))
+            ORDER BY created_at DESC
+            LIMIT :skiptrace_limit
+        ) a
+    ), '[]'::jsonb),
+    'benefit_progress', COALESCE((
+        SELECT jsonb_agg(b ORDER BY b.updated_at DESC)
+        FROM (
+            SELECT benefit_name, status, status_notes, updated_at
+            FROM benefit_progress
+            WHERE case_id = c.id
+        ) b
+    ), '[]'::jsonb),
+    'referrals', COALESCE((
+        SELECT jsonb_agg(r ORDER BY r.created_at DESC)
+        FROM (
+            SELECT pr.id AS partner_referral_id, po.name AS partner_name, pr.routing_category,
+                   pr.status, pr.notes, pr.created_at
+            FROM partner_referrals pr
+            LEFT JOIN partner_organizations po ON po.id = pr.partner_organization_id
+            WHERE pr.case_id = c.id
+            ORDER BY pr.created_at DESC
+            LIMIT :referral_limit
+        ) r
+    ), '[]'::jsonb),
+    'documents', COALESCE((
+        SELECT jsonb_agg(d ORDER BY d.uploaded_at DESC)
+        FROM (
+            SELECT id AS document_id, doc_type, file_url, uploaded_at
+            FROM documents
+            WHERE case_id = c.id
+            ORDER BY uploaded_at DESC
+            LIMIT :document_limit
+        ) d
+    ), '[]'::jsonb)
+)
+FROM cases c
+WHERE c.id = :case_id
+"""
+
+
+class _MemoryBackend:
+    """Per-process LRU with TTL; invalidations only reach this process.
+
+    Entries are kept serialized, so a caller that mutates the detail it got back
+    cannot change what the next request reads. Expiry, invalidation markers and
+    read start times all use the monotonic clock.
+    """
+
+    def __init__(self, max_entries: int):
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._invalidated_at: dict[str, float] = {}
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < self.now():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            raw = entry[1]
+        return json.loads(raw)
+
+    def set(self, key: str, value: dict, ttl_seconds: int, *, read_started: float) -> None:
+        raw = json.dumps(value)
+        with self._lock:
+            if self._invalidated_at.get(key, float("-inf")) >= read_started:
+                return
+            self._entries[key] = (self.now() + ttl_seconds, raw)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, keys: list[str], *, ttl_seconds: int) -> None:
+        now = self.now()
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+                self._invalidated_at[key] = now
+            # Markers only matter for reads that started before them.
+            horizon = now - ttl_seconds
+            for key in [k for k, at in self._invalidated_at.items() if at < horizon]:
+                del self._invalidated_at[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._invalidated_at.clear()
+
+
+class _RedisBackend:
+    """Shared cache for multi-worker deployments, so invalidations reach every worker."""
+
+    def __init__(self, url: str):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+
+    def now(self) -> float:
+        # Invalidation markers are compared across processes, so wall-clock time.
+        return time.time()
+
+    def get(self, key: str) -> dict | None:
+        raw = self._client.get(key)
+        return json.loads(raw) if raw else None
+
+    def set(self, key: str, value: dict, ttl_seconds: int, *, read_started: float) -> None:
+        invalidated_at = self._client.get(f"{key}:invalidated_at")
+        if invalidated_at is not None and float(invalidated_at) >= read_started:
+            return
+        self._client.set(key, json.dumps(value), ex=ttl_seconds)
+
+    def delete(self, keys: list[str], *, ttl_seconds: int) -> None:
+        now = self.now()
+        pipeline = self._client.pipeline()
+        for key in keys:
+            pipeline.delete(key)
+            pipeline.set(f"{key}:invalidated_at", now, ex=ttl_seconds)
+        pipeline.execute()
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(match="case_detail:*"):
+            self._client.delete(key)
+
+
+_backend: _MemoryBackend | _RedisBackend | None = None
+_backend_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+_stats_lock = threading.Lock()
+
+
+def get_case_detail(db: Session, case_id: UUID) -> dict[str, Any] | None:
+    """Assembled workspace data for a case, from cache or one database round trip."""
+    key = _cache_key(case_id)
+    backend = _cache_backend()
+    try:
+        cached = backend.get(key)
+    except Exception:
+        logger.warning("case_detail_cache.unavailable", exc_info=True)
+        cached = None
+    if cached is not None:
+        _count("hits")
+        return cached
+
+    _count("misses")
+    read_started = backend.now()
+    detail = load_case_detail(db, case_id)
+    # Flushed but uncommitted writes to this case must not reach the cache, and an
+    # invalidation that lands while we read wins over the value we just read.
+    if detail is not None and str(case_id) not in _pending_case_ids(db):
+        try:
+            backend.set(key, detail, _cache_ttl_seconds(), read_started=read_started)
+        except Exception:
+            logger.warning("case_detail_cache.unavailable", exc_info=True)
+    return detail
+
+
+def load_case_detail(db: Session, case_id: UUID) -> dict[str, Any] | None:
+    document = db.execute(
+        text(CASE_DETAIL_SQL),
+        {
+            "case_id": str(case_id),
+            "audit_limit": RECENT_AUDIT_LIMIT,
+            "skiptrace_limit": SKIPTRACE_HISTORY_LIMIT,
+            "skiptrace_action_types": list(SKIPTRACE_ACTION_TYPES),
+            "referral_limit": REFERRAL_LIMIT,
+            "document_limit": DOCUMENT_LIMIT,
+        },
+    ).scalar()
+    return _normalize_timestamps(document) if document is not None else None
+
+
+def mark_case_details_stale(db: Session, case_ids: Iterable[UUID]) -> None:
+    """Queue cache invalidation for writes the ORM listener cannot see (bulk or raw SQL)."""
+    _pending_case_ids(db).update(str(case_id) for case_id in case_ids if case_id)
+
+
+def invalidate_case_details(case_ids: Iterable[UUID | str]) -> None:
+    keys = [_cache_key(case_id) for case_id in {str(v) for v in case_ids if v}]
+    if not keys:
+        return
+    try:
+        _cache_backend().delete(keys, ttl_seconds=_cache_ttl_seconds())
+    except Exception:
+        logger.warning("case_detail_cache.unavailable", exc_info=True)
+    _count("invalidations", len(keys))
+
+
+def case_detail_cache_stats() -> dict[str, Any]:
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats["hits"] + stats["misses"]
+    return {
+        **stats,
+        "hit_ratio": round(stats["hits"] / lookups, 4) if lookups else None,
+        "backend": "redis" if isinstance(_cache_backend(), _RedisBackend) else "memory",
+        "ttl_seconds": _cache_ttl_seconds(),
+    }
+
+
+def reset_case_detail_cache() -> None:
+    _cache_backend().clear()
+    with _stats_lock:
+        for key in _stats:
+            _stats[key] = 0
+
+
+def _pending_case_ids(db: Session) -> set[str]:
+    return db.info.setdefault("case_detail_stale_ids", set())
+
+
+def _cache_backend() -> _MemoryBackend | _RedisBackend:
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                url = os.getenv("CASE_DETAIL_CACHE_URL", "").strip()
+                _backend = (
+                    _RedisBackend(url)
+                    if url
+                    else _MemoryBackend(int(os.getenv("CASE_DETAIL_CACHE_MAX_ENTRIES", str(DEFAULT_CACHE_MAX_ENTRIES))))
+                )
+    return _backend
+
+
+def _cache_ttl_seconds() -> int:
+    return int(os.getenv("CASE_DETAIL_CACHE_TTL_SECONDS", str(DEFAULT_CACHE_TTL_SECONDS)))
+
+
+def _cache_key(case_id: UUID | str) -> str:
+    return f"case_detail:{case_id}"
+
+
+def _count(name: str, amount: int = 1) -> None:
+    with _stats_lock:
+        _stats[name] += amount
+
+
+def _normalize_timestamps(document: dict) -> dict:
+    # Postgres renders timestamps with trimmed fractions; match datetime.isoformat().
+    # Only row-level columns are touched, not nested JSON such as meta or after_state.
+    def row(values: dict | None) -> dict | None:
+        if values is None:
+            return None
+        return {key: _iso(item) if key.endswith("_at") and isinstance(item, str) else item for key, item in values.items()}
+
+    return {
+        section: [row(item) for item in value] if isinstance(value, list) else row(value)
+        for section, value in document.items()
+    }
+
+
+def _iso(value: str) -> str:
+    try:
+        return datetime.fromisoformat(value).isoformat()
+    except ValueError:
+        return value
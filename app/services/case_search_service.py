@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Iterable
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import String, bindparam, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Which indexed cases each workspace lists.
+WORKSPACE_FILTERS = {
+    "foreclosure": "csi.has_foreclosure_profile",
+    "skiptrace": "csi.has_foreclosure_profile",
+    "veteran": "csi.has_veteran_profile",
+    "partner_routing": "csi.has_foreclosure_profile AND NOT csi.is_routed",
+}
+
+# Extra join and ORDER BY per sort mode; the default ranks matches, then newest first.
+# Priority walks ix_foreclosure_case_data_priority backwards, so it only lists
+# cases that have a foreclosure profile.
+SORT_MODES = {
+    None: ("", None),
+    "priority": (
+        "JOIN foreclosure_case_data fcd ON fcd.case_id = csi.case_id",
+        "fcd.priority_score DESC, fcd.case_id DESC",
+    ),
+}
+
+INDEX_SELECT_SQL = """
+SELECT
+    c.id AS case_id,
+    c.id::text AS case_id_text,
+    fcd.property_address,
+    fcd.city,
+    d.state,
+    fcd.zip_code,
+    d.owner_name,
+    fcd.id IS NOT NULL AS has_foreclosure_profile,
+    vp.id IS NOT NULL AS has_veteran_profile,
+    EXISTS (SELECT 1 FROM partner_referrals pr WHERE pr.case_id = c.id) AS is_routed,
+    c.created_at AS case_created_at,
+    lower(concat_ws(' ', c.id::text, fcd.property_address, fcd.city, d.state, fcd.zip_code, d.owner_name)) AS search_text,
+    setweight(to_tsvector('simple', concat_ws(' ', fcd.property_address, d.owner_name)), 'A')
+        || setweight(to_tsvector('simple', concat_ws(' ', fcd.city, d.state, fcd.zip_code)), 'B') AS search_vector,
+    now() AS updated_at
+FROM cases c
+LEFT JOIN foreclosure_case_data fcd ON fcd.case_id = c.id
+LEFT JOIN veteran_profiles vp ON vp.case_id = c.id
+CROSS JOIN LATERAL (
+    SELECT
+        COALESCE(fcd.state, vp.state_of_residence) AS state,
+        COALESCE(
+            NULLIF(btrim(c.meta::jsonb ->> 'full_name'), ''),
+            NULLIF(btrim(c.meta::jsonb ->> 'owner_name'), '')
+        ) AS owner_name
+) d
+"""
+
+UPSERT_SQL = """
+INSERT INTO case_search_index (
+    case_id,
+    case_id_text,
+    property_address,
+    city,
+    state,
+    zip_code,
+    owner_name,
+    has_foreclosure_profile,
+    has_veteran_profile,
+    is_routed,
+    case_created_at,
+    search_text,
+    search_vector,
+    updated_at
+)
+{select_sql}
+{where_sql}
+ON CONFLICT (case_id) DO UPDATE SET
+    case_id_text = EXCLUDED.case_id_text,
+    property_address = EXCLUDED.property_address,
+    city = EXCLUDED.city,
+    state = EXCLUDED.state,
+    zip_code = EXCLUDED.zip_code,
+    owner_name = EXCLUDED.owner_name,
+    has_foreclosure_profile = EXCLUDED.has_foreclosure_profile,
+    has_veteran_profile = EXCLUDED.has_veteran_profile,
+    is_routed = EXCLUDED.is_routed,
+    case_created_at = EXCLUDED.case_created_at,
+    search_text = EXCLUDED.search_text,
+    search_vector = EXCLUDED.search_vector,
+    updated_at = EXCLUDED.updated_at
+"""
+
+TARGETED_WHERE_SQL = "WHERE c.id = ANY(CAST(:case_ids AS uuid[]))"
+
+# Prefix full-text match on address/owner/city/state/zip, a case id prefix, or a
+# substring anywhere in the indexed text (the lists' original matching, so "ckingb"
+# still finds Mockingbird). With pg_trgm installed the trigram index serves the
+# substring match and word similarity adds typo-tolerant matches and ranking;
+# without it the substring match scans case_search_index.
+SEARCH_SQL = """
+SELECT
+    csi.case_id,
+    csi.property_address,
+    csi.city,
+    csi.state,
+    csi.zip_code,
+    csi.owner_name,
+    csi.case_created_at,
+    r.rank
+FROM case_search_index csi
+{join_sql}
+CROSS JOIN LATERAL (
+    SELECT
+        CASE WHEN :tsquery IS NULL THEN 0
+             ELSE ts_rank(csi.search_vector, to_tsquery('simple', :tsquery)) END
+        + CASE WHEN csi.case_id_text LIKE :id_prefix THEN 1 ELSE 0 END
+        {trigram_rank}
+        AS rank
+) r
+WHERE {workspace_sql}
+  AND (
+        (:tsquery IS NOT NULL AND csi.search_vector @@ to_tsquery('simple', :tsquery))
+     OR csi.case_id_text LIKE :id_prefix
+     OR csi.search_text LIKE :contains ESCAPE '\\'
+     {trigram_match}
+  )
+ORDER BY {order_sql}
+LIMIT :limit OFFSET :offset
+"""
+
+TRIGRAM_RANK_SQL = "+ word_similarity(:query, csi.search_text)"
+TRIGRAM_MATCH_SQL = "OR :query <% csi.search_text"
+
+SEARCH_ORDER_SQL = "r.rank DESC, csi.case_created_at DESC, csi.case_id DESC"
+LIST_ORDER_SQL = "csi.case_created_at DESC, csi.case_id DESC"
+
+LIST_SQL = """
+SELECT
+    csi.case_id,
+    csi.property_address,
+    csi.city,
+    csi.state,
+    csi.zip_code,
+    csi.owner_name,
+    csi.case_created_at,
+    0 AS rank
+FROM case_search_index csi
+{join_sql}
+WHERE {workspace_sql}
+ORDER BY {order_sql}
+LIMIT :limit OFFSET :offset
+"""
+
+# pg_trgm can be installed on a running database; re-check every few minutes.
+TRIGRAM_CHECK_SECONDS = 300.0
+_TRIGRAM_AVAILABLE: dict[str, tuple[bool, float]] = {}
+
+
+def refresh_case_search_index(bind: Session | Connection, *, case_ids: Iterable[UUID]) -> None:
+    """Re-derive index rows for cases whose case, profile or routing rows changed."""
+    ids = sorted({str(v) for v in case_ids if v})
+    if not ids:
+        return
+    bind.execute(text(UPSERT_SQL.format(select_sql=INDEX_SELECT_SQL, where_sql=TARGETED_WHERE_SQL)), {"case_ids": ids})
+
+
+def rebuild_case_search_index(db: Session) -> int:
+    """Backfill or repair every index row, e.g. after a bulk import."""
+    result = db.execute(text(UPSERT_SQL.format(select_sql=INDEX_SELECT_SQL, where_sql="")))
+    return int(result.rowcount or 0)
+
+
+def search_cases(
+    db: Session,
+    *,
+    query: str | None = None,
+    workspace: str | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+    sort: str | None = None,
+) -> dict[str, Any]:
+    """Ranked, paginated case search; without a query, lists newest cases first.
+
+    ``sort="priority"`` orders by the stored foreclosure priority instead.
+    """
+    if workspace is not None and workspace not in WORKSPACE_FILTERS:
+        raise HTTPException(status_code=422, detail=f"Unknown search workspace '{workspace}'")
+    if sort not in SORT_MODES:
+        raise HTTPException(status_code=422, detail=f"Unknown search sort '{sort}'")
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    offset = max(0, int(offset))
+
+    params: dict[str, Any] = {"limit": limit + 1, "offset": offset}
+    workspace_sql = WORKSPACE_FILTERS.get(workspace, "true")
+    normalized = " ".join((query or "").lower().split())
+    join_sql, order_sql = SORT_MODES[sort]
+
+    if not normalized:
+        statement = text(
+            LIST_SQL.format(
+                workspace_sql=workspace_sql,
+                join_sql=join_sql,
+                order_sql=order_sql or LIST_ORDER_SQL,
+            )
+        )
+    else:
+        trigram = _trigram_available(db)
+        sql = SEARCH_SQL.format(
+            workspace_sql=workspace_sql,
+            join_sql=join_sql,
+            order_sql=order_sql or SEARCH_ORDER_SQL,
+            trigram_rank=TRIGRAM_RANK_SQL if trigram else "",
+            trigram_match=TRIGRAM_MATCH_SQL if trigram else "",
+        )
+        # Typed so drivers that prepare statements (asyncpg) can tell what a NULL is.
+        statement = text(sql).bindparams(
+            *(bindparam(name, type_=String) for name in ("tsquery", "id_prefix", "contains", *(("query",) if trigram else ())))
+        )
+        params.update(
+            {
+                "query": normalized,
+                "tsquery": _prefix_tsquery(normalized),
+                "id_prefix": _case_id_prefix(normalized),
+                "contains": f"%{_escape_like(normalized)}%",
+            }
+        )
+
+    rows = db.execute(statement, params).mappings().all()
+    return {
+        "items": [
+            {
+                "case_id": str(row["case_id"]),
+                "property_address": row["property_address"],
+                "city": row["city"],
+                "state": row["state"],
+                "zip_code": row["zip_code"],
+                "owner_name": row["owner_name"],
+                "created_at": row["case_created_at"].isoformat() if row["case_created_at"] else None,
+                "rank": round(float(row["rank"] or 0), 4),
+            }
+            for row in rows[:limit]
+        ],
+        "limit": limit,
+        "offset": offset,
+        "has_more": len(rows) > limit,
+    }
+
+
+def search_case_ids(
+    db: Session,
+    *,
+    query: str | None,
+    workspace: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+    sort: str | None = None,
+) -> list[UUID]:
+    """Ordered case ids for a workspace page, for routes that hydrate their own rows."""
+    page = search_cases(db, query=query, workspace=workspace, limit=limit, offset=offset, sort=sort)
+    return [UUID(item["case_id"]) for item in page["items"]]
+
+
+def _prefix_tsquery(normalized: str) -> str | None:
+    tokens = re.findall(r"\w+", normalized)
+    return " & ".join(f"{token}:*" for token in tokens) or None
+
+
+def _case_id_prefix(normalized: str) -> str | None:
+    if re.fullmatch(r"[0-9a-f-]{4,36}", normalized):
+        return f"{normalized}%"
+    return None
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _trigram_available(db: Session) -> bool:
+    key = str(db.get_bind().url)
+    cached = _TRIGRAM_AVAILABLE.get(key)
+    now = time.monotonic()
+    if cached is None or now - cached[1] >= TRIGRAM_CHECK_SECONDS:
+        available = bool(db.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).scalar())
+        cached = _TRIGRAM_AVAILABLE[key] = (available, now)
+    return cached[0]
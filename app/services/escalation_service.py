@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import desc
+from sqlalchemy import desc, func, tuple_
 from sqlalchemy.orm import Session
 
 from app.models.audit_logs import AuditLog
@@ -12,130 +13,190 @@ from app.models.member_layer import InstallmentStatus, Membership, MembershipIns
 from app.services.workflow_service import advance_to_risk_stage
 
 RISK_STABILITY_THRESHOLD = 65
+RISK_EVALUATION_CHUNK_SIZE = 1000
+ESCALATION_ACTION_TYPE = "escalated_due_to_risk"
 
 
 def evaluate_member_risk(db: Session, membership_id: UUID) -> dict:
-    membership = db.query(Membership).filter(Membership.id == membership_id).first()
-    if not membership:
+    results = evaluate_member_risk_batch(db, [membership_id])
+    if not results:
         return {"error": "membership_not_found", "membership_id": str(membership_id)}
+    return results[0]
 
-    missed_count = (
-        db.query(MembershipInstallment)
+
+def evaluate_member_risk_batch(db: Session, membership_ids: list[UUID]) -> list[dict[str, Any]]:
+    """Evaluate risk for many memberships with a fixed number of set-based queries.
+
+    Missed installments, latest stability scores, prior escalation audits and the
+    members' latest cases are each loaded once for the whole batch. Results keep
+    the per-membership shape returned by ``evaluate_member_risk``; no commit.
+    """
+    if not membership_ids:
+        return []
+
+    memberships = db.query(Membership).filter(Membership.id.in_(membership_ids)).order_by(Membership.id).all()
+    if not memberships:
+        return []
+    ids = [m.id for m in memberships]
+
+    missed_counts = dict(
+        db.query(MembershipInstallment.membership_id, func.count(MembershipInstallment.id))
         .filter(
-            MembershipInstallment.membership_id == membership.id,
+            MembershipInstallment.membership_id.in_(ids),
             MembershipInstallment.status == InstallmentStatus.missed,
         )
-        .count()
+        .group_by(MembershipInstallment.membership_id)
+        .all()
     )
 
-    latest_assessment = (
-        db.query(StabilityAssessment)
-        .filter(
-            StabilityAssessment.user_id == membership.user_id,
-            StabilityAssessment.program_key == membership.program_key,
+    member_keys = {(m.user_id, m.program_key) for m in memberships}
+    latest_scores = {
+        (row.user_id, row.program_key): row.stability_score
+        for row in (
+            db.query(StabilityAssessment.user_id, StabilityAssessment.program_key, StabilityAssessment.stability_score)
+            .filter(tuple_(StabilityAssessment.user_id, StabilityAssessment.program_key).in_(member_keys))
+            .distinct(StabilityAssessment.user_id, StabilityAssessment.program_key)
+            .order_by(
+                StabilityAssessment.user_id,
+                StabilityAssessment.program_key,
+                desc(StabilityAssessment.created_at),
+            )
+            .all()
         )
-        .order_by(desc(StabilityAssessment.created_at))
-        .first()
-    )
-    stability_score = latest_assessment.stability_score if latest_assessment else None
-
-    risk_triggered = (
-        missed_count > 0
-        or (stability_score is not None and stability_score < RISK_STABILITY_THRESHOLD)
-    )
+    }
 
-    audit_created = False
-    workflow_escalated = False
-    if risk_triggered:
-        if membership.good_standing:
-            membership.good_standing = False
-
-            reason_code = f"membership:{membership.id}:escalated_due_to_risk"
-            existing = (
-                db.query(AuditLog.id)
-                .filter(
-                    AuditLog.action_type == "escalated_due_to_risk",
-                    AuditLog.reason_code == reason_code,
-                )
-                .first()
-            )
-            if not existing:
-                db.add(
-                    AuditLog(
-                        case_id=None,
-                        actor_id=None,
-                        actor_is_ai=False,
-                        action_type="escalated_due_to_risk",
-                        reason_code=reason_code,
-                        before_state={"entity_type": "membership", "entity_id": str(membership.id), "good_standing": True},
-                        after_state={
-                            "entity_type": "membership",
-                            "entity_id": str(membership.id),
-                            "action": "escalated_due_to_risk",
-                            "metadata": {
-                                "missed_installments": missed_count,
-                                "latest_stability_score": stability_score,
-                            },
-                            "good_standing": False,
-                            "created_at": datetime.now(timezone.utc).isoformat(),
-                        },
-                        policy_version_id=None,
-                    )
-                )
-                audit_created = True
-
-        case = (
-            db.query(Case)
+    results: dict[UUID, dict[str, Any]] = {}
+    triggered: list[Membership] = []
+    for membership in memberships:
+        missed_count = int(missed_counts.get(membership.id, 0))
+        stability_score = latest_scores.get((membership.user_id, membership.program_key))
+        risk_triggered = (
+            missed_count > 0
+            or (stability_score is not None and stability_score < RISK_STABILITY_THRESHOLD)
+        )
+        results[membership.id] = {
+            "membership_id": str(membership.id),
+            "risk_triggered": risk_triggered,
+            "missed_installments": missed_count,
+            "stability_score": stability_score,
+            "good_standing": bool(membership.good_standing),
+            "audit_created": False,
+            "workflow_escalated": False,
+        }
+        if risk_triggered:
+            triggered.append(membership)
+
+    if not triggered:
+        return list(results.values())
+
+    newly_escalated = [m for m in triggered if m.good_standing]
+    reason_codes = {m.id: _escalation_reason_code(m.id) for m in newly_escalated}
+    existing_codes = set()
+    if reason_codes:
+        existing_codes = {
+            code
+            for (code,) in db.query(AuditLog.reason_code)
             .filter(
-                Case.created_by == membership.user_id,
-                Case.program_key == membership.program_key,
+                AuditLog.action_type == ESCALATION_ACTION_TYPE,
+                AuditLog.reason_code.in_(reason_codes.values()),
+            )
+            .all()
+        }
+
+    now_iso = datetime.now(timezone.utc).isoformat()
+    for membership in newly_escalated:
+        membership.good_standing = False
+        result = results[membership.id]
+        result["good_standing"] = False
+        if reason_codes[membership.id] in existing_codes:
+            continue
+        db.add(
+            AuditLog(
+                case_id=None,
+                actor_id=None,
+                actor_is_ai=False,
+                action_type=ESCALATION_ACTION_TYPE,
+                reason_code=reason_codes[membership.id],
+                before_state={"entity_type": "membership", "entity_id": str(membership.id), "good_standing": True},
+                after_state={
+                    "entity_type": "membership",
+                    "entity_id": str(membership.id),
+                    "action": ESCALATION_ACTION_TYPE,
+                    "metadata": {
+                        "missed_installments": result["missed_installments"],
+                        "latest_stability_score": result["stability_score"],
+                    },
+                    "good_standing": False,
+                    "created_at": now_iso,
+                },
+                policy_version_id=None,
             )
-            .order_by(desc(Case.created_at))
-            .first()
         )
-        if case:
-            workflow_escalated = advance_to_risk_stage(db, case.id)
+        result["audit_created"] = True
+
+    triggered_keys = {(m.user_id, m.program_key) for m in triggered}
+    latest_cases = {
+        (row.created_by, row.program_key): row.id
+        for row in (
+            db.query(Case.id, Case.created_by, Case.program_key)
+            .filter(tuple_(Case.created_by, Case.program_key).in_(triggered_keys))
+            .distinct(Case.created_by, Case.program_key)
+            .order_by(Case.created_by, Case.program_key, desc(Case.created_at))
+            .all()
+        )
+    }
+    for membership in triggered:
+        case_id = latest_cases.get((membership.user_id, membership.program_key))
+        if case_id:
+            results[membership.id]["workflow_escalated"] = advance_to_risk_stage(db, case_id)
 
     db.flush()
+    return list(results.values())
 
-    return {
-        "membership_id": str(membership.id),
-        "risk_triggered": risk_triggered,
-        "missed_installments": missed_count,
-        "stability_score": stability_score,
-        "good_standing": bool(membership.good_standing),
-        "audit_created": audit_created,
-        "workflow_escalated": workflow_escalated,
-    }
 
+def run_daily_risk_evaluation(db: Session, *, chunk_size: int = RISK_EVALUATION_CHUNK_SIZE) -> dict:
+    """Evaluate every active membership in keyset-paged chunks within the caller's transaction.
 
-def run_daily_risk_evaluation(db: Session) -> dict:
-    memberships = (
-        db.query(Membership)
-        .filter(Membership.status == MembershipStatus.active)
-        .all()
-    )
+    For the parallel, checkpointed nightly run see ``risk_evaluation_runner``.
+    """
+    summary = empty_risk_summary()
+    after_id: UUID | None = None
+    while True:
+        chunk = active_membership_id_page(db, after_id=after_id, limit=chunk_size)
+        if not chunk:
+            break
+        accumulate_risk_summary(summary, evaluate_member_risk_batch(db, chunk))
+        after_id = chunk[-1]
+    return summary
 
-    processed = 0
-    triggered = 0
-    audits_created = 0
-    escalated = 0
 
-    for membership in memberships:
-        result = evaluate_member_risk(db, membership.id)
-        if result.get("error"):
-            continue
-        processed += 1
+def active_membership_id_page(db: Session, *, after_id: UUID | None, limit: int) -> list[UUID]:
+    query = db.query(Membership.id).filter(Membership.status == MembershipStatus.active)
+    if after_id is not None:
+        query = query.filter(Membership.id > after_id)
+    return [row.id for row in query.order_by(Membership.id).limit(limit).all()]
+
+
+def empty_risk_summary() -> dict[str, int]:
+    return {
+        "processed_memberships": 0,
+        "risk_triggered": 0,
+        "audit_logs_created": 0,
+        "workflow_escalations": 0,
+    }
+
+
+def accumulate_risk_summary(summary: dict[str, int], results: list[dict[str, Any]]) -> dict[str, int]:
+    for result in results:
+        summary["processed_memberships"] += 1
         if result["risk_triggered"]:
-            triggered += 1
+            summary["risk_triggered"] += 1
         if result["audit_created"]:
-            audits_created += 1
+            summary["audit_logs_created"] += 1
         if result["workflow_escalated"]:
-            escalated += 1
+            summary["workflow_escalations"] += 1
+    return summary
 
-    return {
-        "processed_memberships": processed,
-        "risk_triggered": triggered,
-        "audit_logs_created": audits_created,
-        "workflow_escalations": escalated,
-    }
+
+def _escalation_reason_code(membership_id: UUID) -> str:
+    return f"membership:{membership_id}:escalated_due_to_risk"
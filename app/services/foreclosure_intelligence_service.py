@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import json
+from collections.abc import Iterable
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.models.audit_logs import AuditLog
@@ -10,6 +13,49 @@ from app.models.cases import Case
 from app.models.enums import CaseStatus
 from app.models.housing_intelligence import ForeclosureCaseData
 from app.models.policy_versions import PolicyVersion
+from app.services.case_detail_service import mark_case_details_stale
+
+
+PRIORITY_STAGE_WEIGHTS = {
+    "pre_foreclosure": 15,
+    "notice_of_default": 30,
+    "auction_scheduled": 50,
+    "post_sale": 80,
+}
+DEFAULT_STAGE_WEIGHT = 10
+MAX_ARREARS_PRESSURE = 40
+CRITICAL_PRIORITY_THRESHOLD = 70
+HIGH_PRIORITY_THRESHOLD = 40
+
+# Same formula as score_case_priority, applied to every profile (or the given cases).
+RESCORE_SQL = """
+WITH scored AS (
+    SELECT
+        fcd.id,
+        p.score,
+        CASE
+            WHEN p.score >= :critical_threshold THEN 'critical'
+            WHEN p.score >= :high_threshold THEN 'high'
+            ELSE 'standard'
+        END AS tier
+    FROM foreclosure_case_data fcd
+    CROSS JOIN LATERAL (
+        SELECT round(CAST(LEAST(100,
+            COALESCE(CAST(CAST(:stage_weights AS jsonb) ->> lower(COALESCE(fcd.foreclosure_stage, '')) AS float), :default_weight)
+            + CASE WHEN COALESCE(fcd.homeowner_income, 0) <= 0 THEN 0
+                   ELSE LEAST(:max_pressure, COALESCE(fcd.arrears_amount, 0) / GREATEST(fcd.homeowner_income, 1) * 10)
+              END
+        ) AS numeric), 2) AS score
+    ) p
+    WHERE CAST(:case_ids AS uuid[]) IS NULL OR fcd.case_id = ANY(CAST(:case_ids AS uuid[]))
+)
+UPDATE foreclosure_case_data fcd
+SET priority_score = s.score, priority_tier = s.tier, priority_scored_at = now()
+FROM scored s
+WHERE fcd.id = s.id
+  AND (fcd.priority_score IS DISTINCT FROM s.score OR fcd.priority_tier IS DISTINCT FROM s.tier)
+RETURNING fcd.case_id
+"""
 
 
 def create_foreclosure_profile(
@@ -117,35 +163,80 @@ def calculate_case_priority(
     if not profile:
         raise HTTPException(status_code=404, detail="Foreclosure profile not found")
 
-    stage = (profile.foreclosure_stage or "").lower()
+    return case_priority(profile, case_id=case_id)
 
-    stage_weight = {
-        "pre_foreclosure": 15,
-        "notice_of_default": 30,
-        "auction_scheduled": 50,
-        "post_sale": 80,
-    }.get(stage, 10)
 
-    arrears = float(profile.arrears_amount or 0)
+def case_priority(profile, *, case_id: UUID | None = None) -> dict:
+    """Priority for an already loaded profile, read from its materialized columns."""
 
-    income = float(profile.homeowner_income or 0)
+    score = getattr(profile, "priority_score", None)
+    tier = getattr(profile, "priority_tier", None)
 
-    pressure = 0 if income <= 0 else min(40, (arrears / max(income, 1)) * 10)
+    if score is None or tier is None:
+        score, tier = score_case_priority(
+            foreclosure_stage=profile.foreclosure_stage,
+            arrears_amount=profile.arrears_amount,
+            homeowner_income=profile.homeowner_income,
+        )
+
+    return {
+        "case_id": str(case_id or profile.case_id),
+        "priority_score": round(float(score), 2),
+        "priority_tier": tier,
+    }
+
+
+def score_case_priority(
+    *,
+    foreclosure_stage: str | None,
+    arrears_amount: float | None,
+    homeowner_income: float | None,
+) -> tuple[float, str]:
+
+    stage_weight = PRIORITY_STAGE_WEIGHTS.get((foreclosure_stage or "").lower(), DEFAULT_STAGE_WEIGHT)
+
+    arrears = float(arrears_amount or 0)
 
-    score = min(100, stage_weight + pressure)
+    income = float(homeowner_income or 0)
 
-    if score >= 70:
+    pressure = 0 if income <= 0 else min(MAX_ARREARS_PRESSURE, (arrears / max(income, 1)) * 10)
+
+    score = round(min(100, stage_weight + pressure), 2)
+
+    if score >= CRITICAL_PRIORITY_THRESHOLD:
         tier = "critical"
-    elif score >= 40:
+    elif score >= HIGH_PRIORITY_THRESHOLD:
         tier = "high"
     else:
         tier = "standard"
 
-    return {
-        "case_id": str(case_id),
-        "priority_score": round(score, 2),
-        "priority_tier": tier,
-    }
+    return score, tier
+
+
+def rescore_case_priorities(
+    db: Session,
+    *,
+    case_ids: Iterable[UUID] | None = None,
+) -> int:
+    """Recompute stored priorities set-wise, e.g. after a weight change or a raw import.
+
+    Only rows whose score or tier actually moves are written; returns that count.
+    """
+
+    ids = sorted({str(v) for v in case_ids if v}) if case_ids is not None else None
+    rescored = db.execute(
+        text(RESCORE_SQL),
+        {
+            "case_ids": ids,
+            "stage_weights": json.dumps(PRIORITY_STAGE_WEIGHTS),
+            "default_weight": DEFAULT_STAGE_WEIGHT,
+            "max_pressure": MAX_ARREARS_PRESSURE,
+            "critical_threshold": CRITICAL_PRIORITY_THRESHOLD,
+            "high_threshold": HIGH_PRIORITY_THRESHOLD,
+        },
+    ).scalars().all()
+    mark_case_details_stale(db, rescored)
+    return len(rescored)
 
 
 def _audit(
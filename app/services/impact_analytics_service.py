@@ -58,13 +58,18 @@ def get_opportunity_map(db: Session) -> list[dict[str, Any]]:
     )
 
 
+def benefit_value_map_for(db: Session) -> dict[str, float]:
+    value_map = {row.benefit_name: float(row.estimated_value or 0.0) for row in db.query(BenefitRegistry).all()}
+    for benefit in DEFAULT_BENEFITS:
+        value_map.setdefault(benefit["benefit_name"], float(benefit.get("estimated_value") or 0.0))
+    return value_map
+
+
 def _collect_case_impact_rows(db: Session) -> list[dict[str, Any]]:
     profiles = db.query(VeteranProfile).all()
     progresses = db.query(BenefitProgress).all()
 
-    benefit_value_map = {row.benefit_name: float(row.estimated_value or 0.0) for row in db.query(BenefitRegistry).all()}
-    for benefit in DEFAULT_BENEFITS:
-        benefit_value_map.setdefault(benefit["benefit_name"], float(benefit.get("estimated_value") or 0.0))
+    benefit_value_map = benefit_value_map_for(db)
 
     progress_by_case: dict[str, list[BenefitProgress]] = defaultdict(list)
     for progress in progresses:
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.impact_rollups import ImpactRollup, RollupWatermark
+from app.models.veteran_intelligence import BenefitProgress, VeteranProfile
+from app.services.impact_analytics_service import (
+    CLAIMED_STATUSES,
+    FORECLOSURE_PREVENTION_BENEFITS,
+    UNLOCKED_STATUSES,
+    benefit_value_map_for,
+)
+
+
+ROLLUP_NAME = "impact_benefit_progress"
+GRAIN_DAY = "day"
+GRAIN_WEEK = "week"
+GRAINS = {GRAIN_DAY, GRAIN_WEEK}
+
+# Rows committed by transactions that started before the previous run can carry
+# an updated_at slightly behind the stored watermark; re-scan that slack window.
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+FACT_FIELDS = (
+    "benefits_discovered",
+    "benefits_claimed",
+    "benefit_value_discovered",
+    "benefit_value_unlocked",
+    "foreclosure_prevention_claims",
+)
+
+
+def refresh_impact_rollups(db: Session, *, full: bool = False) -> dict[str, Any]:
+    """Rebuild daily and weekly impact facts for buckets touched since the last watermark.
+
+    A changed ``BenefitProgress`` row can move its claim out of an older bucket, so the
+    refresh recomputes every bucket from the week containing the earliest ``created_at``
+    among changed rows onward. Recomputing a bucket is idempotent.
+    """
+    watermark = _get_or_create_watermark(db)
+    now = datetime.now(timezone.utc)
+
+    changed_query = db.query(
+        func.min(BenefitProgress.created_at),
+        func.max(BenefitProgress.updated_at),
+        func.count(BenefitProgress.id),
+    )
+    if not full and watermark.watermark_at is not None:
+        changed_query = changed_query.filter(BenefitProgress.updated_at > watermark.watermark_at - WATERMARK_OVERLAP)
+    earliest_created, latest_updated, changed_rows = changed_query.one()
+
+    watermark.last_run_at = now
+    if not changed_rows:
+        db.flush()
+        return {"rollup": ROLLUP_NAME, "changed_rows": 0, "window_start": None, "buckets_written": 0}
+
+    window_start = None if full or watermark.watermark_at is None else week_start(earliest_created.date())
+
+    discovered_rows, claimed_rows = _grouped_progress_counts(db, window_start=window_start)
+    daily = build_daily_facts(discovered_rows, claimed_rows, value_map=benefit_value_map_for(db))
+    weekly = roll_up_weekly(daily)
+
+    delete_query = db.query(ImpactRollup)
+    if window_start is not None:
+        delete_query = delete_query.filter(ImpactRollup.bucket_start >= window_start)
+    delete_query.delete(synchronize_session=False)
+
+    rows = [
+        ImpactRollup(grain=grain, bucket_start=bucket, state_of_residence=state, refreshed_at=now, **facts)
+        for grain, buckets in ((GRAIN_DAY, daily), (GRAIN_WEEK, weekly))
+        for (bucket, state), facts in buckets.items()
+    ]
+    db.add_all(rows)
+
+    watermark.watermark_at = max(latest_updated, watermark.watermark_at) if watermark.watermark_at else latest_updated
+    watermark.rows_processed = int(watermark.rows_processed or 0) + int(changed_rows)
+    db.flush()
+
+    return {
+        "rollup": ROLLUP_NAME,
+        "changed_rows": int(changed_rows),
+        "window_start": window_start.isoformat() if window_start else None,
+        "buckets_written": len(rows),
+    }
+
+
+def get_impact_trends(
+    db: Session,
+    *,
+    grain: str = GRAIN_WEEK,
+    state_of_residence: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> list[dict[str, Any]]:
+    if grain not in GRAINS:
+        raise HTTPException(status_code=400, detail=f"Invalid grain '{grain}'")
+
+    query = db.query(ImpactRollup).filter(ImpactRollup.grain == grain)
+    if state_of_residence:
+        query = query.filter(ImpactRollup.state_of_residence == state_of_residence)
+    if start:
+        query = query.filter(ImpactRollup.bucket_start >= start)
+    if end:
+        query = query.filter(ImpactRollup.bucket_start <= end)
+
+    series: dict[date, dict[str, Any]] = {}
+    for row in query.order_by(ImpactRollup.bucket_start.asc()).all():
+        point = series.setdefault(row.bucket_start, {"bucket_start": row.bucket_start.isoformat(), **_empty_facts()})
+        for field in FACT_FIELDS:
+            point[field] += getattr(row, field) or 0
+
+    return [
+        {
+            **point,
+            "benefit_value_discovered": round(point["benefit_value_discovered"], 2),
+            "benefit_value_unlocked": round(point["benefit_value_unlocked"], 2),
+        }
+        for point in series.values()
+    ]
+
+
+def build_daily_facts(
+    discovered_rows: list[tuple],
+    claimed_rows: list[tuple],
+    *,
+    value_map: dict[str, float],
+) -> dict[tuple[date, str], dict[str, Any]]:
+    """Fold grouped progress counts into per-(day, state) fact rows.
+
+    ``discovered_rows`` are ``(day, state, benefit_name, count)`` keyed on creation;
+    ``claimed_rows`` are ``(day, state, benefit_name, status, foreclosure_risk, count)``
+    keyed on the last status change.
+    """
+    facts: dict[tuple[date, str], dict[str, Any]] = defaultdict(_empty_facts)
+
+    for day, state, benefit_name, count in discovered_rows:
+        node = facts[(day, state or "UNKNOWN")]
+        node["benefits_discovered"] += count
+        node["benefit_value_discovered"] += value_map.get(benefit_name, 0.0) * count
+
+    for day, state, benefit_name, status, foreclosure_risk, count in claimed_rows:
+        node = facts[(day, state or "UNKNOWN")]
+        node["benefits_claimed"] += count
+        if status in UNLOCKED_STATUSES:
+            node["benefit_value_unlocked"] += value_map.get(benefit_name, 0.0) * count
+        if foreclosure_risk and benefit_name in FORECLOSURE_PREVENTION_BENEFITS:
+            node["foreclosure_prevention_claims"] += count
+
+    return dict(facts)
+
+
+def roll_up_weekly(daily: dict[tuple[date, str], dict[str, Any]]) -> dict[tuple[date, str], dict[str, Any]]:
+    weekly: dict[tuple[date, str], dict[str, Any]] = defaultdict(_empty_facts)
+    for (day, state), facts in daily.items():
+        node = weekly[(week_start(day), state)]
+        for field in FACT_FIELDS:
+            node[field] += facts[field]
+    return dict(weekly)
+
+
+def week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def _grouped_progress_counts(db: Session, *, window_start: date | None) -> tuple[list[tuple], list[tuple]]:
+    created_day = func.date(BenefitProgress.created_at)
+    discovered_query = (
+        db.query(created_day, VeteranProfile.state_of_residence, BenefitProgress.benefit_name, func.count(BenefitProgress.id))
+        .join(VeteranProfile, VeteranProfile.case_id == BenefitProgress.case_id)
+    )
+    if window_start is not None:
+        discovered_query = discovered_query.filter(BenefitProgress.created_at >= window_start)
+    discovered_rows = discovered_query.group_by(
+        created_day, VeteranProfile.state_of_residence, BenefitProgress.benefit_name
+    ).all()
+
+    updated_day = func.date(BenefitProgress.updated_at)
+    claimed_query = (
+        db.query(
+            updated_day,
+            VeteranProfile.state_of_residence,
+            BenefitProgress.benefit_name,
+            BenefitProgress.status,
+            VeteranProfile.foreclosure_risk,
+            func.count(BenefitProgress.id),
+        )
+        .join(VeteranProfile, VeteranProfile.case_id == BenefitProgress.case_id)
+        .filter(BenefitProgress.status.in_(sorted(CLAIMED_STATUSES)))
+    )
+    if window_start is not None:
+        claimed_query = claimed_query.filter(BenefitProgress.updated_at >= window_start)
+    claimed_rows = claimed_query.group_by(
+        updated_day,
+        VeteranProfile.state_of_residence,
+        BenefitProgress.benefit_name,
+        BenefitProgress.status,
+        VeteranProfile.foreclosure_risk,
+    ).all()
+
+    return discovered_rows, claimed_rows
+
+
+def _get_or_create_watermark(db: Session) -> RollupWatermark:
+    watermark = (
+        db.query(RollupWatermark)
+        .filter(RollupWatermark.rollup_name == ROLLUP_NAME)
+        .with_for_update()
+        .first()
+    )
+    if not watermark:
+        watermark = RollupWatermark(rollup_name=ROLLUP_NAME, watermark_at=None, rows_processed=0)
+        db.add(watermark)
+        db.flush()
+    return watermark
+
+
+def _empty_facts() -> dict[str, Any]:
+    return {
+        "benefits_discovered": 0,
+        "benefits_claimed": 0,
+        "benefit_value_discovered": 0.0,
+        "benefit_value_unlocked": 0.0,
+        "foreclosure_prevention_claims": 0,
+    }
@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import logging
+import math
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from fastapi import HTTPException
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.lead_intelligence import LeadConnectorState
+from app.services.lead_intelligence_service import bulk_ingest_leads, parse_lead_timestamp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_CONNECTOR_TIMEOUT_SECONDS = 300.0
+# Extra time the coordinator allows a connector to notice its deadline and roll back.
+TIMEOUT_GRACE_SECONDS = 5.0
+
+
+class ConnectorTimeout(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class LeadConnector:
+    """A county feed: ``fetch(since)`` yields leads filed at or after ``since`` (None on the first run)."""
+
+    name: str
+    source_type: str
+    fetch: Callable[[datetime | None], Iterable[dict]]
+    timeout_seconds: float | None = None
+    # Lead field carrying the filing time the watermark advances on.
+    watermark_field: str = "filed_at"
+
+
+CONNECTORS: dict[str, LeadConnector] = {}
+
+
+def register_connector(
+    name: str,
+    *,
+    source_type: str,
+    timeout_seconds: float | None = None,
+    watermark_field: str = "filed_at",
+) -> Callable[[Callable[[datetime | None], Iterable[dict]]], Callable[[datetime | None], Iterable[dict]]]:
+    """Register a fetch function as a lead connector; its name doubles as the lead source name."""
+
+    def decorator(fetch: Callable[[datetime | None], Iterable[dict]]) -> Callable[[datetime | None], Iterable[dict]]:
+        CONNECTORS[name] = LeadConnector(
+            name=name,
+            source_type=source_type,
+            fetch=fetch,
+            timeout_seconds=timeout_seconds,
+            watermark_field=watermark_field,
+        )
+        return fetch
+
+    return decorator
+
+
+class _ConnectorStream:
+    """Passes a connector's leads through, tracking the watermark and enforcing the deadline."""
+
+    def __init__(self, connector: LeadConnector, *, since: datetime | None, deadline: float):
+        self._connector = connector
+        self._field = connector.watermark_field
+        self._since = since
+        self._deadline = deadline
+        self.watermark = since
+        self.received = 0
+        self.skipped = 0
+
+    def __iter__(self) -> Iterator[dict]:
+        for lead in self._connector.fetch(self._since):
+            self.check_deadline()
+            filed_at = parse_lead_timestamp(lead.get(self._field))
+            # Sources that ignore ``since`` still only contribute new filings.
+            if self._since is not None and filed_at is not None and filed_at < self._since:
+                self.skipped += 1
+                continue
+            if filed_at is not None and (self.watermark is None or filed_at > self.watermark):
+                self.watermark = filed_at
+            self.received += 1
+            yield lead
+
+    def check_deadline(self) -> None:
+        if time.monotonic() > self._deadline:
+            raise ConnectorTimeout()
+
+
+def run_lead_connectors(
+    session_factory: Callable[[], Session],
+    *,
+    names: Iterable[str] | None = None,
+    max_workers: int | None = None,
+    timeout_seconds: float | None = None,
+) -> dict[str, Any]:
+    """Run registered connectors concurrently, each ingesting and committing in its own session.
+
+    A connector that overruns its timeout rolls back and reports ``timed_out``
+    without holding up the others; one whose fetch blocks outright is reported
+    once the coordinator stops waiting for it.
+    """
+    if names is None:
+        connectors = list(CONNECTORS.values())
+    else:
+        unknown = sorted(set(names) - set(CONNECTORS))
+        if unknown:
+            raise HTTPException(status_code=404, detail=f"Unknown lead connectors: {', '.join(unknown)}")
+        connectors = [CONNECTORS[name] for name in dict.fromkeys(names)]
+    if not connectors:
+        return {"status": "success", "leads_ingested": 0, "duration_ms": 0.0, "connectors": []}
+
+    started = time.perf_counter()
+    workers = min(max_workers or _max_workers(), len(connectors))
+    timeouts = {c.name: c.timeout_seconds or timeout_seconds or _default_timeout() for c in connectors}
+    # Connectors queued behind a full pool start late, so allow for each wave.
+    waves = math.ceil(len(connectors) / workers)
+    overall_timeout = waves * (max(timeouts.values()) + TIMEOUT_GRACE_SECONDS)
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lead-connector")
+    try:
+        futures = {
+            connector.name: pool.submit(_run_connector, session_factory, connector, timeouts[connector.name])
+            for connector in connectors
+        }
+        wait(futures.values(), timeout=overall_timeout)
+    finally:
+        # Never block on a connector stuck in its fetch; it rolls back if it ever resumes.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    results = []
+    for connector in connectors:
+        future = futures[connector.name]
+        if future.done() and not future.cancelled():
+            results.append(future.result())
+        else:
+            results.append(_connector_result(connector.name, status="timed_out", error="Coordinator stopped waiting"))
+            logger.warning("lead_connector.abandoned", extra={"connector": connector.name})
+
+    return {
+        "status": "success" if all(r["status"] == "succeeded" for r in results) else "partial",
+        "leads_ingested": sum(r["leads_ingested"] for r in results),
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        "connectors": results,
+    }
+
+
+def weekly_foreclosure_scan(db: Session, *, session_factory: Callable[[], Session] | None = None) -> dict:
+    """Run every registered county connector; each commits on its own, independent of ``db``."""
+    factory = session_factory or sessionmaker(bind=db.get_bind(), autocommit=False, autoflush=False)
+    outcome = run_lead_connectors(factory)
+    return {
+        "status": outcome["status"],
+        "weekly_leads_ingested": outcome["leads_ingested"],
+        "duration_ms": outcome["duration_ms"],
+        "connectors": outcome["connectors"],
+    }
+
+
+def connector_states(db: Session) -> list[dict[str, Any]]:
+    states = {state.connector_name: state for state in db.query(LeadConnectorState).all()}
+    summaries = []
+    for name, connector in sorted(CONNECTORS.items()):
+        state = states.get(name) or LeadConnectorState(connector_name=name, runs=0, total_leads_ingested=0)
+        summaries.append(
+            {
+                "connector": name,
+                "source_type": connector.source_type,
+                "timeout_seconds": connector.timeout_seconds or _default_timeout(),
+                "watermark_at": _isoformat(state.watermark_at),
+                "runs": state.runs,
+                "total_leads_ingested": state.total_leads_ingested,
+                "last_status": state.last_status,
+                "last_error": state.last_error,
+                "last_leads_received": state.last_leads_received or 0,
+                "last_leads_ingested": state.last_leads_ingested or 0,
+                "last_duration_ms": state.last_duration_ms,
+                "last_run_at": _isoformat(state.last_run_at),
+            }
+        )
+    return summaries
+
+
+def _run_connector(session_factory: Callable[[], Session], connector: LeadConnector, timeout: float) -> dict[str, Any]:
+    started = time.perf_counter()
+    deadline = time.monotonic() + timeout
+    db = session_factory()
+    try:
+        # Holding the state row lock makes overlapping runs of one connector take turns.
+        state = _lock_state(db, connector.name)
+        stream = _ConnectorStream(connector, since=state.watermark_at, deadline=deadline)
+        try:
+            ingest = bulk_ingest_leads(db, source_name=connector.name, source_type=connector.source_type, leads=stream)
+            stream.check_deadline()
+        except Exception as exc:
+            db.rollback()
+            status = "timed_out" if isinstance(exc, ConnectorTimeout) else "failed"
+            error = f"Exceeded {timeout:g}s timeout" if status == "timed_out" else f"{type(exc).__name__}: {exc}"
+            result = _connector_result(
+                connector.name,
+                status=status,
+                error=error,
+                leads_received=stream.received,
+                skipped=stream.skipped,
+                duration_ms=_elapsed_ms(started),
+            )
+            _record_run(db, _lock_state(db, connector.name), result, watermark=None)
+            db.commit()
+            logger.warning("lead_connector.failed", extra=result)
+            return result
+
+        result = _connector_result(
+            connector.name,
+            status="succeeded",
+            leads_received=stream.received,
+            leads_ingested=ingest["leads_ingested"],
+            duplicates=ingest["duplicates"],
+            invalid=ingest["invalid"],
+            skipped=stream.skipped,
+            duration_ms=_elapsed_ms(started),
+            watermark_at=_isoformat(stream.watermark),
+        )
+        _record_run(db, state, result, watermark=stream.watermark)
+        db.commit()
+        logger.info("lead_connector.completed", extra=result)
+        return result
+    finally:
+        db.close()
+
+
+def _lock_state(db: Session, connector_name: str) -> LeadConnectorState:
+    db.execute(
+        pg_insert(LeadConnectorState)
+        .values(connector_name=connector_name, runs=0, total_leads_ingested=0)
+        .on_conflict_do_nothing(index_elements=["connector_name"])
+    )
+    return db.get(LeadConnectorState, connector_name, with_for_update=True, populate_existing=True)
+
+
+def _record_run(db: Session, state: LeadConnectorState, result: dict[str, Any], *, watermark: datetime | None) -> None:
+    if watermark is not None:
+        state.watermark_at = watermark
+    state.runs = int(state.runs or 0) + 1
+    state.total_leads_ingested = int(state.total_leads_ingested or 0) + result["leads_ingested"]
+    state.last_status = result["status"]
+    state.last_error = result["error"]
+    state.last_leads_received = result["leads_received"]
+    state.last_leads_ingested = result["leads_ingested"]
+    state.last_duration_ms = result["duration_ms"]
+    state.last_run_at = datetime.now(timezone.utc)
+    db.flush()
+
+
+def _connector_result(
+    name: str,
+    *,
+    status: str,
+    error: str | None = None,
+    leads_received: int = 0,
+    leads_ingested: int = 0,
+    duplicates: int = 0,
+    invalid: int = 0,
+    skipped: int = 0,
+    duration_ms: float | None = None,
+    watermark_at: str | None = None,
+) -> dict[str, Any]:
+    return {
+        "connector": name,
+        "status": status,
+        "error": error,
+        "leads_received": leads_received,
+        "leads_ingested": leads_ingested,
+        "duplicates": duplicates,
+        "invalid": invalid,
+        "skipped": skipped,
+        "duration_ms": duration_ms,
+        "watermark_at": watermark_at,
+    }
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def _max_workers() -> int:
+    return int(os.getenv("LEAD_CONNECTOR_MAX_WORKERS", str(DEFAULT_MAX_WORKERS)))
+
+
+def _default_timeout() -> float:
+    return float(os.getenv("LEAD_CONNECTOR_TIMEOUT_SECONDS", str(DEFAULT_CONNECTOR_TIMEOUT_SECONDS)))
+
+
+def _filed_since(leads: list[dict], since: datetime | None) -> Iterator[dict]:
+    for lead in leads:
+        filed_at = parse_lead_timestamp(lead.get("filed_at"))
+        if since is None or filed_at is None or filed_at >= since:
+            yield lead
+
+
+@register_connector("dallas_county_foreclosure_connector", source_type="foreclosure_filings")
+def dallas_county_foreclosure_connector(since: datetime | None) -> Iterator[dict]:
+    return _filed_since(
+        [
+            {
+                "property_address": "100 Elm St",
+                "city": "Dallas",
+                "state": "TX",
+                "foreclosure_stage": "pre_foreclosure",
+                "tax_delinquent": True,
+                "equity_estimate": 60000,
+                "filed_at": "2026-10-12T00:00:00+00:00",
+            }
+        ],
+        since,
+    )
+
+
+@register_connector("tarrant_county_trustee_connector", source_type="trustee_sale_notices")
+def tarrant_county_trustee_connector(since: datetime | None) -> Iterator[dict]:
+    return _filed_since(
+        [
+            {
+                "property_address": "200 Oak St",
+                "city": "Fort Worth",
+                "state": "TX",
+                "foreclosure_stage": "auction_scheduled",
+                "tax_delinquent": False,
+                "equity_estimate": 45000,
+                "filed_at": "2026-10-13T00:00:00+00:00",
+            }
+        ],
+        since,
+    )
+
+
+@register_connector("collin_county_notice_connector", source_type="notice_connector")
+def collin_county_notice_connector(since: datetime | None) -> Iterator[dict]:
+    return _filed_since(
+        [
+            {
+                "property_address": "300 Pine St",
+                "city": "Plano",
+                "state": "TX",
+                "foreclosure_stage": "notice_of_default",
+                "tax_delinquent": True,
+                "equity_estimate": 85000,
+                "filed_at": "2026-10-14T00:00:00+00:00",
+            }
+        ],
+        since,
+    )
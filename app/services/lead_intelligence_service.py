@@ -1,70 +1,160 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import csv
+import json
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timezone
+from itertools import islice
+from typing import Any, TextIO
 from uuid import UUID
 
 from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.models.cases import Case
 from app.models.enums import CaseStatus
 from app.models.lead_intelligence import LeadScore, LeadSource, PropertyLead
 from app.models.policy_versions import PolicyVersion
+from app.services import metrics
+from app.services.address_normalization import normalize_address
+from app.services.lead_scoring_service import (
+    SCORE_THRESHOLD,
+    LeadColumns,
+    converted_lead_ids,
+    lead_grade,
+    recommended_action,
+    score_columns,
+)
 
+logger = logging.getLogger(__name__)
 
-SCORE_THRESHOLD = 65.0
 
+BULK_INGEST_THRESHOLD = 500
+DEFAULT_INGEST_CHUNK_SIZE = 5000
+TRUE_FLAGS = {"true", "t", "yes", "y", "1"}
 
-def ingest_leads(db: Session, *, source_name: str, source_type: str, leads: list[dict]) -> dict:
-    source = db.query(LeadSource).filter(LeadSource.source_name == source_name).first()
 
-    if not source:
-        source = LeadSource(source_name=source_name, source_type=source_type)
-        db.add(source)
-        db.flush()
+def ingest_leads(db: Session, *, source_name: str, source_type: str, leads: list[dict]) -> dict:
+    """Add leads a source has not seen yet, keyed by normalized address; the caller commits.
+
+    Lists above ``BULK_INGEST_THRESHOLD`` go through ``bulk_ingest_leads``.
+    """
+    if len(leads) > BULK_INGEST_THRESHOLD:
+        return bulk_ingest_leads(db, source_name=source_name, source_type=source_type, leads=leads)
+
+    started = time.perf_counter()
+    source = _lead_source(db, source_name, source_type)
+    rows, invalid = _unique_lead_rows(leads, source.id)
+    existing = {
+        lead.address_key
+        for lead in db.query(PropertyLead)
+        .filter(PropertyLead.source_id == source.id, PropertyLead.address_key.in_(list(rows)))
+        .all()
+    }
 
     ingested = 0
-
-    for lead in leads:
-        if deduplicate_leads(
-            db,
-            source_id=source.id,
-            property_address=lead.get("property_address", ""),
-        ):
+    for key, row in rows.items():
+        if key in existing:
             continue
-
-        db.add(
-            PropertyLead(
-                source_id=source.id,
-                property_address=lead.get("property_address", ""),
-                city=lead.get("city"),
-                state=lead.get("state"),
-                zip_code=lead.get("zip_code"),
-                foreclosure_stage=lead.get("foreclosure_stage"),
-                tax_delinquent=str(bool(lead.get("tax_delinquent", False))).lower(),
-                equity_estimate=float(lead.get("equity_estimate", 0) or 0),
-                auction_date=lead.get("auction_date"),
-                owner_occupancy=str(bool(lead.get("owner_occupancy", True))).lower(),
-                raw_payload=lead,
-            )
-        )
-
+        db.add(PropertyLead(**row))
         ingested += 1
 
     db.flush()
 
-    return {
-        "source": source_name,
-        "leads_ingested": ingested,
-    }
-
+    summary = _ingest_summary(source_name, received=len(leads), ingested=ingested, invalid=invalid)
+    _record_ingest_metrics(source_type, summary, time.perf_counter() - started)
+    return summary
+
+
+def bulk_ingest_leads(
+    db: Session,
+    *,
+    source_name: str,
+    source_type: str,
+    leads: Iterable[dict],
+    chunk_size: int = DEFAULT_INGEST_CHUNK_SIZE,
+) -> dict:
+    """Stream leads into ``property_leads`` chunk by chunk; the caller commits.
+
+    Each chunk is deduplicated on its normalized address keys, checked against the
+    source's existing leads in one query and inserted in one statement. ``ON CONFLICT
+    DO NOTHING`` covers leads another writer inserted in between.
+    """
+    source = _lead_source(db, source_name, source_type)
+    received = ingested = invalid = 0
+    started = time.perf_counter()
+
+    for chunk in _chunks(leads, chunk_size):
+        received += len(chunk)
+        rows, chunk_invalid = _unique_lead_rows(chunk, source.id)
+        invalid += chunk_invalid
+        if not rows:
+            continue
 
-def deduplicate_leads(db: Session, *, source_id: UUID, property_address: str) -> bool:
+        existing = set(
+            db.scalars(
+                select(PropertyLead.address_key).where(
+                    PropertyLead.source_id == source.id,
+                    PropertyLead.address_key.in_(list(rows)),
+                )
+            )
+        )
+        fresh = [row for key, row in rows.items() if key not in existing]
+        if fresh:
+            inserted = db.execute(
+                pg_insert(PropertyLead)
+                .on_conflict_do_nothing(index_elements=["source_id", "address_key"])
+                .returning(PropertyLead.id),
+                fresh,
+            ).all()
+            ingested += len(inserted)
+
+    summary = _ingest_summary(source_name, received=received, ingested=ingested, invalid=invalid)
+    elapsed = time.perf_counter() - started
+    _record_ingest_metrics(source_type, summary, elapsed)
+    logger.info("lead_ingestion.completed", extra={**summary, "elapsed_ms": round(elapsed * 1000, 1)})
+    return summary
+
+
+def iter_lead_file(stream: TextIO, file_format: str) -> Iterator[dict]:
+    """Yield leads from a CSV or NDJSON text stream one record at a time."""
+    file_format = file_format.lower()
+    if file_format == "csv":
+        for record in csv.DictReader(stream):
+            # Empty CSV cells mean "not provided", like a missing JSON key.
+            yield {key: value for key, value in record.items() if key and value not in ("", None)}
+    elif file_format in ("ndjson", "jsonl"):
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise HTTPException(status_code=422, detail=f"Invalid JSON on line {line_number}") from exc
+            if not isinstance(record, dict):
+                raise HTTPException(status_code=422, detail=f"Line {line_number} is not a JSON object")
+            yield record
+    else:
+        raise HTTPException(status_code=422, detail=f"Unsupported lead file format '{file_format}'")
+
+
+def deduplicate_leads(
+    db: Session,
+    *,
+    source_id: UUID,
+    property_address: str,
+    city: str | None = None,
+    state: str | None = None,
+) -> bool:
     existing = (
         db.query(PropertyLead)
         .filter(
             PropertyLead.source_id == source_id,
-            PropertyLead.property_address == property_address,
+            PropertyLead.address_key == normalize_address(property_address, city, state),
         )
         .first()
     )
@@ -78,39 +168,14 @@ def score_property_lead(db: Session, *, lead_id: UUID, actor_id: UUID | None = N
     if not lead:
         raise HTTPException(status_code=404, detail="Lead not found")
 
-    score = 0.0
-    stage = (lead.foreclosure_stage or "").lower()
-
-    if "auction" in stage:
-        score += 30
-    elif "default" in stage:
-        score += 20
-    elif "pre" in stage:
-        score += 15
-
-    if str(lead.tax_delinquent).lower() == "true":
-        score += 20
-
-    if float(lead.equity_estimate or 0) > 50000:
-        score += 20
-
-    if lead.auction_date:
-        days = (lead.auction_date - datetime.now(timezone.utc)).days
-        if days <= 45:
-            score += 15
-
-    if str(lead.owner_occupancy).lower() == "true":
-        score += 10
-
-    score = round(min(100.0, score), 2)
-
-    grade = "A" if score >= 80 else "B" if score >= 65 else "C"
+    (score,) = score_columns(LeadColumns.from_leads([lead], now=datetime.now(timezone.utc)))
+    grade = lead_grade(score)
 
     score_row = LeadScore(
         lead_id=lead.id,
         score=score,
         grade=grade,
-        recommended_action="create_case" if score >= SCORE_THRESHOLD else "monitor",
+        recommended_action=recommended_action(score),
     )
 
     db.add(score_row)
@@ -118,7 +183,7 @@ def score_property_lead(db: Session, *, lead_id: UUID, actor_id: UUID | None = N
 
     created_case_id = None
 
-    if score >= SCORE_THRESHOLD and actor_id:
+    if score >= SCORE_THRESHOLD and actor_id and not converted_lead_ids(db, [lead.id]):
         created_case_id = create_case_from_lead(
             db,
             lead_id=lead.id,
@@ -172,80 +237,111 @@ def create_case_from_lead(db: Session, *, lead_id: UUID, actor_id: UUID) -> UUID
     return case.id
 
 
-def weekly_foreclosure_scan(db: Session) -> dict:
-    connectors = [
-        dallas_county_foreclosure_connector,
-        tarrant_county_trustee_connector,
-        collin_county_notice_connector,
-    ]
-
-    total = 0
+def _lead_source(db: Session, source_name: str, source_type: str) -> LeadSource:
+    source = db.query(LeadSource).filter(LeadSource.source_name == source_name).first()
+    if not source:
+        source = LeadSource(source_name=source_name, source_type=source_type)
+        db.add(source)
+        db.flush()
+    return source
 
-    for connector in connectors:
-        result = connector(db)
-        total += result.get("leads_ingested", 0)
 
+def _unique_lead_rows(leads: Iterable[dict], source_id: UUID) -> tuple[dict[str, dict], int]:
+    # First occurrence of each address key wins; leads without an address are invalid.
+    rows: dict[str, dict] = {}
+    invalid = 0
+    for lead in leads:
+        row = _lead_row(lead, source_id)
+        if row is None:
+            invalid += 1
+        else:
+            rows.setdefault(row["address_key"], row)
+    return rows, invalid
+
+
+def _lead_row(lead: dict, source_id: UUID) -> dict | None:
+    address = str(lead.get("property_address") or "").strip()
+    key = normalize_address(address, lead.get("city"), lead.get("state"))
+    if not address or not key:
+        return None
     return {
-        "status": "success",
-        "weekly_leads_ingested": total,
+        "source_id": source_id,
+        "property_address": address,
+        "address_key": key,
+        "city": lead.get("city"),
+        "state": lead.get("state"),
+        "zip_code": str(lead["zip_code"]) if lead.get("zip_code") is not None else None,
+        "foreclosure_stage": lead.get("foreclosure_stage"),
+        "tax_delinquent": _flag(lead.get("tax_delinquent"), default=False),
+        "equity_estimate": _amount(lead.get("equity_estimate")),
+        "auction_date": parse_lead_timestamp(lead.get("auction_date")),
+        "owner_occupancy": _flag(lead.get("owner_occupancy"), default=True),
+        "raw_payload": json.loads(json.dumps(lead, default=str)),
     }
 
 
-def dallas_county_foreclosure_connector(db: Session) -> dict:
-    leads = [
-        {
-            "property_address": "100 Elm St",
-            "city": "Dallas",
-            "state": "TX",
-            "foreclosure_stage": "pre_foreclosure",
-            "tax_delinquent": True,
-            "equity_estimate": 60000,
-        }
-    ]
-
-    return ingest_leads(
-        db,
-        source_name="dallas_county_foreclosure_connector",
-        source_type="foreclosure_filings",
-        leads=leads,
-    )
-
-
-def tarrant_county_trustee_connector(db: Session) -> dict:
-    leads = [
-        {
-            "property_address": "200 Oak St",
-            "city": "Fort Worth",
-            "state": "TX",
-            "foreclosure_stage": "auction_scheduled",
-            "tax_delinquent": False,
-            "equity_estimate": 45000,
-        }
-    ]
-
-    return ingest_leads(
-        db,
-        source_name="tarrant_county_trustee_connector",
-        source_type="trustee_sale_notices",
-        leads=leads,
+def _flag(value: Any, *, default: bool) -> str:
+    # Stored as "true"/"false"; CSV exports send these as text.
+    if value is None or value == "":
+        return str(default).lower()
+    if isinstance(value, str):
+        return str(value.strip().lower() in TRUE_FLAGS).lower()
+    return str(bool(value)).lower()
+
+
+def _amount(value: Any) -> float:
+    if isinstance(value, str):
+        value = value.replace("$", "").replace(",", "").strip()
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def parse_lead_timestamp(value: Any) -> datetime | None:
+    """ISO 8601 dates and datetimes, in UTC when no offset is given.
+
+    Anything else is stored as NULL and logged, so a feed that changes its date
+    format shows up in the logs rather than as leads without auction dates.
+    """
+    if value is None or value == "":
+        return None
+    parsed = value
+    if isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value.strip())
+        except ValueError:
+            parsed = None
+    elif isinstance(value, date) and not isinstance(value, datetime):
+        parsed = datetime.combine(value, datetime.min.time())
+    if not isinstance(parsed, datetime):
+        logger.warning("lead_ingestion.unparsed_timestamp", extra={"value": str(value)[:100]})
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _chunks(items: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _record_ingest_metrics(source_type: str, summary: dict, seconds: float) -> None:
+    # Labelled by source type: source names are per county/feed and unbounded.
+    metrics.record_ingestion(
+        source_type,
+        created=summary["leads_ingested"],
+        duplicates=summary["duplicates"],
+        invalid=summary["invalid"],
     )
+    metrics.INGESTION_RUN_SECONDS.labels(source_type).observe(seconds)
 
 
-def collin_county_notice_connector(db: Session) -> dict:
-    leads = [
-        {
-            "property_address": "300 Pine St",
-            "city": "Plano",
-            "state": "TX",
-            "foreclosure_stage": "notice_of_default",
-            "tax_delinquent": True,
-            "equity_estimate": 85000,
-        }
-    ]
-
-    return ingest_leads(
-        db,
-        source_name="collin_county_notice_connector",
-        source_type="notice_connector",
-        leads=leads,
-    )
+def _ingest_summary(source_name: str, *, received: int, ingested: int, invalid: int) -> dict:
+    return {
+        "source": source_name,
+        "leads_received": received,
+        "leads_ingested": ingested,
+        "duplicates": received - ingested - invalid,
+        "invalid": invalid,
+    }
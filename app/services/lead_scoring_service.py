@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models.cases import Case
+from app.models.enums import CaseStatus
+from app.models.lead_intelligence import LeadScore, PropertyLead
+from app.models.policy_versions import PolicyVersion
+from app.services.case_search_service import refresh_case_search_index
+
+logger = logging.getLogger(__name__)
+
+SCORE_THRESHOLD = 65.0
+DEFAULT_SCORING_CHUNK_SIZE = 2000
+AUCTION_WINDOW_DAYS = 45
+
+LEAD_SCORING_COLUMNS = (
+    PropertyLead.id,
+    PropertyLead.property_address,
+    PropertyLead.city,
+    PropertyLead.state,
+    PropertyLead.foreclosure_stage,
+    PropertyLead.tax_delinquent,
+    PropertyLead.equity_estimate,
+    PropertyLead.auction_date,
+    PropertyLead.owner_occupancy,
+)
+
+
+@dataclass(frozen=True)
+class LeadColumns:
+    """Scoring inputs for a set of leads, one list per attribute, aligned by position."""
+
+    lead_ids: list[UUID]
+    stages: list[str]
+    tax_delinquent: list[bool]
+    equity: list[float]
+    # Whole days until the auction; None when no auction is scheduled.
+    auction_days: list[int | None]
+    owner_occupied: list[bool]
+
+    @classmethod
+    def from_leads(cls, leads: Sequence[Any], *, now: datetime) -> "LeadColumns":
+        return cls(
+            lead_ids=[lead.id for lead in leads],
+            stages=[(lead.foreclosure_stage or "").lower() for lead in leads],
+            tax_delinquent=[str(lead.tax_delinquent).lower() == "true" for lead in leads],
+            equity=[float(lead.equity_estimate or 0) for lead in leads],
+            auction_days=[(lead.auction_date - now).days if lead.auction_date else None for lead in leads],
+            owner_occupied=[str(lead.owner_occupancy).lower() == "true" for lead in leads],
+        )
+
+    def __len__(self) -> int:
+        return len(self.lead_ids)
+
+
+def _stage_points(columns: LeadColumns) -> list[float]:
+    return [
+        30.0 if "auction" in stage else 20.0 if "default" in stage else 15.0 if "pre" in stage else 0.0
+        for stage in columns.stages
+    ]
+
+
+def _tax_points(columns: LeadColumns) -> list[float]:
+    return [20.0 if delinquent else 0.0 for delinquent in columns.tax_delinquent]
+
+
+def _equity_points(columns: LeadColumns) -> list[float]:
+    return [20.0 if equity > 50000 else 0.0 for equity in columns.equity]
+
+
+def _auction_window_points(columns: LeadColumns) -> list[float]:
+    return [15.0 if days is not None and days <= AUCTION_WINDOW_DAYS else 0.0 for days in columns.auction_days]
+
+
+def _occupancy_points(columns: LeadColumns) -> list[float]:
+    return [10.0 if occupied else 0.0 for occupied in columns.owner_occupied]
+
+
+# Each rule maps the whole column set to one point value per lead.
+SCORING_RULES: tuple[Callable[[LeadColumns], list[float]], ...] = (
+    _stage_points,
+    _tax_points,
+    _equity_points,
+    _auction_window_points,
+    _occupancy_points,
+)
+
+
+def score_columns(columns: LeadColumns) -> list[float]:
+    if not len(columns):
+        return []
+    return [round(min(100.0, sum(points)), 2) for points in zip(*(rule(columns) for rule in SCORING_RULES))]
+
+
+def lead_grade(score: float) -> str:
+    return "A" if score >= 80 else "B" if score >= 65 else "C"
+
+
+def recommended_action(score: float, threshold: float = SCORE_THRESHOLD) -> str:
+    return "create_case" if score >= threshold else "monitor"
+
+
+def rescore_leads(
+    db: Session,
+    *,
+    lead_ids: Iterable[UUID] | None = None,
+    actor_id: UUID | None = None,
+    threshold: float = SCORE_THRESHOLD,
+    chunk_size: int = DEFAULT_SCORING_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Score leads chunk by chunk and record one ``LeadScore`` each; the caller commits.
+
+    With an ``actor_id``, leads at or over the threshold that have no case yet get
+    one, created in one statement per chunk under the active policy.
+    """
+    started = time.perf_counter()
+    now = datetime.now(timezone.utc)
+    policy = _active_policy(db) if actor_id else None
+    grades: Counter[str] = Counter()
+    scored = cases_created = 0
+
+    for leads in _lead_chunks(db, lead_ids, chunk_size):
+        scores = score_columns(LeadColumns.from_leads(leads, now=now))
+        case_ids = _create_cases(db, leads, scores, threshold, policy, actor_id) if policy else {}
+
+        db.execute(
+            insert(LeadScore),
+            [
+                {
+                    "id": uuid4(),
+                    "lead_id": lead.id,
+                    "score": score,
+                    "grade": lead_grade(score),
+                    "recommended_action": recommended_action(score, threshold),
+                    "created_case_id": case_ids.get(lead.id),
+                    "created_at": now,
+                }
+                for lead, score in zip(leads, scores)
+            ],
+        )
+        grades.update(lead_grade(score) for score in scores)
+        scored += len(leads)
+        cases_created += len(case_ids)
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "leads_scored": scored,
+        "cases_created": cases_created,
+        "grades": {grade: grades.get(grade, 0) for grade in ("A", "B", "C")},
+        "threshold": threshold,
+        "seconds": round(elapsed, 3),
+        "leads_per_second": round(scored / elapsed, 1) if elapsed > 0 else None,
+    }
+    logger.info("lead_scoring.completed", extra=summary)
+    return summary
+
+
+def _lead_chunks(db: Session, lead_ids: Iterable[UUID] | None, chunk_size: int):
+    if lead_ids is not None:
+        ids = list(dict.fromkeys(lead_ids))
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start : start + chunk_size]
+            leads = db.execute(select(*LEAD_SCORING_COLUMNS).where(PropertyLead.id.in_(chunk))).all()
+            if leads:
+                yield leads
+        return
+
+    # Keyset pagination keeps every page an index range scan on the primary key.
+    last_id = None
+    while True:
+        statement = select(*LEAD_SCORING_COLUMNS).order_by(PropertyLead.id).limit(chunk_size)
+        if last_id is not None:
+            statement = statement.where(PropertyLead.id > last_id)
+        leads = db.execute(statement).all()
+        if not leads:
+            return
+        yield leads
+        last_id = leads[-1].id
+
+
+def _active_policy(db: Session) -> PolicyVersion:
+    policy = (
+        db.query(PolicyVersion)
+        .filter(PolicyVersion.is_active.is_(True))
+        .order_by(PolicyVersion.created_at.desc())
+        .first()
+    )
+    if not policy:
+        raise HTTPException(status_code=400, detail="No active policy for lead conversion")
+    return policy
+
+
+def converted_lead_ids(db: Session, lead_ids: Iterable[UUID]) -> set[str]:
+    return {
+        lead_id
+        for (lead_id,) in db.query(Case.meta["lead_id"].as_string()).filter(
+            Case.case_type == "lead_intelligence",
+            Case.meta["lead_id"].as_string().in_([str(lead_id) for lead_id in lead_ids]),
+        )
+    }
+
+
+def _create_cases(
+    db: Session,
+    leads: Sequence[Any],
+    scores: Sequence[float],
+    threshold: float,
+    policy: PolicyVersion,
+    actor_id: UUID,
+) -> dict[UUID, UUID]:
+    qualifying = [lead for lead, score in zip(leads, scores) if score >= threshold]
+    if not qualifying:
+        return {}
+
+    converted = converted_lead_ids(db, [lead.id for lead in qualifying])
+    rows = [
+        {
+            "id": uuid4(),
+            "status": CaseStatus.intake_submitted,
+            "created_by": actor_id,
+            "program_type": policy.program_key,
+            "program_key": policy.program_key,
+            "case_type": "lead_intelligence",
+            "meta": {
+                "property_address": lead.property_address,
+                "city": lead.city,
+                "state": lead.state,
+                "lead_id": str(lead.id),
+            },
+            "policy_version_id": policy.id,
+        }
+        for lead in qualifying
+        if str(lead.id) not in converted
+    ]
+    if not rows:
+        return {}
+
+    db.execute(insert(Case), rows)
+    # Core inserts bypass the flush listener that indexes new cases.
+    refresh_case_search_index(db, case_ids=[row["id"] for row in rows])
+    return {UUID(row["meta"]["lead_id"]): row["id"] for row in rows}
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "gpt-4o-mini"
+DEFAULT_OPENAI_URL = "https://api.openai.com/v1/chat/completions"
+DEFAULT_TIMEOUT_SECONDS = 20.0
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_CACHE_TTL_SECONDS = 3600
+DEFAULT_CACHE_MAX_ENTRIES = 2000
+
+
+@dataclass(frozen=True)
+class Completion:
+    text: str
+    total_tokens: int
+
+
+class LLMBackend(Protocol):
+    name: str
+
+    async def complete(self, client: httpx.AsyncClient, *, model: str, messages: list[dict[str, str]]) -> Completion:
+        ...
+
+
+class OpenAIBackend:
+    name = "openai"
+
+    def __init__(self, api_key: str, url: str = DEFAULT_OPENAI_URL):
+        self._api_key = api_key
+        self._url = url
+
+    async def complete(self, client: httpx.AsyncClient, *, model: str, messages: list[dict[str, str]]) -> Completion:
+        response = await client.post(
+            self._url,
+            json={"model": model, "temperature": 0.2, "messages": messages},
+            headers={"Authorization": f"Bearer {self._api_key}"},
+        )
+        response.raise_for_status()
+        data = response.json()
+        usage = data.get("usage") or {}
+        return Completion(
+            text=(data["choices"][0]["message"].get("content") or "").strip(),
+            total_tokens=int(usage.get("total_tokens") or 0),
+        )
+
+
+class StubBackend:
+    """Offline backend: echoes the question and estimates tokens at four characters each."""
+
+    name = "stub"
+
+    def __init__(self, latency_seconds: float = 0.0):
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+
+    async def complete(self, client: httpx.AsyncClient, *, model: str, messages: list[dict[str, str]]) -> Completion:
+        del client
+        self.calls += 1
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        question = messages[-1]["content"].split("\n\n", 1)[0]
+        text = f"[{model} stub] {question}"
+        return Completion(text=text, total_tokens=(sum(len(m["content"]) for m in messages) + len(text)) // 4)
+
+
+class LLMGateway:
+    """Cached, coalescing front for chat completions, callable from sync request handlers.
+
+    Completions run on one background event loop with a shared async client, so
+    the concurrency cap and per-call timeout apply across all request threads.
+    Identical prompts against the same context version share one cache entry,
+    and concurrent identical prompts share one backend call.
+    """
+
+    def __init__(
+        self,
+        backend: LLMBackend,
+        *,
+        model: str = DEFAULT_MODEL,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ):
+        self.backend = backend
+        self.model = model
+        self.timeout_seconds = timeout_seconds
+        self.max_concurrency = max_concurrency
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_max_entries = cache_max_entries
+
+        self._cache: OrderedDict[str, tuple[float, Completion]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "cache_hits": 0,
+            "coalesced": 0,
+            "backend_calls": 0,
+            "errors": 0,
+            "tokens_used": 0,
+            "tokens_saved": 0,
+        }
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        # Only touched on the loop thread.
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def complete(self, *, system_prompt: str, prompt: str, context: str, context_version: str) -> str:
+        key = self.cache_key(system_prompt=system_prompt, prompt=prompt, context_version=context_version)
+        self._count("requests")
+
+        cached = self._cache_get(key)
+        if cached is not None:
+            self._count("cache_hits")
+            self._count("tokens_saved", cached.total_tokens)
+            return cached.text
+
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": f"User question: {prompt}\n\nPlatform context: {context}"},
+        ]
+        future = asyncio.run_coroutine_threadsafe(self._complete(key, messages), self._ensure_loop())
+        # The loop enforces the per-call timeout; this only guards against a stuck loop.
+        return future.result(timeout=self.timeout_seconds * 2).text
+
+    def cache_key(self, *, system_prompt: str, prompt: str, context_version: str) -> str:
+        parts = (self.backend.name, self.model, system_prompt, normalize_prompt(prompt), context_version)
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            entries = len(self._cache)
+        served = stats["cache_hits"] + stats["coalesced"]
+        return {
+            **stats,
+            "hit_rate": round(served / stats["requests"], 4) if stats["requests"] else None,
+            "cache_entries": entries,
+            "backend": self.backend.name,
+            "model": self.model,
+            "max_concurrency": self.max_concurrency,
+        }
+
+    def close(self) -> None:
+        loop, thread = self._loop, self._thread
+        if loop is None or thread is None:
+            return
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), loop).result(timeout=5)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+        self._loop = self._thread = self._client = self._semaphore = None
+
+    async def _complete(self, key: str, messages: list[dict[str, str]]) -> Completion:
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._count("coalesced")
+            completion = await asyncio.shield(inflight)
+            self._count("tokens_saved", completion.total_tokens)
+            return completion
+
+        # A call that finished while this one was queued on the loop already cached it.
+        cached = self._cache_get(key)
+        if cached is not None:
+            self._count("cache_hits")
+            self._count("tokens_saved", cached.total_tokens)
+            return cached
+
+        shared: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = shared
+        try:
+            async with self._semaphore:
+                self._count("backend_calls")
+                completion = await asyncio.wait_for(
+                    self.backend.complete(self._client, model=self.model, messages=messages),
+                    timeout=self.timeout_seconds,
+                )
+        except Exception as exc:
+            self._count("errors")
+            shared.set_exception(exc)
+            shared.exception()  # retrieved here; waiters re-raise their own copy
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        self._count("tokens_used", completion.total_tokens)
+        if completion.text:
+            self._cache_set(key, completion)
+        shared.set_result(completion)
+        return completion
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run() -> None:
+                    import httpx
+
+                    asyncio.set_event_loop(loop)
+                    self._client = httpx.AsyncClient(
+                        timeout=self.timeout_seconds,
+                        limits=httpx.Limits(max_connections=self.max_concurrency),
+                    )
+                    self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                thread = threading.Thread(target=run, name="llm-gateway", daemon=True)
+                thread.start()
+                ready.wait()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def _cache_get(self, key: str) -> Completion | None:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry[1]
+
+    def _cache_set(self, key: str, completion: Completion) -> None:
+        with self._lock:
+            self._cache[key] = (time.monotonic() + self.cache_ttl_seconds, completion)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_max_entries:
+                self._cache.popitem(last=False)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+
+# Punctuation around a word, in any script; signs that carry meaning ("5.5%", "$200") stay.
+_EDGE_PUNCTUATION = re.compile(r"^[^\w%$€£]+|[^\w%$€£]+$")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Case, spacing and surrounding punctuation do not change the meaning of a question for caching.
+
+    Words keep every letter of every script and inner punctuation such as decimal
+    points, so only spellings of the same question share a cache key.
+    """
+    text = unicodedata.normalize("NFKC", prompt or "").casefold()
+    words = (_EDGE_PUNCTUATION.sub("", word) for word in text.split())
+    return " ".join(word for word in words if word)
+
+
+_gateway: LLMGateway | None = None
+_gateway_lock = threading.Lock()
+
+
+def llm_gateway() -> LLMGateway | None:
+    """The per-process gateway; None when no backend is configured.
+
+    ``LLM_BACKEND`` selects ``openai`` or ``stub``; without it, OpenAI is used
+    whenever ``OPENAI_API_KEY`` is set.
+    """
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                backend = _configured_backend()
+                if backend is None:
+                    return None
+                _gateway = LLMGateway(
+                    backend,
+                    model=os.getenv("OPENAI_MODEL", DEFAULT_MODEL),
+                    timeout_seconds=float(os.getenv("LLM_TIMEOUT_SECONDS", str(DEFAULT_TIMEOUT_SECONDS))),
+                    max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))),
+                    cache_ttl_seconds=float(os.getenv("LLM_CACHE_TTL_SECONDS", str(DEFAULT_CACHE_TTL_SECONDS))),
+                    cache_max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", str(DEFAULT_CACHE_MAX_ENTRIES))),
+                )
+    return _gateway
+
+
+def set_llm_gateway(gateway: LLMGateway | None) -> None:
+    """Swap the process gateway, closing the previous one (tests and config reloads)."""
+    global _gateway
+    with _gateway_lock:
+        previous, _gateway = _gateway, gateway
+    if previous is not None and previous is not gateway:
+        previous.close()
+
+
+def _configured_backend() -> LLMBackend | None:
+    name = os.getenv("LLM_BACKEND", "").strip().lower()
+    api_key = os.getenv("OPENAI_API_KEY", "").strip()
+    if name == "stub":
+        return StubBackend()
+    if name in ("", "openai") and api_key:
+        return OpenAIBackend(api_key, os.getenv("OPENAI_CHAT_COMPLETIONS_URL", DEFAULT_OPENAI_URL))
+    if name not in ("", "openai"):
+        logger.warning("llm_gateway.unknown_backend", extra={"backend": name})
+    return None
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+
+# Each aggregate is a correlated subquery served by a per-membership (or per-user)
+# index, so refreshing one membership never fans out across the joined tables.
+# Assessments written in one transaction can share created_at; id breaks the tie so
+# every refresh picks the same row. alembic a11c1d2e3f44 keeps a frozen copy.
+SUMMARY_SELECT_SQL = """
+SELECT
+    m.id AS membership_id,
+    NULLIF(
+        GREATEST(
+            COALESCE((SELECT max(mi.paid_at) FROM membership_installments mi WHERE mi.membership_id = m.id), to_timestamp(0)),
+            COALESCE((SELECT max(cc.created_at) FROM contribution_credits cc WHERE cc.membership_id = m.id), to_timestamp(0)),
+            COALESCE((SELECT max(mc.created_at) FROM member_checkins mc WHERE mc.membership_id = m.id), to_timestamp(0)),
+            COALESCE(
+                (
+                    SELECT max(d.uploaded_at)
+                    FROM cases c
+                    JOIN documents d ON d.case_id = c.id
+                    WHERE c.created_by = m.user_id AND c.program_key = m.program_key
+                ),
+                to_timestamp(0)
+            ),
+            COALESCE((SELECT max(tqa.created_at) FROM training_quiz_attempts tqa WHERE tqa.user_id = m.user_id), to_timestamp(0))
+        ),
+        to_timestamp(0)
+    ) AS last_activity_at,
+    ic.missed_installments_count,
+    ic.due_installments_count,
+    ls.stability_score AS latest_stability_score,
+    ls.created_at AS latest_stability_at,
+    now() AS refreshed_at
+FROM memberships m
+CROSS JOIN LATERAL (
+    SELECT
+        COUNT(*) FILTER (WHERE mi.status = 'missed') AS missed_installments_count,
+        COUNT(*) FILTER (WHERE mi.status = 'due') AS due_installments_count
+    FROM membership_installments mi
+    WHERE mi.membership_id = m.id
+) ic
+LEFT JOIN LATERAL (
+    SELECT sa.stability_score, sa.created_at
+    FROM stability_assessments sa
+    WHERE sa.user_id = m.user_id AND sa.program_key = m.program_key
+    ORDER BY sa.created_at DESC, sa.id DESC
+    LIMIT 1
+) ls ON true
+"""
+
+UPSERT_SQL = """
+INSERT INTO membership_activity (
+    membership_id,
+    last_activity_at,
+    missed_installments_count,
+    due_installments_count,
+    latest_stability_score,
+    latest_stability_at,
+    refreshed_at
+)
+{select_sql}
+{where_sql}
+ON CONFLICT (membership_id) DO UPDATE SET
+    last_activity_at = EXCLUDED.last_activity_at,
+    missed_installments_count = EXCLUDED.missed_installments_count,
+    due_installments_count = EXCLUDED.due_installments_count,
+    latest_stability_score = EXCLUDED.latest_stability_score,
+    latest_stability_at = EXCLUDED.latest_stability_at,
+    refreshed_at = EXCLUDED.refreshed_at
+"""
+
+TARGETED_WHERE_SQL = """
+WHERE m.id = ANY(CAST(:membership_ids AS uuid[]))
+   OR m.user_id = ANY(CAST(:user_ids AS uuid[]))
+   OR m.id IN (
+        SELECT m2.id
+        FROM cases c
+        JOIN memberships m2 ON m2.user_id = c.created_by AND m2.program_key = c.program_key
+        WHERE c.id = ANY(CAST(:case_ids AS uuid[]))
+   )
+"""
+
+
+def refresh_membership_activity(
+    bind: Session | Connection,
+    *,
+    membership_ids: Iterable[UUID] = (),
+    user_ids: Iterable[UUID] = (),
+    case_ids: Iterable[UUID] = (),
+) -> None:
+    """Recompute summaries for the memberships touched by a write.
+
+    Writes are mapped to memberships directly (installments, credits, check-ins),
+    by member (stability assessments, quiz attempts) or by case (documents).
+    """
+    params = {
+        "membership_ids": sorted({str(v) for v in membership_ids if v}),
+        "user_ids": sorted({str(v) for v in user_ids if v}),
+        "case_ids": sorted({str(v) for v in case_ids if v}),
+    }
+    if not any(params.values()):
+        return
+    bind.execute(text(UPSERT_SQL.format(select_sql=SUMMARY_SELECT_SQL, where_sql=TARGETED_WHERE_SQL)), params)
+
+
+def rebuild_membership_activity(db: Session) -> int:
+    """Backfill or repair every summary row, e.g. after a migration or bulk load."""
+    result = db.execute(text(UPSERT_SQL.format(select_sql=SUMMARY_SELECT_SQL, where_sql="")))
+    return int(result.rowcount or 0)
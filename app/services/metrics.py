@@ -0,0 +1,204 @@
+"""Prometheus metrics for ingestion, workflow sync, authorization and the outbox.
+
+Metrics live in the default ``prometheus_client`` registry of each process. With
+``PROMETHEUS_MULTIPROC_DIR`` set (it must be set before ``prometheus_client`` is
+first imported, here or by ``db.pool``), every uvicorn worker and Celery child writes its samples to that
+directory and ``render_metrics`` aggregates them, so one scrape covers all
+processes on the host.
+
+Skiptrace lookups, module actions and per-route SQL are recorded here as well
+as in their in-memory ``LatencyHistogram`` stats. The in-memory stats only
+describe the process that serves an admin endpoint. DB pool checkouts are
+recorded in ``db.pool``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+logger = logging.getLogger(__name__)
+
+INGESTION_ROWS = Counter(
+    "ingestion_rows_total",
+    "Rows handled by ingestion, by source and outcome (created, duplicate, invalid).",
+    ["source", "outcome"],
+)
+INGESTION_PARSE_ERRORS = Counter(
+    "ingestion_parse_errors_total",
+    "Rows or files that failed to parse, by source.",
+    ["source"],
+)
+INGESTION_RUN_SECONDS = Histogram(
+    "ingestion_run_seconds",
+    "Wall time of one ingestion run (file, feed or connector pull), by source.",
+    ["source"],
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+OCR_SECONDS = Histogram(
+    "ingestion_ocr_seconds",
+    "Time spent OCRing one scanned PDF.",
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+
+WORKFLOW_SYNC_SECONDS = Histogram(
+    "workflow_sync_seconds",
+    "Latency of one case workflow sync.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+WORKFLOW_STEPS_ADVANCED = Counter(
+    "workflow_steps_advanced_total",
+    "Workflow steps completed by a sync, by step.",
+    ["step"],
+)
+
+AUTHORIZATION_DECISIONS = Counter(
+    "authorization_decisions_total",
+    "Policy authorization decisions, by action, decision and reason.",
+    ["action", "decision", "reason"],
+)
+
+OUTBOX_DELIVERY_LAG_SECONDS = Histogram(
+    "outbox_delivery_lag_seconds",
+    "Time from an outbox row being queued to its delivery.",
+    buckets=(0.1, 0.5, 1, 5, 15, 60, 300, 900, 3600),
+)
+
+SKIPTRACE_LOOKUP_SECONDS = Histogram(
+    "skiptrace_lookup_seconds",
+    "Latency of one skiptrace provider lookup, by provider.",
+    ["provider"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+SKIPTRACE_LOOKUPS = Counter(
+    "skiptrace_lookups_total",
+    "Skiptrace provider lookups, by provider and outcome (hit, miss, error).",
+    ["provider", "outcome"],
+)
+
+MODULE_ACTION_SECONDS = Histogram(
+    "module_action_seconds",
+    "Latency of declared module actions, by module action.",
+    ["action"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+MODULE_ACTION_ERRORS = Counter(
+    "module_action_errors_total",
+    "Module action calls that failed, by module action.",
+    ["action"],
+)
+
+SQL_ROUTE_QUERIES = Histogram(
+    "sql_route_queries",
+    "SQL statements issued per request, by route.",
+    ["route"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+SQL_ROUTE_DB_SECONDS = Histogram(
+    "sql_route_db_seconds",
+    "DB time per request, by route.",
+    ["route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+SQL_ROUTE_N_PLUS_ONE = Counter(
+    "sql_route_n_plus_one_requests_total",
+    "Requests that repeated one statement past the N+1 threshold, by route.",
+    ["route"],
+)
+
+OUTBOX_BACKLOG_SQL = """
+SELECT count(*), COALESCE(EXTRACT(EPOCH FROM now() - min(created_at)), 0)
+FROM outbox_queue
+WHERE processed_at IS NULL AND attempts < max_attempts
+"""
+
+
+def record_ingestion(source: str, *, created: int = 0, duplicates: int = 0, invalid: int = 0) -> None:
+    for outcome, rows in (("created", created), ("duplicate", duplicates), ("invalid", invalid)):
+        if rows:
+            INGESTION_ROWS.labels(source, outcome).inc(rows)
+    if invalid:
+        INGESTION_PARSE_ERRORS.labels(source).inc(invalid)
+
+
+@contextmanager
+def timed(histogram, *labels: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        (histogram.labels(*labels) if labels else histogram).observe(time.perf_counter() - started)
+
+
+class OutboxBacklogCollector:
+    """Pending outbox rows and the age of the oldest, read from Postgres at scrape time.
+
+    Computed once per scrape rather than per process, so it stays correct
+    however many workers deliver from the outbox.
+    """
+
+    def __init__(self, session_factory):
+        self._session_factory = session_factory
+
+    def collect(self):
+        # A failed read reports the collector down instead of failing the whole scrape.
+        up = GaugeMetricFamily("outbox_collector_up", "Whether the outbox backlog could be read from Postgres.")
+        db = self._session_factory()
+        try:
+            count, oldest = db.execute(text(OUTBOX_BACKLOG_SQL)).one()
+        except SQLAlchemyError:
+            logger.warning("metrics.outbox_backlog_failed", exc_info=True)
+            up.add_metric([], 0)
+            yield up
+            return
+        finally:
+            db.close()
+        up.add_metric([], 1)
+        yield up
+        pending = GaugeMetricFamily("outbox_pending", "Outbox rows waiting for delivery.")
+        pending.add_metric([], count)
+        yield pending
+        lag = GaugeMetricFamily("outbox_oldest_pending_seconds", "Age of the oldest undelivered outbox row.")
+        lag.add_metric([], float(oldest))
+        yield lag
+
+
+def _process_registry() -> CollectorRegistry:
+    if not os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render_metrics(session_factory) -> bytes:
+    """Exposition text for every process on this host plus the DB-derived gauges."""
+    backlog_registry = CollectorRegistry()
+    backlog_registry.register(OutboxBacklogCollector(session_factory))
+    return generate_latest(_process_registry()) + generate_latest(backlog_registry)
+
+
+def start_metrics_server(port: int) -> None:
+    """Serve this host's process metrics over HTTP, for processes without the API (Celery)."""
+    start_http_server(port, registry=_process_registry())
+
+
+def mark_process_dead(pid: int) -> None:
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
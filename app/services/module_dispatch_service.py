@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.models.module_registry import ModuleRegistry
+from app.services import metrics
+from db.latency_stats import LatencyHistogram
+
+DEFAULT_TABLE_REFRESH_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class ActionRoute:
+    service_name: str
+    handler: Callable[..., dict[str, Any]]
+    requires_actor: bool
+
+
+@dataclass(frozen=True)
+class CompiledModule:
+    """An active module with its actions resolved to domain handlers once."""
+
+    module_id: UUID
+    module_name: str
+    version: str
+    routes: dict[str, ActionRoute]
+    # Allowed actions that cannot run, with the status and detail they fail with.
+    rejections: dict[str, tuple[int, str]] = field(default_factory=dict)
+
+    def resolve(self, action_name: str) -> ActionRoute:
+        route = self.routes.get(action_name)
+        if route is not None:
+            return route
+        status_code, detail = self.rejections.get(
+            action_name, (403, f"Action '{action_name}' not allowed for module")
+        )
+        raise HTTPException(status_code=status_code, detail=detail)
+
+
+class ModuleDispatchTable:
+    """Active modules by name, compiled from ``module_registry`` for this process."""
+
+    def __init__(self, modules: list[CompiledModule], *, loaded_at: float | None = None):
+        self._modules = {module.module_name: module for module in modules}
+        self.loaded_at = time.monotonic() if loaded_at is None else loaded_at
+
+    def get(self, module_name: str, version: str | None = None) -> CompiledModule | None:
+        module = self._modules.get(module_name)
+        if module is None or (version is not None and module.version != version):
+            return None
+        return module
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "module_name": module.module_name,
+                "version": module.version,
+                "actions": sorted(module.routes),
+                "rejected_actions": {name: detail for name, (_, detail) in sorted(module.rejections.items())},
+            }
+            for module in sorted(self._modules.values(), key=lambda m: m.module_name)
+        ]
+
+
+@dataclass
+class ActionStats:
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    calls: int = 0
+    errors: int = 0
+
+
+_table: ModuleDispatchTable | None = None
+_table_lock = threading.Lock()
+# Bumped whenever this process learns the registry changed; other caches derived
+# from the registry compare it to decide when to rebuild.
+_registry_generation = 0
+ACTION_STATS: dict[str, ActionStats] = {}
+_stats_lock = threading.Lock()
+
+
+def module_dispatch_table(
+    db: Session,
+    compile_module: Callable[[ModuleRegistry], CompiledModule],
+) -> ModuleDispatchTable:
+    """The per-process table, rebuilt through ``db`` once older than the refresh interval.
+
+    Registry writes in this process drop it on commit (see
+    app.models.module_registry_events); the interval bounds how long other
+    processes keep serving a module after it changes.
+    """
+    table = _table
+    if table is None or time.monotonic() - table.loaded_at >= _refresh_seconds():
+        with _table_lock:
+            table = _table
+            if table is None or time.monotonic() - table.loaded_at >= _refresh_seconds():
+                table = _swap_table(db, compile_module)
+    return table
+
+
+def refresh_module_dispatch_table(
+    db: Session,
+    compile_module: Callable[[ModuleRegistry], CompiledModule],
+) -> ModuleDispatchTable:
+    """Rebuild from the registry now and swap the new table in as one reference change."""
+    with _table_lock:
+        return _swap_table(db, compile_module)
+
+
+def invalidate_module_dispatch_table() -> None:
+    global _table, _registry_generation
+    with _table_lock:
+        _table = None
+        _registry_generation += 1
+
+
+def module_registry_generation() -> int:
+    return _registry_generation
+
+
+def record_action_latency(module_name: str, action_name: str, started: float, *, error: bool) -> None:
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    with _stats_lock:
+        stats = ACTION_STATS.setdefault(f"{module_name}.{action_name}", ActionStats())
+        stats.calls += 1
+        stats.errors += int(error)
+    stats.latency.observe(elapsed_ms)
+    metrics.MODULE_ACTION_SECONDS.labels(f"{module_name}.{action_name}").observe(elapsed_ms / 1000)
+    if error:
+        metrics.MODULE_ACTION_ERRORS.labels(f"{module_name}.{action_name}").inc()
+
+
+def module_action_stats() -> dict[str, Any]:
+    with _stats_lock:
+        stats = dict(ACTION_STATS)
+    return {
+        name: {"calls": s.calls, "errors": s.errors, "latency": s.latency.snapshot()}
+        for name, s in sorted(stats.items())
+    }
+
+
+def reset_module_action_stats() -> None:
+    with _stats_lock:
+        ACTION_STATS.clear()
+
+
+def _swap_table(db: Session, compile_module: Callable[[ModuleRegistry], CompiledModule]) -> ModuleDispatchTable:
+    # Requests keep whichever table they read; in-flight calls never see a half-built one.
+    global _table
+    active = (
+        db.query(ModuleRegistry)
+        .filter(ModuleRegistry.is_active.is_(True), ModuleRegistry.status == "active")
+        .all()
+    )
+    _table = ModuleDispatchTable([compile_module(module) for module in active])
+    return _table
+
+
+def _refresh_seconds() -> float:
+    return float(os.getenv("MODULE_DISPATCH_REFRESH_SECONDS", str(DEFAULT_TABLE_REFRESH_SECONDS)))
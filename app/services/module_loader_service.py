@@ -4,13 +4,11 @@ from __future__ import annotations
 from typing import Any, Callable
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, FastAPI, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
 from app.models.audit_logs import AuditLog
 from app.models.module_registry import ModuleRegistry
-from app.models.users import User
 from app.services.action_payload_builder import (
     ActionExecutionContext,
     build_action_payload,
@@ -31,15 +29,13 @@ from app.services.veteran_intelligence_service import (
     update_benefit_progress,
     upsert_veteran_profile,
 )
+from app.services.module_dispatch_service import (
+    ActionRoute,
+    CompiledModule,
+    refresh_module_dispatch_table,
+)
 from app.services.module_registry_service import ModuleRegistryService
-from auth.authorization import PolicyAuthorizer
-from auth.dependencies import get_current_user
-from db.session import SessionLocal, get_db
-
-
-class ModuleActionRequest(BaseModel):
-    case_id: str | None = None
-    payload: dict[str, Any] = Field(default_factory=dict)
+from db.session import SessionLocal
 
 
 class DomainServiceBroker:
@@ -94,38 +90,46 @@ class DomainServiceBroker:
 
         return True, "required services are valid"
 
+    def compile_module(self, module: ModuleRegistry) -> CompiledModule:
+        """Resolve a module's allowed actions to handlers, recording why the rest cannot run."""
+        routes: dict[str, ActionRoute] = {}
+        rejections: dict[str, tuple[int, str]] = {}
+        required_services = set(module.required_services or [])
+
+        for action_name in module.allowed_actions or []:
+            mapped = self._handlers.get(action_name)
+            if not mapped:
+                rejections[action_name] = (501, f"No safe mapping for action '{action_name}'")
+                continue
+
+            service_name, handler, requires_actor = mapped
+            if service_name not in required_services:
+                rejections[action_name] = (400, f"Action '{action_name}' requires service '{service_name}'")
+                continue
+
+            routes[action_name] = ActionRoute(service_name=service_name, handler=handler, requires_actor=requires_actor)
+
+        return CompiledModule(
+            module_id=module.id,
+            module_name=module.module_name,
+            version=module.version,
+            routes=routes,
+            rejections=rejections,
+        )
+
     def execute_action(
         self,
         db: Session,
         *,
-        module: ModuleRegistry,
+        module: ModuleRegistry | CompiledModule,
         action_name: str,
         payload: dict[str, Any],
         case_id: UUID | None = None,
         actor_id: UUID | None = None,
     ) -> dict[str, Any]:
 
-        if action_name not in (module.allowed_actions or []):
-            raise HTTPException(
-                status_code=403,
-                detail=f"Action '{action_name}' not allowed for module",
-            )
-
-        mapped = self._handlers.get(action_name)
-
-        if not mapped:
-            raise HTTPException(
-                status_code=501,
-                detail=f"No safe mapping for action '{action_name}'",
-            )
-
-        service_name, handler, requires_actor = mapped
-
-        if service_name not in (module.required_services or []):
-            raise HTTPException(
-                status_code=400,
-                detail=f"Action '{action_name}' requires service '{service_name}'",
-            )
+        compiled = module if isinstance(module, CompiledModule) else self.compile_module(module)
+        route = compiled.resolve(action_name)
 
         built_payload = build_action_payload(
             action_name,
@@ -133,10 +137,10 @@ class DomainServiceBroker:
             context=ActionExecutionContext(actor_id=actor_id, case_id=case_id),
         )
 
-        return handler(
+        return route.handler(
             db,
             built_payload,
-            requires_actor and actor_id is not None,
+            route.requires_actor and actor_id is not None,
             actor_id,
         )
 
@@ -298,38 +302,27 @@ class DomainServiceBroker:
 
 class ModuleLoaderService:
 
-    def __init__(self, app: FastAPI, db: Session):
-        self.app = app
+    def __init__(self, db: Session):
         self.db = db
         self.registry_service = ModuleRegistryService(db)
         self.domain_broker = DomainServiceBroker()
 
     def load_active_modules(self) -> int:
+        """Validate active modules and swap them into the dispatch table; returns how many serve."""
         active_modules = (
             self.db.query(ModuleRegistry)
             .filter(ModuleRegistry.is_active.is_(True), ModuleRegistry.status == "active")
             .all()
         )
 
-        if not hasattr(self.app.state, "dynamic_module_routes"):
-            self.app.state.dynamic_module_routes = set()
-
-        loaded_count = 0
         for module in active_modules:
             if not self._validate_spec(module):
                 continue
-
             route_key = f"{module.module_name}:{module.version}"
-            if route_key in self.app.state.dynamic_module_routes:
-                continue
-
-            self._register_module_router(module)
-            self.app.state.dynamic_module_routes.add(route_key)
-            loaded_count += 1
             self._log_load_event(module=module, reason_code="module_loaded", after_state={"route_key": route_key})
 
         self.db.commit()
-        return loaded_count
+        return len(refresh_module_dispatch_table(self.db, self.domain_broker.compile_module))
 
     def _validate_spec(self, module: ModuleRegistry) -> bool:
         validation_errors = self.registry_service._validation_errors(module)
@@ -351,83 +344,6 @@ class ModuleLoaderService:
 
         return True
 
-    def _register_module_router(self, module: ModuleRegistry) -> None:
-        router = APIRouter(prefix=f"/modules/{module.module_name}", tags=["dynamic-modules"])
-
-        @router.post("/actions/{action_name}")
-        def invoke_module_action(
-            action_name: str,
-            request: ModuleActionRequest,
-            db: Session = Depends(get_db),
-            user: User = Depends(get_current_user),
-            module_name: str = module.module_name,
-            module_version: str = module.version,
-        ):
-            live_module = (
-                db.query(ModuleRegistry)
-                .filter(
-                    ModuleRegistry.module_name == module_name,
-                    ModuleRegistry.version == module_version,
-                    ModuleRegistry.is_active.is_(True),
-                    ModuleRegistry.status == "active",
-                )
-                .first()
-            )
-            if not live_module:
-                raise HTTPException(status_code=404, detail="Module is not active")
-
-            if not request.case_id:
-                raise HTTPException(status_code=400, detail="case_id is required for policy authorization")
-
-            policy_authorizer = PolicyAuthorizer(db)
-            policy_authorizer.require_case_action(
-                user=user,
-                case_id=request.case_id,
-                action=f"modules.{live_module.module_name}.{action_name}",
-            )
-            try:
-                case_uuid = UUID(request.case_id)
-            except ValueError as exc:
-                raise HTTPException(status_code=400, detail="case_id must be a valid UUID") from exc
-
-            result = self.domain_broker.execute_action(
-                db,
-                module=live_module,
-                action_name=action_name,
-                payload=request.payload,
-                case_id=case_uuid,
-                actor_id=user.id,
-            )
-
-            db.add(
-                AuditLog(
-                    id=uuid4(),
-                    case_id=case_uuid,
-                    actor_id=user.id,
-                    actor_is_ai=False,
-                    action_type="module_action_invoked",
-                    reason_code=f"module_action:{live_module.module_name}:{action_name}",
-                    before_state={
-                        "module_name": live_module.module_name,
-                        "version": live_module.version,
-                        "action": action_name,
-                    },
-                    after_state={"result": result},
-                    policy_version_id=None,
-                )
-            )
-            db.commit()
-
-            return {
-                "status": "success",
-                "module_name": live_module.module_name,
-                "version": live_module.version,
-                "action": action_name,
-                "result": result,
-            }
-
-        self.app.include_router(router)
-
     def _log_load_event(self, *, module: ModuleRegistry, reason_code: str, after_state: dict[str, Any]) -> None:
         self.db.add(
             AuditLog(
@@ -448,10 +364,10 @@ class ModuleLoaderService:
         )
 
 
-def load_modules_on_startup(app: FastAPI) -> int:
+def load_modules_on_startup() -> int:
     db = SessionLocal()
     try:
-        return ModuleLoaderService(app, db).load_active_modules()
+        return ModuleLoaderService(db).load_active_modules()
     finally:
         db.close()
 
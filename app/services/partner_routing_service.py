@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 
 from app.models.audit_logs import AuditLog
+from app.models.cases import Case
 from app.models.housing_intelligence import PartnerOrganization, PartnerReferral
+from app.services.case_detail_service import mark_case_details_stale
+from app.services.case_search_service import refresh_case_search_index
+
+logger = logging.getLogger(__name__)
 
 
 CATEGORY_TO_SERVICE_TYPE = {
@@ -16,6 +31,171 @@ CATEGORY_TO_SERVICE_TYPE = {
     "property_acquisition": "property_acquisition",
 }
 
+# Referral statuses that still sit in a partner's queue (see ix_partner_referrals_open_partner).
+OPEN_REFERRAL_STATUSES = ("queued", "accepted", "in_progress")
+# Cases whose partners were all at capacity wait here without a partner until
+# reroute_unassigned_referrals finds one with room.
+UNASSIGNED_REFERRAL_STATUS = "unassigned"
+DEFAULT_REROUTE_BATCH_SIZE = 500
+DEFAULT_INDEX_REFRESH_SECONDS = 60
+MAX_BULK_ROUTING_CASES = 10000
+PENDING_ASSIGNMENTS_KEY = "partner_routing_pending_assignments"
+
+
+@dataclass
+class PartnerSlot:
+    partner_id: UUID
+    name: str
+    service_type: str
+    service_region: str | None
+    capacity: int | None
+    routing_weight: float
+    queue_depth: int = 0
+
+    def has_capacity(self, pending: int = 0) -> bool:
+        return self.capacity is None or self.queue_depth + pending < self.capacity
+
+    def load(self, pending: int = 0) -> float:
+        # Queue depth after one more referral, per unit of routing weight.
+        return (self.queue_depth + pending + 1) / max(self.routing_weight, 0.01)
+
+
+class PartnerRoutingIndex:
+    """Partners keyed by (service_type, region) with their open referral counts.
+
+    Selection takes the least-loaded partner relative to its routing weight,
+    skipping partners at capacity. Picks that have not committed yet are passed
+    in as ``pending`` counts and only added to the queue depths by ``record``
+    once their transaction commits.
+    """
+
+    def __init__(self, slots: Iterable[PartnerSlot], *, loaded_at: float | None = None):
+        self._slots: dict[tuple[str, str | None], list[PartnerSlot]] = {}
+        for slot in slots:
+            self._slots.setdefault((slot.service_type, slot.service_region), []).append(slot)
+        self.loaded_at = time.monotonic() if loaded_at is None else loaded_at
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, db: Session) -> "PartnerRoutingIndex":
+        depths = dict(
+            db.query(PartnerReferral.partner_organization_id, func.count())
+            .filter(PartnerReferral.status.in_(OPEN_REFERRAL_STATUSES))
+            .group_by(PartnerReferral.partner_organization_id)
+            .all()
+        )
+        partners = db.query(
+            PartnerOrganization.id,
+            PartnerOrganization.name,
+            PartnerOrganization.service_type,
+            PartnerOrganization.service_region,
+            PartnerOrganization.capacity,
+            PartnerOrganization.routing_weight,
+        ).all()
+        return cls(
+            PartnerSlot(
+                partner_id=partner.id,
+                name=partner.name,
+                service_type=partner.service_type,
+                service_region=partner.service_region,
+                capacity=partner.capacity,
+                routing_weight=partner.routing_weight if partner.routing_weight is not None else 1.0,
+                queue_depth=depths.get(partner.id, 0),
+            )
+            for partner in partners
+        )
+
+    def __len__(self) -> int:
+        return sum(len(slots) for slots in self._slots.values())
+
+    def serves(self, service_type: str, region: str | None) -> bool:
+        return bool(self._candidates(service_type, region))
+
+    def select(
+        self, service_type: str, region: str | None, pending: Counter[UUID] | None = None
+    ) -> PartnerSlot | None:
+        """Pick the partner for the next referral; None when nobody serves it or everyone is full.
+
+        The pick is counted in ``pending`` when given, so later picks in the same
+        transaction see it.
+        """
+        pending = pending if pending is not None else Counter()
+        with self._lock:
+            available = [
+                slot for slot in self._candidates(service_type, region) if slot.has_capacity(pending[slot.partner_id])
+            ]
+            if not available:
+                return None
+            # Regional partners win ties over ones serving every region.
+            slot = min(
+                available,
+                key=lambda s: (s.load(pending[s.partner_id]), s.service_region is None, s.name, str(s.partner_id)),
+            )
+            pending[slot.partner_id] += 1
+            return slot
+
+    def record(self, assignments: Counter[UUID]) -> None:
+        """Add committed assignments to the queue depths."""
+        with self._lock:
+            for group in self._slots.values():
+                for slot in group:
+                    slot.queue_depth += assignments.get(slot.partner_id, 0)
+
+    def _candidates(self, service_type: str, region: str | None) -> list[PartnerSlot]:
+        candidates = list(self._slots.get((service_type, region), ()))
+        if region is not None:
+            candidates.extend(self._slots.get((service_type, None), ()))
+        return candidates
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        with self._lock:
+            slots = [slot for group in self._slots.values() for slot in group]
+            return [
+                {
+                    "partner_organization_id": str(slot.partner_id),
+                    "name": slot.name,
+                    "service_type": slot.service_type,
+                    "service_region": slot.service_region,
+                    "capacity": slot.capacity,
+                    "routing_weight": slot.routing_weight,
+                    "queue_depth": slot.queue_depth,
+                }
+                for slot in sorted(slots, key=lambda s: (s.service_type, s.service_region or "", s.name))
+            ]
+
+
+_index: PartnerRoutingIndex | None = None
+_index_lock = threading.Lock()
+
+
+def partner_routing_index(db: Session) -> PartnerRoutingIndex:
+    """The per-process index, reloaded through ``db`` once older than the refresh interval."""
+    global _index
+    index = _index
+    if index is None or time.monotonic() - index.loaded_at >= _refresh_seconds():
+        with _index_lock:
+            if _index is None or time.monotonic() - _index.loaded_at >= _refresh_seconds():
+                _index = PartnerRoutingIndex.load(db)
+            index = _index
+    return index
+
+
+def invalidate_partner_routing_index() -> None:
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def pending_partner_assignments(db: Session, index: PartnerRoutingIndex) -> Counter[UUID]:
+    """Picks from ``index`` in ``db``'s open transaction, recorded on the index once it commits."""
+    return db.info.setdefault(PENDING_ASSIGNMENTS_KEY, {}).setdefault(index, Counter())
+
+
+def apply_pending_partner_assignments(db: Session, *, committed: bool) -> None:
+    for index, assignments in db.info.pop(PENDING_ASSIGNMENTS_KEY, {}).items():
+        if committed:
+            index.record(assignments)
+
 
 def route_case_to_partner(
     db: Session,
@@ -24,33 +204,19 @@ def route_case_to_partner(
     state: str,
     routing_category: str,
     actor_id: UUID | None,
+    index: PartnerRoutingIndex | None = None,
 ) -> PartnerReferral:
-    service_type = CATEGORY_TO_SERVICE_TYPE.get(routing_category)
-    if not service_type:
-        raise HTTPException(status_code=400, detail="Unsupported routing category")
+    service_type = _service_type(routing_category)
+    index = index if index is not None else partner_routing_index(db)
 
-    partner = (
-        db.query(PartnerOrganization)
-        .filter(PartnerOrganization.service_type == service_type)
-        .filter((PartnerOrganization.service_region.is_(None)) | (PartnerOrganization.service_region == state))
-        .first()
-    )
-    if not partner:
-        partner = PartnerOrganization(
-            name=f"Default {routing_category.title()} Partner",
-            service_type=service_type,
-            service_region=state,
-            contact_info={"mode": "system_seed"},
-            api_endpoint=None,
-        )
-        db.add(partner)
-        db.flush()
+    partner_id = _pick_partner(db, index, routing_category, service_type, state, defaults={})
 
     referral = PartnerReferral(
         case_id=case_id,
-        partner_organization_id=partner.id,
+        partner_organization_id=partner_id,
         routing_category=routing_category,
-        status="queued",
+        routing_region=state,
+        status="queued" if partner_id else UNASSIGNED_REFERRAL_STATUS,
     )
     db.add(referral)
     db.flush()
@@ -64,9 +230,210 @@ def route_case_to_partner(
             action_type="partner_case_routed",
             reason_code=f"partner_routed_{routing_category}",
             before_state={},
-            after_state={"partner_organization_id": str(partner.id), "routing_category": routing_category},
+            after_state={
+                "partner_organization_id": str(partner_id) if partner_id else None,
+                "routing_category": routing_category,
+            },
             policy_version_id=None,
         )
     )
 
     return referral
+
+
+def route_cases_to_partners(
+    db: Session,
+    *,
+    cases: Iterable[dict[str, Any]],
+    actor_id: UUID | None,
+    index: PartnerRoutingIndex | None = None,
+) -> list[dict[str, Any]]:
+    """Route many cases in one pass; the caller commits.
+
+    Each item carries ``case_id``, ``state`` and ``routing_category``. Partners come
+    from the in-memory index, and the referrals and their audit entries are written
+    with one statement each. Cases whose partners are all at capacity get an
+    unassigned referral.
+    """
+    items = list(cases)
+    if not items:
+        return []
+    if len(items) > MAX_BULK_ROUTING_CASES:
+        raise HTTPException(status_code=422, detail=f"Bulk routing accepts at most {MAX_BULK_ROUTING_CASES} cases")
+    service_types = [_service_type(item["routing_category"]) for item in items]
+
+    case_ids = {item["case_id"] for item in items}
+    found = {row.id for row in db.query(Case.id).filter(Case.id.in_(case_ids))}
+    missing = sorted(str(case_id) for case_id in case_ids - found)
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Cases not found: {', '.join(missing[:20])}")
+
+    index = index if index is not None else partner_routing_index(db)
+    defaults: dict[tuple[str, str | None], UUID] = {}
+    now = datetime.utcnow()
+    referral_rows = []
+    audit_rows = []
+    for item, service_type in zip(items, service_types):
+        category, state = item["routing_category"], item["state"]
+        partner_id = _pick_partner(db, index, category, service_type, state, defaults=defaults)
+
+        referral_rows.append(
+            {
+                "id": uuid4(),
+                "case_id": item["case_id"],
+                "partner_organization_id": partner_id,
+                "routing_category": category,
+                "routing_region": state,
+                "status": "queued" if partner_id else UNASSIGNED_REFERRAL_STATUS,
+                "notes": item.get("notes"),
+                "created_at": now,
+            }
+        )
+        audit_rows.append(
+            {
+                "id": uuid4(),
+                "case_id": item["case_id"],
+                "actor_id": actor_id,
+                "actor_is_ai": False,
+                "action_type": "partner_case_routed",
+                "reason_code": f"partner_routed_{category}",
+                "before_state": {},
+                "after_state": {
+                    "partner_organization_id": str(partner_id) if partner_id else None,
+                    "routing_category": category,
+                },
+                "policy_version_id": None,
+            }
+        )
+
+    db.execute(insert(PartnerReferral), referral_rows)
+    db.execute(insert(AuditLog), audit_rows)
+    # Core inserts bypass the flush listeners that keep these in step.
+    refresh_case_search_index(db, case_ids=case_ids)
+    mark_case_details_stale(db, case_ids)
+
+    unassigned = sum(1 for row in referral_rows if row["partner_organization_id"] is None)
+    logger.info(
+        "partner_routing.bulk_routed",
+        extra={"cases": len(referral_rows), "default_partners": len(defaults), "unassigned": unassigned},
+    )
+    return [
+        {
+            "partner_referral_id": str(row["id"]),
+            "case_id": str(row["case_id"]),
+            "partner_organization_id": str(row["partner_organization_id"]) if row["partner_organization_id"] else None,
+            "routing_category": row["routing_category"],
+            "status": row["status"],
+        }
+        for row in referral_rows
+    ]
+
+
+def reroute_unassigned_referrals(
+    db: Session,
+    *,
+    limit: int = DEFAULT_REROUTE_BATCH_SIZE,
+    index: PartnerRoutingIndex | None = None,
+) -> dict[str, int]:
+    """Assign the oldest unassigned referrals to partners that have room again; the caller commits.
+
+    Rows are locked with SKIP LOCKED, so overlapping sweeps split the backlog.
+    Referrals nobody has room for stay unassigned for the next sweep.
+    """
+    referrals = (
+        db.query(PartnerReferral)
+        .filter(PartnerReferral.status == UNASSIGNED_REFERRAL_STATUS)
+        .order_by(PartnerReferral.created_at, PartnerReferral.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    if not referrals:
+        return {"unassigned_checked": 0, "referrals_rerouted": 0}
+
+    index = index if index is not None else partner_routing_index(db)
+    pending = pending_partner_assignments(db, index)
+    rerouted = 0
+    for referral in referrals:
+        service_type = CATEGORY_TO_SERVICE_TYPE.get(referral.routing_category)
+        slot = index.select(service_type, referral.routing_region, pending) if service_type else None
+        if slot is None:
+            continue
+        referral.partner_organization_id = slot.partner_id
+        referral.status = "queued"
+        db.add(
+            AuditLog(
+                id=uuid4(),
+                case_id=referral.case_id,
+                actor_id=None,
+                actor_is_ai=False,
+                action_type="partner_case_routed",
+                reason_code=f"partner_rerouted_{referral.routing_category}",
+                before_state={"partner_organization_id": None, "status": UNASSIGNED_REFERRAL_STATUS},
+                after_state={
+                    "partner_organization_id": str(slot.partner_id),
+                    "routing_category": referral.routing_category,
+                },
+                policy_version_id=None,
+            )
+        )
+        rerouted += 1
+
+    logger.info("partner_routing.rerouted", extra={"checked": len(referrals), "rerouted": rerouted})
+    return {"unassigned_checked": len(referrals), "referrals_rerouted": rerouted}
+
+
+def _service_type(routing_category: str) -> str:
+    service_type = CATEGORY_TO_SERVICE_TYPE.get(routing_category)
+    if not service_type:
+        raise HTTPException(status_code=400, detail="Unsupported routing category")
+    return service_type
+
+
+def _pick_partner(
+    db: Session,
+    index: PartnerRoutingIndex,
+    routing_category: str,
+    service_type: str,
+    state: str | None,
+    *,
+    defaults: dict[tuple[str, str | None], UUID],
+) -> UUID | None:
+    # None leaves the referral unassigned: every partner serving it is at capacity.
+    slot = index.select(service_type, state, pending_partner_assignments(db, index))
+    if slot is not None:
+        return slot.partner_id
+    if index.serves(service_type, state):
+        logger.warning("partner_routing.at_capacity", extra={"service_type": service_type, "region": state})
+        return None
+    if (service_type, state) not in defaults:
+        defaults[(service_type, state)] = _default_partner(db, routing_category, service_type, state).id
+    return defaults[(service_type, state)]
+
+
+def _default_partner(db: Session, routing_category: str, service_type: str, state: str | None) -> PartnerOrganization:
+    # Only reached when no partner serves the type and region. The seeded partner is
+    # reused by later calls and reaches the index once it commits.
+    name = f"Default {routing_category.title()} Partner"
+    partner = (
+        db.query(PartnerOrganization)
+        .filter(PartnerOrganization.name == name)
+        .filter(PartnerOrganization.service_type == service_type)
+        .filter(PartnerOrganization.service_region == state)
+        .first()
+    )
+    if partner is None:
+        partner = PartnerOrganization(
+            name=name,
+            service_type=service_type,
+            service_region=state,
+            contact_info={"mode": "system_seed"},
+            api_endpoint=None,
+        )
+        db.add(partner)
+        db.flush()
+    return partner
+
+
+def _refresh_seconds() -> float:
+    return float(os.getenv("PARTNER_ROUTING_REFRESH_SECONDS", str(DEFAULT_INDEX_REFRESH_SECONDS)))
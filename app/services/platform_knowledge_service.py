@@ -1,18 +1,36 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from sqlalchemy.orm import Session
 
 from app.models.module_registry import ModuleRegistry
+from app.services.module_dispatch_service import module_registry_generation
 from app.services.module_loader_service import DomainServiceBroker
 
+REPO_ROOT = Path(__file__).resolve().parents[2]
+KNOWLEDGE_DOCS = (
+    "docs/platform_operational_report.md",
+    "docs/platform_capability_report.md",
+    "docs/platform_v1_architecture.md",
+)
+MODULE_CONTEXT_LIMIT = 8
+MAX_PROMPT_CONTEXT_CHARS = 12000
+DOC_CHECK_INTERVAL_SECONDS = 5.0
+DEFAULT_SNAPSHOT_REFRESH_SECONDS = 300
+
 
 class PlatformKnowledgeService:
     def __init__(self, db: Session):
         self.db = db
-        self._repo_root = Path(__file__).resolve().parents[2]
+        self._repo_root = REPO_ROOT
 
     def get_platform_overview(self) -> dict[str, Any]:
         return {
@@ -95,3 +113,115 @@ class PlatformKnowledgeService:
         text = path.read_text(encoding="utf-8")
         text = " ".join(text.split())
         return text[:max_chars]
+
+
+@dataclass(frozen=True)
+class KnowledgeSnapshot:
+    """Everything Mufasa grounds answers in, with the prompt context already serialized."""
+
+    overview: dict[str, Any]
+    capabilities: dict[str, Any]
+    architecture: dict[str, Any]
+    modules: list[dict[str, Any]]
+    domain_registry: dict[str, list[str]]
+    version: str
+    prompt_contexts: dict[bool, str]
+    registry_generation: int
+    doc_mtimes: tuple[int | None, ...]
+    built_at: float = field(default_factory=time.monotonic)
+
+    def prompt_context(self, *, investor_mode: bool) -> str:
+        return self.prompt_contexts[bool(investor_mode)]
+
+    def domain_services(self, domain_name: str) -> list[str]:
+        return self.domain_registry.get((domain_name or "").strip().lower(), [])
+
+
+_snapshot: KnowledgeSnapshot | None = None
+_snapshot_lock = threading.Lock()
+_docs_checked_at = 0.0
+
+
+def build_knowledge_snapshot(db: Session) -> KnowledgeSnapshot:
+    generation = module_registry_generation()
+    doc_mtimes = _doc_mtimes()
+    knowledge = PlatformKnowledgeService(db)
+    overview = knowledge.get_platform_overview()
+    capabilities = knowledge.get_capability_summary()
+    architecture = knowledge.get_architecture_summary()
+    modules = knowledge.get_module_descriptions()[:MODULE_CONTEXT_LIMIT]
+
+    prompt_contexts = {
+        investor_mode: json.dumps(
+            {
+                "overview": overview,
+                "capabilities": capabilities,
+                "architecture": architecture,
+                "modules": modules,
+                "investor_mode": investor_mode,
+            },
+            default=str,
+        )[:MAX_PROMPT_CONTEXT_CHARS]
+        for investor_mode in (False, True)
+    }
+    return KnowledgeSnapshot(
+        overview=overview,
+        capabilities=capabilities,
+        architecture=architecture,
+        modules=modules,
+        domain_registry=knowledge._domain_service_registry(),
+        version=hashlib.sha256(prompt_contexts[False].encode("utf-8")).hexdigest()[:16],
+        prompt_contexts=prompt_contexts,
+        registry_generation=generation,
+        doc_mtimes=doc_mtimes,
+    )
+
+
+def knowledge_snapshot(db: Session) -> KnowledgeSnapshot:
+    """The per-process snapshot, rebuilt when the registry or the docs change.
+
+    Registry changes committed in this process are seen immediately; other
+    processes rebuild after MUFASA_KNOWLEDGE_REFRESH_SECONDS. Doc files are
+    stat'ed at most every DOC_CHECK_INTERVAL_SECONDS.
+    """
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot is not None and not _snapshot_stale(snapshot):
+        return snapshot
+    with _snapshot_lock:
+        if _snapshot is None or _snapshot_stale(_snapshot):
+            _snapshot = build_knowledge_snapshot(db)
+        return _snapshot
+
+
+def invalidate_knowledge_snapshot() -> None:
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
+
+
+def _snapshot_stale(snapshot: KnowledgeSnapshot) -> bool:
+    global _docs_checked_at
+    if snapshot.registry_generation != module_registry_generation():
+        return True
+    now = time.monotonic()
+    if now - snapshot.built_at >= _refresh_seconds():
+        return True
+    if now - _docs_checked_at >= DOC_CHECK_INTERVAL_SECONDS:
+        _docs_checked_at = now
+        return _doc_mtimes() != snapshot.doc_mtimes
+    return False
+
+
+def _doc_mtimes() -> tuple[int | None, ...]:
+    mtimes = []
+    for relative_path in KNOWLEDGE_DOCS:
+        try:
+            mtimes.append((REPO_ROOT / relative_path).stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def _refresh_seconds() -> float:
+    return float(os.getenv("MUFASA_KNOWLEDGE_REFRESH_SECONDS", str(DEFAULT_SNAPSHOT_REFRESH_SECONDS)))
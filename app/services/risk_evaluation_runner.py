@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import date, datetime, timezone
+from typing import Any, Callable
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models.risk_evaluation_runs import RiskEvaluationRun
+from app.services.escalation_service import (
+    RISK_EVALUATION_CHUNK_SIZE,
+    accumulate_risk_summary,
+    active_membership_id_page,
+    empty_risk_summary,
+    evaluate_member_risk_batch,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+SUMMARY_FIELDS = ("processed_memberships", "risk_triggered", "audit_logs_created", "workflow_escalations")
+
+
+def daily_run_key(day: date | None = None) -> str:
+    return f"daily:{(day or date.today()).isoformat()}"
+
+
+def run_risk_evaluation(
+    session_factory: Callable[[], Session],
+    *,
+    run_key: str | None = None,
+    chunk_size: int = RISK_EVALUATION_CHUNK_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> dict[str, Any]:
+    """Evaluate all active memberships in parallel chunks, committing each chunk.
+
+    The coordinator pages membership ids with a keyset cursor and hands chunks to a
+    thread pool; every worker evaluates its chunk in its own session and commits.
+    The run's checkpoint only advances over a contiguous prefix of finished chunks,
+    so re-invoking the same ``run_key`` after a crash resumes from the checkpoint.
+    Chunks that finished past the checkpoint are re-evaluated, which is safe because
+    escalation is idempotent.
+    """
+    run_key = run_key or daily_run_key()
+    coordinator = session_factory()
+    try:
+        run = _get_or_start_run(coordinator, run_key=run_key, chunk_size=chunk_size)
+        if run.status == "completed":
+            return _run_summary(run)
+
+        cursor: UUID | None = run.checkpoint_membership_id
+        in_flight: deque[tuple[UUID, Future]] = deque()
+        exhausted = False
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="risk-eval") as pool:
+            while in_flight or not exhausted:
+                while not exhausted and len(in_flight) < max_workers * 2:
+                    chunk = active_membership_id_page(coordinator, after_id=cursor, limit=chunk_size)
+                    coordinator.rollback()
+                    if not chunk:
+                        exhausted = True
+                        break
+                    cursor = chunk[-1]
+                    in_flight.append((cursor, pool.submit(_evaluate_chunk, session_factory, chunk)))
+
+                if not in_flight:
+                    break
+                wait([future for _, future in in_flight], return_when=FIRST_COMPLETED)
+
+                advanced = False
+                while in_flight and in_flight[0][1].done():
+                    last_id, future = in_flight.popleft()
+                    try:
+                        chunk_summary = future.result()
+                    except Exception as exc:
+                        for _, pending in in_flight:
+                            pending.cancel()
+                        _fail_run(coordinator, run, exc)
+                        raise
+                    for field in SUMMARY_FIELDS:
+                        setattr(run, field, int(getattr(run, field) or 0) + chunk_summary[field])
+                    run.checkpoint_membership_id = last_id
+                    run.chunks_completed = int(run.chunks_completed or 0) + 1
+                    advanced = True
+                if advanced:
+                    coordinator.commit()
+
+        run.status = "completed"
+        run.finished_at = datetime.now(timezone.utc)
+        coordinator.commit()
+        logger.info("risk_evaluation.completed", extra={"run_key": run_key, "chunks": run.chunks_completed})
+        return _run_summary(run)
+    finally:
+        coordinator.close()
+
+
+def _evaluate_chunk(session_factory: Callable[[], Session], membership_ids: list[UUID]) -> dict[str, int]:
+    db = session_factory()
+    try:
+        summary = accumulate_risk_summary(empty_risk_summary(), evaluate_member_risk_batch(db, membership_ids))
+        db.commit()
+        return summary
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _get_or_start_run(db: Session, *, run_key: str, chunk_size: int) -> RiskEvaluationRun:
+    run = db.query(RiskEvaluationRun).filter(RiskEvaluationRun.run_key == run_key).first()
+    if not run:
+        run = RiskEvaluationRun(run_key=run_key, chunk_size=chunk_size, status="running")
+        db.add(run)
+    elif run.status != "completed":
+        # Resuming: keep the checkpoint and counters, clear the previous failure.
+        run.status = "running"
+        run.error = None
+    db.commit()
+    return run
+
+
+def _fail_run(db: Session, run: RiskEvaluationRun, exc: Exception) -> None:
+    db.rollback()
+    run.status = "failed"
+    run.error = str(exc)
+    db.commit()
+    logger.warning("risk_evaluation.failed", extra={"run_key": run.run_key, "error": str(exc)})
+
+
+def _run_summary(run: RiskEvaluationRun) -> dict[str, Any]:
+    return {
+        "run_key": run.run_key,
+        "status": run.status,
+        "chunks_completed": run.chunks_completed,
+        "checkpoint_membership_id": str(run.checkpoint_membership_id) if run.checkpoint_membership_id else None,
+        **{field: int(getattr(run, field) or 0) for field in SUMMARY_FIELDS},
+    }
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from fastapi import HTTPException
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from app.models.job_runs import JobRun
+
+logger = logging.getLogger(__name__)
+
+ENQUEUE_TIMEOUT_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class ScheduledJob:
+    name: str
+    # Celery task that runs the job; its queue is set by task_routes in workers.celery_worker.
+    task: str
+    # Key of the job's result dict counted as rows processed.
+    rows_key: str | None = None
+
+
+JOBS: dict[str, ScheduledJob] = {
+    job.name: job
+    for job in (
+        ScheduledJob(
+            "risk_evaluation",
+            "workers.tasks.risk_evaluation.run_daily_risk_evaluation_task",
+            rows_key="processed_memberships",
+        ),
+        ScheduledJob(
+            "foreclosure_scan",
+            "workers.tasks.scheduled_jobs.weekly_foreclosure_scan_task",
+            rows_key="leads_ingested",
+        ),
+        ScheduledJob(
+            "botops_crawl",
+            "workers.tasks.botops_runner.run_botops_commands",
+            rows_key="records_upserted",
+        ),
+        ScheduledJob(
+            "workflow_sla_sweep",
+            "workers.tasks.scheduled_jobs.workflow_sla_sweep_task",
+            rows_key="breaches_flagged",
+        ),
+        ScheduledJob(
+            "partner_reroute_sweep",
+            "workers.tasks.scheduled_jobs.partner_reroute_sweep_task",
+            rows_key="referrals_rerouted",
+        ),
+        ScheduledJob(
+            "impact_rollups",
+            "workers.tasks.impact_rollups.refresh_impact_rollups_task",
+            rows_key="changed_rows",
+        ),
+    )
+}
+
+
+def run_singleton_job(
+    session_factory: Callable[[], Session],
+    job: ScheduledJob,
+    work: Callable[[], dict[str, Any]],
+    *,
+    task_id: str | None = None,
+    queue: str | None = None,
+) -> dict[str, Any]:
+    """Run ``work`` unless another run of the same job holds its lock, recording a ``JobRun``.
+
+    The lock is a Postgres session advisory lock on a dedicated autocommit
+    connection, so it is released when the run ends or its connection dies and
+    never holds a transaction open. Overlapping runs are recorded as ``skipped``.
+    """
+    db = session_factory()
+    lock = db.get_bind().connect().execution_options(isolation_level="AUTOCOMMIT")
+    key = _lock_key(job.name)
+    acquired = False
+    try:
+        acquired = bool(lock.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": key}).scalar())
+        run = JobRun(job_name=job.name, task_id=task_id, queue=queue, status="running" if acquired else "skipped")
+        if not acquired:
+            run.finished_at = datetime.now(timezone.utc)
+            run.duration_ms = 0.0
+            db.add(run)
+            db.commit()
+            logger.info("scheduled_job.skipped", extra={"job": job.name, "task_id": task_id})
+            return job_run_summary(run)
+
+        db.add(run)
+        db.commit()
+        started = time.perf_counter()
+        try:
+            result = work()
+        except Exception as exc:
+            db.rollback()
+            _finish(run, started, status="failed", error=f"{type(exc).__name__}: {exc}")
+            db.commit()
+            logger.exception("scheduled_job.failed", extra={"job": job.name, "task_id": task_id})
+            raise
+
+        result = json.loads(json.dumps(result or {}, default=str))
+        _finish(run, started, status="succeeded", result=result, rows=int(result.get(job.rows_key) or 0) if job.rows_key else 0)
+        db.commit()
+        summary = job_run_summary(run)
+        logger.info("scheduled_job.completed", extra={k: v for k, v in summary.items() if k != "result"})
+        return summary
+    finally:
+        if acquired:
+            lock.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+        lock.close()
+        db.close()
+
+
+def enqueue_job(job_name: str, **kwargs: Any) -> dict[str, Any]:
+    """Hand a job to its Celery queue instead of running it in the web process."""
+    job = _job(job_name)
+    # Imported here: the worker module pulls in Celery and the broker settings.
+    from workers.celery_worker import celery_app
+
+    try:
+        with celery_app.connection_for_write() as connection:
+            # Fail the request quickly when the broker is down instead of retrying for seconds.
+            connection.ensure_connection(max_retries=1, timeout=ENQUEUE_TIMEOUT_SECONDS)
+            result = celery_app.send_task(job.task, kwargs=kwargs, connection=connection, retry=False)
+    except Exception as exc:
+        logger.warning("scheduled_job.enqueue_failed", extra={"job": job_name, "error": str(exc)})
+        raise HTTPException(status_code=503, detail=f"Could not enqueue job '{job_name}'") from exc
+    return {"job": job_name, "status": "queued", "task_id": result.id}
+
+
+def job_run_history(db: Session, job_name: str, *, limit: int = 50) -> list[dict[str, Any]]:
+    _job(job_name)
+    runs = (
+        db.query(JobRun)
+        .filter(JobRun.job_name == job_name)
+        .order_by(JobRun.started_at.desc())
+        .limit(min(max(limit, 1), 500))
+        .all()
+    )
+    return [job_run_summary(run) for run in runs]
+
+
+def latest_job_runs(db: Session) -> list[dict[str, Any]]:
+    latest = (
+        db.query(JobRun.job_name, func.max(JobRun.started_at).label("started_at"))
+        .filter(JobRun.status != "skipped")
+        .group_by(JobRun.job_name)
+        .subquery()
+    )
+    runs = {
+        run.job_name: run
+        for run in db.query(JobRun).join(
+            latest, (JobRun.job_name == latest.c.job_name) & (JobRun.started_at == latest.c.started_at)
+        )
+    }
+    return [
+        {"job": name, "task": job.task, "last_run": job_run_summary(runs[name]) if name in runs else None}
+        for name, job in sorted(JOBS.items())
+    ]
+
+
+def job_run_summary(run: JobRun) -> dict[str, Any]:
+    return {
+        "id": str(run.id) if run.id else None,
+        "job": run.job_name,
+        "status": run.status,
+        "task_id": run.task_id,
+        "queue": run.queue,
+        "rows_processed": run.rows_processed or 0,
+        "duration_ms": run.duration_ms,
+        "result": run.result,
+        "error": run.error,
+        "started_at": run.started_at.isoformat() if run.started_at else None,
+        "finished_at": run.finished_at.isoformat() if run.finished_at else None,
+    }
+
+
+def _finish(
+    run: JobRun,
+    started: float,
+    *,
+    status: str,
+    result: dict[str, Any] | None = None,
+    rows: int = 0,
+    error: str | None = None,
+) -> None:
+    run.status = status
+    run.result = result
+    run.rows_processed = rows
+    run.error = error
+    run.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+    run.finished_at = datetime.now(timezone.utc)
+
+
+def _job(job_name: str) -> ScheduledJob:
+    job = JOBS.get(job_name)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job '{job_name}'")
+    return job
+
+
+def _lock_key(job_name: str) -> int:
+    # Stable across processes, unlike hash(); advisory locks take a signed bigint.
+    return int.from_bytes(hashlib.sha256(f"scheduled_job:{job_name}".encode()).digest()[:8], "big", signed=True)
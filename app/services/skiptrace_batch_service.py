@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException
+from sqlalchemy import insert, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.audit_logs import AuditLog
+from app.models.housing_intelligence import ForeclosureCaseData
+from app.models.skiptrace import SkiptraceBatch, SkiptraceCacheEntry
+from app.services.address_normalization import normalize_address
+from app.services.case_detail_service import mark_case_details_stale
+from app.services.skiptrace_service import (
+    PROVIDER_LIMITS,
+    PROVIDER_TIMEOUT_SECONDS,
+    SKIPTRACE_PROVIDERS,
+    provider_gates,
+    run_sync,
+    skiptrace_property_owner_async,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_TTL = timedelta(days=30)
+DEFAULT_CHUNK_SIZE = 500
+MAX_BATCH_CASES = 10000
+STALE_BATCH_TIMEOUT = timedelta(minutes=15)
+
+# Oldest queued batch, or a running one whose worker stopped updating it.
+CLAIM_BATCH_SQL = """
+UPDATE skiptrace_batches b
+SET status = 'running', started_at = COALESCE(b.started_at, now()), updated_at = now()
+WHERE b.id = (
+    SELECT id
+    FROM skiptrace_batches
+    WHERE status = 'queued'
+       OR (status = 'running' AND updated_at < now() - CAST(:timeout AS interval))
+    ORDER BY created_at
+    LIMIT 1
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING b.id
+"""
+
+
+@dataclass
+class _SkiptracePlan:
+    ids: list[UUID]
+    key_by_case: dict[UUID, str]
+    cached: dict[str, dict]
+    misses: dict[str, str]
+    now: datetime
+
+
+def skiptrace_cases(
+    db: Session,
+    *,
+    case_ids: Iterable[UUID],
+    provider: str = "batchdata",
+    actor_id: UUID | None = None,
+    action_type: str = "skiptrace_run",
+    reason_code: str = "skiptrace_lookup_started",
+    batch_id: UUID | None = None,
+    cache_ttl: timedelta = DEFAULT_CACHE_TTL,
+) -> dict[str, Any]:
+    """Skiptrace the owners of many cases in one pass; the caller commits.
+
+    Addresses are deduplicated and served from the cache where possible; the rest
+    fan out to the provider concurrently. Cache rows and per-case audit entries
+    are written with one statement each.
+    """
+    plan = _plan_lookups(db, case_ids=case_ids, provider=provider)
+    fetched, fetch_errors = run_sync(lambda: _fetch_addresses(provider, plan.misses)) if plan.misses else ({}, {})
+    return _apply_lookups(
+        db,
+        plan,
+        fetched,
+        fetch_errors,
+        provider=provider,
+        actor_id=actor_id,
+        action_type=action_type,
+        reason_code=reason_code,
+        batch_id=batch_id,
+        cache_ttl=cache_ttl,
+    )
+
+
+async def skiptrace_cases_async(
+    db: AsyncSession,
+    *,
+    case_ids: Iterable[UUID],
+    provider: str = "batchdata",
+    actor_id: UUID | None = None,
+    action_type: str = "skiptrace_run",
+    reason_code: str = "skiptrace_lookup_started",
+    batch_id: UUID | None = None,
+    cache_ttl: timedelta = DEFAULT_CACHE_TTL,
+) -> dict[str, Any]:
+    """``skiptrace_cases`` for callers running in an event loop; the caller commits."""
+    ids = list(case_ids)
+    plan = await db.run_sync(lambda session: _plan_lookups(session, case_ids=ids, provider=provider))
+    fetched, fetch_errors = await _fetch_addresses(provider, plan.misses) if plan.misses else ({}, {})
+    return await db.run_sync(
+        lambda session: _apply_lookups(
+            session,
+            plan,
+            fetched,
+            fetch_errors,
+            provider=provider,
+            actor_id=actor_id,
+            action_type=action_type,
+            reason_code=reason_code,
+            batch_id=batch_id,
+            cache_ttl=cache_ttl,
+        )
+    )
+
+
+def _plan_lookups(db: Session, *, case_ids: Iterable[UUID], provider: str) -> _SkiptracePlan:
+    if provider not in SKIPTRACE_PROVIDERS:
+        raise HTTPException(status_code=422, detail=f"Unknown skiptrace provider '{provider}'")
+
+    ids = list(dict.fromkeys(case_ids))
+    profiles = (
+        db.query(
+            ForeclosureCaseData.case_id,
+            ForeclosureCaseData.property_address,
+            ForeclosureCaseData.city,
+            ForeclosureCaseData.state,
+            ForeclosureCaseData.zip_code,
+        )
+        .filter(ForeclosureCaseData.case_id.in_(ids))
+        .all()
+    )
+
+    address_by_key: dict[str, str] = {}
+    key_by_case: dict[UUID, str] = {}
+    for profile in profiles:
+        key = normalize_address(profile.property_address, profile.city, profile.state, profile.zip_code)
+        key_by_case[profile.case_id] = key
+        address_by_key.setdefault(key, profile.property_address)
+
+    now = datetime.now(timezone.utc)
+    cached = {
+        row.address_key: row.result
+        for row in db.query(SkiptraceCacheEntry.address_key, SkiptraceCacheEntry.result).filter(
+            SkiptraceCacheEntry.provider == provider,
+            SkiptraceCacheEntry.address_key.in_(list(address_by_key)),
+            SkiptraceCacheEntry.expires_at > now,
+        )
+    }
+    misses = {key: address for key, address in address_by_key.items() if key not in cached}
+    return _SkiptracePlan(ids=ids, key_by_case=key_by_case, cached=cached, misses=misses, now=now)
+
+
+def _apply_lookups(
+    db: Session,
+    plan: _SkiptracePlan,
+    fetched: dict[str, dict],
+    fetch_errors: dict[str, str],
+    *,
+    provider: str,
+    actor_id: UUID | None,
+    action_type: str,
+    reason_code: str,
+    batch_id: UUID | None,
+    cache_ttl: timedelta,
+) -> dict[str, Any]:
+    ids, key_by_case, cached, now = plan.ids, plan.key_by_case, plan.cached, plan.now
+    if fetched:
+        statement = pg_insert(SkiptraceCacheEntry).values(
+            [
+                {
+                    "id": uuid4(),
+                    "provider": provider,
+                    "address_key": key,
+                    "result": result,
+                    "fetched_at": now,
+                    "expires_at": now + cache_ttl,
+                }
+                for key, result in fetched.items()
+            ]
+        )
+        db.execute(
+            statement.on_conflict_do_update(
+                constraint="uq_skiptrace_cache_provider_address_key",
+                set_={
+                    "result": statement.excluded.result,
+                    "fetched_at": statement.excluded.fetched_at,
+                    "expires_at": statement.excluded.expires_at,
+                },
+            )
+        )
+
+    results: dict[str, dict] = {}
+    errors: dict[str, str] = {}
+    audit_rows = []
+    for case_id in ids:
+        key = key_by_case.get(case_id)
+        if key is None:
+            errors[str(case_id)] = "Foreclosure profile not found"
+            continue
+        data = cached.get(key) or fetched.get(key)
+        if data is None:
+            errors[str(case_id)] = fetch_errors.get(key, "No result")
+            continue
+
+        result = {"case_id": str(case_id), **data}
+        results[str(case_id)] = result
+        after_state: dict[str, Any] = {"provider": provider, "result": result, "cached": key in cached}
+        if batch_id is not None:
+            after_state["batch_id"] = str(batch_id)
+        audit_rows.append(
+            {
+                "id": uuid4(),
+                "case_id": case_id,
+                "actor_id": actor_id,
+                "actor_is_ai": False,
+                "action_type": action_type,
+                "reason_code": reason_code,
+                "before_state": {},
+                "after_state": after_state,
+                "policy_version_id": None,
+            }
+        )
+
+    if audit_rows:
+        db.execute(insert(AuditLog), audit_rows)
+        mark_case_details_stale(db, (row["case_id"] for row in audit_rows))
+
+    return {
+        "results": results,
+        "errors": errors,
+        "cache_hits": sum(1 for case_id in ids if key_by_case.get(case_id) in cached),
+        "provider_calls": len(plan.misses),
+    }
+
+
+def submit_skiptrace_batch(
+    db: Session,
+    *,
+    case_ids: Iterable[UUID],
+    provider: str = "batchdata",
+    actor_id: UUID | None = None,
+) -> SkiptraceBatch:
+    if provider not in SKIPTRACE_PROVIDERS:
+        raise HTTPException(status_code=422, detail=f"Unknown skiptrace provider '{provider}'")
+    ids = [str(case_id) for case_id in dict.fromkeys(case_ids)]
+    if not ids:
+        raise HTTPException(status_code=422, detail="case_ids must not be empty")
+    if len(ids) > MAX_BATCH_CASES:
+        raise HTTPException(status_code=422, detail=f"A skiptrace batch holds at most {MAX_BATCH_CASES} cases")
+
+    batch = SkiptraceBatch(
+        provider=provider,
+        case_ids=ids,
+        requested_by=actor_id,
+        status="queued",
+        total_cases=len(ids),
+        processed_cases=0,
+        resolved_cases=0,
+        cache_hits=0,
+        provider_calls=0,
+        failed_cases=0,
+        errors={},
+    )
+    db.add(batch)
+    db.flush()
+    return batch
+
+
+def run_skiptrace_batch(
+    session_factory: Callable[[], Session],
+    batch_id: UUID,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Work through a claimed batch chunk by chunk, committing progress after each."""
+    db = session_factory()
+    try:
+        batch = db.get(SkiptraceBatch, batch_id)
+        if batch is None:
+            raise HTTPException(status_code=404, detail="Skiptrace batch not found")
+
+        try:
+            while batch.processed_cases < batch.total_cases:
+                chunk = batch.case_ids[batch.processed_cases : batch.processed_cases + chunk_size]
+                outcome = skiptrace_cases(
+                    db,
+                    case_ids=[UUID(case_id) for case_id in chunk],
+                    provider=batch.provider,
+                    actor_id=batch.requested_by,
+                    reason_code="skiptrace_batch_lookup",
+                    batch_id=batch.id,
+                )
+                batch.processed_cases += len(chunk)
+                batch.resolved_cases += len(outcome["results"])
+                batch.cache_hits += outcome["cache_hits"]
+                batch.provider_calls += outcome["provider_calls"]
+                batch.failed_cases += len(outcome["errors"])
+                if outcome["errors"]:
+                    batch.errors = {**(batch.errors or {}), **outcome["errors"]}
+                db.commit()
+        except Exception as exc:
+            db.rollback()
+            batch.status = "failed"
+            batch.error = f"{type(exc).__name__}: {exc}"
+            batch.finished_at = datetime.now(timezone.utc)
+            db.commit()
+            logger.exception("skiptrace_batch.failed", extra={"batch_id": str(batch.id)})
+            raise
+
+        batch.status = "completed"
+        batch.finished_at = datetime.now(timezone.utc)
+        db.commit()
+        summary = skiptrace_batch_summary(batch)
+    finally:
+        db.close()
+
+    logger.info("skiptrace_batch.completed", extra=summary)
+    return summary
+
+
+def drain_skiptrace_batches(
+    session_factory: Callable[[], Session],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_batches: int | None = None,
+) -> dict[str, Any]:
+    """Claim and run queued batches one at a time until none are left."""
+    summary: dict[str, Any] = {"batches": 0, "completed": 0, "failed": 0}
+    while max_batches is None or summary["batches"] < max_batches:
+        coordinator = session_factory()
+        try:
+            batch_id = coordinator.execute(
+                text(CLAIM_BATCH_SQL),
+                {"timeout": f"{int(STALE_BATCH_TIMEOUT.total_seconds())} seconds"},
+            ).scalar()
+            coordinator.commit()
+        finally:
+            coordinator.close()
+        if batch_id is None:
+            break
+
+        summary["batches"] += 1
+        try:
+            run_skiptrace_batch(session_factory, batch_id, chunk_size=chunk_size)
+            summary["completed"] += 1
+        except Exception:
+            summary["failed"] += 1
+    return summary
+
+
+def skiptrace_batch_summary(batch: SkiptraceBatch) -> dict[str, Any]:
+    return {
+        "batch_id": str(batch.id),
+        "provider": batch.provider,
+        "status": batch.status,
+        "total_cases": batch.total_cases,
+        "processed_cases": batch.processed_cases,
+        "resolved_cases": batch.resolved_cases,
+        "cache_hits": batch.cache_hits,
+        "provider_calls": batch.provider_calls,
+        "failed_cases": batch.failed_cases,
+        "errors": batch.errors or {},
+        "error": batch.error,
+        "created_at": batch.created_at.isoformat() if batch.created_at else None,
+        "started_at": batch.started_at.isoformat() if batch.started_at else None,
+        "finished_at": batch.finished_at.isoformat() if batch.finished_at else None,
+    }
+
+
+async def _fetch_addresses(provider: str, addresses: dict[str, str]) -> tuple[dict[str, dict], dict[str, str]]:
+    # The process-wide gates cap each provider's concurrency and request rate across
+    # every batch and request in flight; the waterfall shares them.
+    gates = provider_gates()
+    max_connections = sum(limits.max_concurrency for limits in PROVIDER_LIMITS.values())
+    results: dict[str, dict] = {}
+    errors: dict[str, str] = {}
+
+    import httpx
+
+    async with httpx.AsyncClient(
+        timeout=PROVIDER_TIMEOUT_SECONDS,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+    ) as client:
+
+        async def fetch(key: str, address: str) -> None:
+            try:
+                results[key] = await skiptrace_property_owner_async(
+                    client, address=address, provider=provider, gates=gates
+                )
+            except Exception as exc:
+                errors[key] = f"{type(exc).__name__}: {exc}"
+
+        await asyncio.gather(*(fetch(key, address) for key, address in addresses.items()))
+
+    return results, errors
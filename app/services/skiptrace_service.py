@@ -1,7 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypeVar
 from uuid import UUID
 
+if TYPE_CHECKING:
+    import httpx
+
+from app.services import metrics
+from db.latency_stats import LatencyHistogram
+
+T = TypeVar("T")
+
 
 def batchdata_adapter(address: str) -> dict:
     return {"owner_name": f"Owner of {address}", "phones": ["+1-214-555-0101"], "emails": ["owner@batchdata.example"]}
@@ -22,11 +38,340 @@ ADAPTERS = {
 }
 
 
+@dataclass(frozen=True)
+class ProviderLimits:
+    max_concurrency: int
+    requests_per_second: float
+
+
+# Applied to remote lookups only; the local adapters are not billed or throttled.
+PROVIDER_LIMITS = {
+    "batchdata": ProviderLimits(max_concurrency=16, requests_per_second=25),
+    "propstream": ProviderLimits(max_concurrency=8, requests_per_second=10),
+    "peopledatalabs": ProviderLimits(max_concurrency=8, requests_per_second=10),
+}
+
+PROVIDER_TIMEOUT_SECONDS = 15.0
+GATE_POLL_SECONDS = 0.01
+
+WATERFALL_PROVIDER = "waterfall"
+SKIPTRACE_PROVIDERS = (*ADAPTERS, WATERFALL_PROVIDER)
+DEFAULT_WATERFALL_ORDER = ("batchdata", "propstream", "peopledatalabs")
+DEFAULT_COMPLETENESS_THRESHOLD = 0.67
+# Observed lookups a provider needs before its stats may reorder the waterfall.
+MIN_REORDER_SAMPLES = 20
+COMPLETENESS_FIELDS = ("owner_name", "phones", "emails")
+
+
+@dataclass
+class ProviderStats:
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    attempts: int = 0
+    hits: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.attempts if self.attempts else 0.0
+
+
+# Per-process lookup stats; each worker learns its own ordering.
+PROVIDER_STATS: dict[str, ProviderStats] = {name: ProviderStats() for name in ADAPTERS}
+_STATS_LOCK = threading.Lock()
+
+
+class ProviderGate:
+    """Process-wide concurrency cap plus request spacing for one provider's remote lookups.
+
+    Every batch and request runs its own event loop, often on different threads, so
+    the gate uses thread primitives: a slot is taken without blocking and retried
+    after a short sleep, and start times are reserved under a plain lock.
+    """
+
+    def __init__(self, provider: str, limits: ProviderLimits):
+        self.provider = provider
+        self._slots = threading.BoundedSemaphore(limits.max_concurrency)
+        self._interval = 1.0 / limits.requests_per_second if limits.requests_per_second > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    async def __aenter__(self) -> "ProviderGate":
+        while not self._slots.acquire(blocking=False):
+            await asyncio.sleep(GATE_POLL_SECONDS)
+        try:
+            # Only remote lookups are rate limited; the local adapters are free.
+            if self._interval and provider_endpoint(self.provider):
+                with self._lock:
+                    now = time.monotonic()
+                    start = max(now, self._next_start)
+                    self._next_start = start + self._interval
+                if start > now:
+                    await asyncio.sleep(start - now)
+        except BaseException:
+            self._slots.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._slots.release()
+
+
+_PROVIDER_GATES: dict[str, ProviderGate] = {}
+_GATES_LOCK = threading.Lock()
+
+
+def provider_gates() -> dict[str, ProviderGate]:
+    """The process-wide gates, so concurrent lookups and batches share each provider's limits."""
+    with _GATES_LOCK:
+        for name in ADAPTERS:
+            if name not in _PROVIDER_GATES:
+                _PROVIDER_GATES[name] = ProviderGate(name, PROVIDER_LIMITS.get(name, ProviderLimits(4, 5)))
+        return dict(_PROVIDER_GATES)
+
+
+def run_sync(coroutine_factory: Callable[[], Awaitable[T]]) -> T:
+    """Run a coroutine from sync code, also when this thread is already running a loop.
+
+    Async callers should await the ``*_async`` entry points instead; this keeps the
+    sync wrappers usable from tests and handlers that happen to run inside a loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine_factory())
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="skiptrace-sync") as pool:
+        return pool.submit(lambda: asyncio.run(coroutine_factory())).result()
+
+
 def skiptrace_property_owner(*, address: str, provider: str = "batchdata") -> dict:
+    if provider == WATERFALL_PROVIDER:
+        return run_sync(lambda: lookup_property_owner(address=address, provider=provider))
     adapter = ADAPTERS.get(provider, batchdata_adapter)
     return adapter(address)
 
 
+async def lookup_property_owner(*, address: str, provider: str = "batchdata") -> dict:
+    """Async entry point for callers already running in an event loop; opens its own client."""
+    # httpx is imported on first provider call; it is a tenth of a second of API cold start.
+    import httpx
+
+    async with httpx.AsyncClient(timeout=PROVIDER_TIMEOUT_SECONDS) as client:
+        return await skiptrace_property_owner_async(client, address=address, provider=provider)
+
+
 def skiptrace_case_owner(*, case_id: UUID, address: str, provider: str = "batchdata") -> dict:
     data = skiptrace_property_owner(address=address, provider=provider)
     return {"case_id": str(case_id), **data}
+
+
+def provider_endpoint(provider: str) -> str | None:
+    """Remote lookup URL from ``SKIPTRACE_<PROVIDER>_URL``; unset means the local adapter."""
+    return os.getenv(f"SKIPTRACE_{provider.upper()}_URL", "").strip() or None
+
+
+def result_completeness(result: dict | None) -> float:
+    if not result:
+        return 0.0
+    return sum(1 for key in COMPLETENESS_FIELDS if result.get(key)) / len(COMPLETENESS_FIELDS)
+
+
+def waterfall_order(base: tuple[str, ...] | None = None) -> list[str]:
+    """Configured order, with the providers that have enough samples ranked fastest-to-a-hit.
+
+    Providers are ranked by hits per second of median latency, so a slightly less
+    complete but much faster provider moves ahead of a slow one. Ranked providers
+    trade places among the positions they hold; a provider that is rarely reached
+    (later ones only run on misses and hedges) keeps its configured position.
+    """
+    configured = os.getenv("SKIPTRACE_WATERFALL_ORDER", "").strip()
+    order = list(base or (tuple(p.strip() for p in configured.split(",") if p.strip()) or DEFAULT_WATERFALL_ORDER))
+    order = [name for name in order if name in ADAPTERS]
+
+    with _STATS_LOCK:
+        stats = {name: PROVIDER_STATS.setdefault(name, ProviderStats()) for name in order}
+    sampled = [index for index, name in enumerate(order) if stats[name].attempts >= MIN_REORDER_SAMPLES]
+    if len(sampled) < 2:
+        return order
+
+    def efficiency(name: str) -> float:
+        median_ms = stats[name].latency.quantile(0.5) or 1.0
+        return stats[name].hit_rate / max(median_ms, 1.0)
+
+    ranked = sorted((order[index] for index in sampled), key=efficiency, reverse=True)
+    for index, name in zip(sampled, ranked):
+        order[index] = name
+    return order
+
+
+def provider_stats_snapshot() -> dict[str, Any]:
+    with _STATS_LOCK:
+        stats = dict(PROVIDER_STATS)
+    return {
+        name: {
+            "attempts": s.attempts,
+            "hits": s.hits,
+            "errors": s.errors,
+            "hit_rate": round(s.hit_rate, 4),
+            "latency": s.latency.snapshot(),
+        }
+        for name, s in stats.items()
+    }
+
+
+def reset_provider_stats() -> None:
+    with _STATS_LOCK:
+        for name in list(PROVIDER_STATS):
+            PROVIDER_STATS[name] = ProviderStats()
+
+
+async def skiptrace_property_owner_async(
+    client: httpx.AsyncClient,
+    *,
+    address: str,
+    provider: str,
+    gates: dict[str, ProviderGate] | None = None,
+) -> dict:
+    gates = gates if gates is not None else provider_gates()
+    if provider == WATERFALL_PROVIDER:
+        return await waterfall_lookup(client, address=address, gates=gates)
+    return await _observed_lookup(
+        client,
+        address=address,
+        provider=provider,
+        gate=gates[provider],
+        threshold=_completeness_threshold(),
+    )
+
+
+async def waterfall_lookup(
+    client: httpx.AsyncClient,
+    *,
+    address: str,
+    gates: dict[str, ProviderGate] | None = None,
+    order: list[str] | None = None,
+    completeness_threshold: float | None = None,
+    hedge_after_seconds: float | None = None,
+) -> dict:
+    """Query providers in order until one returns a complete enough result.
+
+    With ``hedge_after_seconds`` the next provider is started when the current one
+    has not answered in time, and the first sufficient answer wins. Returns the
+    best result seen, tagged with the provider that produced it.
+    """
+    gates = gates if gates is not None else provider_gates()
+    queue = list(order or waterfall_order())
+    threshold = completeness_threshold if completeness_threshold is not None else _completeness_threshold()
+    if hedge_after_seconds is None:
+        hedge_ms = _env_float("SKIPTRACE_WATERFALL_HEDGE_MS", 0.0)
+        hedge_after_seconds = hedge_ms / 1000 if hedge_ms > 0 else None
+
+    pending: dict[asyncio.Task, str] = {}
+    best: tuple[float, str, dict] | None = None
+    last_error: Exception | None = None
+
+    def launch() -> None:
+        name = queue.pop(0)
+        pending[asyncio.create_task(_observed_lookup(client, address=address, provider=name, gate=gates[name], threshold=threshold))] = name
+
+    launch()
+    try:
+        while pending:
+            done, _ = await asyncio.wait(
+                pending,
+                timeout=hedge_after_seconds if queue else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                launch()
+                continue
+            for task in done:
+                name = pending.pop(task)
+                try:
+                    result = task.result()
+                except Exception as exc:
+                    last_error = exc
+                else:
+                    completeness = result_completeness(result)
+                    if completeness >= threshold:
+                        return {**result, "provider": name}
+                    if best is None or completeness > best[0]:
+                        best = (completeness, name, result)
+                if queue:
+                    launch()
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if best is not None:
+        return {**best[2], "provider": best[1]}
+    if last_error is not None:
+        raise last_error
+    raise LookupError("No skiptrace providers configured")
+
+
+async def _observed_lookup(
+    client: httpx.AsyncClient,
+    *,
+    address: str,
+    provider: str,
+    gate: ProviderGate,
+    threshold: float,
+) -> dict:
+    async with gate:
+        started = time.perf_counter()
+        hit = error = False
+        try:
+            result = await _provider_lookup(client, address=address, provider=provider)
+            hit = result_completeness(result) >= threshold
+            return result
+        except Exception:
+            error = True
+            raise
+        finally:
+            # Also when a hedge winner cancels this lookup (CancelledError is not an
+            # Exception): the attempt counts as a miss that took at least this long,
+            # so slow providers are not left out of the stats.
+            _record(provider, started, hit=hit, error=error)
+
+
+async def _provider_lookup(client: httpx.AsyncClient, *, address: str, provider: str) -> dict:
+    endpoint = provider_endpoint(provider)
+    if not endpoint:
+        # Local adapters may be plain functions or coroutines (slow stubs in tests).
+        result = ADAPTERS.get(provider, batchdata_adapter)(address)
+        return await result if inspect.isawaitable(result) else result
+
+    headers = {}
+    api_key = os.getenv(f"SKIPTRACE_{provider.upper()}_API_KEY", "").strip()
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+
+    response = await client.post(endpoint, json={"address": address}, headers=headers)
+    response.raise_for_status()
+    data = response.json()
+    return {
+        "owner_name": data.get("owner_name"),
+        "phones": list(data.get("phones") or []),
+        "emails": list(data.get("emails") or []),
+    }
+
+
+def _record(provider: str, started: float, *, hit: bool, error: bool) -> None:
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    with _STATS_LOCK:
+        stats = PROVIDER_STATS.setdefault(provider, ProviderStats())
+        stats.attempts += 1
+        stats.hits += int(hit)
+        stats.errors += int(error)
+    stats.latency.observe(elapsed_ms)
+    metrics.SKIPTRACE_LOOKUP_SECONDS.labels(provider).observe(elapsed_ms / 1000)
+    metrics.SKIPTRACE_LOOKUPS.labels(provider, "error" if error else "hit" if hit else "miss").inc()
+
+
+def _completeness_threshold() -> float:
+    return _env_float("SKIPTRACE_COMPLETENESS_THRESHOLD", DEFAULT_COMPLETENESS_THRESHOLD)
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name, "").strip()
+    return float(raw) if raw else default
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.services import metrics
+from db.latency_stats import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_N_PLUS_ONE_THRESHOLD = 10
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+STATEMENT_PREVIEW_CHARS = 200
+
+
+def profiling_enabled() -> bool:
+    return _flag("SQL_PROFILING_ENABLED", default=True)
+
+
+def profiling_headers_enabled() -> bool:
+    # Off by default: the headers tell any client how many queries and how much DB
+    # time a request cost. Tests and the benchmark suite turn them on.
+    return _flag("SQL_PROFILING_HEADERS", default=False)
+
+
+def n_plus_one_threshold() -> int:
+    return int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", str(DEFAULT_N_PLUS_ONE_THRESHOLD)))
+
+
+@dataclass
+class QueryLog:
+    """Queries issued within one request (or one ``profile_queries`` block).
+
+    Sync endpoints and services fanning out to worker threads share the log
+    through the copied context, so updates go through ``record``.
+    """
+
+    count: int = 0
+    db_ms: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.db_ms += elapsed_ms
+            self.statements[statement] += 1
+
+    def repeated(self, threshold: int | None = None) -> dict[str, int]:
+        """Statements issued at least ``threshold`` times: the N+1 candidates."""
+        threshold = n_plus_one_threshold() if threshold is None else threshold
+        with self._lock:
+            common = self.statements.most_common()
+        return {statement: seen for statement, seen in common if seen >= threshold}
+
+
+_current: ContextVar[QueryLog | None] = ContextVar("sql_profiler_query_log", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("sql_profiler_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    log = _current.get()
+    if log is None:
+        return
+    started = conn.info.get("sql_profiler_started")
+    if not started:
+        return
+    # Parameters are bound separately, so a query issued per row in a loop has one text.
+    log.record(statement, (time.perf_counter() - started.pop()) * 1000)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    # after_cursor_execute never runs for a failed statement; drop its start time so
+    # it does not linger on the pooled connection and skew the next timing.
+    conn = exception_context.connection
+    if conn is None:
+        return
+    started = conn.info.get("sql_profiler_started")
+    if started:
+        started.pop()
+
+
+@contextmanager
+def profile_queries() -> Iterator[QueryLog]:
+    """Record the queries issued in this context, e.g. to assert a service's query budget."""
+    log = QueryLog()
+    token = _current.set(log)
+    try:
+        yield log
+    finally:
+        _current.reset(token)
+
+
+@dataclass
+class RouteQueryStats:
+    query_count: LatencyHistogram = field(default_factory=lambda: LatencyHistogram(QUERY_COUNT_BUCKETS))
+    db_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+    n_plus_one_requests: int = 0
+    # Latest count per flagged statement, so the worst offenders stay visible.
+    repeated_statements: dict[str, int] = field(default_factory=dict)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "requests": self.query_count.count,
+            "queries": self.query_count.snapshot(),
+            "db_time": self.db_time.snapshot(),
+            "n_plus_one_requests": self.n_plus_one_requests,
+            "repeated_statements": [
+                {"statement": statement, "count": seen}
+                for statement, seen in sorted(self.repeated_statements.items(), key=lambda item: -item[1])
+            ],
+        }
+
+
+# Per-process, keyed by "METHOD /route/{template}".
+ROUTE_STATS: dict[str, RouteQueryStats] = {}
+_ROUTE_STATS_LOCK = threading.Lock()
+
+
+def record_request(route: str, log: QueryLog) -> None:
+    repeated = log.repeated()
+    with _ROUTE_STATS_LOCK:
+        stats = ROUTE_STATS.get(route)
+        if stats is None:
+            stats = ROUTE_STATS[route] = RouteQueryStats()
+        if repeated:
+            stats.n_plus_one_requests += 1
+            for statement, seen in repeated.items():
+                stats.repeated_statements[_preview(statement)] = seen
+    stats.query_count.observe(log.count)
+    stats.db_time.observe(log.db_ms)
+    metrics.SQL_ROUTE_QUERIES.labels(route).observe(log.count)
+    metrics.SQL_ROUTE_DB_SECONDS.labels(route).observe(log.db_ms / 1000)
+    if repeated:
+        metrics.SQL_ROUTE_N_PLUS_ONE.labels(route).inc()
+    for statement, seen in repeated.items():
+        logger.warning(
+            "sql_profiler.n_plus_one",
+            extra={"route": route, "count": seen, "statement": _preview(statement)},
+        )
+
+
+def route_query_stats() -> dict[str, Any]:
+    with _ROUTE_STATS_LOCK:
+        routes = dict(ROUTE_STATS)
+    snapshots = {route: stats.snapshot() for route, stats in routes.items()}
+    return {
+        "n_plus_one_threshold": n_plus_one_threshold(),
+        "routes": dict(sorted(snapshots.items(), key=lambda item: -item[1]["db_time"]["sum_ms"])),
+    }
+
+
+def reset_route_query_stats() -> None:
+    with _ROUTE_STATS_LOCK:
+        ROUTE_STATS.clear()
+
+
+class SQLProfilerMiddleware:
+    """Counts queries and DB time per HTTP request and records them per route.
+
+    With ``SQL_PROFILING_HEADERS`` on, the count is returned in ``X-DB-Query-Count``
+    and DB time in ``Server-Timing``, which is what tests read to hold endpoints to
+    a query budget.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not profiling_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        log = QueryLog()
+        token = _current.set(log)
+        with_headers = profiling_headers_enabled()
+
+        async def send_with_counts(message):
+            if with_headers and message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((QUERY_COUNT_HEADER.lower().encode(), str(log.count).encode()))
+                headers.append((b"server-timing", f"db;dur={log.db_ms:.1f}".encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_counts)
+        finally:
+            _current.reset(token)
+            route = scope.get("route")
+            if route is not None:
+                record_request(f"{scope['method']} {route.path}", log)
+
+
+def _flag(name: str, *, default: bool) -> bool:
+    return os.getenv(name, str(default)).strip().lower() not in ("0", "false", "no", "")
+
+
+def _preview(statement: str) -> str:
+    return " ".join(statement.split())[:STATEMENT_PREVIEW_CHARS]
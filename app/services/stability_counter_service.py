@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+
+COUNTER_FIELDS = (
+    "paid_on_time_count",
+    "paid_late_count",
+    "missed_count",
+    "contribution_credit_count",
+)
+
+# Paid dates are compared in UTC, matching how payment handlers stamp paid_at.
+COUNTERS_SELECT_SQL = """
+SELECT
+    m.id AS membership_id,
+    ic.paid_on_time_count,
+    ic.paid_late_count,
+    ic.missed_count,
+    (SELECT count(*) FROM contribution_credits cc WHERE cc.membership_id = m.id) AS contribution_credit_count,
+    (SELECT count(*) FROM documents d WHERE d.uploaded_by = m.user_id) AS document_upload_count,
+    now() AS updated_at
+FROM memberships m
+CROSS JOIN LATERAL (
+    SELECT
+        COUNT(*) FILTER (
+            WHERE mi.status = 'paid_cash'
+              AND mi.paid_at IS NOT NULL
+              AND (mi.paid_at AT TIME ZONE 'UTC')::date <= mi.due_date
+        ) AS paid_on_time_count,
+        COUNT(*) FILTER (
+            WHERE mi.status = 'paid_cash'
+              AND mi.paid_at IS NOT NULL
+              AND (mi.paid_at AT TIME ZONE 'UTC')::date > mi.due_date
+        ) AS paid_late_count,
+        COUNT(*) FILTER (WHERE mi.status = 'missed') AS missed_count
+    FROM membership_installments mi
+    WHERE mi.membership_id = m.id
+) ic
+"""
+
+UPSERT_SQL = """
+INSERT INTO membership_stability_counters (
+    membership_id,
+    paid_on_time_count,
+    paid_late_count,
+    missed_count,
+    contribution_credit_count,
+    document_upload_count,
+    updated_at
+)
+{select_sql}
+{where_sql}
+ON CONFLICT (membership_id) DO UPDATE SET
+    paid_on_time_count = EXCLUDED.paid_on_time_count,
+    paid_late_count = EXCLUDED.paid_late_count,
+    missed_count = EXCLUDED.missed_count,
+    contribution_credit_count = EXCLUDED.contribution_credit_count,
+    document_upload_count = EXCLUDED.document_upload_count,
+    updated_at = EXCLUDED.updated_at
+"""
+
+TARGETED_WHERE_SQL = """
+WHERE m.id = ANY(CAST(:membership_ids AS uuid[]))
+   OR m.user_id = ANY(CAST(:user_ids AS uuid[]))
+"""
+
+PROGRAM_WHERE_SQL = """
+WHERE CAST(:program_key AS text) IS NULL OR m.program_key = :program_key
+"""
+
+APPLY_MEMBERSHIP_DELTAS_SQL = """
+UPDATE membership_stability_counters c SET
+    paid_on_time_count = c.paid_on_time_count + d.paid_on_time_count,
+    paid_late_count = c.paid_late_count + d.paid_late_count,
+    missed_count = c.missed_count + d.missed_count,
+    contribution_credit_count = c.contribution_credit_count + d.contribution_credit_count,
+    updated_at = now()
+FROM unnest(
+    CAST(:membership_ids AS uuid[]),
+    CAST(:paid_on_time_count AS integer[]),
+    CAST(:paid_late_count AS integer[]),
+    CAST(:missed_count AS integer[]),
+    CAST(:contribution_credit_count AS integer[])
+) AS d(membership_id, paid_on_time_count, paid_late_count, missed_count, contribution_credit_count)
+WHERE c.membership_id = d.membership_id
+RETURNING c.membership_id
+"""
+
+APPLY_DOCUMENT_DELTAS_SQL = """
+UPDATE membership_stability_counters c SET
+    document_upload_count = c.document_upload_count + d.delta,
+    updated_at = now()
+FROM unnest(CAST(:user_ids AS uuid[]), CAST(:deltas AS integer[])) AS d(user_id, delta)
+JOIN memberships m ON m.user_id = d.user_id
+WHERE c.membership_id = m.id
+  AND NOT (m.id = ANY(CAST(:skip_membership_ids AS uuid[])))
+"""
+
+
+def installment_bucket(status, paid_at: datetime | None, due_date: date | None) -> str | None:
+    """Return the counter an installment in this state contributes to, if any."""
+    value = getattr(status, "value", status)
+    if value == "missed":
+        return "missed_count"
+    if value != "paid_cash" or paid_at is None or due_date is None:
+        return None
+    if paid_at.tzinfo is not None:
+        paid_at = paid_at.astimezone(timezone.utc)
+    return "paid_on_time_count" if paid_at.date() <= due_date else "paid_late_count"
+
+
+def refresh_stability_counters(
+    bind: Session | Connection,
+    *,
+    membership_ids: Iterable[UUID] = (),
+    user_ids: Iterable[UUID] = (),
+) -> None:
+    """Recount counters from source rows for specific memberships or members."""
+    params = {
+        "membership_ids": sorted({str(v) for v in membership_ids if v}),
+        "user_ids": sorted({str(v) for v in user_ids if v}),
+    }
+    if not any(params.values()):
+        return
+    bind.execute(text(UPSERT_SQL.format(select_sql=COUNTERS_SELECT_SQL, where_sql=TARGETED_WHERE_SQL)), params)
+
+
+def rebuild_stability_counters(db: Session, *, program_key: str | None = None) -> int:
+    """Recount every membership (optionally one program) set-wise, e.g. after a backfill."""
+    result = db.execute(
+        text(UPSERT_SQL.format(select_sql=COUNTERS_SELECT_SQL, where_sql=PROGRAM_WHERE_SQL)),
+        {"program_key": program_key},
+    )
+    return int(result.rowcount or 0)
+
+
+def apply_stability_counter_deltas(
+    bind: Session | Connection,
+    *,
+    membership_deltas: Mapping[UUID, Mapping[str, int]],
+    document_deltas: Mapping[UUID, int],
+    skip_membership_ids: Iterable[UUID] = (),
+) -> None:
+    """Add per-membership and per-member deltas to the running counters.
+
+    Memberships without a counters row yet are recounted from source instead,
+    so a delta never lands on a missing baseline.
+    """
+    skip = {str(v) for v in skip_membership_ids if v}
+    deltas = {
+        str(membership_id): counts
+        for membership_id, counts in membership_deltas.items()
+        if membership_id and str(membership_id) not in skip and any(counts.values())
+    }
+
+    if deltas:
+        ids = sorted(deltas)
+        params = {"membership_ids": ids}
+        for field in COUNTER_FIELDS:
+            params[field] = [int(deltas[membership_id].get(field, 0)) for membership_id in ids]
+        updated = {str(row[0]) for row in bind.execute(text(APPLY_MEMBERSHIP_DELTAS_SQL), params)}
+        missing = set(ids) - updated
+        if missing:
+            refresh_stability_counters(bind, membership_ids=missing)
+            skip |= missing
+
+    documents = {str(user_id): int(delta) for user_id, delta in document_deltas.items() if user_id and delta}
+    if documents:
+        user_ids = sorted(documents)
+        bind.execute(
+            text(APPLY_DOCUMENT_DELTAS_SQL),
+            {
+                "user_ids": user_ids,
+                "deltas": [documents[user_id] for user_id in user_ids],
+                "skip_membership_ids": sorted(skip),
+            },
+        )
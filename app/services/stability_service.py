@@ -1,20 +1,91 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from uuid import UUID
 
 from fastapi import HTTPException
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from app.models.documents import Document
 from app.models.member_layer import (
-    ContributionCredit,
-    InstallmentStatus,
     Membership,
-    MembershipInstallment,
+    MembershipActivity,
+    MembershipStabilityCounters,
     MembershipStatus,
     StabilityAssessment,
 )
 from app.models.users import User
+from app.services.membership_activity_service import refresh_membership_activity
+from app.services.stability_counter_service import rebuild_stability_counters, refresh_stability_counters
+
+
+STABILITY_BASELINE = 70
+GOOD_STANDING_THRESHOLD = 65
+
+# Points per counted event; the score is baseline + sum(count * weight), clamped to 0..100.
+STABILITY_WEIGHTS = {
+    "paid_on_time_count": 5,
+    "paid_late_count": 2,
+    "missed_count": -10,
+    "contribution_credit_count": 3,
+    "document_upload_count": 2,
+}
+
+# Rescore every active membership (optionally one program) from its counters in
+# one statement: append an assessment per member and reset good_standing.
+BULK_RECALCULATE_SQL = """
+WITH scored AS (
+    SELECT
+        m.id AS membership_id,
+        m.user_id,
+        m.program_key,
+        COALESCE(ma.latest_stability_score, :baseline) AS previous_score,
+        c.paid_on_time_count,
+        c.paid_late_count,
+        c.missed_count,
+        c.contribution_credit_count,
+        c.document_upload_count,
+        GREATEST(0, LEAST(100,
+            :baseline
+            + c.paid_on_time_count * :paid_on_time_weight
+            + c.paid_late_count * :paid_late_weight
+            + c.missed_count * :missed_weight
+            + c.contribution_credit_count * :contribution_credit_weight
+            + c.document_upload_count * :document_upload_weight
+        )) AS new_score
+    FROM memberships m
+    JOIN membership_stability_counters c ON c.membership_id = m.id
+    LEFT JOIN membership_activity ma ON ma.membership_id = m.id
+    WHERE m.status = 'active'
+      AND (CAST(:program_key AS text) IS NULL OR m.program_key = :program_key)
+), inserted AS (
+    INSERT INTO stability_assessments (id, user_id, program_key, stability_score, breakdown_json, created_at)
+    SELECT
+        gen_random_uuid(),
+        s.user_id,
+        s.program_key,
+        s.new_score,
+        jsonb_build_object(
+            'source', :source,
+            'previous_score', s.previous_score,
+            'baseline', :baseline,
+            'paid_on_time_count', s.paid_on_time_count,
+            'paid_late_count', s.paid_late_count,
+            'missed_count', s.missed_count,
+            'contribution_credit_count', s.contribution_credit_count,
+            'document_upload_count', s.document_upload_count,
+            'new_score', s.new_score
+        ),
+        now()
+    FROM scored s
+), standing AS (
+    UPDATE memberships m
+    SET good_standing = s.new_score >= :threshold
+    FROM scored s
+    WHERE m.id = s.membership_id
+)
+SELECT membership_id FROM scored
+"""
 
 
 def create_baseline_stability(db: Session, user: User, program_key: str) -> StabilityAssessment:
@@ -39,7 +110,15 @@ def create_baseline_stability(db: Session, user: User, program_key: str) -> Stab
     return assessment
 
 
+def stability_score(counters: Mapping[str, int]) -> int:
+    score = STABILITY_BASELINE + sum(
+        int(counters.get(field) or 0) * weight for field, weight in STABILITY_WEIGHTS.items()
+    )
+    return max(0, min(100, score))
+
+
 def recalculate_stability(db: Session, user_id: UUID, program_key: str) -> StabilityAssessment:
+    """Score a member from the running counters instead of re-reading their history."""
     membership = (
         db.query(Membership)
         .filter(
@@ -52,54 +131,22 @@ def recalculate_stability(db: Session, user_id: UUID, program_key: str) -> Stabi
     if not membership:
         raise HTTPException(status_code=404, detail="Active membership not found")
 
-    installments = (
-        db.query(MembershipInstallment)
-        .filter(MembershipInstallment.membership_id == membership.id)
-        .all()
-    )
+    # Sessions do not autoflush; flushing applies pending installment transitions
+    # to the counters before they are read.
+    db.flush()
+    counters = _load_counters(db, membership.id)
+    if counters is None:
+        refresh_stability_counters(db, membership_ids=[membership.id])
+        counters = _load_counters(db, membership.id)
 
-    latest = (
-        db.query(StabilityAssessment)
-        .filter(
-            StabilityAssessment.user_id == user_id,
-            StabilityAssessment.program_key == program_key,
-        )
-        .order_by(StabilityAssessment.created_at.desc())
-        .first()
-    )
+    counts = {field: getattr(counters, field) for field in STABILITY_WEIGHTS}
+    new_score = stability_score(counts)
 
-    baseline = 70
-    paid_on_time_count = sum(
-        1
-        for installment in installments
-        if installment.status == InstallmentStatus.paid_cash
-        and installment.paid_at is not None
-        and installment.paid_at.date() <= installment.due_date
-    )
-    paid_late_count = sum(
-        1
-        for installment in installments
-        if installment.status == InstallmentStatus.paid_cash
-        and installment.paid_at is not None
-        and installment.paid_at.date() > installment.due_date
+    previous_score = (
+        db.query(MembershipActivity.latest_stability_score)
+        .filter(MembershipActivity.membership_id == membership.id)
+        .scalar()
     )
-    missed_count = sum(1 for installment in installments if installment.status == InstallmentStatus.missed)
-
-    contribution_credit_count = (
-        db.query(ContributionCredit)
-        .filter(ContributionCredit.membership_id == membership.id)
-        .count()
-    )
-    document_upload_count = db.query(Document).filter(Document.uploaded_by == user_id).count()
-    new_score = (
-        baseline
-        + (paid_on_time_count * 5)
-        + (paid_late_count * 2)
-        - (missed_count * 10)
-        + (contribution_credit_count * 3)
-        + (document_upload_count * 2)
-    )
-    new_score = max(0, min(100, new_score))
 
     assessment = StabilityAssessment(
         user_id=user_id,
@@ -111,17 +158,57 @@ def recalculate_stability(db: Session, user_id: UUID, program_key: str) -> Stabi
         risk_level=None,
         breakdown_json={
             "source": "phase5_recalculation",
-            "previous_score": latest.stability_score if latest else baseline,
-            "baseline": baseline,
-            "paid_on_time_count": paid_on_time_count,
-            "paid_late_count": paid_late_count,
-            "missed_count": missed_count,
-            "contribution_credit_count": contribution_credit_count,
-            "document_upload_count": document_upload_count,
+            "previous_score": previous_score if previous_score is not None else STABILITY_BASELINE,
+            "baseline": STABILITY_BASELINE,
+            **counts,
             "new_score": new_score,
         },
     )
     db.add(assessment)
 
-    membership.good_standing = new_score >= 65
+    membership.good_standing = new_score >= GOOD_STANDING_THRESHOLD
     return assessment
+
+
+def bulk_recalculate_stability(
+    db: Session,
+    *,
+    program_key: str | None = None,
+    recount: bool = True,
+) -> int:
+    """Rescore all active memberships set-wise, e.g. after a backfill or weight change.
+
+    With ``recount`` the counters are rebuilt from source rows first, so writes that
+    bypassed the ORM (bulk imports, manual SQL) are picked up too.
+    """
+    if recount:
+        rebuild_stability_counters(db, program_key=program_key)
+
+    membership_ids = db.execute(
+        text(BULK_RECALCULATE_SQL),
+        {
+            "program_key": program_key,
+            "baseline": STABILITY_BASELINE,
+            "threshold": GOOD_STANDING_THRESHOLD,
+            "source": "bulk_recalculation",
+            "paid_on_time_weight": STABILITY_WEIGHTS["paid_on_time_count"],
+            "paid_late_weight": STABILITY_WEIGHTS["paid_late_count"],
+            "missed_weight": STABILITY_WEIGHTS["missed_count"],
+            "contribution_credit_weight": STABILITY_WEIGHTS["contribution_credit_count"],
+            "document_upload_weight": STABILITY_WEIGHTS["document_upload_count"],
+        },
+    ).scalars().all()
+
+    # Raw SQL writes bypass the ORM listeners, so refresh the summary explicitly.
+    refresh_membership_activity(db, membership_ids=membership_ids)
+    return len(membership_ids)
+
+
+def _load_counters(db: Session, membership_id: UUID) -> MembershipStabilityCounters | None:
+    # The counters are updated by SQL in after_flush, so bypass the identity map.
+    return (
+        db.query(MembershipStabilityCounters)
+        .populate_existing()
+        .filter(MembershipStabilityCounters.membership_id == membership_id)
+        .first()
+    )
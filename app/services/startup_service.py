@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
+
+from db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETRY_SECONDS = 5.0
+
+
+def _bootstrap_steps(app: FastAPI, db) -> None:
+    # Imported here so their service graphs load on the bootstrap thread, not at app import.
+    from app.services.auth_service import ensure_admin_user
+    from app.services.module_loader_service import load_modules_on_startup
+    from app.services.platform_knowledge_service import knowledge_snapshot
+
+    ensure_admin_user(db)
+    load_modules_on_startup()
+    knowledge_snapshot(db)
+
+
+class StartupBootstrap:
+    """Runs the DB-backed startup work on a background thread and reports its progress.
+
+    The server accepts requests while this runs; ``/health/ready`` stays 503 until
+    it has succeeded, so load balancers only route to a pod once it is bootstrapped.
+    A database that is not reachable yet is retried every ``STARTUP_RETRY_SECONDS``;
+    any other error fails the bootstrap and the pod never reports ready.
+    """
+
+    def __init__(self, app: FastAPI):
+        self.app = app
+        self.status = "pending"
+        self.attempts = 0
+        self.last_error: str | None = None
+        self.duration_ms: float | None = None
+        self._done = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self.status == "ready"
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="startup-bootstrap", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the bootstrap succeeded or failed; returns whether it finished."""
+        return self._done.wait(timeout)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "attempts": self.attempts,
+            "last_error": self.last_error,
+            "duration_ms": self.duration_ms,
+        }
+
+    def _run(self) -> None:
+        retry_seconds = float(os.getenv("STARTUP_RETRY_SECONDS", str(DEFAULT_RETRY_SECONDS)))
+        started = time.perf_counter()
+        self.status = "running"
+        while not self._stopped.is_set():
+            self.attempts += 1
+            db = SessionLocal()
+            try:
+                _bootstrap_steps(self.app, db)
+            except SQLAlchemyError as exc:
+                self.last_error = str(exc).splitlines()[0]
+                logger.warning(
+                    "Database unavailable during startup bootstrap; retrying in %ss: %s",
+                    retry_seconds,
+                    self.last_error,
+                )
+                self._stopped.wait(retry_seconds)
+                continue
+            except Exception as exc:
+                self.last_error = str(exc)
+                self.status = "failed"
+                logger.exception("Startup bootstrap failed")
+                break
+            finally:
+                db.close()
+            self.status = "ready"
+            self.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+            logger.info("startup.bootstrap.ready", extra=self.snapshot())
+            break
+        self._done.set()
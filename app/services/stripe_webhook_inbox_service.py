@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.stripe_webhook_events import StripeWebhookEvent
+from app.services.payment_service import handle_successful_payment
+
+logger = logging.getLogger(__name__)
+
+INBOX_EVENT_TYPES = {"invoice.payment_succeeded"}
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_WORKERS = 4
+PROCESSING_TIMEOUT = timedelta(minutes=5)
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 3600
+
+# Claim the oldest pending event of each customer whose earlier events are all done.
+# Heads are chosen before the availability filter, so a customer's backed-off event
+# blocks its later events instead of being overtaken. The status re-check in the
+# UPDATE keeps two drainers from claiming the same row. ``customer_ids`` (NULL for
+# all) limits a drain to some customers, e.g. to replay one customer's backlog.
+CLAIM_SQL = """
+WITH heads AS (
+    SELECT DISTINCT ON (e.stripe_customer_id) e.id, e.available_at, e.received_at
+    FROM stripe_webhook_events e
+    WHERE e.status = 'pending'
+      AND (CAST(:customer_ids AS text[]) IS NULL OR e.stripe_customer_id = ANY(CAST(:customer_ids AS text[])))
+    ORDER BY e.stripe_customer_id, e.stripe_created_at NULLS LAST, e.received_at, e.id
+), claimable AS (
+    SELECT e.id
+    FROM stripe_webhook_events e
+    JOIN heads h ON h.id = e.id
+    WHERE h.available_at <= now()
+      AND NOT EXISTS (
+          SELECT 1
+          FROM stripe_webhook_events p
+          WHERE p.stripe_customer_id = e.stripe_customer_id
+            AND p.status = 'processing'
+      )
+    ORDER BY h.received_at
+    LIMIT :batch_size
+    FOR UPDATE OF e SKIP LOCKED
+)
+UPDATE stripe_webhook_events e
+SET status = 'processing', locked_at = now(), attempts = e.attempts + 1
+FROM claimable c
+WHERE e.id = c.id AND e.status = 'pending'
+RETURNING e.id
+"""
+
+# A claim that timed out used up its attempt; an event that keeps killing its worker
+# fails once it is out of attempts instead of being released forever.
+RELEASE_STALE_SQL = """
+UPDATE stripe_webhook_events
+SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END,
+    last_error = CASE
+        WHEN attempts >= max_attempts THEN 'Processing timed out after ' || attempts || ' attempts'
+        ELSE last_error
+    END,
+    locked_at = NULL
+WHERE status = 'processing' AND locked_at < now() - CAST(:timeout AS interval)
+  AND (CAST(:customer_ids AS text[]) IS NULL OR stripe_customer_id = ANY(CAST(:customer_ids AS text[])))
+RETURNING status
+"""
+
+METRICS_SQL = """
+SELECT
+    count(*) FILTER (WHERE status = 'pending') AS pending,
+    count(*) FILTER (WHERE status = 'processing') AS processing,
+    count(*) FILTER (WHERE status = 'failed') AS failed,
+    EXTRACT(EPOCH FROM now() - min(received_at) FILTER (WHERE status IN ('pending', 'processing')))
+        AS oldest_pending_age_seconds,
+    count(*) FILTER (WHERE processed_at >= now() - CAST(:window AS interval)) AS processed_in_window,
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY EXTRACT(EPOCH FROM processed_at - received_at))
+        FILTER (WHERE processed_at >= now() - CAST(:window AS interval)) AS p50_lag_seconds,
+    percentile_cont(0.95) WITHIN GROUP (ORDER BY EXTRACT(EPOCH FROM processed_at - received_at))
+        FILTER (WHERE processed_at >= now() - CAST(:window AS interval)) AS p95_lag_seconds
+FROM stripe_webhook_events
+WHERE status IN ('pending', 'processing', 'failed')
+   OR processed_at >= now() - CAST(:window AS interval)
+"""
+
+
+def enqueue_stripe_event(db: Session, event: dict[str, Any]) -> bool:
+    """Persist a verified event; returns False if the event id is already in the inbox."""
+    event_type = str(event.get("type"))
+    obj = event.get("data", {}).get("object", {})
+    # Stripe always sends an event id; fall back to the invoice for hand-built payloads.
+    stripe_event_id = event.get("id") or f"{event_type}:{obj.get('id')}"
+    created = event.get("created")
+
+    statement = (
+        pg_insert(StripeWebhookEvent)
+        .values(
+            id=uuid4(),
+            stripe_event_id=str(stripe_event_id),
+            event_type=event_type,
+            stripe_customer_id=str(obj.get("customer")),
+            stripe_created_at=datetime.fromtimestamp(int(created), tz=timezone.utc) if created else None,
+            payload=event,
+            status="pending",
+            attempts=0,
+            max_attempts=5,
+        )
+        .on_conflict_do_nothing(index_elements=[StripeWebhookEvent.stripe_event_id])
+        .returning(StripeWebhookEvent.id)
+    )
+    return db.execute(statement).first() is not None
+
+
+def claim_stripe_events(
+    db: Session,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    customer_ids: Sequence[str] | None = None,
+) -> list[UUID]:
+    """Mark up to ``batch_size`` events as processing, at most one per customer."""
+    params = {"batch_size": batch_size, "customer_ids": _customer_filter(customer_ids)}
+    return list(db.execute(text(CLAIM_SQL), params).scalars())
+
+
+def release_stale_stripe_events(
+    db: Session,
+    *,
+    timeout: timedelta = PROCESSING_TIMEOUT,
+    customer_ids: Sequence[str] | None = None,
+) -> dict[str, int]:
+    """Return events left in processing by a crashed worker to the queue.
+
+    Events that have used all their attempts are marked failed instead.
+    """
+    params = {"timeout": f"{int(timeout.total_seconds())} seconds", "customer_ids": _customer_filter(customer_ids)}
+    statuses = list(db.execute(text(RELEASE_STALE_SQL), params).scalars())
+    timed_out = statuses.count("failed")
+    if timed_out:
+        logger.warning("stripe_inbox.stale_events_failed", extra={"count": timed_out})
+    return {"released": statuses.count("pending"), "timed_out": timed_out}
+
+
+def process_stripe_event(session_factory: Callable[[], Session], event_id: UUID) -> str:
+    """Apply one claimed event in its own transaction; returns the outcome bucket."""
+    db = session_factory()
+    try:
+        event = db.get(StripeWebhookEvent, event_id)
+        if event is None or event.status != "processing":
+            return "skipped"
+
+        # Marked before the handler runs so the handler's commit settles both.
+        event.status = "processed"
+        event.processed_at = datetime.now(timezone.utc)
+        event.locked_at = None
+        event.last_error = None
+        _dispatch(db, event)
+        db.commit()
+        return "processed"
+    except Exception as exc:
+        db.rollback()
+        return _record_failure(db, event_id, exc)
+    finally:
+        db.close()
+
+
+def drain_stripe_webhook_inbox(
+    session_factory: Callable[[], Session],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_batches: int | None = None,
+    customer_ids: Sequence[str] | None = None,
+) -> dict[str, Any]:
+    """Claim and process inbox batches on a thread pool until the inbox is empty.
+
+    Each batch holds at most one event per customer, so events for different
+    customers run in parallel while a customer's own events stay in order.
+    ``customer_ids`` restricts the drain to those customers' events.
+    """
+    started = time.perf_counter()
+    summary: dict[str, Any] = {"batches": 0, "claimed": 0, "processed": 0, "retrying": 0, "failed": 0, "skipped": 0}
+    coordinator = session_factory()
+    try:
+        summary.update(release_stale_stripe_events(coordinator, customer_ids=customer_ids))
+        coordinator.commit()
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stripe-inbox") as pool:
+            while max_batches is None or summary["batches"] < max_batches:
+                event_ids = claim_stripe_events(coordinator, batch_size=batch_size, customer_ids=customer_ids)
+                coordinator.commit()
+                if not event_ids:
+                    break
+                summary["batches"] += 1
+                summary["claimed"] += len(event_ids)
+                for outcome in pool.map(lambda event_id: process_stripe_event(session_factory, event_id), event_ids):
+                    summary[outcome] += 1
+    finally:
+        coordinator.close()
+
+    elapsed = time.perf_counter() - started
+    summary["elapsed_seconds"] = round(elapsed, 3)
+    summary["events_per_second"] = round(summary["processed"] / elapsed, 2) if elapsed > 0 else 0.0
+    logger.info("stripe_inbox.drained", extra=summary)
+    return summary
+
+
+def stripe_inbox_metrics(db: Session, *, window_minutes: int = 5) -> dict[str, Any]:
+    """Inbox depth, lag and recent processing rate."""
+    row = db.execute(text(METRICS_SQL), {"window": f"{int(window_minutes)} minutes"}).mappings().one()
+    processed = int(row["processed_in_window"] or 0)
+    return {
+        "pending": int(row["pending"] or 0),
+        "processing": int(row["processing"] or 0),
+        "failed": int(row["failed"] or 0),
+        "oldest_pending_age_seconds": _rounded(row["oldest_pending_age_seconds"]),
+        "window_minutes": window_minutes,
+        "processed_in_window": processed,
+        "processed_per_second": round(processed / (window_minutes * 60), 3),
+        "p50_lag_seconds": _rounded(row["p50_lag_seconds"]),
+        "p95_lag_seconds": _rounded(row["p95_lag_seconds"]),
+    }
+
+
+def _dispatch(db: Session, event: StripeWebhookEvent) -> None:
+    obj = event.payload.get("data", {}).get("object", {})
+    if event.event_type == "invoice.payment_succeeded":
+        handle_successful_payment(
+            db=db,
+            stripe_invoice_id=str(obj["id"]),
+            stripe_customer_id=str(obj["customer"]),
+            amount_paid_cents=int(obj["amount_paid"]),
+        )
+
+
+def _record_failure(db: Session, event_id: UUID, exc: Exception) -> str:
+    event = db.get(StripeWebhookEvent, event_id)
+    if event is None:
+        return "failed"
+
+    if event.attempts >= event.max_attempts:
+        event.status = "failed"
+    else:
+        event.status = "pending"
+        backoff = min(RETRY_BASE_SECONDS * 2 ** max(event.attempts - 1, 0), RETRY_MAX_SECONDS)
+        event.available_at = datetime.now(timezone.utc) + timedelta(seconds=backoff)
+    event.locked_at = None
+    event.last_error = f"{type(exc).__name__}: {exc}"
+    db.commit()
+
+    logger.warning(
+        "stripe_inbox.event_failed",
+        extra={"stripe_event_id": event.stripe_event_id, "attempts": event.attempts, "status": event.status},
+    )
+    return "failed" if event.status == "failed" else "retrying"
+
+
+def _customer_filter(customer_ids: Sequence[str] | None) -> list[str] | None:
+    return None if customer_ids is None else [str(customer_id) for customer_id in customer_ids]
+
+
+def _rounded(value) -> float | None:
+    return round(float(value), 3) if value is not None else None
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from typing import Any
+from uuid import uuid4
 
+from sqlalchemy import and_, func, insert
 from sqlalchemy.orm import Session
 
 from app.models.audit_logs import AuditLog
@@ -21,6 +23,8 @@ from app.models.workflow import (
     WorkflowStepStatus,
     WorkflowTemplate,
 )
+from app.services import metrics
+from app.services.case_detail_service import mark_case_details_stale
 
 FORECLOSURE_PROGRAM_KEY = "foreclosure_stabilization_v1"
 MAX_OVERRIDES_PER_CASE = 3
@@ -159,13 +163,17 @@ DEFAULT_FORECLOSURE_STEPS: list[dict[str, Any]] = [
 ]
 
 
-def ensure_default_template(db: Session) -> WorkflowTemplate:
-    template = (
+def _default_template(db: Session) -> WorkflowTemplate | None:
+    return (
         db.query(WorkflowTemplate)
         .filter(WorkflowTemplate.program_key == FORECLOSURE_PROGRAM_KEY)
         .order_by(WorkflowTemplate.template_version.desc(), WorkflowTemplate.created_at.desc())
         .first()
     )
+
+
+def ensure_default_template(db: Session) -> WorkflowTemplate:
+    template = _default_template(db)
     if template:
         return template
 
@@ -317,6 +325,7 @@ def _sla_breached(progress: CaseWorkflowProgress, step: WorkflowStep, now: datet
     return (now - progress.started_at).days > (step.sla_days or 0)
 
 
+@metrics.WORKFLOW_SYNC_SECONDS.time()
 def sync_case_workflow(db: Session, case_id) -> CaseWorkflowInstance | None:
     instance = (
         db.query(CaseWorkflowInstance)
@@ -350,6 +359,7 @@ def sync_case_workflow(db: Session, case_id) -> CaseWorkflowInstance | None:
             progress.status = WorkflowStepStatus.complete
             progress.block_reason = None
             progress.completed_at = progress.completed_at or now
+            metrics.WORKFLOW_STEPS_ADVANCED.labels(step.step_key).inc()
 
             next_step = steps[i + 1] if i + 1 < len(steps) else None
             if next_step:
@@ -572,8 +582,9 @@ def apply_workflow_override(
 
 
 def get_workflow_analytics(db: Session, default_sla_days: int = 30) -> dict[str, Any]:
-    template = ensure_default_template(db)
-    step_map = {s.step_key: s for s in _ordered_steps(db, template.id)}
+    # Read-only so it can run on a replica: without a template there are no instances either.
+    template = _default_template(db)
+    step_map = {s.step_key: s for s in _ordered_steps(db, template.id)} if template else {}
 
     instances = db.query(CaseWorkflowInstance).all()
     now = datetime.now(timezone.utc)
@@ -648,6 +659,72 @@ def get_workflow_analytics(db: Session, default_sla_days: int = 30) -> dict[str,
             "override_by_actor": override_by_actor,
             "override_by_category": override_by_category,
             "override_by_case": override_by_case,
-            "sla_days": sla_days,
         },
     }
+
+
+def sweep_workflow_sla_breaches(db: Session, *, now: datetime | None = None) -> dict[str, Any]:
+    """Audit every open step past its SLA once; the caller commits.
+
+    Breaches are found in one query (same rule as ``_sla_breached``) and only
+    steps without an earlier ``workflow_sla_breached`` entry are recorded.
+    """
+    now = now or datetime.now(timezone.utc)
+    breaches = (
+        db.query(
+            CaseWorkflowInstance.case_id,
+            CaseWorkflowProgress.step_key,
+            CaseWorkflowProgress.status,
+            CaseWorkflowProgress.started_at,
+            WorkflowStep.sla_days,
+        )
+        .join(CaseWorkflowInstance, CaseWorkflowInstance.id == CaseWorkflowProgress.instance_id)
+        .join(
+            WorkflowStep,
+            and_(
+                WorkflowStep.template_id == CaseWorkflowInstance.template_id,
+                WorkflowStep.step_key == CaseWorkflowProgress.step_key,
+            ),
+        )
+        .filter(
+            CaseWorkflowProgress.status.in_([WorkflowStepStatus.active, WorkflowStepStatus.blocked]),
+            CaseWorkflowProgress.started_at.isnot(None),
+            # (now - started_at).days > sla_days
+            CaseWorkflowProgress.started_at <= now - func.make_interval(0, 0, 0, WorkflowStep.sla_days + 1),
+        )
+        .all()
+    )
+    if not breaches:
+        return {"breaches": 0, "breaches_flagged": 0}
+
+    flagged = set(
+        db.query(AuditLog.case_id, AuditLog.reason_code).filter(
+            AuditLog.action_type == "workflow_sla_breached",
+            AuditLog.case_id.in_({row.case_id for row in breaches}),
+        )
+    )
+    rows = [
+        {
+            "id": uuid4(),
+            "case_id": row.case_id,
+            "actor_id": None,
+            "actor_is_ai": False,
+            "action_type": "workflow_sla_breached",
+            "reason_code": f"sla_breach:{row.step_key}",
+            "before_state": {},
+            "after_state": {
+                "step_key": row.step_key,
+                "status": row.status.value,
+                "sla_days": row.sla_days,
+                "days_open": (now - row.started_at).days,
+            },
+            "policy_version_id": None,
+        }
+        for row in breaches
+        if (row.case_id, f"sla_breach:{row.step_key}") not in flagged
+    ]
+    if rows:
+        db.execute(insert(AuditLog), rows)
+        mark_case_details_stale(db, (row["case_id"] for row in rows))
+
+    return {"breaches": len(breaches), "breaches_flagged": len(rows)}
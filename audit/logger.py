@@ -34,8 +34,8 @@ def log_audit(
         actor_is_ai=actor_is_ai,
         action_type=action_type,
         reason_code=reason_code,
-        before_json=before_json,
-        after_json=after_json,
+        before_state=before_json,
+        after_state=after_json,
         policy_version_id=policy_version_id,
         created_at=datetime.utcnow(),
     )
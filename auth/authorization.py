@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from audit.logger import log_audit
 from app.models.cases import Case
+from app.services import metrics
 from app.models.policy_versions import PolicyVersion
 from app.models.role_sessions import RoleSession
 from app.models.users import User
@@ -44,12 +45,19 @@ class PolicyAuthorizer:
         self.db.refresh(role_session)
         return role_session
 
-    def require_case_action(self, *, user: User, case_id: str, action: str) -> RoleSession:
-        case = self.db.query(Case).filter(Case.id == case_id).first()
-        if not case:
+    def require_case_action(
+        self, *, user: User, case_id: str, action: str, metric_action: str | None = None
+    ) -> RoleSession:
+        row = (
+            self.db.query(Case, PolicyVersion)
+            .outerjoin(PolicyVersion, PolicyVersion.id == Case.policy_version_id)
+            .filter(Case.id == case_id)
+            .first()
+        )
+        if not row:
             raise HTTPException(status_code=404, detail="Case not found")
 
-        policy = self.db.query(PolicyVersion).filter(PolicyVersion.id == case.policy_version_id).first()
+        case, policy = row
         if not policy:
             raise HTTPException(status_code=404, detail="Policy not found for case")
 
@@ -70,6 +78,7 @@ class PolicyAuthorizer:
                 actor_id=user.id,
                 policy_version_id=policy.id,
                 action=action,
+                metric_action=metric_action or action,
                 reason_code="no_active_role_session",
                 allowed=False,
             )
@@ -83,6 +92,7 @@ class PolicyAuthorizer:
                 actor_id=user.id,
                 policy_version_id=policy.id,
                 action=action,
+                metric_action=metric_action or action,
                 reason_code="action_not_allowed_by_policy",
                 allowed=False,
             )
@@ -94,6 +104,7 @@ class PolicyAuthorizer:
             actor_id=user.id,
             policy_version_id=policy.id,
             action=action,
+            metric_action=metric_action or action,
             reason_code="allowed_by_policy",
             allowed=True,
             role_session_id=str(active_session.id),
@@ -135,10 +146,14 @@ class PolicyAuthorizer:
         actor_id,
         policy_version_id,
         action: str,
+        metric_action: str,
         reason_code: str,
         allowed: bool,
         role_session_id: str | None = None,
     ):
+        # The audit row keeps the full action; the metric label must stay bounded, so
+        # callers building actions from request input pass a collapsed metric_action.
+        metrics.AUTHORIZATION_DECISIONS.labels(metric_action, "allow" if allowed else "deny", reason_code).inc()
         log_audit(
             db=self.db,
             case_id=case_id,
@@ -1,11 +1,14 @@
 from typing import List
+from uuid import UUID
 
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from auth.auth_handler import decode_access_token
-from db.session import get_db
+from db.session import get_async_db, get_db
 from app.models.users import User, UserRole
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
@@ -28,6 +31,29 @@ def get_current_user(
     return user
 
 
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    payload = decode_access_token(token)
+
+    if not payload or "sub" not in payload:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    try:
+        # asyncpg binds UUID columns strictly; a malformed subject is an invalid token.
+        user_id = UUID(str(payload["sub"]))
+    except ValueError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    user = (await db.execute(select(User).where(User.id == user_id))).scalar_one_or_none()
+
+    if not user:
+        raise HTTPException(status_code=401, detail="User not found")
+
+    return user
+
+
 def require_role(allowed_roles: List[UserRole]):
     def role_checker(user: User = Depends(get_current_user)):
         if user.role not in allowed_roles:
@@ -38,3 +64,15 @@ def require_role(allowed_roles: List[UserRole]):
         return user
 
     return role_checker
+
+
+def require_role_async(allowed_roles: List[UserRole]):
+    async def role_checker(user: User = Depends(get_current_user_async)):
+        if user.role not in allowed_roles:
+            raise HTTPException(
+                status_code=403,
+                detail="Insufficient permissions",
+            )
+        return user
+
+    return role_checker
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Any
+
+
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistogram:
+    """Thread-safe, fixed-bucket latency histogram kept in process memory."""
+
+    def __init__(self, buckets_ms: tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        self._counts = [0] * (len(self.buckets_ms) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def observe(self, elapsed_ms: float) -> None:
+        index = bisect.bisect_left(self.buckets_ms, elapsed_ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._total_ms += elapsed_ms
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the q-th observation; None when empty."""
+        with self._lock:
+            counts, total = list(self._counts), self._count
+        if total == 0:
+            return None
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if seen >= rank and count:
+                return self.buckets_ms[index] if index < len(self.buckets_ms) else float("inf")
+        return float("inf")
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            counts, total, total_ms = list(self._counts), self._count, self._total_ms
+        cumulative: dict[str, int] = {}
+        running = 0
+        for bound, count in zip((*self.buckets_ms, "+Inf"), counts):
+            running += count
+            cumulative[str(bound)] = running
+        return {
+            "count": total,
+            "sum_ms": round(total_ms, 3),
+            "mean_ms": round(total_ms / total, 3) if total else None,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "buckets": cumulative,
+        }
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from db.latency_stats import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Most checkouts return an idle connection in well under a millisecond; the
+# upper buckets only fill when the pool is exhausted and requests queue.
+CHECKOUT_WAIT_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 25, 50, 100, 250, 1000, 5000, 30000)
+
+# Recorded alongside PoolMetrics, which only describes this process; these reach
+# PROMETHEUS_MULTIPROC_DIR and so the scrape of every worker on the host.
+CHECKOUT_WAIT_SECONDS = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection, by pool.",
+    ["pool"],
+    buckets=tuple(bound / 1000 for bound in CHECKOUT_WAIT_BUCKETS_MS),
+)
+CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that timed out waiting for a connection, by pool.",
+    ["pool"],
+)
+
+# Per process type: web serves many short requests on a thread pool; a Celery
+# prefork child runs one task at a time, plus the task's own worker threads.
+POOL_PROFILES: dict[str, dict[str, int]] = {
+    "web": {"pool_size": 10, "max_overflow": 10, "pool_timeout": 10, "pool_recycle": 1800},
+    "celery": {"pool_size": 5, "max_overflow": 5, "pool_timeout": 30, "pool_recycle": 1800},
+}
+
+POOL_ENV_OVERRIDES = {
+    "pool_size": "DB_POOL_SIZE",
+    "max_overflow": "DB_MAX_OVERFLOW",
+    "pool_timeout": "DB_POOL_TIMEOUT_SECONDS",
+    "pool_recycle": "DB_POOL_RECYCLE_SECONDS",
+}
+
+
+def pool_settings(process_type: str) -> dict[str, int]:
+    """Pool arguments for ``create_engine``: the process type's profile, then env overrides."""
+    profile = POOL_PROFILES.get(process_type)
+    if profile is None:
+        logger.warning("db_pool.unknown_process_type", extra={"process_type": process_type})
+        profile = POOL_PROFILES["web"]
+    settings = dict(profile)
+    for key, env_name in POOL_ENV_OVERRIDES.items():
+        value = os.getenv(env_name)
+        if value:
+            settings[key] = int(value)
+    return settings
+
+
+class PoolMetrics:
+    """Checkout wait times and timeouts for one engine's pool."""
+
+    def __init__(self) -> None:
+        self.checkout_wait = LatencyHistogram(CHECKOUT_WAIT_BUCKETS_MS)
+        self._timeouts = 0
+        self._lock = threading.Lock()
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self._timeouts += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            timeouts = self._timeouts
+        return {"checkout_wait": self.checkout_wait.snapshot(), "checkout_timeouts": timeouts}
+
+
+_metrics: dict[str, PoolMetrics] = {}
+_metrics_lock = threading.Lock()
+
+
+def pool_metrics(name: str) -> PoolMetrics:
+    with _metrics_lock:
+        metrics = _metrics.get(name)
+        if metrics is None:
+            metrics = _metrics[name] = PoolMetrics()
+        return metrics
+
+
+class _TimedCheckout:
+    """Records how long each checkout waited for a connection.
+
+    Metrics are keyed by the pool's logging name, which ``Pool.recreate`` carries
+    over, so they survive ``Engine.dispose``.
+    """
+
+    def _do_get(self):
+        name = self._orig_logging_name or "default"
+        metrics = pool_metrics(name)
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            metrics.record_timeout()
+            CHECKOUT_TIMEOUTS.labels(name).inc()
+            raise
+        waited = time.perf_counter() - started
+        metrics.checkout_wait.observe(waited * 1000)
+        CHECKOUT_WAIT_SECONDS.labels(name).observe(waited)
+        return connection
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_status(engines: dict[str, Engine]) -> dict[str, Any]:
+    status: dict[str, Any] = {}
+    for name, engine in engines.items():
+        pool = engine.pool
+        status[name] = {
+            "url": engine.url.render_as_string(hide_password=True),
+            "pool_size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            # QueuePool counts overflow from -pool_size; only connections beyond the pool matter here.
+            "overflow_in_use": max(pool.overflow(), 0),
+            **pool_metrics(name).snapshot(),
+        }
+    return status
@@ -6,6 +6,7 @@ import pdfplumber
 from sqlalchemy.orm import Session
 
 from app.models.ingestion_metrics import IngestionMetric
+from app.services import metrics
 from ingestion.pdf import extract_text_from_pdf
 
 from .dallas_parser import parse_dallas_row
@@ -122,9 +123,13 @@ def ingest_pdf(
 
     except Exception:
         db.rollback()
+        metrics.INGESTION_PARSE_ERRORS.labels("dallas_pdf").inc()
         logger.exception("PDF ingestion failed")
         raise
 
+    metrics.record_ingestion("dallas_pdf", created=created, invalid=errors)
+    metrics.INGESTION_RUN_SECONDS.labels("dallas_pdf").observe(duration_seconds)
+
     logger.info(
         f"✅ PDF ingest complete | created={created} | "
         f"errors={errors} | duration={duration_seconds:.2f}s"
@@ -3,7 +3,7 @@ import json
 import re
 from dataclasses import dataclass
 from io import StringIO
-from typing import Iterable
+from typing import Iterable, Optional
 from urllib.request import Request, urlopen
 
 
@@ -2,6 +2,8 @@ import re
 
 import pdfplumber
 
+from app.services.metrics import OCR_SECONDS, timed
+
 
 def _normalize_ocr_text(text: str) -> str:
     text = (text or "").replace("\u00a0", " ")
@@ -28,8 +30,9 @@ def _extract_with_ocr(path: str) -> str:
     except Exception as exc:
         raise RuntimeError("OCR dependencies missing: install pdf2image, pytesseract, and system tesseract-ocr") from exc
 
-    images = convert_from_path(path, dpi=300)
-    text_chunks = [pytesseract.image_to_string(img) for img in images]
+    with timed(OCR_SECONDS):
+        images = convert_from_path(path, dpi=300)
+        text_chunks = [pytesseract.image_to_string(img) for img in images]
     return _normalize_ocr_text("\n".join(text_chunks))
 
 
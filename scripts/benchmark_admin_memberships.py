@@ -0,0 +1,183 @@
+"""Benchmark the admin membership list queries at production-like volume.
+
+Seeds N memberships (default 100k) with installments, check-ins and stability
+assessments inside a single transaction, builds the membership_activity summary,
+then times the legacy fan-out aggregate against the summary-backed list,
+below-stability and missed-installment queries. Everything is rolled back at the end.
+
+Usage:
+    python scripts/benchmark_admin_memberships.py --memberships 100000 --repeat 5
+
+Prints timings as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import text
+
+from db.session import SessionLocal
+from app.services.admin_dashboard_service import (
+    list_memberships,
+    memberships_below_stability,
+    memberships_with_missed_installments,
+)
+from app.services.membership_activity_service import rebuild_membership_activity
+
+
+PROGRAM_KEY = "benchmark_membership_program"
+
+# The pre-summary query: every membership is left-joined to all of its activity
+# sources at once before grouping, so rows multiply per member.
+LEGACY_FAN_OUT_SQL = """
+WITH latest_stability AS (
+    SELECT DISTINCT ON (sa.user_id, sa.program_key)
+        sa.user_id, sa.program_key, sa.stability_score, sa.created_at
+    FROM stability_assessments sa
+    ORDER BY sa.user_id, sa.program_key, sa.created_at DESC
+), installment_counts AS (
+    SELECT
+        mi.membership_id,
+        COUNT(*) FILTER (WHERE mi.status = 'missed') AS missed_installments_count,
+        COUNT(*) FILTER (WHERE mi.status = 'due') AS due_installments_count
+    FROM membership_installments mi
+    GROUP BY mi.membership_id
+), activity AS (
+    SELECT
+        m.id AS membership_id,
+        GREATEST(
+            COALESCE(max(mi.paid_at), to_timestamp(0)),
+            COALESCE(max(cc.created_at), to_timestamp(0)),
+            COALESCE(max(mc.created_at), to_timestamp(0)),
+            COALESCE(max(d.uploaded_at), to_timestamp(0)),
+            COALESCE(max(tqa.created_at), to_timestamp(0))
+        ) AS last_activity_at
+    FROM memberships m
+    LEFT JOIN membership_installments mi ON mi.membership_id = m.id
+    LEFT JOIN contribution_credits cc ON cc.membership_id = m.id
+    LEFT JOIN member_checkins mc ON mc.membership_id = m.id
+    LEFT JOIN cases c ON c.created_by = m.user_id AND c.program_key = m.program_key
+    LEFT JOIN documents d ON d.case_id = c.id
+    LEFT JOIN training_quiz_attempts tqa ON tqa.user_id = m.user_id
+    GROUP BY m.id
+)
+SELECT m.id, ls.stability_score, ic.missed_installments_count, a.last_activity_at
+FROM memberships m
+LEFT JOIN latest_stability ls ON ls.user_id = m.user_id AND ls.program_key = m.program_key
+LEFT JOIN installment_counts ic ON ic.membership_id = m.id
+LEFT JOIN activity a ON a.membership_id = m.id
+WHERE m.program_key = :program_key
+ORDER BY m.created_at DESC
+LIMIT 100
+"""
+
+SEED_SQL = [
+    """
+    INSERT INTO users (id, email, hashed_password, full_name)
+    SELECT gen_random_uuid(), 'bench-member-' || g || '@bench.local', 'x', 'Bench Member ' || g
+    FROM generate_series(1, :n) AS g
+    """,
+    """
+    INSERT INTO memberships (
+        id, user_id, program_key, term_start, term_end,
+        annual_price_cents, installment_cents, status, good_standing, created_at
+    )
+    SELECT gen_random_uuid(), u.id, :program_key, current_date, current_date + 365,
+           12000, 1000, 'active', true, now() - (random() * interval '365 days')
+    FROM users u
+    WHERE u.email LIKE 'bench-member-%@bench.local'
+    """,
+    """
+    INSERT INTO membership_installments (id, membership_id, due_date, amount_cents, status, paid_at)
+    SELECT gen_random_uuid(), m.id, current_date - (k * 30), 1000,
+           CAST((ARRAY['paid_cash', 'due', 'missed'])[1 + (abs(hashtext(m.id::text || k)) % 3)] AS installmentstatus),
+           CASE WHEN k % 3 = 0 THEN now() - (k * interval '30 days') END
+    FROM memberships m, generate_series(0, 5) AS k
+    WHERE m.program_key = :program_key
+    """,
+    """
+    INSERT INTO member_checkins (id, membership_id, type, created_at)
+    SELECT gen_random_uuid(), m.id, 'monthly_update', now() - (k * interval '20 days')
+    FROM memberships m, generate_series(1, 2) AS k
+    WHERE m.program_key = :program_key
+    """,
+    """
+    INSERT INTO stability_assessments (id, user_id, program_key, stability_score, breakdown_json, created_at)
+    SELECT gen_random_uuid(), m.user_id, m.program_key, 40 + (abs(hashtext(m.id::text || k)) % 50),
+           '{}'::jsonb, now() - (k * interval '10 days')
+    FROM memberships m, generate_series(1, 3) AS k
+    WHERE m.program_key = :program_key
+    """,
+]
+
+
+def _time(fn, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms": round(min(samples), 2),
+        "max_ms": round(max(samples), 2),
+    }
+
+
+def run_benchmark(memberships: int, repeat: int) -> dict:
+    db = SessionLocal()
+    try:
+        seed_started = time.perf_counter()
+        for statement in SEED_SQL:
+            db.execute(text(statement), {"n": memberships, "program_key": PROGRAM_KEY})
+        rebuild_started = time.perf_counter()
+        rebuilt = rebuild_membership_activity(db)
+        db.execute(text("ANALYZE"))
+        finished_seed = time.perf_counter()
+
+        legacy = _time(
+            lambda: db.execute(text(LEGACY_FAN_OUT_SQL), {"program_key": PROGRAM_KEY}).all(),
+            repeat,
+        )
+        results = {
+            "memberships": memberships,
+            "seed_seconds": round(rebuild_started - seed_started, 2),
+            "summary_rebuild_seconds": round(finished_seed - rebuild_started, 2),
+            "summary_rows": rebuilt,
+            "legacy_fan_out_list": legacy,
+            "list_memberships": _time(lambda: list_memberships(db, program_key=PROGRAM_KEY), repeat),
+            "memberships_below_stability": _time(
+                lambda: memberships_below_stability(db, threshold=65, program_key=PROGRAM_KEY),
+                repeat,
+            ),
+            "memberships_with_missed_installments": _time(
+                lambda: memberships_with_missed_installments(db, program_key=PROGRAM_KEY),
+                repeat,
+            ),
+        }
+        return results
+    finally:
+        db.rollback()
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--memberships", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(args.memberships, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
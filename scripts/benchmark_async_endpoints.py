@@ -0,0 +1,178 @@
+"""Compare p99 latency of the async /cases route against the old sync handler under load.
+
+Seeds N cases under a benchmark program key, then drives the current /cases
+handler and a copy of the pre-async sync handler in process with C concurrent
+clients each. Both are mounted on one bare app, so they share the event loop,
+threadpool and pool settings and differ only in the handler. Meanwhile a probe
+client calls a trivial sync route one request at a time, to show whether the
+load starves the threadpool every other sync route runs on. The seeded cases
+are deleted at the end.
+
+Usage:
+    python scripts/benchmark_async_endpoints.py --clients 500 --requests 5000 --cases 50
+
+Prints latency percentiles and throughput for each handler, and the probe's
+latency under each load, as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from api.routes.cases import list_cases
+from db.session import SessionLocal, async_engine, get_db
+from app.models.cases import Case
+from app.models.enums import CaseStatus
+from app.models.users import User
+
+PROGRAM_KEY = "benchmark_async_cases"
+
+def list_cases_sync(program_key: str, db: Session = Depends(get_db)):
+    # The handler as it was before /cases moved to the async session.
+    cases = db.query(Case).filter(Case.program_key == program_key).order_by(Case.created_at.desc()).all()
+    return [
+        {
+            "id": str(case.id),
+            "program_key": case.program_key,
+            "created_at": case.created_at.isoformat() if case.created_at else None,
+            "status": case.status.value if case.status else None,
+            "meta": case.meta or {},
+        }
+        for case in cases
+    ]
+
+
+def probe():
+    return {"ok": True}
+
+
+bench_app = FastAPI()
+bench_app.add_api_route("/sync/cases", list_cases_sync)
+bench_app.add_api_route("/async/cases", list_cases)
+bench_app.add_api_route("/probe", probe)
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 2)
+
+
+def _latency_summary(latencies: list[float]) -> dict:
+    return {
+        "mean_ms": round(statistics.fmean(latencies), 2),
+        "p50_ms": _percentile(latencies, 0.50),
+        "p95_ms": _percentile(latencies, 0.95),
+        "p99_ms": _percentile(latencies, 0.99),
+    }
+
+
+async def _load(path: str, clients: int, requests: int) -> dict:
+    latencies: list[float] = []
+    probe_latencies: list[float] = []
+    errors = 0
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for index in range(requests):
+        queue.put_nowait(index)
+
+    transport = httpx.ASGITransport(app=bench_app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker() -> None:
+            nonlocal errors
+            while not queue.empty():
+                queue.get_nowait()
+                started = time.perf_counter()
+                response = await client.get(path, params={"program_key": PROGRAM_KEY})
+                latencies.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    errors += 1
+
+        async def prober() -> None:
+            while not queue.empty():
+                started = time.perf_counter()
+                await client.get("/probe")
+                probe_latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(prober(), *(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": requests,
+        "errors": errors,
+        "requests_per_second": round(requests / elapsed, 1),
+        **_latency_summary(latencies),
+        "probe": {"requests": len(probe_latencies), **_latency_summary(probe_latencies)},
+    }
+
+
+async def _compare(clients: int, requests: int) -> dict:
+    results = {
+        "sync_handler": await _load("/sync/cases", clients, requests),
+        "async_handler": await _load("/async/cases", clients, requests),
+    }
+    await async_engine.dispose()
+    return results
+
+
+def run_benchmark(cases: int, clients: int, requests: int) -> dict:
+    db = SessionLocal()
+    user_id = uuid4()
+    try:
+        db.add(User(id=user_id, email=f"bench-async-{user_id.hex[:8]}@bench.local", hashed_password="x"))
+        db.flush()
+        db.execute(
+            insert(Case),
+            [
+                {
+                    "id": uuid4(),
+                    "status": CaseStatus.intake_submitted,
+                    "created_by": user_id,
+                    "program_key": PROGRAM_KEY,
+                    "meta": {"benchmark": True, "index": index},
+                }
+                for index in range(cases)
+            ],
+        )
+        db.commit()
+
+        return {
+            "cases": cases,
+            "clients": clients,
+            **asyncio.run(_compare(clients, requests)),
+        }
+    finally:
+        db.rollback()
+        db.execute(delete(Case).where(Case.program_key == PROGRAM_KEY))
+        db.execute(delete(User).where(User.id == user_id))
+        db.commit()
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", type=int, default=50, help="Cases returned per request")
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(args.cases, args.clients, args.requests), indent=2))
+
+
+if __name__ == "__main__":
+    main()
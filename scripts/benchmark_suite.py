@@ -0,0 +1,379 @@
+"""Time the key endpoints and services against a synthetic dataset and track regressions.
+
+Run it against a database loaded by ``scripts/generate_synthetic_dataset.py``.
+Every benchmark runs ``warmup`` untimed rounds, then ``rounds`` timed ones, and
+reports min/median/mean/p95/max in milliseconds plus the SQL statements one
+round issued: the ``X-DB-Query-Count`` header for endpoints, ``profile_queries``
+for services.
+
+Read-only services run in a session that is rolled back after every round;
+lead ingestion is rolled back too. The kanban endpoint commits the workflow
+sync it performs, and the risk evaluation run commits its escalations under a
+fresh run key each round, so the suite writes to the database it measures.
+
+Results are written to ``benchmarks/results/<timestamp>.json`` with the git
+commit and the row counts of the benchmarked tables. ``--compare`` checks the
+medians against an earlier result (a path, or ``latest`` for the newest file
+in the results directory) and exits with status 1 when a benchmark got slower
+than ``--max-regression``.
+
+Usage:
+    python scripts/benchmark_suite.py --dataset bench
+    python scripts/benchmark_suite.py --dataset bench --compare latest --max-regression 0.2
+    python scripts/benchmark_suite.py --dataset bench --only service. --only endpoint.admin --rounds 10
+
+Prints the results (and the comparison) as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+from uuid import uuid4
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# Endpoint benchmarks read the query count header, which is off by default.
+os.environ.setdefault("SQL_PROFILING_HEADERS", "true")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from auth.auth_handler import create_access_token
+from db.session import SessionLocal
+from app.models.users import User, UserRole
+from app.services.admin_dashboard_service import list_memberships, memberships_with_missed_installments
+from app.services.case_search_service import search_cases
+from app.services.lead_intelligence_service import bulk_ingest_leads
+from app.services.risk_evaluation_runner import run_risk_evaluation
+from app.services.sql_profiler import QUERY_COUNT_HEADER, profile_queries
+from app.services.workflow_engine import get_workflow_analytics
+
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+BENCHMARK_ADMIN_EMAIL = "benchmark-admin@synthetic.local"
+COUNTED_TABLES = (
+    "cases",
+    "properties",
+    "case_workflow_instances",
+    "case_workflow_progress",
+    "audit_logs",
+    "memberships",
+    "membership_installments",
+    "veteran_profiles",
+    "property_leads",
+)
+# Differences below this are noise on small datasets, whatever the ratio.
+MIN_REGRESSION_MS = 5.0
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    fn: Callable[["BenchmarkContext"], int | None]
+    rounds: int
+    warmup: int
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, *, rounds: int = 5, warmup: int = 1):
+    """Register ``fn(ctx)`` as a benchmark; it returns the SQL statements it issued, if known."""
+
+    def register(fn: Callable[["BenchmarkContext"], int | None]):
+        BENCHMARKS.append(Benchmark(name=name, fn=fn, rounds=rounds, warmup=warmup))
+        return fn
+
+    return register
+
+
+class BenchmarkContext:
+    def __init__(self, *, dataset: str, ingest_leads: int, seed: int):
+        self.dataset = dataset
+        self.program_key = f"synthetic_{dataset}"
+        self.ingest_leads = ingest_leads
+        self.rng = random.Random(seed)
+        self._client: TestClient | None = None
+        self._headers: dict[str, str] | None = None
+
+    def service(self, fn: Callable[[Session], Any]) -> int:
+        """Run ``fn`` in a session that is rolled back afterwards; returns its query count."""
+        db = SessionLocal()
+        try:
+            with profile_queries() as log:
+                fn(db)
+            return log.count
+        finally:
+            db.rollback()
+            db.close()
+
+    def get(self, path: str, **params) -> int:
+        response = self.client.get(path, params=params, headers=self.headers)
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {path} returned {response.status_code}: {response.text[:200]}")
+        return int(response.headers.get(QUERY_COUNT_HEADER, 0))
+
+    @property
+    def client(self) -> TestClient:
+        if self._client is None:
+            from api.main import app
+
+            self._client = TestClient(app)
+            self._client.__enter__()
+            app.state.startup_bootstrap.wait(timeout=60)
+        return self._client
+
+    @property
+    def headers(self) -> dict[str, str]:
+        if self._headers is None:
+            self._headers = {"Authorization": f"Bearer {create_access_token({'sub': str(_benchmark_admin_id())})}"}
+        return self._headers
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.__exit__(None, None, None)
+
+
+def _benchmark_admin_id():
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.email == BENCHMARK_ADMIN_EMAIL).first()
+        if user is None:
+            user = User(
+                email=BENCHMARK_ADMIN_EMAIL,
+                hashed_password="x",
+                full_name="Benchmark Admin",
+                role=UserRole.admin,
+            )
+            db.add(user)
+            db.commit()
+        return user.id
+    finally:
+        db.close()
+
+
+# -- benchmarks ------------------------------------------------------------------
+
+
+@benchmark("endpoint.kanban", rounds=1, warmup=0)
+def bench_kanban_endpoint(ctx: BenchmarkContext) -> int:
+    return ctx.get("/kanban/foreclosure")
+
+
+@benchmark("endpoint.workflow_analytics")
+def bench_workflow_analytics_endpoint(ctx: BenchmarkContext) -> int:
+    return ctx.get("/workflow/analytics/foreclosure")
+
+
+@benchmark("service.workflow_analytics")
+def bench_workflow_analytics(ctx: BenchmarkContext) -> int:
+    return ctx.service(lambda db: get_workflow_analytics(db=db, default_sla_days=30))
+
+
+@benchmark("endpoint.admin_memberships")
+def bench_admin_memberships_endpoint(ctx: BenchmarkContext) -> int:
+    return ctx.get("/admin/memberships", program_key=ctx.program_key)
+
+
+@benchmark("service.admin_memberships")
+def bench_admin_memberships(ctx: BenchmarkContext) -> int:
+    return ctx.service(lambda db: list_memberships(db, program_key=ctx.program_key))
+
+
+@benchmark("service.admin_missed_installments")
+def bench_admin_missed_installments(ctx: BenchmarkContext) -> int:
+    return ctx.service(lambda db: memberships_with_missed_installments(db, program_key=ctx.program_key))
+
+
+@benchmark("endpoint.foreclosure_workspace_cases")
+def bench_foreclosure_workspace_endpoint(ctx: BenchmarkContext) -> int:
+    return ctx.get("/foreclosure/workspace/cases", limit=50)
+
+
+@benchmark("service.case_search")
+def bench_case_search(ctx: BenchmarkContext) -> int:
+    return ctx.service(lambda db: search_cases(db, query="elm", workspace="foreclosure", limit=50))
+
+
+@benchmark("service.lead_ingestion", rounds=3, warmup=0)
+def bench_lead_ingestion(ctx: BenchmarkContext) -> int:
+    source_name = f"benchmark_{uuid4().hex[:8]}"
+    leads = (
+        {
+            "property_address": f"{ctx.rng.randint(100, 99999)} {ctx.rng.choice(('Elm', 'Oak', 'Pecan'))} St",
+            "city": "Dallas",
+            "state": "TX",
+            "equity_estimate": str(ctx.rng.randint(5_000, 250_000)),
+            "tax_delinquent": ctx.rng.choice(("true", "false")),
+        }
+        for _ in range(ctx.ingest_leads)
+    )
+    return ctx.service(
+        lambda db: bulk_ingest_leads(db, source_name=source_name, source_type="county", leads=leads)
+    )
+
+
+@benchmark("service.risk_evaluation_run", rounds=1, warmup=0)
+def bench_risk_evaluation_run(ctx: BenchmarkContext) -> int:
+    with profile_queries() as log:
+        run_risk_evaluation(SessionLocal, run_key=f"benchmark:{uuid4().hex}")
+    # Only the coordinator's queries: the workers run on pool threads.
+    return log.count
+
+
+# -- running and comparing ---------------------------------------------------------
+
+
+def _summarize(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+    return {
+        "min_ms": round(ordered[0], 2),
+        "median_ms": round(statistics.median(ordered), 2),
+        "mean_ms": round(statistics.fmean(ordered), 2),
+        "p95_ms": round(p95, 2),
+        "max_ms": round(ordered[-1], 2),
+    }
+
+
+def run_benchmark(item: Benchmark, ctx: BenchmarkContext, rounds: int | None) -> dict:
+    for _ in range(item.warmup):
+        item.fn(ctx)
+    samples = []
+    queries = None
+    for _ in range(rounds or item.rounds):
+        started = time.perf_counter()
+        queries = item.fn(ctx)
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"rounds": len(samples), "queries": queries, **_summarize(samples)}
+
+
+def table_counts() -> dict[str, int]:
+    db = SessionLocal()
+    try:
+        # Planner estimates: exact counts of the audit log alone take seconds at volume.
+        rows = db.execute(
+            text("SELECT relname, reltuples::bigint FROM pg_class WHERE relname = ANY(:tables) AND relkind = 'r'"),
+            {"tables": list(COUNTED_TABLES)},
+        ).all()
+        return {name: max(int(estimate), 0) for name, estimate in sorted(rows)}
+    finally:
+        db.close()
+
+
+def _git_commit() -> str | None:
+    result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+
+def latest_result(results_dir: Path) -> Path | None:
+    results = sorted(results_dir.glob("*.json"))
+    return results[-1] if results else None
+
+
+def compare(current: dict, baseline: dict, max_regression: float) -> dict:
+    """Median of every benchmark present in both runs, flagged when slower beyond the threshold."""
+    rows = {}
+    for name, result in current["benchmarks"].items():
+        before = baseline.get("benchmarks", {}).get(name)
+        if before is None or "median_ms" not in result or "median_ms" not in before:
+            continue
+        ratio = result["median_ms"] / before["median_ms"] if before["median_ms"] else math.inf
+        rows[name] = {
+            "baseline_median_ms": before["median_ms"],
+            "median_ms": result["median_ms"],
+            "change": round(ratio - 1, 3),
+            "regressed": ratio > 1 + max_regression
+            and result["median_ms"] - before["median_ms"] > MIN_REGRESSION_MS,
+        }
+    return {
+        "baseline_commit": baseline.get("git_commit"),
+        "baseline_created_at": baseline.get("created_at"),
+        "max_regression": max_regression,
+        "benchmarks": rows,
+        "regressions": sorted(name for name, row in rows.items() if row["regressed"]),
+    }
+
+
+def run_suite(*, dataset: str, only: list[str], rounds: int | None, ingest_leads: int, seed: int) -> dict:
+    selected = [item for item in BENCHMARKS if not only or any(item.name.startswith(prefix) for prefix in only)]
+    ctx = BenchmarkContext(dataset=dataset, ingest_leads=ingest_leads, seed=seed)
+    results = {}
+    try:
+        for item in selected:
+            try:
+                results[item.name] = run_benchmark(item, ctx, rounds)
+            except Exception as exc:
+                results[item.name] = {"error": f"{type(exc).__name__}: {exc}"}
+    finally:
+        ctx.close()
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "dataset": dataset,
+        "tables": table_counts(),
+        "benchmarks": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dataset", default="bench", help="Dataset name given to generate_synthetic_dataset.py")
+    parser.add_argument("--only", action="append", default=[], help="Run benchmarks whose name starts with this")
+    parser.add_argument("--rounds", type=int, help="Override every benchmark's number of timed rounds")
+    parser.add_argument("--ingest-leads", type=int, default=5_000, help="Leads per lead ingestion round")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--results-dir", type=Path, default=RESULTS_DIR)
+    parser.add_argument("--compare", help="Baseline result file, or 'latest'")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed median slowdown, e.g. 0.2 = 20%%")
+    parser.add_argument("--no-save", action="store_true", help="Do not write the result file")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        print("\n".join(item.name for item in BENCHMARKS))
+        return
+
+    baseline_path = None
+    if args.compare:
+        baseline_path = latest_result(args.results_dir) if args.compare == "latest" else Path(args.compare)
+        if baseline_path is None:
+            raise SystemExit(f"No results in {args.results_dir} to compare against")
+
+    report = run_suite(
+        dataset=args.dataset,
+        only=args.only,
+        rounds=args.rounds,
+        ingest_leads=args.ingest_leads,
+        seed=args.seed,
+    )
+    if not args.no_save:
+        args.results_dir.mkdir(parents=True, exist_ok=True)
+        path = args.results_dir / f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+        path.write_text(json.dumps(report, indent=2) + "\n")
+        report["saved_to"] = str(path.relative_to(ROOT) if path.is_relative_to(ROOT) else path)
+    if baseline_path is not None:
+        report["comparison"] = compare(report, json.loads(baseline_path.read_text()), args.max_regression)
+
+    print(json.dumps(report, indent=2))
+    if any("error" in result for result in report["benchmarks"].values()):
+        sys.exit(2)
+    if report.get("comparison", {}).get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
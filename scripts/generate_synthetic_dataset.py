@@ -0,0 +1,545 @@
+"""Generate a synthetic production-volume dataset with COPY.
+
+Streams deterministic rows (``--seed``) straight into Postgres with ``COPY ...
+FROM STDIN``, one table at a time:
+
+1) Users: case workers plus one member user per membership
+2) Properties
+3) Foreclosure cases, each on a property, with its foreclosure profile scored
+   the way the priority listener would
+4) A workflow instance per case on the default foreclosure template, with step
+   progress up to a random current step
+5) Audit rows: the required actions of every completed step, then filler
+   actions up to ``--audit-rows``
+6) Memberships with monthly installments
+7) Veteran profiles on a share of the cases
+
+COPY bypasses the ORM, so no flush listeners run. Afterwards the script rebuilds
+the derived tables those listeners maintain (case search index, membership
+activity, stability counters, impact rollups) and runs ANALYZE.
+
+Audit logs cannot be deleted, so point DATABASE_URL at a scratch database.
+Rows are tagged with ``--dataset`` (user emails, property source, case meta,
+membership program key); a dataset name can only be generated once.
+
+Usage:
+    python scripts/generate_synthetic_dataset.py --properties 100000 --cases 500000 \\
+        --audit-rows 10000000 --memberships 200000 --veteran-profiles 50000
+
+Prints row counts and per-table load times as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+from uuid import UUID
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import text
+
+from db.session import SessionLocal, engine
+from app.services.case_search_service import rebuild_case_search_index
+from app.services.foreclosure_intelligence_service import PRIORITY_STAGE_WEIGHTS, score_case_priority
+from app.services.impact_rollup_service import refresh_impact_rollups
+from app.services.membership_activity_service import rebuild_membership_activity
+from app.services.stability_counter_service import rebuild_stability_counters
+from app.services.workflow_engine import DEFAULT_FORECLOSURE_STEPS, FORECLOSURE_PROGRAM_KEY, ensure_default_template
+
+EMAIL_DOMAIN = "synthetic.local"
+CASE_WORKERS = 50
+CITIES = (("Dallas", "TX", "752"), ("Fort Worth", "TX", "761"), ("Houston", "TX", "770"), ("Austin", "TX", "787"))
+STREETS = ("Elm", "Oak", "Main", "Pecan", "Cedar", "Live Oak", "Mockingbird", "Bluebonnet", "Mesquite", "Lamar")
+SUFFIXES = ("St", "Ave", "Dr", "Ln", "Blvd", "Ct")
+FIRST_NAMES = ("Maria", "James", "Linda", "Robert", "Ana", "David", "Keisha", "Luis", "Sarah", "Michael")
+LAST_NAMES = ("Garcia", "Johnson", "Nguyen", "Smith", "Hernandez", "Williams", "Brown", "Ramirez", "Lee", "Davis")
+FILLER_ACTIONS = ("case_viewed", "note_added", "authorization_decision", "contact_attempt_logged", "document_requested")
+BRANCHES = ("army", "navy", "air_force", "marines", "coast_guard")
+
+
+class CopyStream(io.TextIOBase):
+    """A read()-able CSV view over a row iterator, so COPY streams without buffering a table."""
+
+    def __init__(self, rows: Iterable[tuple]):
+        self._rows = iter(rows)
+        self._out = io.StringIO()
+        self._writer = csv.writer(self._out, lineterminator="\n")
+        self._buffer = ""
+        self.rows = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        target = size if size and size > 0 else 1 << 20
+        while len(self._buffer) < target:
+            for row in self._rows:
+                self._writer.writerow(row)
+                self.rows += 1
+                if self._out.tell() >= target:
+                    break
+            chunk = self._out.getvalue()
+            if not chunk:
+                break
+            self._buffer += chunk
+            self._out.seek(0)
+            self._out.truncate()
+        data, self._buffer = self._buffer[:target], self._buffer[target:]
+        return data
+
+
+class DatasetGenerator:
+    def __init__(self, *, dataset: str, seed: int, now: datetime | None = None):
+        self.dataset = dataset
+        # Keyed by dataset too, so two datasets with the same seed do not share ids.
+        self.rng = random.Random(f"{dataset}:{seed}")
+        self.now = now or datetime.now(timezone.utc)
+        self.timings: dict[str, dict[str, Any]] = {}
+        self._audit_state = json.dumps({"dataset": dataset})
+
+    # -- helpers ---------------------------------------------------------------
+
+    def uuid(self) -> str:
+        # Postgres accepts 32 bare hex digits for a uuid; formatting UUID objects
+        # costs more than generating the row.
+        return f"{self.rng.getrandbits(128):032x}"
+
+    def past(self, days: int) -> datetime:
+        return self.now - timedelta(seconds=self.rng.randrange(max(1, days * 86400)))
+
+    def copy(self, connection, table: str, columns: tuple[str, ...], rows: Iterable[tuple]) -> int:
+        stream = CopyStream(rows)
+        started = time.perf_counter()
+        with connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", stream)
+        connection.commit()
+        elapsed = time.perf_counter() - started
+        self.timings[table] = {
+            "rows": stream.rows,
+            "seconds": round(elapsed, 2),
+            "rows_per_second": round(stream.rows / elapsed) if elapsed else None,
+        }
+        return stream.rows
+
+    # -- row generators ---------------------------------------------------------
+
+    def users(self, case_workers: list[str], members: list[str]) -> Iterator[tuple]:
+        for index, user_id in enumerate(case_workers):
+            email = f"synthetic-{self.dataset}-worker-{index}@{EMAIL_DOMAIN}"
+            yield (user_id, email, "x", "case_worker", f"Synthetic Worker {index}", self.past(730))
+        for index, user_id in enumerate(members):
+            email = f"synthetic-{self.dataset}-member-{index}@{EMAIL_DOMAIN}"
+            yield (user_id, email, "x", "user", self.name(), self.past(730))
+
+    def name(self) -> str:
+        return f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+
+    def properties(self, property_ids: list[str]) -> Iterator[tuple]:
+        for index, property_id in enumerate(property_ids):
+            city, state, zip_prefix = self.rng.choice(CITIES)
+            street = f"{self.rng.randint(100, 9999)} {self.rng.choice(STREETS)} {self.rng.choice(SUFFIXES)}"
+            assessed = self.rng.randrange(90_000, 650_000, 1000)
+            yield (
+                property_id,
+                f"SYN-{self.dataset}-{index}",
+                street,
+                city,
+                state,
+                f"{zip_prefix}{self.rng.randint(0, 99):02d}",
+                assessed,
+                int(assessed * self.rng.uniform(0.3, 0.95)),
+                self.name(),
+                f"synthetic:{self.dataset}",
+                self.past(730),
+            )
+
+    def cases(self, cases: list[dict], property_ids: list[str], case_workers: list[str]) -> Iterator[tuple]:
+        for case in cases:
+            status = "program_completed_positive_outcome" if case["completed"] else "in_progress"
+            meta = {"synthetic_dataset": self.dataset, "full_name": self.name()}
+            yield (
+                case["id"],
+                status,
+                self.rng.choice(case_workers),
+                case["created_at"],
+                "foreclosure_intervention",
+                FORECLOSURE_PROGRAM_KEY,
+                json.dumps(meta),
+                "housing_intervention",
+                self.rng.choice(property_ids),
+            )
+
+    def foreclosure_profiles(self, cases: list[dict]) -> Iterator[tuple]:
+        stages = tuple(PRIORITY_STAGE_WEIGHTS)
+        for case in cases:
+            city, state, zip_prefix = self.rng.choice(CITIES)
+            stage = self.rng.choice(stages)
+            arrears = round(self.rng.uniform(0, 40_000), 2)
+            income = round(self.rng.uniform(18_000, 140_000), 2)
+            score, tier = score_case_priority(foreclosure_stage=stage, arrears_amount=arrears, homeowner_income=income)
+            value = self.rng.uniform(90_000, 650_000)
+            yield (
+                self.uuid(),
+                case["id"],
+                f"{self.rng.randint(100, 9999)} {self.rng.choice(STREETS)} {self.rng.choice(SUFFIXES)}",
+                city,
+                state,
+                f"{zip_prefix}{self.rng.randint(0, 99):02d}",
+                round(value * self.rng.uniform(0.3, 0.95), 2),
+                round(value, 2),
+                arrears,
+                stage,
+                "owner_occupied",
+                income,
+                score,
+                tier,
+                case["created_at"],
+                case["created_at"],
+                case["created_at"],
+            )
+
+    def workflow_instances(self, cases: list[dict], template_id: UUID) -> Iterator[tuple]:
+        for case in cases:
+            step = DEFAULT_FORECLOSURE_STEPS[case["step_index"]]
+            completed_at = case["step_started_at"] if case["completed"] else None
+            yield (case["instance_id"], case["id"], template_id, 1, step["step_key"], case["created_at"], completed_at)
+
+    def workflow_progress(self, cases: list[dict]) -> Iterator[tuple]:
+        for case in cases:
+            current = case["step_index"]
+            started = case["created_at"]
+            for index, step in enumerate(DEFAULT_FORECLOSURE_STEPS):
+                if index < current or (index == current and case["completed"]):
+                    status, block_reason = "complete", None
+                    finished = started + (case["step_started_at"] - case["created_at"]) / max(current, 1)
+                    row = (case["instance_id"], step["step_key"], status, started, finished, block_reason)
+                    started = finished
+                elif index == current:
+                    blocked = step["blocking_conditions"] and self.rng.random() < 0.15
+                    status = "blocked" if blocked else "active"
+                    block_reason = step["blocking_conditions"][0] if blocked else None
+                    row = (case["instance_id"], step["step_key"], status, case["step_started_at"], None, block_reason)
+                else:
+                    row = (case["instance_id"], step["step_key"], "pending", None, None, None)
+                yield (self.uuid(), *row)
+
+    def audit_logs(self, cases: list[dict], case_workers: list[str], total: int) -> Iterator[tuple]:
+        written = 0
+        for case in cases:
+            done = case["step_index"] + (1 if case["completed"] else 0)
+            for step in DEFAULT_FORECLOSURE_STEPS[:done]:
+                for action in step["required_actions"]:
+                    if written >= total:
+                        return
+                    written += 1
+                    yield self._audit_row(case, action, case_workers)
+        while written < total:
+            written += 1
+            yield self._audit_row(self.rng.choice(cases), self.rng.choice(FILLER_ACTIONS), case_workers)
+
+    def _audit_row(self, case: dict, action: str, case_workers: list[str]) -> tuple:
+        created_at = case["created_at"] + (self.now - case["created_at"]) * self.rng.random()
+        return (
+            self.uuid(),
+            case["id"],
+            self.rng.choice(case_workers),
+            False,
+            action,
+            "synthetic",
+            "{}",
+            self._audit_state,
+            created_at,
+        )
+
+    def memberships(self, memberships: list[dict]) -> Iterator[tuple]:
+        for membership in memberships:
+            yield (
+                membership["id"],
+                membership["user_id"],
+                membership["program_key"],
+                membership["term_start"],
+                membership["term_start"] + timedelta(days=365),
+                12_000,
+                1_000,
+                membership["status"],
+                membership["status"] == "active",
+                datetime.combine(membership["term_start"], datetime.min.time(), tzinfo=timezone.utc),
+            )
+
+    def installments(self, memberships: list[dict], per_membership: int) -> Iterator[tuple]:
+        today = self.now.date()
+        for membership in memberships:
+            for month in range(per_membership):
+                due = membership["term_start"] + timedelta(days=30 * month)
+                if due > today:
+                    status, paid_at = "due", None
+                else:
+                    roll = self.rng.random()
+                    if roll < 0.8:
+                        status = "paid_cash"
+                        paid_at = datetime.combine(due, datetime.min.time(), tzinfo=timezone.utc) + timedelta(
+                            days=self.rng.randint(-3, 10)
+                        )
+                    elif roll < 0.9:
+                        status, paid_at = "missed", None
+                    else:
+                        status, paid_at = "satisfied_contribution", None
+                yield (self.uuid(), membership["id"], due, 1_000, status, paid_at)
+
+    def veteran_profiles(self, cases: list[dict]) -> Iterator[tuple]:
+        for case in cases:
+            yield (
+                self.uuid(),
+                case["id"],
+                self.rng.choice(BRANCHES),
+                self.rng.randint(2, 30),
+                "honorable",
+                self.rng.choice((0, 10, 30, 50, 70, 100)),
+                self.rng.random() < 0.1,
+                self.rng.random() < 0.3,
+                self.rng.random() < 0.5,
+                "TX",
+                True,
+                self.rng.choice(("current", "delinquent", "default")),
+                self.rng.random() < 0.4,
+                self.rng.choice(("low", "moderate", "high")),
+                case["created_at"],
+                case["created_at"],
+            )
+
+    # -- orchestration ----------------------------------------------------------
+
+    def plan_cases(self, count: int) -> list[dict]:
+        last_step = len(DEFAULT_FORECLOSURE_STEPS) - 1
+        cases = []
+        for _ in range(count):
+            created_at = self.past(540)
+            # Most cases sit in the early steps, like a live pipeline.
+            step_index = min(last_step, int(self.rng.expovariate(0.45)))
+            completed = step_index == last_step and self.rng.random() < 0.5
+            step_started_at = created_at + (self.now - created_at) * self.rng.uniform(0.2, 0.95)
+            cases.append(
+                {
+                    "id": self.uuid(),
+                    "instance_id": self.uuid(),
+                    "created_at": created_at,
+                    "step_index": step_index,
+                    "step_started_at": step_started_at,
+                    "completed": completed,
+                }
+            )
+        return cases
+
+    def plan_memberships(self, count: int) -> list[dict]:
+        statuses = ("active",) * 8 + ("paused", "expired")
+        return [
+            {
+                "id": self.uuid(),
+                "user_id": self.uuid(),
+                "program_key": f"synthetic_{self.dataset}",
+                "term_start": (self.now - timedelta(days=self.rng.randrange(365))).date(),
+                "status": self.rng.choice(statuses),
+            }
+            for _ in range(count)
+        ]
+
+
+def _dataset_exists(db, dataset: str) -> bool:
+    pattern = f"synthetic-{dataset}-%@{EMAIL_DOMAIN}"
+    return db.execute(text("SELECT 1 FROM users WHERE email LIKE :pattern LIMIT 1"), {"pattern": pattern}).first() is not None
+
+
+def generate_dataset(
+    *,
+    dataset: str,
+    properties: int,
+    cases: int,
+    audit_rows: int,
+    memberships: int,
+    installments_per_membership: int,
+    veteran_profiles: int,
+    seed: int,
+) -> dict:
+    generator = DatasetGenerator(dataset=dataset, seed=seed)
+    db = SessionLocal()
+    try:
+        if _dataset_exists(db, dataset):
+            raise SystemExit(f"Dataset '{dataset}' already exists; pick another --dataset name")
+        template = ensure_default_template(db)
+        template_id = template.id
+        db.commit()
+    finally:
+        db.close()
+
+    case_workers = [generator.uuid() for _ in range(CASE_WORKERS)]
+    property_ids = [generator.uuid() for _ in range(max(1, properties))]
+    case_plan = generator.plan_cases(cases)
+    membership_plan = generator.plan_memberships(memberships)
+    veteran_cases = generator.rng.sample(case_plan, min(veteran_profiles, len(case_plan)))
+
+    connection = engine.raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SET synchronous_commit TO off")
+        generator.copy(
+            connection,
+            "users",
+            ("id", "email", "hashed_password", "role", "full_name", "created_at"),
+            generator.users(case_workers, [m["user_id"] for m in membership_plan]),
+        )
+        generator.copy(
+            connection,
+            "properties",
+            (
+                "id", "external_id", "address", "city", "state", "zip",
+                "assessed_value", "est_balance", "mortgagor", "source", "created_at",
+            ),
+            generator.properties(property_ids),
+        )
+        generator.copy(
+            connection,
+            "cases",
+            (
+                "id", "status", "created_by", "created_at", "program_type",
+                "program_key", "meta", "case_type", "property_id",
+            ),
+            generator.cases(case_plan, property_ids, case_workers),
+        )
+        generator.copy(
+            connection,
+            "foreclosure_case_data",
+            (
+                "id", "case_id", "property_address", "city", "state", "zip_code",
+                "loan_balance", "estimated_property_value", "arrears_amount", "foreclosure_stage",
+                "occupancy_status", "homeowner_income", "priority_score", "priority_tier",
+                "priority_scored_at", "created_at", "updated_at",
+            ),
+            generator.foreclosure_profiles(case_plan),
+        )
+        generator.copy(
+            connection,
+            "case_workflow_instances",
+            ("id", "case_id", "template_id", "locked_template_version", "current_step_key", "started_at", "completed_at"),
+            generator.workflow_instances(case_plan, template_id),
+        )
+        generator.copy(
+            connection,
+            "case_workflow_progress",
+            ("id", "instance_id", "step_key", "status", "started_at", "completed_at", "block_reason"),
+            generator.workflow_progress(case_plan),
+        )
+        generator.copy(
+            connection,
+            "audit_logs",
+            (
+                "id", "case_id", "actor_id", "actor_is_ai", "action_type",
+                "reason_code", "before_state", "after_state", "created_at",
+            ),
+            generator.audit_logs(case_plan, case_workers, audit_rows),
+        )
+        generator.copy(
+            connection,
+            "memberships",
+            (
+                "id", "user_id", "program_key", "term_start", "term_end", "annual_price_cents",
+                "installment_cents", "status", "good_standing", "created_at",
+            ),
+            generator.memberships(membership_plan),
+        )
+        generator.copy(
+            connection,
+            "membership_installments",
+            ("id", "membership_id", "due_date", "amount_cents", "status", "paid_at"),
+            generator.installments(membership_plan, installments_per_membership),
+        )
+        generator.copy(
+            connection,
+            "veteran_profiles",
+            (
+                "id", "case_id", "branch_of_service", "years_of_service", "discharge_status",
+                "disability_rating", "permanent_and_total_status", "combat_service", "dependent_status",
+                "state_of_residence", "homeowner_status", "mortgage_status", "foreclosure_risk",
+                "income_level", "created_at", "updated_at",
+            ),
+            generator.veteran_profiles(veteran_cases),
+        )
+    finally:
+        connection.close()
+
+    derived = _rebuild_derived_tables(f"synthetic_{dataset}")
+    return {
+        "dataset": dataset,
+        "seed": seed,
+        "tables": generator.timings,
+        "derived": derived,
+    }
+
+
+def _rebuild_derived_tables(program_key: str) -> dict[str, Any]:
+    db = SessionLocal()
+    timings: dict[str, Any] = {}
+    try:
+        steps = {
+            "case_search_index": lambda: rebuild_case_search_index(db),
+            "membership_activity": lambda: rebuild_membership_activity(db),
+            "membership_stability_counters": lambda: rebuild_stability_counters(db, program_key=program_key),
+            "impact_rollups": lambda: refresh_impact_rollups(db, full=True),
+        }
+        for name, step in steps.items():
+            started = time.perf_counter()
+            result = step()
+            db.commit()
+            timings[name] = {
+                "rows": result if isinstance(result, int) else None,
+                "seconds": round(time.perf_counter() - started, 2),
+            }
+    finally:
+        db.close()
+
+    started = time.perf_counter()
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("ANALYZE"))
+    timings["analyze"] = {"seconds": round(time.perf_counter() - started, 2)}
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dataset", default="bench", help="Tag for the generated rows; must be new")
+    parser.add_argument("--properties", type=int, default=100_000)
+    parser.add_argument("--cases", type=int, default=500_000)
+    parser.add_argument("--audit-rows", type=int, default=10_000_000)
+    parser.add_argument("--memberships", type=int, default=200_000)
+    parser.add_argument("--installments-per-membership", type=int, default=12)
+    parser.add_argument("--veteran-profiles", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    report = generate_dataset(
+        dataset=args.dataset,
+        properties=args.properties,
+        cases=args.cases,
+        audit_rows=args.audit_rows,
+        memberships=args.memberships,
+        installments_per_membership=args.installments_per_membership,
+        veteran_profiles=args.veteran_profiles,
+        seed=args.seed,
+    )
+    report["total_seconds"] = round(time.perf_counter() - started, 2)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
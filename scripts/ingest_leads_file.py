@@ -0,0 +1,61 @@
+"""Bulk-load a CSV or NDJSON lead export into property_leads.
+
+Rows are streamed from the file, deduplicated on their normalized address and
+inserted in chunks; leads the source already has are skipped.
+
+Usage:
+    python scripts/ingest_leads_file.py PATH --source-name NAME --source-type TYPE
+        [--format csv|ndjson] [--chunk-size N] [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from db.session import SessionLocal
+from app.services.lead_intelligence_service import DEFAULT_INGEST_CHUNK_SIZE, bulk_ingest_leads, iter_lead_file
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path, help="Lead export (.csv, .ndjson or .jsonl)")
+    parser.add_argument("--source-name", required=True)
+    parser.add_argument("--source-type", required=True)
+    parser.add_argument("--format", dest="file_format", help="Defaults to the file extension")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_INGEST_CHUNK_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="Report the counts and roll back")
+    args = parser.parse_args()
+
+    file_format = args.file_format or args.path.suffix.lstrip(".")
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        with args.path.open(encoding="utf-8-sig", newline="") as stream:
+            result = bulk_ingest_leads(
+                db,
+                source_name=args.source_name,
+                source_type=args.source_type,
+                leads=iter_lead_file(stream, file_format),
+                chunk_size=args.chunk_size,
+            )
+        if args.dry_run:
+            db.rollback()
+        else:
+            db.commit()
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - started
+    print(json.dumps({**result, "seconds": round(elapsed, 2), "dry_run": args.dry_run}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Profile API cold start: import time by module and route group, then the startup bootstrap.
+
+Imports ``api.main`` in a fresh interpreter under ``python -X importtime`` and
+reports the cumulative time of its heaviest imports, split into third-party
+packages and first-party modules, plus the import and include time of each
+route module by route group as recorded by ``include_route_groups`` (a module
+only pays for what an earlier import has not loaded already). With
+``--bootstrap`` it also runs the startup bootstrap steps against the configured
+database and reports how long each took.
+
+Usage:
+    python scripts/profile_startup.py --top 25
+    API_ROUTE_GROUPS=partner python scripts/profile_startup.py
+    python scripts/profile_startup.py --bootstrap
+
+Prints the breakdown as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+FIRST_PARTY = ("api", "app", "auth", "audit", "db", "ingestion", "policy", "verification", "workers", "ai")
+
+
+# Route modules are imported through importlib, which -X importtime does not
+# log; the app records their timings itself.
+IMPORT_SNIPPET = "import json, api.main; print(json.dumps(api.main.app.state.route_load_profile))"
+
+
+def _import_profile() -> tuple[float, list[tuple[str, int, float]], list[dict]]:
+    """Wall time of the interpreter, (module, depth, cumulative ms) per logged import, router timings."""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_SNIPPET],
+        cwd=ROOT,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        # Names are indented two spaces per nesting level after a one-space margin.
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), depth, int(cumulative_us) / 1000))
+    return wall_ms, imports, json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def import_breakdown(top: int) -> dict:
+    wall_ms, imports, routers = _import_profile()
+
+    first_party: dict[str, float] = {}
+    third_party: dict[str, float] = {}
+    for name, depth, ms in imports:
+        # Direct imports of api.main and of the route modules both sit at depth 1.
+        if depth != 1:
+            continue
+        if name.split(".")[0] in FIRST_PARTY:
+            first_party[name] = ms
+        else:
+            third_party[name] = ms
+
+    groups: dict[str, float] = defaultdict(float)
+    for router in routers:
+        groups[router["group"]] += router["import_ms"] + router["include_ms"]
+
+    def ranked(items: dict[str, float]) -> list[dict]:
+        return [
+            {"module": name, "ms": round(ms, 1)}
+            for name, ms in sorted(items.items(), key=lambda item: -item[1])[:top]
+        ]
+
+    return {
+        "route_groups_env": os.getenv("API_ROUTE_GROUPS", "all"),
+        "interpreter_wall_ms": round(wall_ms, 1),
+        "api_main_import_ms": round(next((ms for name, _, ms in imports if name == "api.main"), 0.0), 1),
+        "route_groups_ms": {group: round(ms, 1) for group, ms in sorted(groups.items(), key=lambda item: -item[1])},
+        "routers": sorted(routers, key=lambda router: -(router["import_ms"] + router["include_ms"]))[:top],
+        "third_party": ranked(third_party),
+        "first_party": ranked(first_party),
+    }
+
+
+def bootstrap_breakdown() -> dict:
+    from app.services.auth_service import ensure_admin_user
+    from app.services.module_loader_service import load_modules_on_startup
+    from app.services.platform_knowledge_service import knowledge_snapshot
+    from db.session import SessionLocal
+
+    steps = {
+        "ensure_admin_user": lambda db: ensure_admin_user(db),
+        "load_modules_on_startup": lambda db: load_modules_on_startup(),
+        "knowledge_snapshot": lambda db: knowledge_snapshot(db),
+    }
+    timings = {}
+    db = SessionLocal()
+    try:
+        for name, step in steps.items():
+            started = time.perf_counter()
+            step(db)
+            timings[name] = round((time.perf_counter() - started) * 1000, 1)
+    finally:
+        db.close()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=15, help="Modules listed per section")
+    parser.add_argument("--bootstrap", action="store_true", help="Also time the DB-backed startup steps")
+    args = parser.parse_args()
+
+    report = import_breakdown(args.top)
+    if args.bootstrap:
+        report["bootstrap_ms"] = bootstrap_breakdown()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Recompute stored foreclosure case priorities.
+
+Profiles are rescored automatically when stage, arrears or income change through
+the ORM. Run this after changing the priority weights, or after rows were written
+with raw SQL, to bring every stored score back in line.
+
+Usage:
+    python scripts/rescore_foreclosure_priority.py [--case-id UUID ...] [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from uuid import UUID
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from db.session import SessionLocal
+from app.services.foreclosure_intelligence_service import rescore_case_priorities
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--case-id", action="append", type=UUID, dest="case_ids", help="Limit to these cases")
+    parser.add_argument("--dry-run", action="store_true", help="Report the count and roll back")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        updated = rescore_case_priorities(db, case_ids=args.case_ids)
+        if args.dry_run:
+            db.rollback()
+        else:
+            db.commit()
+    finally:
+        db.close()
+
+    print(json.dumps({"updated": updated, "dry_run": args.dry_run}))
+
+
+if __name__ == "__main__":
+    main()
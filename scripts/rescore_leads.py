@@ -0,0 +1,56 @@
+"""Rescore property leads in batches, e.g. after the scoring rules or threshold change.
+
+Every lead gets a new lead_scores row. With --actor-id, leads at or over the
+threshold that have no case yet are converted under the active policy.
+
+Usage:
+    python scripts/rescore_leads.py [--lead-id UUID ...] [--actor-id UUID]
+        [--threshold N] [--chunk-size N] [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from uuid import UUID
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from db.session import SessionLocal
+from app.services.lead_scoring_service import DEFAULT_SCORING_CHUNK_SIZE, SCORE_THRESHOLD, rescore_leads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lead-id", action="append", type=UUID, dest="lead_ids", help="Limit to these leads")
+    parser.add_argument("--actor-id", type=UUID, help="Create cases for qualifying leads as this user")
+    parser.add_argument("--threshold", type=float, default=SCORE_THRESHOLD)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_SCORING_CHUNK_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="Report the counts and roll back")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        result = rescore_leads(
+            db,
+            lead_ids=args.lead_ids,
+            actor_id=args.actor_id,
+            threshold=args.threshold,
+            chunk_size=args.chunk_size,
+        )
+        if args.dry_run:
+            db.rollback()
+        else:
+            db.commit()
+    finally:
+        db.close()
+
+    print(json.dumps({**result, "dry_run": args.dry_run}))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,12 +8,15 @@ from fastapi.testclient import TestClient
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if BASE_DIR not in sys.path:
     sys.path.insert(0, BASE_DIR)
+# query_budget reads the per-request query count header, which is off by default.
+os.environ.setdefault("SQL_PROFILING_HEADERS", "true")
 
 from api.main import app
 from auth.auth_handler import hash_password
-from db.session import SessionLocal, get_db
+from db.session import SessionLocal, get_db, get_read_db
 from app.models.policy_versions import PolicyVersion
 from app.models.users import User, UserRole
+from app.services.sql_profiler import QUERY_COUNT_HEADER
 
 
 @pytest.fixture(scope="function")
@@ -31,11 +34,28 @@ def client(db_session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     with TestClient(app) as test_client:
+        # Tests write to the tables the bootstrap reads; let it finish first.
+        app.state.startup_bootstrap.wait(timeout=30)
         yield test_client
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def query_budget():
+    """Assert a response stayed within a number of SQL queries (counted by SQLProfilerMiddleware)."""
+
+    def check(response, max_queries: int) -> int:
+        count = int(response.headers[QUERY_COUNT_HEADER])
+        assert count <= max_queries, (
+            f"{response.request.method} {response.request.url.path} issued {count} queries; budget is {max_queries}"
+        )
+        return count
+
+    return check
+
+
 @pytest.fixture(scope="function")
 def seeded_user(db_session):
     user = User(
@@ -0,0 +1,74 @@
+from uuid import uuid4
+
+from auth.auth_handler import create_access_token
+from app.models.cases import Case
+from app.models.enums import CaseStatus
+from app.models.housing_intelligence import ForeclosureCaseData
+from app.models.users import User, UserRole
+
+
+def _headers(db_session, role: UserRole) -> tuple[User, dict[str, str]]:
+    user = User(id=uuid4(), email=f"async-{uuid4().hex[:8]}@example.com", hashed_password="x", role=role)
+    db_session.add(user)
+    db_session.commit()
+    return user, {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+
+def _foreclosure_case(db_session, user: User, street: str) -> Case:
+    case = Case(
+        id=uuid4(),
+        status=CaseStatus.intake_submitted,
+        created_by=user.id,
+        program_key=f"async_{uuid4().hex[:6]}",
+        meta={"full_name": "Async Owner"},
+    )
+    db_session.add(case)
+    db_session.flush()
+    db_session.add(
+        ForeclosureCaseData(id=uuid4(), case_id=case.id, property_address=street, city="Dallas", state="TX")
+    )
+    db_session.commit()
+    return case
+
+
+def test_async_case_lists_and_search(client, db_session):
+    user, headers = _headers(db_session, UserRole.case_worker)
+    token = uuid4().hex[:8]
+    case = _foreclosure_case(db_session, user, f"{token} Bluebonnet Lane")
+
+    listed = client.get("/cases", params={"program_key": case.program_key, "status": "intake_submitted"})
+    assert listed.status_code == 200
+    assert [item["id"] for item in listed.json()] == [str(case.id)]
+
+    searched = client.get("/cases/search", params={"q": f"{token} blueb", "workspace": "foreclosure"}, headers=headers)
+    assert searched.status_code == 200
+    assert [item["case_id"] for item in searched.json()["items"]] == [str(case.id)]
+
+    workspace = client.get("/foreclosure/workspace/cases", params={"search": token}, headers=headers)
+    assert workspace.status_code == 200
+    assert [item["case_id"] for item in workspace.json()] == [str(case.id)]
+
+    routing = client.get("/partners/workspace/cases", params={"search": token}, headers=headers)
+    assert routing.status_code == 200
+    assert [item["case_id"] for item in routing.json()] == [str(case.id)]
+
+    assert client.get("/essential-worker/workspace/cases", headers=headers).status_code == 200
+    assert client.get("/foreclosure/workspace/cases").status_code == 401
+
+
+def test_async_partner_status_and_member_dashboard(client, db_session):
+    partner, partner_headers = _headers(db_session, UserRole.partner_org)
+    case = _foreclosure_case(db_session, partner, f"{uuid4().hex[:8]} Mesquite Court")
+
+    status = client.get(f"/partner/v1/cases/{case.id}/status", headers=partner_headers)
+    assert status.status_code == 200
+    assert status.json()["status"] == "intake_submitted"
+    assert client.get(f"/partner/v1/cases/{uuid4()}/status", headers=partner_headers).status_code == 404
+
+    _, worker_headers = _headers(db_session, UserRole.case_worker)
+    assert client.get(f"/partner/v1/cases/{case.id}/status", headers=worker_headers).status_code == 403
+
+    # Service errors raised inside run_sync surface unchanged.
+    dashboard = client.get("/member/dashboard", headers=partner_headers)
+    assert dashboard.status_code == 404
+    assert dashboard.json()["detail"] == "Active membership not found"
@@ -0,0 +1,94 @@
+from uuid import uuid4
+
+from app.models.audit_logs import AuditLog
+from app.models.cases import Case
+from app.models.enums import CaseStatus
+from app.models.housing_intelligence import ForeclosureCaseData, PartnerOrganization, PartnerReferral
+from app.models.users import User
+from app.services.case_detail_service import case_detail_cache_stats, get_case_detail, reset_case_detail_cache
+
+
+def _foreclosure_case(db_session) -> tuple[Case, ForeclosureCaseData]:
+    user = User(id=uuid4(), email=f"detail-{uuid4().hex[:6]}@example.com", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+
+    case = Case(id=uuid4(), status=CaseStatus.intake_submitted, created_by=user.id, program_key="foreclosure_prevention")
+    db_session.add(case)
+    db_session.flush()
+    profile = ForeclosureCaseData(
+        id=uuid4(),
+        case_id=case.id,
+        property_address="12 Birch Way",
+        state="TX",
+        foreclosure_stage="pre_foreclosure",
+    )
+    db_session.add(profile)
+    db_session.commit()
+    return case, profile
+
+
+def _audit(case_id, action_type: str) -> AuditLog:
+    return AuditLog(
+        id=uuid4(),
+        case_id=case_id,
+        actor_id=None,
+        actor_is_ai=False,
+        action_type=action_type,
+        reason_code=action_type,
+        before_state={},
+        after_state={},
+        policy_version_id=None,
+    )
+
+
+def test_case_detail_is_cached_until_a_write_commits(db_session):
+    reset_case_detail_cache()
+    case, profile = _foreclosure_case(db_session)
+
+    first = get_case_detail(db_session, case.id)
+    assert first["case"]["created_at"] == case.created_at.isoformat()
+    assert first["foreclosure_profile"]["priority_tier"] == "standard"
+    first["foreclosure_profile"]["foreclosure_stage"] = "mutated by a caller"
+    cached = get_case_detail(db_session, case.id)
+    assert cached is not first
+    assert cached["foreclosure_profile"]["foreclosure_stage"] == "pre_foreclosure"
+    assert case_detail_cache_stats()["hits"] == 1
+
+    db_session.add(_audit(case.id, "detail_cache_probe"))
+    profile.foreclosure_stage = "post_sale"
+    db_session.commit()
+
+    refreshed = get_case_detail(db_session, case.id)
+    assert refreshed["recent_audits"][0]["action_type"] == "detail_cache_probe"
+    assert refreshed["foreclosure_profile"]["priority_tier"] == "critical"
+    assert case_detail_cache_stats()["invalidations"] >= 1
+
+
+def test_flushed_uncommitted_writes_do_not_populate_the_cache(db_session):
+    reset_case_detail_cache()
+    case, _ = _foreclosure_case(db_session)
+
+    db_session.add(_audit(case.id, "detail_cache_pending"))
+    db_session.flush()
+    assert get_case_detail(db_session, case.id)["recent_audits"][0]["action_type"] == "detail_cache_pending"
+    db_session.rollback()
+
+    assert get_case_detail(db_session, case.id)["recent_audits"] == []
+    assert case_detail_cache_stats()["hits"] == 0
+
+
+def test_partner_renames_drop_the_details_of_cases_referred_to_it(db_session):
+    reset_case_detail_cache()
+    case, _ = _foreclosure_case(db_session)
+    partner = PartnerOrganization(id=uuid4(), name="Old Partner Name", service_type="legal_defense", service_region="TX")
+    db_session.add(partner)
+    db_session.flush()
+    db_session.add(PartnerReferral(case_id=case.id, partner_organization_id=partner.id, routing_category="legal_defense"))
+    db_session.commit()
+    assert get_case_detail(db_session, case.id)["referrals"][0]["partner_name"] == "Old Partner Name"
+
+    partner.name = "New Partner Name"
+    db_session.commit()
+
+    assert get_case_detail(db_session, case.id)["referrals"][0]["partner_name"] == "New Partner Name"
@@ -0,0 +1,101 @@
+from uuid import uuid4
+
+from app.models.cases import Case
+from app.models.enums import CaseStatus
+from app.models.housing_intelligence import ForeclosureCaseData, PartnerOrganization, PartnerReferral
+from app.models.users import User
+from app.services import case_search_service
+from app.services.case_search_service import search_cases
+
+
+def _foreclosure_case(db_session, *, street: str, owner: str) -> Case:
+    user = User(id=uuid4(), email=f"search-{uuid4().hex[:6]}@example.com", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+
+    case = Case(
+        id=uuid4(),
+        status=CaseStatus.intake_submitted,
+        created_by=user.id,
+        program_key="foreclosure_prevention",
+        meta={"full_name": owner},
+    )
+    db_session.add(case)
+    db_session.flush()
+    db_session.add(
+        ForeclosureCaseData(
+            id=uuid4(),
+            case_id=case.id,
+            property_address=street,
+            city="Dallas",
+            state="TX",
+            zip_code="75201",
+        )
+    )
+    db_session.commit()
+    return case
+
+
+def test_search_ranks_prefix_matches_and_tracks_writes(db_session):
+    token = uuid4().hex[:8]
+    case = _foreclosure_case(db_session, street=f"{token} Magnolia Avenue", owner=f"Rosalind {token}zz")
+
+    page = search_cases(db_session, query=f"{token} magno", workspace="foreclosure")
+    assert [item["case_id"] for item in page["items"]] == [str(case.id)]
+    assert page["items"][0]["rank"] > 0
+
+    by_id = search_cases(db_session, query=str(case.id)[:13], workspace="skiptrace")
+    assert str(case.id) in {item["case_id"] for item in by_id["items"]}
+
+    case.meta = {"full_name": f"Marguerite {token}qq"}
+    db_session.commit()
+    renamed = search_cases(db_session, query=f"marguerite {token}qq")
+    assert [item["owner_name"] for item in renamed["items"]] == [f"Marguerite {token}qq"]
+    assert search_cases(db_session, query=f"rosalind {token}zz")["items"] == []
+
+
+def test_partner_routing_workspace_excludes_routed_cases(db_session):
+    token = uuid4().hex[:8]
+    case = _foreclosure_case(db_session, street=f"{token} Pecan Street", owner="Owner")
+    assert search_cases(db_session, query=token, workspace="partner_routing")["items"]
+
+    partner = PartnerOrganization(id=uuid4(), name=f"Partner {token}", service_type="legal_aid")
+    db_session.add(partner)
+    db_session.flush()
+    db_session.add(
+        PartnerReferral(
+            id=uuid4(),
+            case_id=case.id,
+            partner_organization_id=partner.id,
+            routing_category="legal_aid",
+        )
+    )
+    db_session.commit()
+
+    assert search_cases(db_session, query=token, workspace="partner_routing")["items"] == []
+    assert search_cases(db_session, query=token, workspace="foreclosure")["items"]
+
+
+def test_search_matches_mid_word_substrings(db_session):
+    token = uuid4().hex[:8]
+    case = _foreclosure_case(db_session, street=f"{token} Mockingbird Lane", owner="Owner")
+
+    page = search_cases(db_session, query=f"{token[2:]} mockingb", workspace="foreclosure")
+    assert [item["case_id"] for item in page["items"]] == [str(case.id)]
+    # LIKE wildcards in the query are matched literally.
+    assert search_cases(db_session, query=f"{token[:3]}%{token[4:]}")["items"] == []
+
+
+def test_trigram_availability_is_rechecked_after_ttl(db_session, monkeypatch):
+    key = str(db_session.get_bind().url)
+    monkeypatch.setitem(case_search_service._TRIGRAM_AVAILABLE, key, (True, 0.0))
+    monkeypatch.setattr(case_search_service.time, "monotonic", lambda: 1.0)
+    assert case_search_service._trigram_available(db_session) is True
+
+    installed = db_session.execute(
+        case_search_service.text("SELECT count(*) FROM pg_extension WHERE extname = 'pg_trgm'")
+    ).scalar()
+    monkeypatch.setattr(
+        case_search_service.time, "monotonic", lambda: case_search_service.TRIGRAM_CHECK_SECONDS + 1.0
+    )
+    assert case_search_service._trigram_available(db_session) is bool(installed)
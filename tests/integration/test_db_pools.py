@@ -0,0 +1,65 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from db.pool import POOL_PROFILES, TimedQueuePool, pool_metrics, pool_settings, pool_status
+from db.session import DATABASE_URL, ReadSessionLocal, SessionLocal, db_pool_status
+
+
+def test_pool_settings_follow_process_type_and_env(monkeypatch):
+    for name in ("DB_POOL_SIZE", "DB_MAX_OVERFLOW", "DB_POOL_TIMEOUT_SECONDS", "DB_POOL_RECYCLE_SECONDS"):
+        monkeypatch.delenv(name, raising=False)
+
+    assert pool_settings("web")["pool_size"] > pool_settings("celery")["pool_size"]
+    assert pool_settings("unknown") == pool_settings("web")
+
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    monkeypatch.setenv("DB_POOL_RECYCLE_SECONDS", "60")
+    settings = pool_settings("celery")
+    assert settings["pool_size"] == 3
+    assert settings["pool_recycle"] == 60
+    assert settings["max_overflow"] == POOL_PROFILES["celery"]["max_overflow"]
+
+
+def test_read_sessions_reject_writes_and_return_clean_connections():
+    with ReadSessionLocal() as read_db:
+        assert read_db.execute(text("SELECT 1")).scalar() == 1
+        assert read_db.execute(text("SHOW transaction_read_only")).scalar() == "on"
+        with pytest.raises(exc.DBAPIError):
+            read_db.execute(text("UPDATE users SET full_name = full_name WHERE false"))
+
+    # Without a replica both sessions share one pool; the read-only flag must not leak.
+    with SessionLocal() as db:
+        assert db.execute(text("SHOW transaction_read_only")).scalar() == "off"
+
+    status = db_pool_status()
+    assert status["pools"]["primary"]["checkout_wait"]["count"] >= 1
+
+
+def test_timed_pool_records_checkout_waits_and_timeouts():
+    name = f"test_pool_{uuid4().hex[:8]}"
+    engine = create_engine(
+        DATABASE_URL,
+        poolclass=TimedQueuePool,
+        pool_logging_name=name,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.2,
+    )
+    try:
+        with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        snapshot = pool_status({name: engine})[name]
+        assert snapshot["checkout_timeouts"] == 1
+        assert snapshot["checkout_wait"]["count"] == 1
+        assert snapshot["checked_in"] == 1
+
+        engine.dispose()
+        with engine.connect():
+            pass
+        assert pool_metrics(name).checkout_wait.count == 2
+    finally:
+        engine.dispose()
@@ -0,0 +1,69 @@
+from uuid import uuid4
+
+from sqlalchemy import text
+
+from app.models.cases import Case
+from app.models.enums import CaseStatus
+from app.models.housing_intelligence import ForeclosureCaseData
+from app.models.users import User
+from app.services.case_search_service import search_cases
+from app.services.foreclosure_intelligence_service import calculate_case_priority, rescore_case_priorities
+
+
+def _profile(db_session, *, street: str, **fields) -> ForeclosureCaseData:
+    user = User(id=uuid4(), email=f"priority-{uuid4().hex[:6]}@example.com", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+
+    case = Case(id=uuid4(), status=CaseStatus.intake_submitted, created_by=user.id, program_key="foreclosure_prevention")
+    db_session.add(case)
+    db_session.flush()
+    profile = ForeclosureCaseData(id=uuid4(), case_id=case.id, property_address=street, state="TX", **fields)
+    db_session.add(profile)
+    db_session.commit()
+    return profile
+
+
+def test_priority_is_stored_and_rescored_only_when_inputs_change(db_session):
+    token = uuid4().hex[:8]
+    profile = _profile(
+        db_session,
+        street=f"{token} Cedar Lane",
+        foreclosure_stage="notice_of_default",
+        arrears_amount=6000,
+        homeowner_income=3000,
+    )
+    assert (profile.priority_score, profile.priority_tier) == (50.0, "high")
+    scored_at = profile.priority_scored_at
+
+    profile.city = "Austin"
+    db_session.commit()
+    assert profile.priority_scored_at == scored_at
+
+    profile.foreclosure_stage = "auction_scheduled"
+    db_session.commit()
+    assert calculate_case_priority(db_session, case_id=profile.case_id) == {
+        "case_id": str(profile.case_id),
+        "priority_score": 70.0,
+        "priority_tier": "critical",
+    }
+
+    # A raw write bypasses the listener until the bulk rescore picks it up.
+    db_session.execute(
+        text("UPDATE foreclosure_case_data SET foreclosure_stage = 'pre_foreclosure' WHERE id = :id"),
+        {"id": profile.id},
+    )
+    assert rescore_case_priorities(db_session, case_ids=[profile.case_id]) == 1
+    assert rescore_case_priorities(db_session, case_ids=[profile.case_id]) == 0
+    db_session.commit()
+    db_session.refresh(profile)
+    assert (profile.priority_score, profile.priority_tier) == (35.0, "standard")
+
+
+def test_workspace_search_sorts_by_priority(db_session):
+    token = uuid4().hex[:8]
+    low = _profile(db_session, street=f"{token} Elm Court", foreclosure_stage="pre_foreclosure")
+    high = _profile(db_session, street=f"{token} Oak Court", foreclosure_stage="post_sale")
+
+    page = search_cases(db_session, query=token, workspace="foreclosure", sort="priority")
+    assert [item["case_id"] for item in page["items"]] == [str(high.case_id), str(low.case_id)]
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from app.models.case_search_index import CaseSearchIndex
+from app.models.cases import Case
+from app.models.lead_intelligence import LeadScore, LeadSource, PropertyLead
+from app.models.users import User
+from app.services.lead_intelligence_service import score_property_lead
+from app.services.lead_scoring_service import rescore_leads
+
+
+def _leads(db_session) -> list[PropertyLead]:
+    source = LeadSource(id=uuid4(), source_name=f"scoring_{uuid4().hex[:8]}", source_type="test")
+    db_session.add(source)
+    soon = datetime.now(timezone.utc) + timedelta(days=7)
+    leads = [
+        PropertyLead(id=uuid4(), source_id=source.id, property_address=f"{n} Hot St", address_key=f"{n} hot st {source.id}",
+                     foreclosure_stage="auction_scheduled", tax_delinquent="true", equity_estimate=80000,
+                     auction_date=soon, owner_occupancy="true")
+        for n in range(5)
+    ] + [
+        PropertyLead(id=uuid4(), source_id=source.id, property_address=f"{n} Cold St", address_key=f"{n} cold st {source.id}",
+                     foreclosure_stage="pre_foreclosure", tax_delinquent="false", equity_estimate=1000,
+                     owner_occupancy="false")
+        for n in range(7)
+    ]
+    db_session.add_all(leads)
+    db_session.commit()
+    return leads
+
+
+def test_rescore_leads_batches_scores_and_converts_each_lead_once(db_session, seeded_policy):
+    leads = _leads(db_session)
+    actor = User(id=uuid4(), email=f"scorer-{uuid4().hex[:6]}@example.com", hashed_password="x")
+    db_session.add(actor)
+    db_session.commit()
+    ids = [lead.id for lead in leads]
+
+    result = rescore_leads(db_session, lead_ids=ids, actor_id=actor.id, chunk_size=4)
+    db_session.commit()
+
+    assert result["leads_scored"] == 12
+    assert result["cases_created"] == 5
+    assert result["grades"] == {"A": 5, "B": 0, "C": 7}
+    assert result["leads_per_second"] > 0
+
+    rows = db_session.query(LeadScore).filter(LeadScore.lead_id.in_(ids)).all()
+    assert len(rows) == 12
+    converted = [row for row in rows if row.created_case_id]
+    assert {row.lead_id for row in converted} == {lead.id for lead in leads[:5]}
+    case = db_session.get(Case, converted[0].created_case_id)
+    assert case.meta["lead_id"] == str(converted[0].lead_id)
+    assert db_session.query(CaseSearchIndex).filter(CaseSearchIndex.case_id == case.id).count() == 1
+
+    again = rescore_leads(db_session, lead_ids=ids, actor_id=actor.id)
+    db_session.commit()
+    assert again["cases_created"] == 0
+    assert db_session.query(LeadScore).filter(LeadScore.lead_id.in_(ids)).count() == 24
+
+
+def test_single_lead_scoring_matches_batch_engine(db_session):
+    leads = _leads(db_session)
+
+    single = score_property_lead(db_session, lead_id=leads[0].id)
+    rescore_leads(db_session, lead_ids=[leads[0].id])
+    db_session.commit()
+
+    scores = {row.score for row in db_session.query(LeadScore).filter(LeadScore.lead_id == leads[0].id)}
+    assert scores == {single["score"]} == {95.0}
+
+
+def test_single_lead_scoring_does_not_convert_a_lead_twice(db_session, seeded_policy):
+    leads = _leads(db_session)
+    actor = User(id=uuid4(), email=f"scorer-{uuid4().hex[:6]}@example.com", hashed_password="x")
+    db_session.add(actor)
+    db_session.commit()
+
+    rescore_leads(db_session, lead_ids=[leads[0].id], actor_id=actor.id)
+    again = score_property_lead(db_session, lead_id=leads[0].id, actor_id=actor.id)
+    db_session.commit()
+
+    assert again["created_case_id"] is None
+    cases = db_session.query(Case).filter(Case.meta["lead_id"].as_string() == str(leads[0].id)).count()
+    assert cases == 1
@@ -0,0 +1,126 @@
+import io
+import json
+from uuid import uuid4
+
+from auth.auth_handler import create_access_token
+from app.models.lead_intelligence import LeadSource, PropertyLead
+from app.models.users import User
+from app.services import lead_intelligence_service
+from app.services.lead_intelligence_service import (
+    bulk_ingest_leads,
+    ingest_leads,
+    iter_lead_file,
+    parse_lead_timestamp,
+)
+
+
+def _source_leads(db_session, source_name: str) -> list[PropertyLead]:
+    return (
+        db_session.query(PropertyLead)
+        .join(LeadSource, LeadSource.id == PropertyLead.source_id)
+        .filter(LeadSource.source_name == source_name)
+        .order_by(PropertyLead.property_address)
+        .all()
+    )
+
+
+def test_bulk_ingest_dedupes_normalized_addresses_and_is_idempotent(db_session):
+    source_name = f"county_export_{uuid4().hex[:8]}"
+    leads = [
+        {"property_address": "100 North Elm Street", "city": "Dallas", "state": "TX", "tax_delinquent": "false"},
+        {"property_address": "100 n. elm st", "city": "DALLAS", "state": "tx"},
+        {"property_address": "  100 N ELM ST ", "city": "Dallas", "state": "TX"},
+        {"property_address": "200 Oak Avenue", "city": "Dallas", "state": "TX", "equity_estimate": "$61,500"},
+        {"property_address": "", "city": "Dallas", "state": "TX"},
+    ] + [{"property_address": f"{n} Pine Rd", "city": "Plano", "state": "TX"} for n in range(1, 13)]
+
+    first = bulk_ingest_leads(db_session, source_name=source_name, source_type="county", leads=iter(leads), chunk_size=5)
+    db_session.commit()
+
+    assert first["leads_received"] == 17
+    assert first["leads_ingested"] == 14
+    assert first["duplicates"] == 2
+    assert first["invalid"] == 1
+
+    stored = _source_leads(db_session, source_name)
+    elm = next(lead for lead in stored if lead.address_key == "100 n elm st dallas tx")
+    assert elm.property_address == "100 North Elm Street"
+    assert elm.tax_delinquent == "false"
+    oak = next(lead for lead in stored if lead.address_key == "200 oak ave dallas tx")
+    assert oak.equity_estimate == 61500.0
+
+    again = ingest_leads(
+        db_session,
+        source_name=source_name,
+        source_type="county",
+        leads=[{"property_address": "100 NORTH ELM ST.", "city": "Dallas", "state": "TX"}],
+    )
+    db_session.commit()
+    assert again["leads_ingested"] == 0
+    assert again["duplicates"] == 1
+
+    replay = bulk_ingest_leads(db_session, source_name=source_name, source_type="county", leads=leads)
+    db_session.commit()
+    assert replay["leads_ingested"] == 0
+    assert len(_source_leads(db_session, source_name)) == 14
+
+
+def test_same_street_address_in_another_city_is_a_separate_lead(db_session):
+    # Both paths once collided on the raw (source_id, property_address) constraint:
+    # ingest_leads raised IntegrityError and the bulk insert silently dropped the row.
+    for ingest in (ingest_leads, bulk_ingest_leads):
+        source_name = f"city_split_{uuid4().hex[:8]}"
+        for city in ("Dallas", None):
+            summary = ingest(
+                db_session,
+                source_name=source_name,
+                source_type="county",
+                leads=[{"property_address": "1 Main St", "city": city, "state": "TX"}],
+            )
+            db_session.commit()
+            assert summary["leads_ingested"] == 1
+
+        keys = {lead.address_key for lead in _source_leads(db_session, source_name)}
+        assert keys == {"1 main st dallas tx", "1 main st tx"}
+
+
+def test_unparsed_auction_dates_are_logged(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(lead_intelligence_service.logger, "warning", lambda event, **kw: warnings.append(kw["extra"]))
+
+    assert parse_lead_timestamp("2030-01-15").year == 2030
+    assert parse_lead_timestamp("") is None
+    assert warnings == []
+
+    assert parse_lead_timestamp("01/15/2030") is None
+    assert warnings == [{"value": "01/15/2030"}]
+
+
+def test_iter_lead_file_streams_csv_and_ndjson():
+    csv_rows = list(iter_lead_file(io.StringIO("property_address,city,zip_code\n1 A St,Dallas,\n"), "csv"))
+    assert csv_rows == [{"property_address": "1 A St", "city": "Dallas"}]
+
+    ndjson = io.StringIO(json.dumps({"property_address": "2 B St"}) + "\n\n" + json.dumps({"property_address": "3 C St"}))
+    assert [row["property_address"] for row in iter_lead_file(ndjson, "ndjson")] == ["2 B St", "3 C St"]
+
+
+def test_ingest_file_endpoint_loads_csv_upload(client, db_session):
+    user = User(id=uuid4(), email=f"leads-{uuid4().hex[:6]}@example.com", hashed_password="x")
+    db_session.add(user)
+    db_session.commit()
+    token = create_access_token({"sub": str(user.id)})
+    source_name = f"upload_{uuid4().hex[:8]}"
+    body = "property_address,city,state,auction_date\n5 Main St,Dallas,TX,2030-01-15\n5 main street,Dallas,TX,\n"
+
+    response = client.post(
+        "/leads/intelligence/ingest-file",
+        params={"source_name": source_name, "source_type": "upload"},
+        files={"file": ("leads.csv", body.encode(), "text/csv")},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["leads_ingested"] == 1
+    assert response.json()["duplicates"] == 1
+    (lead,) = _source_leads(db_session, source_name)
+    assert lead.auction_date.year == 2030
@@ -0,0 +1,84 @@
+import time
+from uuid import uuid4
+
+from db.session import SessionLocal
+from app.models.lead_intelligence import LeadConnectorState, LeadSource, PropertyLead
+from app.services import lead_connector_service
+from app.services.lead_connector_service import LeadConnector, run_lead_connectors, weekly_foreclosure_scan
+
+
+def _register(monkeypatch, fetch, **kwargs) -> str:
+    name = f"test_connector_{uuid4().hex[:8]}"
+    monkeypatch.setitem(
+        lead_connector_service.CONNECTORS,
+        name,
+        LeadConnector(name=name, source_type="test", fetch=fetch, **kwargs),
+    )
+    return name
+
+
+def test_connectors_run_concurrently_and_resume_from_watermarks(db_session, monkeypatch):
+    seen_since = []
+
+    def filings(since):
+        seen_since.append(since)
+        time.sleep(0.3)
+        return [
+            {"property_address": f"{n} Filing Rd", "city": "Dallas", "state": "TX", "filed_at": f"2026-10-0{n}T00:00:00+00:00"}
+            for n in range(1, 5)
+        ]
+
+    def slow(since):
+        for n in range(100):
+            time.sleep(0.05)
+            yield {"property_address": f"{n} Slow Ln", "city": "Dallas", "state": "TX"}
+
+    def broken(since):
+        raise RuntimeError("county portal down")
+
+    first = _register(monkeypatch, filings)
+    second = _register(monkeypatch, filings)
+    stalled = _register(monkeypatch, slow, timeout_seconds=0.3)
+    failing = _register(monkeypatch, broken)
+
+    started = time.perf_counter()
+    outcome = run_lead_connectors(SessionLocal, names=[first, second, stalled, failing], max_workers=4)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.5
+    results = {result["connector"]: result for result in outcome["connectors"]}
+    assert outcome["status"] == "partial"
+    assert results[first]["status"] == results[second]["status"] == "succeeded"
+    assert results[first]["leads_ingested"] == 4
+    assert results[first]["watermark_at"].startswith("2026-10-04")
+    assert results[stalled]["status"] == "timed_out"
+    assert results[failing]["status"] == "failed"
+    assert "county portal down" in results[failing]["error"]
+
+    # The timed-out connector rolled back everything it had streamed.
+    stalled_leads = (
+        db_session.query(PropertyLead).join(LeadSource).filter(LeadSource.source_name == stalled).count()
+    )
+    assert stalled_leads == 0
+    state = db_session.get(LeadConnectorState, stalled)
+    assert state.last_status == "timed_out" and state.watermark_at is None
+
+    rerun = run_lead_connectors(SessionLocal, names=[first])
+    (result,) = rerun["connectors"]
+    assert seen_since[-1].isoformat().startswith("2026-10-04")
+    assert result["skipped"] == 3
+    assert result["leads_ingested"] == 0
+    state = db_session.get(LeadConnectorState, first, populate_existing=True)
+    assert state.runs == 2 and state.total_leads_ingested == 4
+
+
+def test_weekly_scan_runs_every_county_connector(db_session):
+    scan = weekly_foreclosure_scan(db_session)
+
+    assert {result["connector"] for result in scan["connectors"]} == {
+        "dallas_county_foreclosure_connector",
+        "tarrant_county_trustee_connector",
+        "collin_county_notice_connector",
+    }
+    assert all(result["status"] == "succeeded" for result in scan["connectors"])
+    assert "weekly_leads_ingested" in scan
@@ -0,0 +1,108 @@
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.cases import Case
+from app.models.documents import Document
+from app.models.enums import CaseStatus, DocumentType
+from app.models.member_layer import (
+    InstallmentStatus,
+    Membership,
+    MembershipActivity,
+    MembershipInstallment,
+    MembershipStatus,
+    StabilityAssessment,
+)
+from app.models.users import User
+from app.services.admin_dashboard_service import list_memberships
+
+
+def _member(db_session, program_key: str = "homeowner_protection") -> Membership:
+    user = User(id=uuid4(), email=f"activity-{uuid4().hex[:6]}@example.com", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    membership = Membership(
+        id=uuid4(),
+        user_id=user.id,
+        program_key=program_key,
+        term_start=date.today(),
+        term_end=date.today() + timedelta(days=365),
+        annual_price_cents=12000,
+        installment_cents=1000,
+        status=MembershipStatus.active,
+        good_standing=True,
+    )
+    db_session.add(membership)
+    db_session.flush()
+    return membership
+
+
+def test_membership_activity_follows_installment_and_stability_writes(db_session):
+    membership = _member(db_session)
+    user = db_session.get(User, membership.user_id)
+    installment = MembershipInstallment(
+        id=uuid4(),
+        membership_id=membership.id,
+        due_date=date.today(),
+        amount_cents=1000,
+        status=InstallmentStatus.due,
+    )
+    db_session.add(installment)
+    db_session.commit()
+
+    summary = db_session.get(MembershipActivity, membership.id)
+    assert summary.due_installments_count == 1
+    assert summary.missed_installments_count == 0
+    assert summary.last_activity_at is None
+
+    installment.status = InstallmentStatus.missed
+    db_session.add(
+        StabilityAssessment(
+            id=uuid4(),
+            user_id=user.id,
+            program_key="homeowner_protection",
+            stability_score=55,
+            breakdown_json={"baseline": 55},
+        )
+    )
+    db_session.commit()
+    db_session.refresh(summary)
+    assert summary.due_installments_count == 0
+    assert summary.missed_installments_count == 1
+    assert summary.latest_stability_score == 55
+
+    installment.status = InstallmentStatus.paid_cash
+    installment.paid_at = datetime.now(timezone.utc)
+    db_session.commit()
+    db_session.refresh(summary)
+    assert summary.missed_installments_count == 0
+    assert summary.last_activity_at is not None
+
+
+def test_membership_activity_follows_case_reassignment(db_session):
+    program_key = f"activity_{uuid4().hex[:6]}"
+    first = _member(db_session, program_key)
+    second = _member(db_session, program_key)
+    case = Case(id=uuid4(), status=CaseStatus.intake_submitted, created_by=first.user_id, program_key=program_key)
+    db_session.add(case)
+    db_session.flush()
+    db_session.add(
+        Document(id=uuid4(), case_id=case.id, uploaded_by=first.user_id, doc_type=DocumentType.id_verification)
+    )
+    db_session.commit()
+    assert db_session.get(MembershipActivity, first.id).last_activity_at is not None
+    assert db_session.get(MembershipActivity, second.id).last_activity_at is None
+
+    case.created_by = second.user_id
+    db_session.commit()
+    db_session.expire_all()
+    assert db_session.get(MembershipActivity, first.id).last_activity_at is None
+    assert db_session.get(MembershipActivity, second.id).last_activity_at is not None
+
+
+def test_membership_lists_reject_unknown_status(db_session):
+    with pytest.raises(HTTPException) as exc_info:
+        list_memberships(db_session, status="actve")
+    assert exc_info.value.status_code == 400
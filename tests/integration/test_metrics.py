@@ -0,0 +1,88 @@
+import time
+from uuid import uuid4
+
+from prometheus_client import REGISTRY
+from sqlalchemy.exc import OperationalError
+
+from app.models.outbox_queue import OutboxQueue
+from app.services.lead_intelligence_service import ingest_leads
+from app.services.metrics import render_metrics
+from app.services.module_dispatch_service import record_action_latency
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_metrics_endpoint_exposes_ingestion_counters_and_outbox_backlog(client, db_session):
+    created_before = _sample("ingestion_rows_total", source="metrics_feed", outcome="created")
+    invalid_before = _sample("ingestion_parse_errors_total", source="metrics_feed")
+    runs_before = _sample("ingestion_run_seconds_count", source="metrics_feed")
+
+    ingest_leads(
+        db_session,
+        source_name=f"metrics_{uuid4().hex[:8]}",
+        source_type="metrics_feed",
+        leads=[
+            {"property_address": "10 Metric Way", "city": "Dallas", "state": "TX"},
+            {"property_address": "10 metric way", "city": "dallas", "state": "tx"},
+            {"property_address": "", "city": "Dallas", "state": "TX"},
+        ],
+    )
+    db_session.add(OutboxQueue(id=uuid4(), event_type="referral_created", payload={}, dedupe_key=uuid4().hex))
+    db_session.commit()
+
+    assert _sample("ingestion_rows_total", source="metrics_feed", outcome="created") == created_before + 1
+    assert _sample("ingestion_rows_total", source="metrics_feed", outcome="duplicate") >= 1
+    assert _sample("ingestion_parse_errors_total", source="metrics_feed") == invalid_before + 1
+    assert _sample("ingestion_run_seconds_count", source="metrics_feed") == runs_before + 1
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'ingestion_rows_total{outcome="created",source="metrics_feed"}' in body
+    assert "# TYPE workflow_sync_seconds histogram" in body
+    pending = next(line for line in body.splitlines() if line.startswith("outbox_pending "))
+    assert float(pending.split()[1]) >= 1
+
+
+def test_metrics_token_is_required_when_configured(client, monkeypatch):
+    monkeypatch.setenv("METRICS_TOKEN", "scrape-secret")
+
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
+
+
+def test_metrics_report_the_outbox_collector_down_when_postgres_fails():
+    class _BrokenSession:
+        def execute(self, *_args, **_kwargs):
+            raise OperationalError("SELECT 1", {}, Exception("connection refused"))
+
+        def close(self):
+            pass
+
+    body = render_metrics(_BrokenSession).decode()
+
+    assert "outbox_collector_up 0.0" in body
+    assert "outbox_pending " not in body
+    # The rest of the scrape is still served.
+    assert "# TYPE workflow_sync_seconds histogram" in body
+
+
+def test_metrics_export_latency_samples_through_the_process_registry(client, db_session):
+    action = f"metrics_{uuid4().hex[:8]}.run"
+    record_action_latency(action.split(".")[0], "run", time.perf_counter() - 0.02, error=True)
+    routes_before = _sample("sql_route_queries_count", route="GET /cases")
+
+    assert client.get("/cases", params={"program_key": "foreclosure_prevention"}).status_code == 200
+
+    assert _sample("module_action_seconds_count", action=action) == 1
+    assert _sample("module_action_errors_total", action=action) == 1
+    assert _sample("sql_route_queries_count", route="GET /cases") == routes_before + 1
+    assert _sample("db_pool_checkout_wait_seconds_count", pool="primary") >= 1
+    body = client.get("/metrics").text
+    assert "outbox_collector_up 1.0" in body
+    assert f'module_action_seconds_count{{action="{action}"}} 1.0' in body
+    assert "# TYPE skiptrace_lookup_seconds histogram" in body
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from prometheus_client import REGISTRY
+
+from app.models.cases import Case
+from app.models.enums import CaseStatus
+from app.models.policy_versions import PolicyVersion
+from app.models.role_sessions import RoleSession
+from app.models.users import User, UserRole
+from app.schemas.module_registry import ModuleSpec
+from app.services.module_dispatch_service import module_dispatch_table
+from app.services.module_loader_service import DomainServiceBroker
+from app.services.module_registry_service import ModuleRegistryService
+from auth.auth_handler import create_access_token
+
+
+def _spec(module_name: str, version: str) -> ModuleSpec:
+    return ModuleSpec(
+        module_name=module_name,
+        module_type="housing_operating_system",
+        version=version,
+        permissions=["foreclosure.property.analyze"],
+        required_services=["property_analysis_service"],
+        data_schema={"inputs": {"case_id": "uuid"}},
+        allowed_actions=["analyze_property"],
+    )
+
+
+def test_activation_swaps_the_compiled_module(db_session):
+    compile_module = DomainServiceBroker().compile_module
+    registry = ModuleRegistryService(db_session)
+    module_name = f"dispatch_{uuid4().hex[:8]}"
+
+    first = registry.activate_module(registry.create_module(_spec(module_name, "1.0.0")).id)
+    table = module_dispatch_table(db_session, compile_module)
+    assert table.get(module_name, "1.0.0").routes.keys() == {"analyze_property"}
+    assert module_dispatch_table(db_session, compile_module) is table
+
+    registry.activate_module(registry.create_module(_spec(module_name, "1.1.0")).id)
+    table = module_dispatch_table(db_session, compile_module)
+    assert table.get(module_name, first.version) is None
+    assert table.get(module_name).version == "1.1.0"
+
+
+def test_mounted_dispatcher_serves_modules_activated_after_startup(client, db_session):
+    module_name = f"dispatch_{uuid4().hex[:8]}"
+    user = User(id=uuid4(), email=f"{module_name}@example.com", hashed_password="x", role=UserRole.case_worker)
+    policy = PolicyVersion(
+        id=uuid4(),
+        program_key="dispatch_test",
+        version_tag=module_name,
+        config_json={"permissions": {"actions": {f"modules.{module_name}.analyze_property": ["case_worker"]}}},
+    )
+    db_session.add_all([user, policy])
+    db_session.flush()
+    case = Case(id=uuid4(), status=CaseStatus.intake_submitted, created_by=user.id, policy_version_id=policy.id)
+    db_session.add(case)
+    db_session.add(RoleSession(user_id=user.id, role_name="case_worker", expires_at=datetime.utcnow() + timedelta(hours=1)))
+    db_session.commit()
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+    body = {
+        "case_id": str(case.id),
+        "payload": {"estimated_property_value": 200000, "loan_balance": 150000, "arrears_amount": 4000},
+    }
+    url = f"/modules/{module_name}/actions/analyze_property"
+    assert client.post(url, json=body, headers=headers).status_code == 404
+
+    registry = ModuleRegistryService(db_session)
+    registry.activate_module(registry.create_module(_spec(module_name, "1.0.0")).id)
+
+    response = client.post(url, json=body, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["result"]["equity"] == 50000
+
+    # Undeclared action names from the URL share one metric label.
+    labels = {"action": "modules.unknown", "decision": "deny", "reason": "action_not_allowed_by_policy"}
+    before = REGISTRY.get_sample_value("authorization_decisions_total", labels) or 0.0
+    bogus = f"/modules/{module_name}/actions/made_up_{uuid4().hex[:8]}"
+    assert client.post(bogus, json=body, headers=headers).status_code == 403
+    assert REGISTRY.get_sample_value("authorization_decisions_total", labels) == before + 1
@@ -0,0 +1,170 @@
+from uuid import uuid4
+
+from app.models.audit_logs import AuditLog
+from app.models.case_search_index import CaseSearchIndex
+from app.models.cases import Case
+from app.models.enums import CaseStatus
+from app.models.housing_intelligence import ForeclosureCaseData, PartnerOrganization, PartnerReferral
+from app.models.users import User
+from app.services.partner_routing_service import (
+    PartnerRoutingIndex,
+    PartnerSlot,
+    partner_routing_index,
+    reroute_unassigned_referrals,
+    route_cases_to_partners,
+)
+
+
+def _cases(db_session, count: int, region: str) -> list[Case]:
+    user = User(id=uuid4(), email=f"routing-{uuid4().hex[:6]}@example.com", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+
+    cases = [
+        Case(id=uuid4(), status=CaseStatus.intake_submitted, created_by=user.id, program_key="foreclosure_prevention")
+        for _ in range(count)
+    ]
+    db_session.add_all(cases)
+    db_session.flush()
+    db_session.add_all(
+        ForeclosureCaseData(id=uuid4(), case_id=case.id, property_address=f"{i} Elm St", state=region)
+        for i, case in enumerate(cases)
+    )
+    db_session.commit()
+    return cases
+
+
+def _slot(partner: PartnerOrganization) -> PartnerSlot:
+    return PartnerSlot(
+        partner_id=partner.id,
+        name=partner.name,
+        service_type=partner.service_type,
+        service_region=partner.service_region,
+        capacity=partner.capacity,
+        routing_weight=partner.routing_weight,
+    )
+
+
+def test_bulk_routing_spreads_cases_and_writes_in_batches(db_session):
+    region = f"Z{uuid4().hex[:5]}"
+    cases = _cases(db_session, 30, region)
+    primary = PartnerOrganization(
+        id=uuid4(), name="Primary Defense", service_type="legal_defense", service_region=region, routing_weight=2.0
+    )
+    overflow = PartnerOrganization(
+        id=uuid4(), name="Overflow Defense", service_type="legal_defense", service_region=region, capacity=5
+    )
+    db_session.add_all([primary, overflow])
+    db_session.commit()
+
+    referrals = route_cases_to_partners(
+        db_session,
+        cases=[{"case_id": case.id, "state": region, "routing_category": "legal_defense"} for case in cases],
+        actor_id=None,
+        index=PartnerRoutingIndex([_slot(primary), _slot(overflow)]),
+    )
+    db_session.commit()
+
+    assert len(referrals) == 30
+    by_partner = {partner.id: 0 for partner in (primary, overflow)}
+    for referral in db_session.query(PartnerReferral).filter(PartnerReferral.case_id.in_([c.id for c in cases])):
+        by_partner[referral.partner_organization_id] += 1
+    assert by_partner == {primary.id: 25, overflow.id: 5}
+
+    audits = (
+        db_session.query(AuditLog)
+        .filter(AuditLog.case_id.in_([c.id for c in cases]), AuditLog.action_type == "partner_case_routed")
+        .count()
+    )
+    assert audits == 30
+    routed = db_session.query(CaseSearchIndex.is_routed).filter(CaseSearchIndex.case_id == cases[0].id).scalar()
+    assert routed is True
+
+    depths = {
+        row["partner_organization_id"]: row["queue_depth"]
+        for row in PartnerRoutingIndex.load(db_session).snapshot()
+    }
+    assert depths[str(primary.id)] == 25
+    assert depths[str(overflow.id)] == 5
+
+
+def test_partner_writes_invalidate_the_shared_index(db_session):
+    first = partner_routing_index(db_session)
+    assert partner_routing_index(db_session) is first
+
+    db_session.add(
+        PartnerOrganization(id=uuid4(), name="Fresh Partner", service_type="nonprofit_support", service_region="TX")
+    )
+    db_session.commit()
+
+    assert partner_routing_index(db_session) is not first
+
+
+def test_routing_counts_only_committed_picks_and_queues_cases_past_capacity(db_session):
+    region = f"Z{uuid4().hex[:5]}"
+    cases = _cases(db_session, 3, region)
+    partner = PartnerOrganization(
+        id=uuid4(), name="Small Defense", service_type="legal_defense", service_region=region, capacity=1
+    )
+    db_session.add(partner)
+    db_session.commit()
+    index = PartnerRoutingIndex([_slot(partner)])
+
+    def route(case: Case) -> dict:
+        return route_cases_to_partners(
+            db_session,
+            cases=[{"case_id": case.id, "state": region, "routing_category": "legal_defense"}],
+            actor_id=None,
+            index=index,
+        )[0]
+
+    route(cases[0])
+    db_session.rollback()
+    assert index.snapshot()[0]["queue_depth"] == 0
+
+    assert route(cases[1])["partner_organization_id"] == str(partner.id)
+    db_session.commit()
+    assert index.snapshot()[0]["queue_depth"] == 1
+
+    queued = route(cases[2])
+    db_session.commit()
+    assert queued["partner_organization_id"] is None
+    assert queued["status"] == "unassigned"
+    assert index.snapshot()[0]["queue_depth"] == 1
+
+
+def test_unassigned_referrals_are_rerouted_once_a_partner_has_room(db_session):
+    region = f"Z{uuid4().hex[:5]}"
+    cases = _cases(db_session, 2, region)
+    partner = PartnerOrganization(
+        id=uuid4(), name="Busy Defense", service_type="legal_defense", service_region=region, capacity=1
+    )
+    db_session.add(partner)
+    db_session.commit()
+    index = PartnerRoutingIndex([_slot(partner)])
+
+    routed = route_cases_to_partners(
+        db_session,
+        cases=[{"case_id": case.id, "state": region, "routing_category": "legal_defense"} for case in cases],
+        actor_id=None,
+        index=index,
+    )
+    db_session.commit()
+    assert [row["status"] for row in routed] == ["queued", "unassigned"]
+
+    # Still full: the waiting referral stays unassigned.
+    reroute_unassigned_referrals(db_session, index=index)
+    db_session.commit()
+    waiting = db_session.query(PartnerReferral).filter(PartnerReferral.case_id == cases[1].id).one()
+    assert waiting.status == "unassigned"
+    assert waiting.routing_region == region
+
+    db_session.query(PartnerReferral).filter(PartnerReferral.case_id == cases[0].id).update({"status": "closed"})
+    db_session.commit()
+    summary = reroute_unassigned_referrals(db_session, index=PartnerRoutingIndex.load(db_session))
+    db_session.commit()
+
+    assert summary["referrals_rerouted"] >= 1
+    db_session.refresh(waiting)
+    assert waiting.status == "queued"
+    assert waiting.partner_organization_id == partner.id
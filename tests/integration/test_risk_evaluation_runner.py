@@ -0,0 +1,116 @@
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.models.audit_logs import AuditLog
+from app.models.member_layer import InstallmentStatus, Membership, MembershipInstallment, MembershipStatus
+from app.models.risk_evaluation_runs import RiskEvaluationRun
+from app.models.users import User
+from app.services.risk_evaluation_runner import run_risk_evaluation
+from db.session import SessionLocal
+
+
+def _member_with_missed_installment(db_session) -> Membership:
+    user = User(id=uuid4(), email=f"risk-run-{uuid4().hex[:6]}@example.com", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    membership = Membership(
+        id=uuid4(),
+        user_id=user.id,
+        program_key="homeowner_protection",
+        term_start=date.today(),
+        term_end=date.today() + timedelta(days=365),
+        annual_price_cents=12000,
+        installment_cents=1000,
+        status=MembershipStatus.active,
+        good_standing=True,
+    )
+    db_session.add(membership)
+    db_session.flush()
+    db_session.add(
+        MembershipInstallment(
+            id=uuid4(),
+            membership_id=membership.id,
+            due_date=date.today() - timedelta(days=3),
+            amount_cents=1000,
+            status=InstallmentStatus.missed,
+        )
+    )
+    db_session.commit()
+    return membership
+
+
+def test_parallel_run_escalates_and_completed_run_is_not_repeated(db_session):
+    memberships = [_member_with_missed_installment(db_session) for _ in range(3)]
+    run_key = f"test:{uuid4().hex}"
+
+    summary = run_risk_evaluation(SessionLocal, run_key=run_key, chunk_size=2, max_workers=2)
+
+    assert summary["status"] == "completed"
+    assert summary["processed_memberships"] >= 3
+    assert summary["chunks_completed"] >= 2
+    for membership in memberships:
+        db_session.refresh(membership)
+        assert membership.good_standing is False
+        assert (
+            db_session.query(AuditLog)
+            .filter(
+                AuditLog.action_type == "escalated_due_to_risk",
+                AuditLog.reason_code == f"membership:{membership.id}:escalated_due_to_risk",
+            )
+            .count()
+            == 1
+        )
+
+    again = run_risk_evaluation(SessionLocal, run_key=run_key, chunk_size=2, max_workers=2)
+    assert again == summary
+
+
+def test_failed_run_resumes_from_checkpoint(db_session):
+    membership = _member_with_missed_installment(db_session)
+    run_key = f"test:{uuid4().hex}"
+    db_session.add(
+        RiskEvaluationRun(
+            run_key=run_key,
+            status="failed",
+            chunk_size=500,
+            checkpoint_membership_id=membership.id,
+            chunks_completed=1,
+            processed_memberships=10,
+            error="worker lost",
+        )
+    )
+    db_session.commit()
+
+    summary = run_risk_evaluation(SessionLocal, run_key=run_key, chunk_size=500, max_workers=2)
+
+    assert summary["status"] == "completed"
+    assert summary["processed_memberships"] >= 10
+    db_session.refresh(membership)
+    # Memberships at or before the checkpoint are not evaluated again.
+    assert membership.good_standing is True
+
+
+def test_daily_task_retries_with_the_key_of_its_first_attempt(monkeypatch):
+    from workers.tasks import risk_evaluation
+
+    class Retry(Exception):
+        pass
+
+    retried = {}
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("database went away")
+
+    def retry(**kwargs):
+        retried.update(kwargs)
+        return Retry()
+
+    monkeypatch.setattr(risk_evaluation, "run_singleton_job", fail)
+    monkeypatch.setattr(risk_evaluation, "daily_run_key", lambda: "daily:2026-01-01")
+    monkeypatch.setattr(risk_evaluation.run_daily_risk_evaluation_task, "retry", retry)
+
+    with pytest.raises(Retry):
+        risk_evaluation.run_daily_risk_evaluation_task.run()
+    assert retried["kwargs"] == {"run_key": "daily:2026-01-01"}
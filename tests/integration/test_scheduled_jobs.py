@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+
+from db.session import SessionLocal, engine
+from app.models.audit_logs import AuditLog
+from app.models.cases import Case
+from app.models.enums import CaseStatus
+from app.models.job_runs import JobRun
+from app.models.users import User
+from app.models.workflow import (
+    CaseWorkflowInstance,
+    CaseWorkflowProgress,
+    WorkflowResponsibleRole,
+    WorkflowStep,
+    WorkflowStepStatus,
+    WorkflowTemplate,
+)
+from app.services import scheduled_jobs_service
+from app.services.scheduled_jobs_service import ScheduledJob, _lock_key, job_run_history, run_singleton_job
+from app.services.workflow_engine import sweep_workflow_sla_breaches
+
+
+def _job() -> ScheduledJob:
+    return ScheduledJob(f"test_job_{uuid4().hex[:8]}", "tests.noop", rows_key="rows")
+
+
+def test_singleton_job_records_runs_and_skips_overlaps(db_session, monkeypatch):
+    job = _job()
+    monkeypatch.setitem(scheduled_jobs_service.JOBS, job.name, job)
+
+    summary = run_singleton_job(SessionLocal, job, lambda: {"rows": 42, "at": datetime(2026, 1, 1)}, task_id="t-1", queue="batch")
+    assert summary["status"] == "succeeded"
+    assert summary["rows_processed"] == 42
+    assert summary["result"]["at"].startswith("2026-01-01")
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as holder:
+        holder.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _lock_key(job.name)})
+        ran = []
+        skipped = run_singleton_job(SessionLocal, job, lambda: ran.append(1) or {})
+        holder.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _lock_key(job.name)})
+    assert skipped["status"] == "skipped"
+    assert ran == []
+
+    def broken():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        run_singleton_job(SessionLocal, job, broken)
+
+    history = job_run_history(db_session, job.name)
+    assert [run["status"] for run in history] == ["failed", "skipped", "succeeded"]
+    assert "boom" in history[0]["error"]
+    assert history[2]["queue"] == "batch" and history[2]["duration_ms"] is not None
+    db_session.query(JobRun).filter(JobRun.job_name == job.name).delete()
+    db_session.commit()
+
+
+def test_sla_sweep_flags_each_breached_step_once(db_session):
+    user = User(id=uuid4(), email=f"sla-{uuid4().hex[:6]}@example.com", hashed_password="x")
+    case = Case(id=uuid4(), status=CaseStatus.intake_submitted, created_by=user.id, program_key="foreclosure_prevention")
+    template = WorkflowTemplate(id=uuid4(), program_key=f"sla_{uuid4().hex[:6]}", name="SLA test")
+    db_session.add(user)
+    db_session.flush()
+    db_session.add_all([case, template])
+    db_session.flush()
+    db_session.add_all(
+        WorkflowStep(
+            template_id=template.id,
+            step_key=key,
+            display_name=key,
+            responsible_role=WorkflowResponsibleRole.system,
+            kanban_column=key,
+            order_index=index,
+            sla_days=5,
+        )
+        for index, key in enumerate(("intake", "review"), start=1)
+    )
+    instance = CaseWorkflowInstance(id=uuid4(), case_id=case.id, template_id=template.id, current_step_key="intake")
+    db_session.add(instance)
+    db_session.flush()
+    now = datetime.now(timezone.utc)
+    db_session.add_all(
+        [
+            CaseWorkflowProgress(
+                instance_id=instance.id, step_key="intake", status=WorkflowStepStatus.blocked, started_at=now - timedelta(days=9)
+            ),
+            CaseWorkflowProgress(
+                instance_id=instance.id, step_key="review", status=WorkflowStepStatus.active, started_at=now - timedelta(days=5)
+            ),
+        ]
+    )
+    db_session.commit()
+
+    first = sweep_workflow_sla_breaches(db_session)
+    db_session.commit()
+    second = sweep_workflow_sla_breaches(db_session)
+    db_session.commit()
+
+    assert first["breaches_flagged"] >= 1
+    assert second["breaches_flagged"] == 0
+    audit = (
+        db_session.query(AuditLog)
+        .filter(AuditLog.case_id == case.id, AuditLog.action_type == "workflow_sla_breached")
+        .one()
+    )
+    assert audit.reason_code == "sla_breach:intake"
+    assert audit.after_state["days_open"] == 9
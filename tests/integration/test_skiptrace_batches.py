@@ -0,0 +1,95 @@
+import asyncio
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.models.audit_logs import AuditLog
+from app.models.cases import Case
+from app.models.enums import CaseStatus
+from app.models.housing_intelligence import ForeclosureCaseData
+from app.models.users import User
+from app.services.skiptrace_batch_service import (
+    run_skiptrace_batch,
+    skiptrace_cases,
+    skiptrace_cases_async,
+    submit_skiptrace_batch,
+)
+from db.session import ASYNC_DATABASE_URL, SessionLocal
+
+
+def _cases(db_session, addresses: list[str]) -> list:
+    user = User(id=uuid4(), email=f"skiptrace-{uuid4().hex[:6]}@example.com", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+
+    case_ids = []
+    for address in addresses:
+        case = Case(id=uuid4(), status=CaseStatus.intake_submitted, created_by=user.id, program_key="foreclosure_prevention")
+        db_session.add(case)
+        db_session.flush()
+        db_session.add(ForeclosureCaseData(id=uuid4(), case_id=case.id, property_address=address, city="Dallas", state="TX"))
+        case_ids.append(case.id)
+    db_session.commit()
+    return case_ids
+
+
+def test_batch_dedupes_addresses_and_reuses_cached_results(db_session):
+    token = uuid4().hex[:8]
+    case_ids = _cases(db_session, [f"{token} Main Street", f"{token} main st.", f"{token} Elm Avenue"])
+
+    first = submit_skiptrace_batch(db_session, case_ids=case_ids, provider="propstream")
+    db_session.commit()
+    summary = run_skiptrace_batch(SessionLocal, first.id, chunk_size=2)
+
+    assert summary["status"] == "completed"
+    assert summary["resolved_cases"] == 3
+    assert summary["provider_calls"] == 2
+    assert summary["cache_hits"] == 0
+    assert db_session.query(AuditLog).filter(
+        AuditLog.case_id.in_(case_ids),
+        AuditLog.reason_code == "skiptrace_batch_lookup",
+    ).count() == 3
+
+    second = submit_skiptrace_batch(db_session, case_ids=case_ids, provider="propstream")
+    db_session.commit()
+    repeat = run_skiptrace_batch(SessionLocal, second.id)
+    assert (repeat["provider_calls"], repeat["cache_hits"]) == (0, 3)
+
+
+def test_batch_records_cases_without_profiles(db_session):
+    case_ids = _cases(db_session, [f"{uuid4().hex[:8]} Pine Road"])
+    missing = uuid4()
+
+    batch = submit_skiptrace_batch(db_session, case_ids=[*case_ids, missing])
+    db_session.commit()
+    summary = run_skiptrace_batch(SessionLocal, batch.id)
+
+    assert (summary["resolved_cases"], summary["failed_cases"]) == (1, 1)
+    assert summary["errors"] == {str(missing): "Foreclosure profile not found"}
+    db_session.refresh(batch)
+    assert batch.status == "completed"
+
+
+def test_skiptrace_cases_from_a_running_loop(db_session):
+    token = uuid4().hex[:8]
+    sync_case, async_case = _cases(db_session, [f"{token} Cedar Court", f"{token} Birch Drive"])
+
+    async def handler() -> tuple[dict, dict]:
+        # The sync entry point must not trip over the running loop; async callers await.
+        sync_outcome = skiptrace_cases(db_session, case_ids=[sync_case], provider="peopledatalabs")
+        db_session.commit()
+        engine = create_async_engine(ASYNC_DATABASE_URL, poolclass=NullPool)
+        try:
+            async with AsyncSession(engine) as session:
+                async_outcome = await skiptrace_cases_async(session, case_ids=[async_case], provider="peopledatalabs")
+                await session.commit()
+        finally:
+            await engine.dispose()
+        return sync_outcome, async_outcome
+
+    sync_outcome, async_outcome = asyncio.run(handler())
+    assert set(sync_outcome["results"]) == {str(sync_case)}
+    assert set(async_outcome["results"]) == {str(async_case)}
+    assert async_outcome["provider_calls"] == 1
+    assert db_session.query(AuditLog).filter(AuditLog.case_id.in_([sync_case, async_case])).count() == 2
@@ -0,0 +1,115 @@
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.exc import ProgrammingError
+
+from auth.auth_handler import create_access_token
+from app.models.cases import Case
+from app.models.enums import CaseStatus
+from app.models.housing_intelligence import ForeclosureCaseData
+from app.models.users import User, UserRole
+from app.services.sql_profiler import (
+    QUERY_COUNT_HEADER,
+    QueryLog,
+    profile_queries,
+    record_request,
+    reset_route_query_stats,
+    route_query_stats,
+)
+
+
+def test_profile_queries_flags_repeated_statements(db_session, monkeypatch):
+    monkeypatch.setenv("SQL_N_PLUS_ONE_THRESHOLD", "5")
+    reset_route_query_stats()
+
+    with profile_queries() as log:
+        db_session.execute(select(Case.id).limit(1)).all()
+        for _ in range(6):
+            db_session.execute(select(User.email).where(User.id == uuid4())).all()
+
+    assert log.count == 7
+    assert log.db_ms > 0
+    [(statement, seen)] = log.repeated().items()
+    assert seen == 6 and "FROM users" in statement
+
+    # Queries outside the block are not counted.
+    db_session.execute(select(Case.id).limit(1)).all()
+    assert log.count == 7
+
+    record_request("GET /example/{id}", log)
+    stats = route_query_stats()["routes"]["GET /example/{id}"]
+    assert stats["requests"] == 1
+    assert stats["n_plus_one_requests"] == 1
+    assert stats["repeated_statements"][0]["count"] == 6
+
+
+def test_middleware_reports_per_request_query_counts(client, db_session, query_budget):
+    reset_route_query_stats()
+    user = User(id=uuid4(), email=f"profiler-{uuid4().hex[:8]}@example.com", hashed_password="x", role=UserRole.admin)
+    db_session.add(user)
+    db_session.flush()
+    token = uuid4().hex[:8]
+    case = Case(
+        id=uuid4(),
+        status=CaseStatus.intake_submitted,
+        created_by=user.id,
+        program_key="foreclosure_prevention",
+        meta={"full_name": "Profiled Owner"},
+    )
+    db_session.add(case)
+    db_session.flush()
+    db_session.add(ForeclosureCaseData(id=uuid4(), case_id=case.id, property_address=f"{token} Elm", city="Dallas", state="TX"))
+    db_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+    listed = client.get("/foreclosure/workspace/cases", params={"search": token}, headers=headers)
+    assert listed.status_code == 200
+    # Current user, ranked search, one hydrate query; no per-row lookups.
+    assert query_budget(listed, 4) >= 2
+    assert listed.headers["server-timing"].startswith("db;dur=")
+
+    assert query_budget(client.get("/cases", params={"program_key": "foreclosure_prevention"}), 1) == 1
+
+    profile = client.get("/admin/system/sql-profile", headers=headers).json()
+    route = profile["routes"]["GET /foreclosure/workspace/cases"]
+    assert route["requests"] == 1
+    assert route["n_plus_one_requests"] == 0
+    assert "GET /cases" in profile["routes"]
+
+
+def test_query_log_counts_statements_from_many_threads():
+    log = QueryLog()
+
+    def issue(_):
+        for _ in range(1000):
+            log.record("SELECT 1", 0.5)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(issue, range(8)))
+
+    assert log.count == 8000
+    assert log.statements["SELECT 1"] == 8000
+    assert round(log.db_ms) == 4000
+
+
+def test_query_count_headers_are_opt_in(client, monkeypatch):
+    monkeypatch.setenv("SQL_PROFILING_HEADERS", "false")
+    response = client.get("/cases", params={"program_key": "foreclosure_prevention"})
+
+    assert response.status_code == 200
+    assert QUERY_COUNT_HEADER not in response.headers
+    assert "server-timing" not in response.headers
+
+
+def test_failed_statements_do_not_leave_start_times_on_the_connection(db_session):
+    with profile_queries() as log:
+        with pytest.raises(ProgrammingError):
+            db_session.execute(text("SELECT * FROM no_such_table_for_profiler"))
+        db_session.rollback()
+        connection = db_session.connection()
+        db_session.execute(select(Case.id).limit(1)).all()
+
+    assert connection.info.get("sql_profiler_started") == []
+    assert log.count == 1
@@ -0,0 +1,111 @@
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+from app.models.member_layer import (
+    InstallmentStatus,
+    Membership,
+    MembershipInstallment,
+    MembershipStabilityCounters,
+    MembershipStatus,
+    StabilityAssessment,
+)
+from app.models.users import User
+from app.services.stability_service import bulk_recalculate_stability, recalculate_stability
+
+
+PROGRAM_KEY = "homeowner_protection"
+
+
+def _membership_with_installments(db_session, statuses):
+    user = User(id=uuid4(), email=f"counters-{uuid4().hex[:6]}@example.com", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+
+    membership = Membership(
+        id=uuid4(),
+        user_id=user.id,
+        program_key=PROGRAM_KEY,
+        term_start=date.today(),
+        term_end=date.today() + timedelta(days=365),
+        annual_price_cents=12000,
+        installment_cents=1000,
+        status=MembershipStatus.active,
+        good_standing=True,
+    )
+    db_session.add(membership)
+    db_session.flush()
+
+    installments = [
+        MembershipInstallment(
+            id=uuid4(),
+            membership_id=membership.id,
+            due_date=date.today() - timedelta(days=30 * index),
+            amount_cents=1000,
+            status=status,
+        )
+        for index, status in enumerate(statuses)
+    ]
+    db_session.add_all(installments)
+    db_session.commit()
+    return user, membership, installments
+
+
+def test_counters_follow_installment_transitions(db_session):
+    user, membership, installments = _membership_with_installments(
+        db_session,
+        [InstallmentStatus.due, InstallmentStatus.due, InstallmentStatus.missed],
+    )
+    counters = db_session.get(MembershipStabilityCounters, membership.id)
+    assert (counters.paid_on_time_count, counters.paid_late_count, counters.missed_count) == (0, 0, 1)
+
+    # Loaded in this transaction: applied as an incremental delta.
+    on_time = db_session.get(MembershipInstallment, installments[0].id)
+    assert on_time.status == InstallmentStatus.due
+    on_time.status = InstallmentStatus.paid_cash
+    on_time.paid_at = datetime.now(timezone.utc)
+
+    # Expired after commit: previous state unknown, so the membership is recounted.
+    late = installments[1]
+    late.status = InstallmentStatus.paid_cash
+    late.paid_at = datetime.now(timezone.utc)
+
+    assessment = recalculate_stability(db_session, user.id, PROGRAM_KEY)
+    db_session.commit()
+
+    db_session.refresh(counters)
+    assert (counters.paid_on_time_count, counters.paid_late_count, counters.missed_count) == (1, 1, 1)
+    assert assessment.stability_score == 70 + 5 + 2 - 10
+    assert assessment.breakdown_json["paid_late_count"] == 1
+    assert membership.good_standing is True
+
+    db_session.delete(installments[2])
+    db_session.commit()
+    db_session.refresh(counters)
+    assert counters.missed_count == 0
+
+
+def test_bulk_recalculate_matches_incremental_score(db_session):
+    user, membership, _ = _membership_with_installments(
+        db_session,
+        [InstallmentStatus.missed, InstallmentStatus.missed, InstallmentStatus.missed],
+    )
+
+    # Drift the counters as a raw bulk import would; the recount repairs them.
+    counters = db_session.get(MembershipStabilityCounters, membership.id)
+    counters.missed_count = 0
+    db_session.commit()
+
+    assert bulk_recalculate_stability(db_session, program_key=PROGRAM_KEY) >= 1
+    db_session.commit()
+
+    latest = (
+        db_session.query(StabilityAssessment)
+        .filter(StabilityAssessment.user_id == user.id, StabilityAssessment.program_key == PROGRAM_KEY)
+        .one()
+    )
+    assert latest.stability_score == 40
+    assert latest.breakdown_json["source"] == "bulk_recalculation"
+    db_session.refresh(membership)
+    assert membership.good_standing is False
+    assert recalculate_stability(db_session, user.id, PROGRAM_KEY).stability_score == 40
+    db_session.rollback()
@@ -0,0 +1,68 @@
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.exc import OperationalError
+
+from api.route_groups import ALWAYS_ENABLED_GROUP, enabled_route_groups, include_route_groups
+from app.services import startup_service
+from app.services.startup_service import StartupBootstrap
+
+
+def test_health_endpoints_report_ready_after_bootstrap(client):
+    assert client.get("/health/live").json() == {"status": "ok"}
+
+    ready = client.get("/health/ready")
+    assert ready.status_code == 200
+    body = ready.json()
+    assert body["ready"] is True
+    assert body["checks"]["database"] == "ok"
+    assert body["checks"]["bootstrap"]["status"] == "ready"
+
+
+def test_bootstrap_retries_until_the_database_is_reachable(monkeypatch):
+    monkeypatch.setenv("STARTUP_RETRY_SECONDS", "0")
+    calls = []
+
+    def flaky_steps(app, db):
+        calls.append(app)
+        if len(calls) == 1:
+            raise OperationalError("SELECT 1", {}, Exception("connection refused"))
+
+    monkeypatch.setattr(startup_service, "_bootstrap_steps", flaky_steps)
+    bootstrap = StartupBootstrap(FastAPI())
+    assert not bootstrap.ready
+
+    bootstrap.start()
+    assert bootstrap.wait(timeout=5)
+    assert bootstrap.ready
+    assert bootstrap.attempts == 2
+    assert "connection refused" in bootstrap.last_error
+
+
+def test_bootstrap_fails_on_non_database_errors(monkeypatch):
+    def broken_steps(app, db):
+        raise RuntimeError("bad module spec")
+
+    monkeypatch.setattr(startup_service, "_bootstrap_steps", broken_steps)
+    bootstrap = StartupBootstrap(FastAPI())
+    bootstrap.start()
+    assert bootstrap.wait(timeout=5)
+    assert bootstrap.snapshot()["status"] == "failed"
+    assert bootstrap.attempts == 1
+
+
+def test_route_groups_limit_the_routers_a_process_serves(monkeypatch):
+    monkeypatch.setenv("API_ROUTE_GROUPS", "partner")
+    groups = enabled_route_groups()
+    assert groups == {"partner", ALWAYS_ENABLED_GROUP}
+
+    app = FastAPI()
+    profile = include_route_groups(app, groups)
+    assert {entry["group"] for entry in profile} == groups
+    paths = {route.path for route in app.routes}
+    assert "/partner/v1/cases/{case_id}/status" in paths
+    assert "/health/ready" in paths and "/metrics" in paths
+    assert not any(path.startswith("/admin") for path in paths)
+
+    monkeypatch.setenv("API_ROUTE_GROUPS", "partner,reports")
+    with pytest.raises(ValueError, match="reports"):
+        enabled_route_groups()
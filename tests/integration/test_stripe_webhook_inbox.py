@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete
+
+from app.models.stripe_webhook_events import StripeWebhookEvent
+from app.services.stripe_webhook_inbox_service import (
+    claim_stripe_events,
+    drain_stripe_webhook_inbox,
+    enqueue_stripe_event,
+    release_stale_stripe_events,
+)
+from db.session import SessionLocal
+
+
+@pytest.fixture
+def customers(db_session):
+    """Fresh customer ids; claims and drains are scoped to them and their rows removed afterwards."""
+    created: list[str] = []
+
+    def make() -> str:
+        created.append(f"cus_{uuid4().hex[:8]}")
+        return created[-1]
+
+    yield make
+    db_session.rollback()
+    db_session.execute(delete(StripeWebhookEvent).where(StripeWebhookEvent.stripe_customer_id.in_(created)))
+    db_session.commit()
+
+
+def _event(customer: str, invoice: str, created: int) -> dict:
+    return {
+        "id": f"evt_{uuid4().hex}",
+        "type": "invoice.payment_succeeded",
+        "created": created,
+        "data": {"object": {"id": invoice, "customer": customer, "amount_paid": 1000}},
+    }
+
+
+def test_inbox_dedupes_and_claims_one_event_per_customer_in_order(db_session, customers):
+    customer = customers()
+    other = customers()
+    second = _event(customer, f"in_{uuid4().hex[:8]}", 1700000200)
+    first = _event(customer, f"in_{uuid4().hex[:8]}", 1700000100)
+    elsewhere = _event(other, f"in_{uuid4().hex[:8]}", 1700000300)
+
+    assert enqueue_stripe_event(db_session, second) is True
+    assert enqueue_stripe_event(db_session, first) is True
+    assert enqueue_stripe_event(db_session, elsewhere) is True
+    assert enqueue_stripe_event(db_session, first) is False
+    db_session.commit()
+
+    claimed = claim_stripe_events(db_session, batch_size=10, customer_ids=[customer, other])
+    db_session.commit()
+    events = {e.id: e for e in db_session.query(StripeWebhookEvent).filter(StripeWebhookEvent.id.in_(claimed))}
+    assert {e.stripe_event_id for e in events.values()} == {first["id"], elsewhere["id"]}
+
+    # The customer's later event waits while the earlier one is in flight.
+    assert claim_stripe_events(db_session, batch_size=10, customer_ids=[customer, other]) == []
+    db_session.rollback()
+
+
+def test_drain_retries_unmatched_invoice_with_backoff(db_session, customers):
+    customer = customers()
+    event = _event(customer, f"in_missing_{uuid4().hex[:8]}", 1700000000)
+    enqueue_stripe_event(db_session, event)
+    db_session.commit()
+
+    summary = drain_stripe_webhook_inbox(SessionLocal, max_workers=2, customer_ids=[customer])
+    assert summary["retrying"] == 1
+
+    row = db_session.query(StripeWebhookEvent).filter_by(stripe_event_id=event["id"]).one()
+    assert row.status == "pending"
+    assert row.attempts == 1
+    assert "Installment not found" in row.last_error
+    assert row.available_at > row.received_at
+
+
+def test_stale_claims_are_released_until_attempts_run_out(db_session, customers):
+    retryable = customers()
+    poison = customers()
+    stale_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    for customer in (retryable, poison):
+        enqueue_stripe_event(db_session, _event(customer, f"in_{uuid4().hex[:8]}", 1700000000))
+    db_session.commit()
+    ours = StripeWebhookEvent.stripe_customer_id.in_([retryable, poison])
+    for row in db_session.query(StripeWebhookEvent).filter(ours):
+        row.status = "processing"
+        row.locked_at = stale_at
+        row.attempts = row.max_attempts if row.stripe_customer_id == poison else 1
+    db_session.commit()
+
+    assert release_stale_stripe_events(db_session, customer_ids=[retryable, poison]) == {"released": 1, "timed_out": 1}
+    db_session.commit()
+
+    rows = {row.stripe_customer_id: row for row in db_session.query(StripeWebhookEvent).filter(ours)}
+    assert rows[retryable].status == "pending"
+    assert rows[poison].status == "failed"
+    assert "timed out" in rows[poison].last_error
@@ -7,6 +7,8 @@ from uuid import uuid4
 from app.models.audit_logs import AuditLog
 from app.models.member_layer import InstallmentStatus, Membership, MembershipInstallment, MembershipStatus, StabilityAssessment
 from app.models.users import User
+from app.services.stripe_webhook_inbox_service import drain_stripe_webhook_inbox
+from db.session import SessionLocal
 
 
 def _stripe_sig(secret: str, payload: bytes, timestamp: str = "1700000000") -> str:
@@ -74,6 +76,8 @@ def test_stripe_webhook_settlement_idempotent(client, db_session, monkeypatch):
     r1 = client.post("/webhooks/stripe", data=body, headers=headers)
     assert r1.status_code == 200
     assert r1.json()["status"] == "ok"
+    assert r1.json()["queued"] is True
+    drain_stripe_webhook_inbox(SessionLocal, max_workers=1)
 
     db_session.refresh(installment)
     db_session.refresh(membership)
@@ -100,6 +104,8 @@ def test_stripe_webhook_settlement_idempotent(client, db_session, monkeypatch):
     r2 = client.post("/webhooks/stripe", data=body, headers=headers)
     assert r2.status_code == 200
     assert r2.json()["status"] == "ok"
+    assert r2.json()["queued"] is False
+    drain_stripe_webhook_inbox(SessionLocal, max_workers=1)
 
     assert (
         db_session.query(StabilityAssessment)
@@ -0,0 +1,50 @@
+from datetime import date
+
+from app.services.impact_rollup_service import build_daily_facts, roll_up_weekly, week_start
+
+
+VALUE_MAP = {
+    "VA_HOME_LOAN": 15000.0,
+    "VA_FORECLOSURE_ASSISTANCE": 12000.0,
+}
+
+
+def test_build_daily_facts_splits_discovery_and_claims():
+    discovered = [
+        (date(2026, 3, 2), "TX", "VA_HOME_LOAN", 2),
+        (date(2026, 3, 2), None, "VA_FORECLOSURE_ASSISTANCE", 1),
+    ]
+    claimed = [
+        (date(2026, 3, 4), "TX", "VA_FORECLOSURE_ASSISTANCE", "APPROVED", True, 1),
+        (date(2026, 3, 4), "TX", "VA_HOME_LOAN", "SUBMITTED", False, 1),
+    ]
+
+    facts = build_daily_facts(discovered, claimed, value_map=VALUE_MAP)
+
+    tx_discovered = facts[(date(2026, 3, 2), "TX")]
+    assert tx_discovered["benefits_discovered"] == 2
+    assert tx_discovered["benefit_value_discovered"] == 30000.0
+    assert facts[(date(2026, 3, 2), "UNKNOWN")]["benefits_discovered"] == 1
+
+    tx_claimed = facts[(date(2026, 3, 4), "TX")]
+    assert tx_claimed["benefits_claimed"] == 2
+    assert tx_claimed["benefit_value_unlocked"] == 12000.0
+    assert tx_claimed["foreclosure_prevention_claims"] == 1
+
+
+def test_roll_up_weekly_groups_days_by_monday():
+    daily = build_daily_facts(
+        [
+            (date(2026, 3, 2), "TX", "VA_HOME_LOAN", 1),
+            (date(2026, 3, 8), "TX", "VA_HOME_LOAN", 1),
+            (date(2026, 3, 9), "TX", "VA_HOME_LOAN", 1),
+        ],
+        [],
+        value_map=VALUE_MAP,
+    )
+
+    weekly = roll_up_weekly(daily)
+
+    assert week_start(date(2026, 3, 8)) == date(2026, 3, 2)
+    assert weekly[(date(2026, 3, 2), "TX")]["benefits_discovered"] == 2
+    assert weekly[(date(2026, 3, 9), "TX")]["benefit_value_discovered"] == 15000.0
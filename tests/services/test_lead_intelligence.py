@@ -1,7 +1,9 @@
+from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from uuid import uuid4
 
 from app.services.lead_intelligence_service import deduplicate_leads, ingest_leads, score_property_lead
+from app.services.lead_scoring_service import LeadColumns, lead_grade, score_columns
 
 
 class _Query:
@@ -70,3 +72,20 @@ def test_score_property_lead_returns_grade(monkeypatch):
     db = _DB({"PropertyLead": [lead], "PolicyVersion": [policy]})
     result = score_property_lead(db, lead_id=lead.id)
     assert result["grade"] in {"A", "B", "C"}
+
+
+def test_score_columns_applies_each_rule_per_lead():
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    leads = [
+        SimpleNamespace(id=uuid4(), foreclosure_stage="Auction_Scheduled", tax_delinquent="true", equity_estimate=90000,
+                        auction_date=now + timedelta(days=10), owner_occupancy="true"),
+        SimpleNamespace(id=uuid4(), foreclosure_stage="notice_of_default", tax_delinquent="false", equity_estimate=None,
+                        auction_date=now + timedelta(days=90), owner_occupancy="true"),
+        SimpleNamespace(id=uuid4(), foreclosure_stage=None, tax_delinquent=None, equity_estimate=50000,
+                        auction_date=None, owner_occupancy="false"),
+    ]
+
+    scores = score_columns(LeadColumns.from_leads(leads, now=now))
+
+    assert scores == [95.0, 30.0, 0.0]
+    assert [lead_grade(score) for score in scores] == ["A", "C", "C"]
@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.ai_orchestration_service import handle_mufasa_question
+from app.services.llm_gateway import LLMGateway, StubBackend, normalize_prompt, set_llm_gateway
+
+
+class _Query:
+    def order_by(self, *_args, **_kwargs):
+        return self
+
+    def all(self):
+        return []
+
+
+class _DB:
+    def query(self, _model):
+        return _Query()
+
+
+def _ask(gateway: LLMGateway, prompt: str, context_version: str = "v1") -> str:
+    return gateway.complete(system_prompt="system", prompt=prompt, context="{}", context_version=context_version)
+
+
+def test_equivalent_prompts_share_one_cached_completion():
+    backend = StubBackend()
+    gateway = LLMGateway(backend)
+    try:
+        first = _ask(gateway, "What does this platform do?")
+        assert _ask(gateway, "  what does this PLATFORM do ") == first
+        _ask(gateway, "What does this platform do?", context_version="v2")
+
+        stats = gateway.stats()
+        assert backend.calls == 2
+        assert stats["cache_hits"] == 1
+        assert stats["tokens_saved"] > 0
+        assert normalize_prompt("Who, exactly?") == "who exactly"
+    finally:
+        gateway.close()
+
+
+def test_prompts_in_other_scripts_keep_their_own_cache_entries():
+    backend = StubBackend()
+    gateway = LLMGateway(backend)
+    try:
+        _ask(gateway, "什么是止赎？")
+        _ask(gateway, "如何申请援助？")
+        _ask(gateway, "什么是止赎?")
+
+        assert backend.calls == 2
+        assert gateway.stats()["cache_hits"] == 1
+        assert normalize_prompt("¿Qué es la Ejecución?") == "qué es la ejecución"
+        assert normalize_prompt("Rate: 5.5%") != normalize_prompt("Rate: 5 5")
+    finally:
+        gateway.close()
+
+
+def test_concurrent_identical_prompts_are_coalesced():
+    backend = StubBackend(latency_seconds=0.2)
+    gateway = LLMGateway(backend, max_concurrency=2)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            answers = list(pool.map(lambda _: _ask(gateway, "Run investor demo"), range(8)))
+
+        stats = gateway.stats()
+        assert len(set(answers)) == 1
+        assert backend.calls == 1
+        assert stats["coalesced"] + stats["cache_hits"] == 7
+        assert stats["hit_rate"] == 0.875
+    finally:
+        gateway.close()
+
+
+def test_mufasa_question_answers_through_the_gateway():
+    gateway = LLMGateway(StubBackend())
+    set_llm_gateway(gateway)
+    try:
+        answer = handle_mufasa_question("How are partners routed?", _DB())
+        assert answer.startswith("[gpt-4o-mini stub] User question: How are partners routed?")
+        handle_mufasa_question("how are partners routed", _DB())
+        assert gateway.stats()["cache_hits"] == 1
+    finally:
+        set_llm_gateway(None)
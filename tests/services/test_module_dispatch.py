@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.module_dispatch_service import module_action_stats, record_action_latency, reset_module_action_stats
+from app.services.module_loader_service import DomainServiceBroker
+
+
+def _module(**overrides):
+    values = {
+        "id": uuid4(),
+        "module_name": "housing_os",
+        "version": "1.0.0",
+        "allowed_actions": ["analyze_property", "route_case_partner", "teleport_case"],
+        "required_services": ["property_analysis_service"],
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_compiled_module_keeps_the_broker_error_contract():
+    compiled = DomainServiceBroker().compile_module(_module())
+
+    assert sorted(compiled.routes) == ["analyze_property"]
+    for action_name, status_code in (("teleport_case", 501), ("route_case_partner", 400), ("delete_case", 403)):
+        with pytest.raises(HTTPException) as exc:
+            compiled.resolve(action_name)
+        assert exc.value.status_code == status_code
+
+    result = DomainServiceBroker().execute_action(
+        None,
+        module=compiled,
+        action_name="analyze_property",
+        payload={"estimated_property_value": 200000, "loan_balance": 150000, "arrears_amount": 4000},
+        case_id=uuid4(),
+    )
+    assert result["equity"] == 50000
+
+
+def test_action_latency_is_recorded_per_module_action():
+    reset_module_action_stats()
+    record_action_latency("housing_os", "analyze_property", 0.0, error=False)
+    record_action_latency("housing_os", "analyze_property", 0.0, error=True)
+
+    stats = module_action_stats()["housing_os.analyze_property"]
+    assert stats["calls"] == 2
+    assert stats["errors"] == 1
+    assert stats["latency"]["count"] == 2
@@ -1,9 +1,10 @@
+from collections import Counter
 from types import SimpleNamespace
 from uuid import uuid4
 
 from app.services.foreclosure_intelligence_service import calculate_case_priority, create_foreclosure_profile
 from app.services.membership_service import create_membership
-from app.services.partner_routing_service import route_case_to_partner
+from app.services.partner_routing_service import PartnerRoutingIndex, PartnerSlot, route_case_to_partner
 from app.services.property_analysis_service import (
     calculate_acquisition_score,
     calculate_equity,
@@ -36,6 +37,7 @@ class _DB:
     def __init__(self, model_map):
         self.model_map = model_map
         self.added = []
+        self.info = {}
 
     def query(self, model):
         return _Query(self.model_map.get(model.__name__, []))
@@ -85,8 +87,65 @@ def test_partner_routing_logic():
     case_id = uuid4()
     partner = SimpleNamespace(id=uuid4())
     db = _DB({"PartnerOrganization": [partner]})
-    referral = route_case_to_partner(db, case_id=case_id, state="TX", routing_category="legal_defense", actor_id=uuid4())
+    index = PartnerRoutingIndex(
+        [
+            PartnerSlot(
+                partner_id=partner.id,
+                name="Lone Star Legal",
+                service_type="legal_defense",
+                service_region="TX",
+                capacity=None,
+                routing_weight=1.0,
+            )
+        ]
+    )
+    referral = route_case_to_partner(
+        db, case_id=case_id, state="TX", routing_category="legal_defense", actor_id=uuid4(), index=index
+    )
     assert str(referral.case_id) == str(case_id)
+    assert referral.partner_organization_id == partner.id
+
+
+def test_partner_routing_index_balances_by_weight_and_capacity():
+    heavy, light, full = uuid4(), uuid4(), uuid4()
+    index = PartnerRoutingIndex(
+        [
+            PartnerSlot(heavy, "Heavy", "legal_defense", "TX", capacity=None, routing_weight=3.0),
+            PartnerSlot(light, "Light", "legal_defense", None, capacity=None, routing_weight=1.0),
+            PartnerSlot(full, "Full", "legal_defense", "TX", capacity=2, routing_weight=10.0, queue_depth=2),
+        ]
+    )
+
+    pending = Counter()
+    picks = [index.select("legal_defense", "TX", pending).partner_id for _ in range(8)]
+
+    assert picks.count(heavy) == 6
+    assert picks.count(light) == 2
+    assert full not in picks
+    assert pending == Counter(picks)
+    assert index.select("legal_defense", "CA").partner_id == light
+    assert index.select("loan_modification", "TX") is None
+
+    # Picks only reach the queue depths once recorded after their commit.
+    assert {row["name"]: row["queue_depth"] for row in index.snapshot()} == {"Heavy": 0, "Light": 0, "Full": 2}
+    index.record(pending)
+    assert {row["name"]: row["queue_depth"] for row in index.snapshot()} == {"Heavy": 6, "Light": 2, "Full": 2}
+
+
+def test_partner_routing_index_leaves_referrals_unassigned_when_everyone_is_full():
+    full = uuid4()
+    index = PartnerRoutingIndex(
+        [PartnerSlot(full, "Full", "legal_defense", "TX", capacity=1, routing_weight=1.0, queue_depth=1)]
+    )
+    db = _DB({"PartnerOrganization": []})
+
+    referral = route_case_to_partner(
+        db, case_id=uuid4(), state="TX", routing_category="legal_defense", actor_id=None, index=index
+    )
+
+    assert referral.partner_organization_id is None
+    assert referral.status == "unassigned"
+    assert index.serves("legal_defense", "TX")
 
 
 def test_portfolio_tracking_summary():
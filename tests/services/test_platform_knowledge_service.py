@@ -1,4 +1,10 @@
-from app.services.platform_knowledge_service import PlatformKnowledgeService
+from app.services.module_dispatch_service import invalidate_module_dispatch_table
+from app.services.platform_knowledge_service import (
+    MAX_PROMPT_CONTEXT_CHARS,
+    PlatformKnowledgeService,
+    invalidate_knowledge_snapshot,
+    knowledge_snapshot,
+)
 
 
 class _Query:
@@ -28,3 +34,17 @@ def test_platform_knowledge_service_core_methods():
     assert "architecture_report" in architecture
     assert isinstance(modules, list)
     assert domain["domain"] == "foreclosure_intelligence"
+
+
+def test_knowledge_snapshot_is_reused_until_the_registry_changes():
+    invalidate_knowledge_snapshot()
+    snapshot = knowledge_snapshot(_DB())
+
+    assert knowledge_snapshot(_DB()) is snapshot
+    assert len(snapshot.prompt_context(investor_mode=True)) <= MAX_PROMPT_CONTEXT_CHARS
+    assert snapshot.domain_services("partner_routing") == ["partner_routing_service"]
+
+    invalidate_module_dispatch_table()
+    rebuilt = knowledge_snapshot(_DB())
+    assert rebuilt is not snapshot
+    assert rebuilt.version == snapshot.version
@@ -1,5 +1,8 @@
+import asyncio
+import time
 from uuid import uuid4
 
+from app.services import skiptrace_service
 from app.services.skiptrace_service import skiptrace_case_owner, skiptrace_property_owner
 
 
@@ -14,3 +17,100 @@ def test_skiptrace_case_owner_normalized():
     result = skiptrace_case_owner(case_id=case_id, address="123 Main St", provider="propstream")
     assert result["case_id"] == str(case_id)
     assert isinstance(result.get("emails"), list)
+
+
+def test_normalize_address_collapses_formatting_variants():
+    from app.services.skiptrace_batch_service import normalize_address
+
+    assert normalize_address("123 Main Street,", "Dallas", "TX") == normalize_address("123  MAIN st", "dallas", "tx")
+    assert normalize_address("9 North Oak Avenue") == "9 n oak ave"
+
+
+def _incomplete_adapter(address: str) -> dict:
+    return {"owner_name": f"Owner of {address}", "phones": [], "emails": []}
+
+
+async def _slow_adapter(address: str) -> dict:
+    await asyncio.sleep(1)
+    return {"owner_name": "Slow", "phones": ["+1-000"], "emails": ["slow@example.com"]}
+
+
+def test_waterfall_falls_through_incomplete_results(monkeypatch):
+    monkeypatch.setitem(skiptrace_service.ADAPTERS, "batchdata", _incomplete_adapter)
+    monkeypatch.setenv("SKIPTRACE_WATERFALL_ORDER", "batchdata,propstream")
+    skiptrace_service.reset_provider_stats()
+
+    result = skiptrace_property_owner(address="5 Oak Ln", provider="waterfall")
+
+    assert result["provider"] == "propstream"
+    stats = skiptrace_service.provider_stats_snapshot()
+    assert (stats["batchdata"]["attempts"], stats["batchdata"]["hits"]) == (1, 0)
+    assert stats["propstream"]["hits"] == 1
+
+
+def test_waterfall_hedges_past_a_slow_provider(monkeypatch):
+    monkeypatch.setitem(skiptrace_service.ADAPTERS, "batchdata", _slow_adapter)
+    monkeypatch.setenv("SKIPTRACE_WATERFALL_ORDER", "batchdata,peopledatalabs")
+    monkeypatch.setenv("SKIPTRACE_WATERFALL_HEDGE_MS", "50")
+
+    started = time.perf_counter()
+    result = skiptrace_property_owner(address="5 Oak Ln", provider="waterfall")
+
+    assert result["provider"] == "peopledatalabs"
+    assert time.perf_counter() - started < 0.5
+
+
+def test_waterfall_order_prefers_faster_hits_once_sampled():
+    skiptrace_service.reset_provider_stats()
+    for name, latency_ms, hits in (("batchdata", 2000, 20), ("propstream", 100, 18), ("peopledatalabs", 100, 5)):
+        stats = skiptrace_service.PROVIDER_STATS[name]
+        stats.attempts, stats.hits = skiptrace_service.MIN_REORDER_SAMPLES, hits
+        for _ in range(stats.attempts):
+            stats.latency.observe(latency_ms)
+
+    assert skiptrace_service.waterfall_order() == ["propstream", "peopledatalabs", "batchdata"]
+    skiptrace_service.reset_provider_stats()
+
+
+def test_hedged_out_provider_still_records_its_attempt(monkeypatch):
+    monkeypatch.setitem(skiptrace_service.ADAPTERS, "batchdata", _slow_adapter)
+    monkeypatch.setenv("SKIPTRACE_WATERFALL_ORDER", "batchdata,peopledatalabs")
+    monkeypatch.setenv("SKIPTRACE_WATERFALL_HEDGE_MS", "50")
+    skiptrace_service.reset_provider_stats()
+
+    skiptrace_property_owner(address="5 Oak Ln", provider="waterfall")
+
+    slow = skiptrace_service.provider_stats_snapshot()["batchdata"]
+    assert (slow["attempts"], slow["hits"], slow["errors"]) == (1, 0, 0)
+    assert slow["latency"]["count"] == 1
+    skiptrace_service.reset_provider_stats()
+
+
+def test_waterfall_order_ranks_only_sampled_providers(monkeypatch):
+    monkeypatch.setenv("SKIPTRACE_WATERFALL_ORDER", "batchdata,propstream,peopledatalabs")
+    skiptrace_service.reset_provider_stats()
+    for name, latency_ms in (("batchdata", 2000), ("peopledatalabs", 100)):
+        stats = skiptrace_service.PROVIDER_STATS[name]
+        stats.attempts = stats.hits = skiptrace_service.MIN_REORDER_SAMPLES
+        for _ in range(stats.attempts):
+            stats.latency.observe(latency_ms)
+
+    # propstream is rarely reached and keeps its slot; the sampled two swap.
+    assert skiptrace_service.waterfall_order() == ["peopledatalabs", "propstream", "batchdata"]
+    skiptrace_service.reset_provider_stats()
+
+
+def test_sync_lookup_works_inside_a_running_loop(monkeypatch):
+    monkeypatch.setenv("SKIPTRACE_WATERFALL_ORDER", "propstream")
+
+    async def handler() -> dict:
+        sync_result = skiptrace_property_owner(address="5 Oak Ln", provider="waterfall")
+        async_result = await skiptrace_service.lookup_property_owner(address="5 Oak Ln", provider="waterfall")
+        return {"sync": sync_result["provider"], "async": async_result["provider"]}
+
+    assert asyncio.run(handler()) == {"sync": "propstream", "async": "propstream"}
+
+
+def test_provider_gates_are_shared_across_calls():
+    first, second = skiptrace_service.provider_gates(), skiptrace_service.provider_gates()
+    assert all(first[name] is second[name] for name in skiptrace_service.ADAPTERS)
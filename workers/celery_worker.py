@@ -1,8 +1,105 @@
 from celery import Celery
+from celery.schedules import crontab
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown
 import os
 
 celery_app = Celery(
     "outbox_worker",
     broker=os.getenv("CELERY_BROKER_URL", "redis://redis:6379/0"),
     backend=os.getenv("CELERY_RESULT_BACKEND", "redis://redis:6379/0"),
+    include=[
+        "workers.tasks.botops_runner",
+        "workers.tasks.referral_delivery",
+        "workers.tasks.impact_rollups",
+        "workers.tasks.risk_evaluation",
+        "workers.tasks.stripe_webhooks",
+        "workers.tasks.skiptrace_batches",
+        "workers.tasks.scheduled_jobs",
+    ],
 )
+
+# Job classes get their own queues so a nightly batch never delays webhook or
+# outbox delivery; see the celery and celery-batch services in docker-compose.yml.
+# Unlisted tasks stay on the default "celery" queue.
+celery_app.conf.task_routes = {
+    "workers.tasks.stripe_webhooks.*": {"queue": "realtime"},
+    "workers.tasks.referral_delivery.*": {"queue": "realtime"},
+    "workers.tasks.risk_evaluation.*": {"queue": "batch"},
+    "workers.tasks.skiptrace_batches.*": {"queue": "batch"},
+    "workers.tasks.scheduled_jobs.weekly_foreclosure_scan_task": {"queue": "ingestion"},
+    "workers.tasks.botops_runner.*": {"queue": "ingestion"},
+    "workers.tasks.scheduled_jobs.workflow_sla_sweep_task": {"queue": "maintenance"},
+    "workers.tasks.scheduled_jobs.partner_reroute_sweep_task": {"queue": "maintenance"},
+    "workers.tasks.impact_rollups.*": {"queue": "maintenance"},
+}
+# Long jobs: take one message at a time and acknowledge only once it finished,
+# so a worker restart re-delivers the job instead of losing it.
+celery_app.conf.worker_prefetch_multiplier = 1
+celery_app.conf.task_acks_late = True
+# Redis re-delivers unacknowledged messages after this long; keep it above the
+# longest job. A duplicate delivery is still skipped by the job's singleton lock.
+celery_app.conf.broker_transport_options = {
+    "visibility_timeout": int(os.getenv("CELERY_VISIBILITY_TIMEOUT_SECONDS", "21600")),
+}
+
+celery_app.conf.beat_schedule = {
+    "refresh-impact-rollups": {
+        "task": "workers.tasks.impact_rollups.refresh_impact_rollups_task",
+        "schedule": crontab(minute=f"*/{os.getenv('IMPACT_ROLLUP_REFRESH_MINUTES', '15')}"),
+    },
+    "nightly-risk-evaluation": {
+        "task": "workers.tasks.risk_evaluation.run_daily_risk_evaluation_task",
+        "schedule": crontab(hour=2, minute=0),
+    },
+    "drain-stripe-webhook-inbox": {
+        "task": "workers.tasks.stripe_webhooks.drain_stripe_webhook_inbox_task",
+        "schedule": float(os.getenv("STRIPE_INBOX_DRAIN_SECONDS", "5")),
+    },
+    "drain-skiptrace-batches": {
+        "task": "workers.tasks.skiptrace_batches.drain_skiptrace_batches_task",
+        "schedule": float(os.getenv("SKIPTRACE_BATCH_DRAIN_SECONDS", "30")),
+    },
+    "weekly-foreclosure-scan": {
+        "task": "workers.tasks.scheduled_jobs.weekly_foreclosure_scan_task",
+        "schedule": crontab(day_of_week=1, hour=3, minute=0),
+    },
+    "poll-botops-crawler-commands": {
+        "task": "workers.tasks.botops_runner.run_botops_commands",
+        "schedule": float(os.getenv("BOTOPS_POLL_SECONDS", "300")),
+    },
+    "workflow-sla-sweep": {
+        "task": "workers.tasks.scheduled_jobs.workflow_sla_sweep_task",
+        "schedule": crontab(minute=30),
+    },
+    "partner-reroute-sweep": {
+        "task": "workers.tasks.scheduled_jobs.partner_reroute_sweep_task",
+        "schedule": float(os.getenv("PARTNER_REROUTE_SWEEP_SECONDS", "300")),
+    },
+}
+
+
+@worker_process_init.connect
+def reset_db_pools(**_kwargs):
+    # Task modules create the engines in the parent before it forks; each child
+    # must open its own connections rather than share the parent's sockets.
+    from db.session import dispose_engines
+
+    dispose_engines()
+
+
+@worker_init.connect
+def serve_metrics(**_kwargs):
+    # The pool children write their samples to PROMETHEUS_MULTIPROC_DIR; the
+    # main worker process serves the aggregate.
+    port = os.getenv("CELERY_METRICS_PORT")
+    if port:
+        from app.services.metrics import start_metrics_server
+
+        start_metrics_server(int(port))
+
+
+@worker_process_shutdown.connect
+def release_process_metrics(pid=None, **_kwargs):
+    from app.services.metrics import mark_process_dead
+
+    mark_process_dead(pid or os.getpid())
@@ -6,8 +6,11 @@ from sqlalchemy.orm import Session
 
 from db.session import SessionLocal
 from ingestion.dallas.public_records import fetch_public_records
-from app.models.botops import BotCommand, BotReport, BotSetting, Lead
+from app.models.botops import BotCommand, BotReport, BotSetting
+from app.models.leads import Lead
+from app.services.scheduled_jobs_service import JOBS, run_singleton_job
 from workers.celery_worker import celery_app
+from workers.tasks.scheduled_jobs import delivery_queue
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +39,14 @@ def _log_report(db: Session, bot: str, level: str, code: str, message: str, deta
 
 @celery_app.task(bind=True, max_retries=2)
 def run_botops_commands(self):
+    return run_singleton_job(
+        SessionLocal, JOBS["botops_crawl"], process_crawler_commands, task_id=self.request.id, queue=delivery_queue(self)
+    )
+
+
+def process_crawler_commands() -> dict:
     db: Session = SessionLocal()
+    summary = {"commands_processed": 0, "records_upserted": 0}
     try:
         commands = (
             db.query(BotCommand)
@@ -44,10 +54,9 @@ def run_botops_commands(self):
             .order_by(BotCommand.created_at.asc())
             .all()
         )
-        if not commands:
-            return
 
         for command in commands:
+            summary["commands_processed"] += 1
             command.status = "processing"
             db.commit()
 
@@ -96,6 +105,7 @@ def run_botops_commands(self):
                         upserted += 1
 
                     command.status = "done"
+                    summary["records_upserted"] += upserted
                     _log_report(
                         db,
                         "CrawlerBot",
@@ -128,5 +138,6 @@ def run_botops_commands(self):
                     {"command_id": str(command.id), "command": command.command},
                 )
                 db.commit()
+        return summary
     finally:
         db.close()
@@ -0,0 +1,34 @@
+import logging
+
+from sqlalchemy.orm import Session
+
+from db.session import SessionLocal
+from app.services.impact_rollup_service import refresh_impact_rollups
+from app.services.scheduled_jobs_service import JOBS, run_singleton_job
+from workers.celery_worker import celery_app
+from workers.tasks.scheduled_jobs import delivery_queue
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, max_retries=2)
+def refresh_impact_rollups_task(self, full: bool = False):
+    def refresh():
+        db: Session = SessionLocal()
+        try:
+            result = refresh_impact_rollups(db, full=full)
+            db.commit()
+            logger.info("impact_rollups.refreshed", extra=result)
+            return result
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    try:
+        return run_singleton_job(
+            SessionLocal, JOBS["impact_rollups"], refresh, task_id=self.request.id, queue=delivery_queue(self)
+        )
+    except Exception as exc:
+        raise self.retry(exc=exc, countdown=60)
@@ -3,9 +3,10 @@ from sqlalchemy.orm import Session
 from db.session import SessionLocal
 from app.models.outbox_queue import OutboxQueue
 from app.models.referrals import Referral
+from app.services.metrics import OUTBOX_DELIVERY_LAG_SECONDS
 from audit.logger import log_audit
 from uuid import uuid4
-from datetime import datetime
+from datetime import datetime, timezone
 
 @celery_app.task(bind=True, max_retries=3)
 def process_referral_outbox(self, outbox_id: str):
@@ -43,6 +44,8 @@ def process_referral_outbox(self, outbox_id: str):
         )
 
         db.commit()
+        if outbox.created_at is not None:
+            OUTBOX_DELIVERY_LAG_SECONDS.observe((datetime.now(timezone.utc) - outbox.created_at).total_seconds())
 
     except Exception as e:
         db.rollback()
@@ -0,0 +1,29 @@
+import os
+
+from db.session import SessionLocal
+from app.services.risk_evaluation_runner import daily_run_key, run_risk_evaluation
+from app.services.scheduled_jobs_service import JOBS, run_singleton_job
+from workers.celery_worker import celery_app
+from workers.tasks.scheduled_jobs import delivery_queue
+
+
+@celery_app.task(bind=True, max_retries=3)
+def run_daily_risk_evaluation_task(self, run_key: str | None = None):
+    # Fix the key before the first attempt and hand it to every retry, so a failed
+    # night resumes from its checkpoint even when the retry runs after midnight.
+    run_key = run_key or daily_run_key()
+    try:
+        return run_singleton_job(
+            SessionLocal,
+            JOBS["risk_evaluation"],
+            lambda: run_risk_evaluation(
+                SessionLocal,
+                run_key=run_key,
+                chunk_size=int(os.getenv("RISK_EVALUATION_CHUNK_SIZE", "1000")),
+                max_workers=int(os.getenv("RISK_EVALUATION_WORKERS", "4")),
+            ),
+            task_id=self.request.id,
+            queue=delivery_queue(self),
+        )
+    except Exception as exc:
+        raise self.retry(exc=exc, countdown=300, kwargs={"run_key": run_key})
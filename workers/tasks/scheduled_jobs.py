@@ -0,0 +1,68 @@
+import logging
+
+from db.session import SessionLocal
+from app.services.lead_connector_service import run_lead_connectors
+from app.services.partner_routing_service import reroute_unassigned_referrals
+from app.services.scheduled_jobs_service import JOBS, run_singleton_job
+from app.services.workflow_engine import sweep_workflow_sla_breaches
+from workers.celery_worker import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+def delivery_queue(task) -> str | None:
+    # None when the task runs eagerly or was called directly.
+    return (getattr(task.request, "delivery_info", None) or {}).get("routing_key")
+
+
+@celery_app.task(bind=True, max_retries=2)
+def weekly_foreclosure_scan_task(self, connectors: list[str] | None = None):
+    # Connector failures are reported per connector; retries only cover the run itself.
+    try:
+        return run_singleton_job(
+            SessionLocal,
+            JOBS["foreclosure_scan"],
+            lambda: run_lead_connectors(SessionLocal, names=connectors),
+            task_id=self.request.id,
+            queue=delivery_queue(self),
+        )
+    except Exception as exc:
+        raise self.retry(exc=exc, countdown=600)
+
+
+@celery_app.task(bind=True, max_retries=2)
+def workflow_sla_sweep_task(self):
+    def sweep():
+        db = SessionLocal()
+        try:
+            result = sweep_workflow_sla_breaches(db)
+            db.commit()
+            return result
+        finally:
+            db.close()
+
+    try:
+        return run_singleton_job(
+            SessionLocal, JOBS["workflow_sla_sweep"], sweep, task_id=self.request.id, queue=delivery_queue(self)
+        )
+    except Exception as exc:
+        raise self.retry(exc=exc, countdown=120)
+
+
+@celery_app.task(bind=True, max_retries=2)
+def partner_reroute_sweep_task(self):
+    def sweep():
+        db = SessionLocal()
+        try:
+            result = reroute_unassigned_referrals(db)
+            db.commit()
+            return result
+        finally:
+            db.close()
+
+    try:
+        return run_singleton_job(
+            SessionLocal, JOBS["partner_reroute_sweep"], sweep, task_id=self.request.id, queue=delivery_queue(self)
+        )
+    except Exception as exc:
+        raise self.retry(exc=exc, countdown=120)
@@ -0,0 +1,22 @@
+import logging
+import os
+
+from db.session import SessionLocal
+from app.services.skiptrace_batch_service import DEFAULT_CHUNK_SIZE, drain_skiptrace_batches
+from workers.celery_worker import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, max_retries=3)
+def drain_skiptrace_batches_task(self, max_batches: int | None = None):
+    # A failed batch is marked failed and skipped; retries only cover claim errors.
+    try:
+        return drain_skiptrace_batches(
+            SessionLocal,
+            chunk_size=int(os.getenv("SKIPTRACE_BATCH_CHUNK_SIZE", str(DEFAULT_CHUNK_SIZE))),
+            max_batches=max_batches or int(os.getenv("SKIPTRACE_MAX_BATCHES_PER_RUN", "5")),
+        )
+    except Exception as exc:
+        logger.exception("skiptrace_batch.drain_failed")
+        raise self.retry(exc=exc, countdown=30)
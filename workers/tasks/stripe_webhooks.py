@@ -0,0 +1,26 @@
+import logging
+import os
+
+from db.session import SessionLocal
+from app.services.stripe_webhook_inbox_service import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_WORKERS,
+    drain_stripe_webhook_inbox,
+)
+from workers.celery_worker import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, max_retries=3)
+def drain_stripe_webhook_inbox_task(self, max_batches: int | None = None):
+    try:
+        return drain_stripe_webhook_inbox(
+            SessionLocal,
+            batch_size=int(os.getenv("STRIPE_INBOX_BATCH_SIZE", str(DEFAULT_BATCH_SIZE))),
+            max_workers=int(os.getenv("STRIPE_INBOX_WORKERS", str(DEFAULT_MAX_WORKERS))),
+            max_batches=max_batches or int(os.getenv("STRIPE_INBOX_MAX_BATCHES", "50")),
+        )
+    except Exception as exc:
+        logger.exception("stripe_inbox.drain_failed")
+        raise self.retry(exc=exc, countdown=10)